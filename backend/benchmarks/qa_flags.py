@@ -0,0 +1,155 @@
+"""Benchmark the cost of computing QA flags during a study.
+
+Flags are collected in the same pass as the deltas, so their cost is the
+per-claim bookkeeping (similarity key and counters) plus one evaluation of
+the rules at the end. This script measures both against the engine runs.
+
+Usage:
+    python benchmarks/qa_flags.py [claim_count]
+"""
+
+import random
+import sys
+import time
+from datetime import date
+
+from decision_ledger.core.qa_engine import QAImpactEngine
+from decision_ledger.core.qa_flags import QAFlagRules, evaluate_flags, similarity_key
+from decision_ledger.core.qa_stats import DeltaAggregate
+from decision_ledger.schemas.catalog import (
+    Assumption,
+    AssumptionAlternative,
+    AssumptionSet,
+    DecisionOption,
+    DecisionPoint,
+    InterpretationSet,
+    RiskTier,
+    Role,
+    SetStatus,
+)
+from decision_ledger.schemas.claim import Claim, ClaimStatus, Fact, FactStatus, LineItem
+from decision_ledger.schemas.qa import QACohort, QAProposedChange
+
+
+def make_catalog() -> tuple[InterpretationSet, AssumptionSet]:
+    """A CH Motor catalog with the accessory decision point and assumption."""
+    options = ["INCLUDED_IF_DECLARED", "INCLUDED_BY_DEFAULT", "EXCLUDED"]
+    interpretation_set = InterpretationSet(
+        interpretation_set_id="INT-BENCH",
+        jurisdiction="CH",
+        product_line="Motor/Casco",
+        effective_from=date(2025, 1, 1),
+        version="1",
+        status=SetStatus.APPROVED,
+        decision_points=[
+            DecisionPoint(
+                decision_point_id="DP.ACCESSORY_COVERAGE",
+                label="Accessory Coverage",
+                description="",
+                options=[DecisionOption(option_id=o, label=o, description="") for o in options],
+                default_option="INCLUDED_IF_DECLARED",
+                owner="Policy Team",
+                status=SetStatus.APPROVED,
+            )
+        ],
+    )
+    assumption_set = AssumptionSet(
+        assumption_set_id="ASM-BENCH",
+        jurisdiction="CH",
+        product_line="Motor/Casco",
+        version="1",
+        status=SetStatus.APPROVED,
+        assumptions=[
+            Assumption(
+                assumption_id="ASM.ACCESSORY_DECLARED",
+                label="Accessory Declaration Status",
+                trigger="FACT.ACCESSORY_DECLARED is UNKNOWN",
+                trigger_fact_id="FACT.ACCESSORY_DECLARED",
+                description="",
+                recommended_resolution="NOT_DECLARED",
+                alternatives=[
+                    AssumptionAlternative(
+                        alternative_id=a, label=a, description="", allowed_roles=[Role.ADJUSTER]
+                    )
+                    for a in ("NOT_DECLARED", "DECLARED")
+                ],
+                risk_tier=RiskTier.MEDIUM,
+            )
+        ],
+    )
+    return interpretation_set, assumption_set
+
+
+def make_claims(count: int, seed: int = 0) -> list[Claim]:
+    """Synthetic claims with random amounts and declaration status."""
+    rng = random.Random(seed)
+    claims = []
+    for i in range(count):
+        unknown = rng.random() < 0.4
+        items = [LineItem(item_id="LI-1", label="Repair", amount_chf=rng.uniform(500, 8000), category="repair")]
+        if rng.random() < 0.5:
+            items.append(
+                LineItem(item_id="LI-2", label="Tow bar", amount_chf=rng.uniform(200, 3000), category="accessory")
+            )
+        claims.append(
+            Claim(
+                claim_id=f"CLM-BENCH-{i}",
+                jurisdiction="CH",
+                product_line="Motor/Casco",
+                loss_date=date(2025, 6, 1),
+                policy_id=f"POL-{i}",
+                status=ClaimStatus.READY,
+                facts=[
+                    Fact(
+                        fact_id="FACT.ACCESSORY_DECLARED",
+                        label="Accessory Declared",
+                        value=None if unknown else "DECLARED",
+                        status=FactStatus.UNKNOWN if unknown else FactStatus.KNOWN,
+                        source="Bench",
+                    )
+                ],
+                evidence=[],
+                line_items=items,
+            )
+        )
+    return claims
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    catalog = make_catalog()
+    claims = make_claims(count)
+    change = QAProposedChange(
+        proposal_id="PROP-BENCH",
+        label="Include accessories by default",
+        description="",
+        change_type="INTERPRETATION",
+        target_item_id="DP.ACCESSORY_COVERAGE",
+        to_value="INCLUDED_BY_DEFAULT",
+    )
+    cohort = QACohort(cohort_id="COH-BENCH", label="Bench", description="", claim_count=count)
+
+    start = time.perf_counter()
+    result = QAImpactEngine().run_study(cohort, change, claims, lambda c: catalog)
+    study = time.perf_counter() - start
+
+    start = time.perf_counter()
+    aggregate = DeltaAggregate()
+    for claim in claims:
+        aggregate.add_unchanged(1, bucket=similarity_key(claim))
+    bookkeeping = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        evaluate_flags(aggregate, QAFlagRules())
+    rules = (time.perf_counter() - start) / 1000
+
+    print(f"claims:                 {count}")
+    print(f"study (engine + flags): {study:.3f}s ({study / count * 1e6:.1f} us/claim)")
+    print(f"flag bookkeeping:       {bookkeeping:.3f}s ({bookkeeping / count * 1e6:.2f} us/claim)")
+    print(f"flag rule evaluation:   {rules * 1e6:.1f} us per study ({len(aggregate.buckets)} buckets)")
+    print(f"flags:                  {[f.value for f in result.flags]}")
+
+
+if __name__ == "__main__":
+    main()
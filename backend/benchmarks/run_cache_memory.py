@@ -0,0 +1,124 @@
+"""Benchmark the memory held by cached decision runs.
+
+Stores one decision run for each of ``run_count`` synthetic claims, then,
+each in a fresh process, measures the growth in resident set size while
+
+- a new ``DecisionService`` reads every run, regenerating and caching it
+  (``cached``), and
+- every run is parsed from its full JSON, as runs were held before they
+  were stored compactly and regenerated (``parsed``),
+
+and reports it per million runs. Run it on two commits to compare them.
+
+Usage:
+    python benchmarks/run_cache_memory.py [run_count]
+"""
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from qa_flags import make_catalog, make_claims
+
+
+def rss_bytes() -> int:
+    """Current resident set size (Linux), or the peak elsewhere."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def populate(workdir: Path, count: int) -> None:
+    """Write fixtures, store the runs and save their full JSON."""
+    from decision_ledger.api.services.decision_service import DecisionService
+    from decision_ledger.schemas.decision import DecisionRunRequest
+    from decision_ledger.storage.filesystem import FileStorage
+
+    interpretation_set, assumption_set = make_catalog()
+    claims = make_claims(count)
+    fixtures = workdir / "fixtures"
+    fixtures.mkdir()
+    for filename, items in [
+        ("claims.json", claims),
+        ("interpretation_sets.json", [interpretation_set]),
+        ("assumption_sets.json", [assumption_set]),
+    ]:
+        (fixtures / filename).write_text(json.dumps([i.model_dump(mode="json") for i in items]))
+
+    service = DecisionService()
+    service.storage = FileStorage(fixtures)
+    with open(workdir / "runs.jsonl", "w") as f:
+        for claim in claims:
+            run = service.run_decision(
+                DecisionRunRequest(
+                    claim_id=claim.claim_id,
+                    resolved_assumptions=[],
+                    selected_interpretations=[],
+                    role="Adjuster",
+                )
+            )
+            f.write(run.model_dump_json() + "\n")
+
+
+def measure(workdir: Path, mode: str) -> None:
+    """Print the RSS growth per million runs while holding every run."""
+    from decision_ledger.api.services.decision_service import DecisionService
+    from decision_ledger.schemas.decision import DecisionRun
+    from decision_ledger.storage.filesystem import FileStorage
+
+    lines = (workdir / "runs.jsonl").read_text().splitlines()
+    run_ids = [json.loads(line)["run_id"] for line in lines]
+    service = DecisionService()
+    service.storage = FileStorage(workdir / "fixtures")
+    service.get_run(run_ids[0])  # load claims and catalogs before measuring
+
+    gc.collect()
+    before = rss_bytes()
+    start = time.perf_counter()
+    if mode == "cached":
+        held = [service.get_run(run_id) for run_id in run_ids]
+    else:
+        held = [DecisionRun.model_validate_json(line) for line in lines]
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    growth = rss_bytes() - before
+    count = len(held)
+    print(
+        f"{mode:<7} {growth / count * 1e6 / 2**20:7.0f} MiB per million runs "
+        f"({growth / count:5.0f} B/run, {elapsed / count * 1e6:5.0f} us/run)"
+    )
+
+
+def main() -> None:
+    if sys.argv[1:2] == ["--phase"]:
+        phase, workdir = sys.argv[2], Path(sys.argv[3])
+        if phase == "populate":
+            populate(workdir, int(sys.argv[4]))
+        else:
+            measure(workdir, phase)
+        return
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    workdir = Path(tempfile.mkdtemp(prefix="run-cache-bench-"))
+    env = {
+        **os.environ,
+        "DATA_DIR": str(workdir / "data"),
+        "RUN_CACHE_ENTRIES": str(count),
+    }
+    print(f"runs: {count}")
+    for phase in ("populate", "cached", "parsed"):
+        args = [sys.executable, __file__, "--phase", phase, str(workdir), str(count)]
+        subprocess.run(args, env=env, check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Bounded worker pools for running blocking work off the event loop.
+
+Route handlers are ``async`` but the services they call are synchronous and
+may run the engine or touch storage for a long time. Handlers therefore hand
+service calls to a bounded thread pool. Admission control caps the number of
+queued calls; beyond that callers get ``ExecutorSaturatedError``, which the
+app maps to ``503 Service Unavailable`` with a ``Retry-After`` header.
+
+Engine calls can additionally be sent to a process pool (see
+``engine_executor_kind``) so CPU-bound work does not contend for the GIL.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, TypeVar
+
+from pydantic import BaseModel
+
+from decision_ledger.config import get_settings
+
+T = TypeVar("T")
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when a call is rejected because the queue is full."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Executor queue is full")
+        self.retry_after = retry_after
+
+
+class ExecutorMetrics(BaseModel):
+    """Point-in-time metrics for a bounded executor."""
+
+    kind: str
+    max_workers: int
+    max_queue_depth: int
+    in_flight: int
+    queued: int
+    completed: int
+    rejected: int
+    queue_wait_avg_ms: float
+    queue_wait_p95_ms: float
+    queue_wait_max_ms: float
+
+
+def _timed_call(
+    fn: Callable[..., T], submitted_at: float, args: tuple, kwargs: dict
+) -> tuple[float, T]:
+    """Run ``fn`` and report when it started (module-level so it pickles)."""
+    started_at = time.time()
+    return started_at, fn(*args, **kwargs)
+
+
+class BoundedExecutor:
+    """A thread or process pool with a bounded admission queue."""
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: int = 8,
+        max_queue_depth: int = 64,
+        retry_after_seconds: int = 1,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            kind: "thread" or "process"
+            max_workers: Number of pool workers
+            max_queue_depth: Calls allowed to wait beyond ``max_workers``
+            retry_after_seconds: Value reported to rejected callers
+        """
+        if kind == "thread":
+            self._pool: Executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="decision-ledger"
+            )
+        elif kind == "process":
+            self._pool = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            raise ValueError(f"Unknown executor kind: {kind}")
+
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.retry_after_seconds = retry_after_seconds
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._recent_waits: deque[float] = deque(maxlen=1024)
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Submit a call, rejecting it if the queue is full.
+
+        Raises:
+            ExecutorSaturatedError: If ``max_workers + max_queue_depth``
+                calls are already in flight
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue_depth:
+                self._rejected += 1
+                raise ExecutorSaturatedError(self.retry_after_seconds)
+            self._in_flight += 1
+
+        submitted_at = time.time()
+        result: Future[T] = Future()
+        try:
+            inner = self._pool.submit(_timed_call, fn, submitted_at, args, kwargs)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+
+        def _done(f: "Future[tuple[float, T]]") -> None:
+            # Record before resolving, so a caller woken by the result sees the
+            # call counted as completed
+            try:
+                started_at, value = f.result()
+            except BaseException as e:
+                self._record(submitted_at, None)
+                result.set_exception(e)
+            else:
+                self._record(submitted_at, started_at)
+                result.set_result(value)
+
+        inner.add_done_callback(_done)
+        return result
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Submit a call and block until it completes."""
+        return self.submit(fn, *args, **kwargs).result()
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Submit a call and await its result without blocking the loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def _record(self, submitted_at: float, started_at: float | None) -> None:
+        """Record completion and queue-wait time for a call."""
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+            if started_at is not None:
+                wait = max(0.0, started_at - submitted_at)
+                self._wait_total += wait
+                self._wait_max = max(self._wait_max, wait)
+                self._recent_waits.append(wait)
+
+    def metrics(self) -> ExecutorMetrics:
+        """Return current queue depth and queue-wait statistics."""
+        with self._lock:
+            waits = sorted(self._recent_waits)
+            p95 = waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0
+            return ExecutorMetrics(
+                kind=self.kind,
+                max_workers=self.max_workers,
+                max_queue_depth=self.max_queue_depth,
+                in_flight=self._in_flight,
+                queued=max(0, self._in_flight - self.max_workers),
+                completed=self._completed,
+                rejected=self._rejected,
+                queue_wait_avg_ms=(self._wait_total / self._completed * 1000) if self._completed else 0.0,
+                queue_wait_p95_ms=p95 * 1000,
+                queue_wait_max_ms=self._wait_max * 1000,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the underlying pool."""
+        self._pool.shutdown(wait=wait)
+
+
+@lru_cache
+def get_executor() -> BoundedExecutor:
+    """Get the shared thread pool used by route handlers."""
+    settings = get_settings()
+    return BoundedExecutor(
+        kind="thread",
+        max_workers=settings.executor_max_workers,
+        max_queue_depth=settings.executor_max_queue_depth,
+        retry_after_seconds=settings.executor_retry_after_seconds,
+    )
+
+
+@lru_cache
+def get_batch_executor() -> ProcessPoolExecutor | None:
+    """Get the process pool for batch engine work, or None to run inline.
+
+    Batch jobs submit many large work units at once and wait for all of
+    them, so this pool has no admission queue.
+    """
+    settings = get_settings()
+    if settings.batch_max_workers <= 0:
+        return None
+    return ProcessPoolExecutor(max_workers=settings.batch_max_workers)
+
+
+@lru_cache
+def get_engine_executor() -> BoundedExecutor | None:
+    """Get the pool for engine calls, or None to run them inline."""
+    settings = get_settings()
+    if settings.engine_executor_kind == "inline":
+        return None
+    return BoundedExecutor(
+        kind=settings.engine_executor_kind,
+        max_workers=settings.engine_executor_max_workers,
+        max_queue_depth=settings.executor_max_queue_depth,
+        retry_after_seconds=settings.executor_retry_after_seconds,
+    )
@@ -0,0 +1,254 @@
+"""In-process runner for long-running background jobs.
+
+Jobs (large QA studies, backfills) are submitted by kind and executed by a
+small thread pool. Their state lives in the shared SQLite database, so
+any API worker can report on a job, and no broker is needed:
+
+- Handlers report progress and save checkpoints through a ``JobContext``.
+  Each report renews the runner's lease on the job and picks up
+  cancellation requests, which stop the handler at its next report.
+- A job whose runner disappears stops renewing its lease. After a restart,
+  ``resume_pending`` claims such jobs and runs them again; the handler
+  continues from its last checkpoint. A runner whose lease lapsed and was
+  taken over is interrupted at its next report and leaves the job alone.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable
+
+from decision_ledger.config import get_settings
+from decision_ledger.schemas.job import Job, JobStatus
+from decision_ledger.storage.jobs import JobLeaseLostError, JobStore
+from decision_ledger.storage.sqlite import get_state_store
+from decision_ledger.utils.ids import new_id
+
+logger = logging.getLogger(__name__)
+
+
+class JobCancelledError(Exception):
+    """Raised inside a handler when its job was cancelled."""
+
+
+class JobInterruptedError(Exception):
+    """Raised inside a handler when its runner is shutting down or lost the job."""
+
+
+class JobContext:
+    """Progress, checkpoint and cancellation handle given to job handlers."""
+
+    def __init__(
+        self,
+        runner: "JobRunner",
+        job: Job,
+        checkpoint: dict[str, Any] | None,
+        report_interval: float = 0.25,
+    ) -> None:
+        self.job = job
+        self.checkpoint = checkpoint
+        self.lease_lost = False  # Another runner took over; leave the job to it
+        self._runner = runner
+        self._report_interval = report_interval
+        self._last_report = 0.0
+
+    def report(self, processed: int, total: int | None = None, force: bool = False) -> None:
+        """Record progress; writes are throttled unless ``force`` is set.
+
+        Raises:
+            JobCancelledError: If cancellation was requested
+            JobInterruptedError: If the runner is shutting down or another
+                runner took over the job
+        """
+        self.job.processed = processed
+        if total is not None:
+            self.job.total = total
+        now = time.monotonic()
+        if not force and now - self._last_report < self._report_interval:
+            return
+        self._last_report = now
+        self._heartbeat(None)
+
+    def save_checkpoint(
+        self, checkpoint: dict[str, Any], processed: int, total: int | None = None
+    ) -> None:
+        """Persist a checkpoint the handler can resume from, with progress.
+
+        Raises:
+            JobCancelledError: If cancellation was requested
+            JobInterruptedError: If the runner is shutting down or another
+                runner took over the job
+        """
+        self.checkpoint = checkpoint
+        self.job.processed = processed
+        if total is not None:
+            self.job.total = total
+        self._last_report = time.monotonic()
+        self._heartbeat(checkpoint)
+
+    def _heartbeat(self, checkpoint: dict[str, Any] | None) -> None:
+        runner = self._runner
+        try:
+            cancelled = runner.store.heartbeat(self.job, runner.owner, checkpoint)
+        except JobLeaseLostError:
+            self.lease_lost = True
+            raise JobInterruptedError(self.job.job_id) from None
+        if cancelled:
+            raise JobCancelledError(self.job.job_id)
+        if runner.stopping:
+            raise JobInterruptedError(self.job.job_id)
+
+
+JobHandler = Callable[[Job, JobContext], dict[str, Any]]
+
+
+class JobRunner:
+    """Executes registered job kinds on a thread pool with persisted state."""
+
+    def __init__(
+        self,
+        store: JobStore,
+        max_workers: int = 2,
+        lease_seconds: float = 60.0,
+        report_interval: float = 0.25,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            store: Persistent job state
+            max_workers: Jobs executed concurrently
+            lease_seconds: Silence after which another runner may take over
+                a job; handlers must report more often than this
+            report_interval: Minimum seconds between progress writes
+        """
+        self.store = store
+        self.lease_seconds = lease_seconds
+        self.report_interval = report_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.stopping = False
+        self._handlers: dict[str, JobHandler] = {}
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job-runner")
+        self._lock = threading.Lock()
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """Register the handler for a job kind.
+
+        The handler returns the job's JSON result. It should call
+        ``context.report`` regularly and ``context.save_checkpoint`` at
+        points it can resume from, and start from ``context.checkpoint``
+        when one exists.
+        """
+        self._handlers[kind] = handler
+
+    def submit(self, kind: str, params: dict[str, Any]) -> Job:
+        """Queue a job and start it when a worker is free.
+
+        Inside a state store transaction the job is created as part of it
+        and only started once it commits, so the worker sees the job row
+        and no job starts for a rolled back change.
+
+        Raises:
+            ValueError: If no handler is registered for ``kind``
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        now = datetime.now()
+        job = Job(
+            job_id=new_id("JOB", now),
+            kind=kind,
+            status=JobStatus.QUEUED,
+            params=params,
+            created_at=now,
+            updated_at=now,
+        )
+        self.store.create(job)
+        self.store.state.on_commit(lambda: self._dispatch(job.job_id))
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Get a job by ID."""
+        return self.store.get(job_id)
+
+    def list_jobs(self, kind: str | None = None) -> list[Job]:
+        """List jobs, newest first."""
+        return self.store.list_jobs(kind)
+
+    def cancel(self, job_id: str) -> Job | None:
+        """Request cancellation; a running job stops at its next report."""
+        return self.store.request_cancel(job_id)
+
+    def resume(self, job_id: str) -> Job | None:
+        """Queue a cancelled or failed job again; it continues from its checkpoint."""
+        job = self.store.requeue(job_id)
+        if job is not None and job.status == JobStatus.QUEUED:
+            self._dispatch(job_id)
+        return job
+
+    def resume_pending(self) -> list[str]:
+        """Start jobs that are queued or were abandoned by a stopped runner.
+
+        Returns:
+            IDs of the jobs dispatched
+        """
+        job_ids = []
+        for job_id in self.store.claimable(self.lease_seconds):
+            job = self.store.get(job_id)
+            if job is not None and job.kind in self._handlers:
+                self._dispatch(job_id)
+                job_ids.append(job_id)
+        return job_ids
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop running jobs at their next report and release them for resumption."""
+        self.stopping = True
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _dispatch(self, job_id: str) -> None:
+        with self._lock:
+            if not self.stopping:
+                self._pool.submit(self._execute, job_id)
+
+    def _execute(self, job_id: str) -> None:
+        """Claim and run one job, recording its outcome."""
+        job = self.store.claim(job_id, self.owner, self.lease_seconds)
+        if job is None:
+            return
+        context = JobContext(
+            self, job, self.store.load_checkpoint(job_id), report_interval=self.report_interval
+        )
+        try:
+            result = self._handlers[job.kind](job, context)
+        except JobInterruptedError:
+            if not context.lease_lost:
+                self.store.release(job)
+            return
+        except JobCancelledError:
+            job.status = JobStatus.CANCELLED
+        except Exception as e:
+            logger.exception("Job %s failed", job_id)
+            job.status = JobStatus.FAILED
+            job.error = str(e) or type(e).__name__
+        else:
+            job.status = JobStatus.SUCCEEDED
+            job.result = result
+            if job.total is not None:
+                job.processed = job.total
+        job.finished_at = datetime.now()
+        self.store.save(job)
+
+
+@lru_cache
+def get_job_runner() -> JobRunner:
+    """Get the process-wide background job runner."""
+    settings = get_settings()
+    return JobRunner(
+        JobStore(get_state_store()),
+        max_workers=settings.job_max_workers,
+        lease_seconds=settings.job_lease_seconds,
+    )
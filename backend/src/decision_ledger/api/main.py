@@ -1,17 +1,48 @@
 """FastAPI application entry point for Decision Ledger."""
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from decision_ledger.config import get_settings
+from decision_ledger.api.executor import (
+    ExecutorSaturatedError,
+    get_batch_executor,
+    get_engine_executor,
+    get_executor,
+)
+from decision_ledger.api.jobs import get_job_runner
+from decision_ledger.core.catalog_registry import get_catalog_registry
 from decision_ledger.api.routes import claims, decisions, governance, catalogs, qa
+from decision_ledger.storage.governance_log import get_governance_log
+from decision_ledger.storage.sqlite import get_state_store
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Resume interrupted jobs at startup; shut down worker pools at exit."""
+    get_job_runner().resume_pending()
+    yield
+    get_job_runner().shutdown(wait=False)
+    get_executor().shutdown(wait=False)
+    engine_executor = get_engine_executor()
+    if engine_executor is not None:
+        engine_executor.shutdown(wait=False)
+    batch_executor = get_batch_executor()
+    if batch_executor is not None:
+        batch_executor.shutdown(wait=False)
+
+
 app = FastAPI(
     title="Decision Ledger API",
     description="Deterministic, versioned decision engine for insurance claims",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -23,6 +54,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(ExecutorSaturatedError)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError) -> JSONResponse:
+    """Reject work with 503 when the worker queue is full."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server is busy, please retry"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 # Include routers
 app.include_router(claims.router, prefix="/api/claims", tags=["claims"])
 app.include_router(decisions.router, prefix="/api/decisions", tags=["decisions"])
@@ -37,8 +78,24 @@ async def health_check() -> dict:
     return {"status": "ok", "version": "0.1.0"}
 
 
+@app.get("/api/metrics")
+async def metrics() -> dict:
+    """Worker pool queue depth and queue-wait metrics."""
+    engine_executor = get_engine_executor()
+    return {
+        "executor": get_executor().metrics().model_dump(),
+        "engine_executor": engine_executor.metrics().model_dump() if engine_executor else None,
+    }
+
+
 @app.post("/api/reset")
 async def reset_demo_data() -> dict:
     """Reset demo data to initial state."""
-    # TODO: Implement reset logic
+    get_state_store().clear()
+    decisions.decision_service.idempotency.clear()
+    qa.qa_service.dependency_index.clear()
+    qa.qa_service.result_cache.clear()
+    get_job_runner().store.clear()
+    get_catalog_registry().clear()
+    get_governance_log().clear()
     return {"status": "reset", "message": "Demo data has been reset"}
@@ -1,12 +1,14 @@
 """Catalogs API routes."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
-from decision_ledger.schemas.catalog import InterpretationSet, AssumptionSet
+from decision_ledger.schemas.catalog import CatalogDiff, InterpretationSet, AssumptionSet
+from decision_ledger.api.executor import get_executor
 from decision_ledger.api.services.catalog_service import CatalogService
 
 router = APIRouter()
 catalog_service = CatalogService()
+executor = get_executor()
 
 
 @router.get("/interpretation-sets", response_model=list[InterpretationSet])
@@ -15,7 +17,8 @@ async def list_interpretation_sets(
     product_line: str | None = None,
 ) -> list[InterpretationSet]:
     """List all interpretation sets."""
-    return catalog_service.list_interpretation_sets(
+    return await executor.run(
+        catalog_service.list_interpretation_sets,
         jurisdiction=jurisdiction,
         product_line=product_line,
     )
@@ -24,7 +27,7 @@ async def list_interpretation_sets(
 @router.get("/interpretation-sets/{set_id}", response_model=InterpretationSet)
 async def get_interpretation_set(set_id: str) -> InterpretationSet:
     """Get a single interpretation set by ID."""
-    iset = catalog_service.get_interpretation_set(set_id)
+    iset = await executor.run(catalog_service.get_interpretation_set, set_id)
     if not iset:
         raise HTTPException(status_code=404, detail=f"Interpretation set {set_id} not found")
     return iset
@@ -36,7 +39,8 @@ async def list_assumption_sets(
     product_line: str | None = None,
 ) -> list[AssumptionSet]:
     """List all assumption sets."""
-    return catalog_service.list_assumption_sets(
+    return await executor.run(
+        catalog_service.list_assumption_sets,
         jurisdiction=jurisdiction,
         product_line=product_line,
     )
@@ -45,7 +49,24 @@ async def list_assumption_sets(
 @router.get("/assumption-sets/{set_id}", response_model=AssumptionSet)
 async def get_assumption_set(set_id: str) -> AssumptionSet:
     """Get a single assumption set by ID."""
-    aset = catalog_service.get_assumption_set(set_id)
+    aset = await executor.run(catalog_service.get_assumption_set, set_id)
     if not aset:
         raise HTTPException(status_code=404, detail=f"Assumption set {set_id} not found")
     return aset
+
+
+@router.get("/diff", response_model=CatalogDiff)
+async def diff_catalogs(
+    from_set_id: str = Query(..., alias="from"),
+    to_set_id: str = Query(..., alias="to"),
+) -> CatalogDiff:
+    """Structural diff between two versions of an interpretation or assumption set."""
+    try:
+        diff = await executor.run(catalog_service.diff, from_set_id, to_set_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not diff:
+        raise HTTPException(
+            status_code=404, detail=f"Catalog set {from_set_id} or {to_set_id} not found"
+        )
+    return diff
@@ -3,10 +3,12 @@
 from fastapi import APIRouter, HTTPException
 
 from decision_ledger.schemas.claim import Claim, ClaimSummary
+from decision_ledger.api.executor import get_executor
 from decision_ledger.api.services.claims_service import ClaimsService
 
 router = APIRouter()
 claims_service = ClaimsService()
+executor = get_executor()
 
 
 @router.get("", response_model=list[ClaimSummary])
@@ -16,7 +18,8 @@ async def list_claims(
     search: str | None = None,
 ) -> list[ClaimSummary]:
     """List all claims with optional filters."""
-    return claims_service.list_claims(
+    return await executor.run(
+        claims_service.list_claims,
         jurisdiction=jurisdiction,
         product_line=product_line,
         search=search,
@@ -26,7 +29,7 @@ async def list_claims(
 @router.get("/{claim_id}", response_model=Claim)
 async def get_claim(claim_id: str) -> Claim:
     """Get a single claim by ID."""
-    claim = claims_service.get_claim(claim_id)
+    claim = await executor.run(claims_service.get_claim, claim_id)
     if not claim:
         raise HTTPException(status_code=404, detail=f"Claim {claim_id} not found")
     return claim
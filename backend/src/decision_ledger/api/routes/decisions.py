@@ -1,41 +1,149 @@
 """Decisions API routes."""
 
-from fastapi import APIRouter, HTTPException
+from datetime import datetime
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import JSONResponse
 
 from decision_ledger.schemas.decision import (
     DecisionRun,
     DecisionRunRequest,
+    DecisionRunSummary,
     CounterfactualRequest,
     CounterfactualRun,
+    RunProof,
+    TraceEncoding,
+)
+from decision_ledger.api.executor import get_executor
+from decision_ledger.api.services.decision_service import (
+    DecisionService,
+    IdempotencyConflictError,
+    needs_full_runs,
 )
-from decision_ledger.api.services.decision_service import DecisionService
+from decision_ledger.core.run_codec import RunRegenerationError
+from decision_ledger.utils.projection import parse_fields
 
 router = APIRouter()
 decision_service = DecisionService()
+executor = get_executor()
+
 
+@router.get("", response_model=list[DecisionRun | DecisionRunSummary])
+async def list_decision_runs(
+    claim_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    fields: str | None = None,
+    trace: TraceEncoding = TraceEncoding.FULL,
+) -> list[DecisionRun | DecisionRunSummary] | JSONResponse:
+    """List decision runs, newest first, optionally filtered by claim.
 
-@router.get("", response_model=list[DecisionRun])
-async def list_decision_runs(claim_id: str | None = None) -> list[DecisionRun]:
-    """List all decision runs, optionally filtered by claim."""
-    return decision_service.list_runs(claim_id=claim_id)
+    ``since`` (inclusive) and ``until`` (exclusive) restrict runs to a time
+    range. With ``limit`` runs come in pages: pass the last run ID of a page
+    as ``cursor`` to get the next one.
+
+    Runs are listed as summaries with their outcome totals. ``fields``
+    restricts each run to the given comma-separated dotted paths (e.g.
+    ``run_id,outcome.status,outcome.payout_total``); naming
+    ``trace_steps``, ``dependencies`` or ``outcome.payout_breakdown``
+    regenerates the full runs, and a run that can no longer be regenerated
+    is listed as a summary with the reason in ``unavailable``. With
+    ``trace=compact`` the response becomes ``{"runs": [...],
+    "trace_templates": {...}}`` and steps reference shared templates.
+    """
+    paths = parse_fields(fields)
+    try:
+        runs = await executor.run(
+            decision_service.list_runs,
+            claim_id=claim_id,
+            since=since,
+            until=until,
+            cursor=cursor,
+            limit=limit,
+            full=needs_full_runs(paths, trace),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if paths is None and trace == TraceEncoding.FULL:
+        return runs
+    try:
+        rendered = decision_service.render_runs(runs, fields=paths, trace=trace)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if trace == TraceEncoding.FULL:
+        return JSONResponse(content=rendered["runs"])
+    return JSONResponse(content=rendered)
 
 
 @router.get("/{run_id}", response_model=DecisionRun)
-async def get_decision_run(run_id: str) -> DecisionRun:
-    """Get a single decision run by ID."""
-    run = decision_service.get_run(run_id)
+async def get_decision_run(
+    run_id: str,
+    fields: str | None = None,
+    trace: TraceEncoding = TraceEncoding.FULL,
+) -> DecisionRun | JSONResponse:
+    """Get a single decision run by ID.
+
+    Supports the same ``fields`` and ``trace`` parameters as the list route;
+    a compact run carries its templates under ``trace_templates``. The trace
+    is regenerated from the stored run on first access; 409 if the engine no
+    longer reproduces it.
+    """
+    try:
+        run = await executor.run(decision_service.get_run, run_id)
+    except RunRegenerationError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     if not run:
         raise HTTPException(status_code=404, detail=f"Decision run {run_id} not found")
-    return run
+    paths = parse_fields(fields)
+    if paths is None and trace == TraceEncoding.FULL:
+        return run
+    try:
+        rendered = decision_service.render_runs([run], fields=paths, trace=trace)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    content = rendered["runs"][0]
+    if trace == TraceEncoding.COMPACT:
+        content["trace_templates"] = rendered["trace_templates"]
+    return JSONResponse(content=content)
+
+
+@router.get("/{run_id}/proof", response_model=RunProof)
+async def get_decision_run_proof(run_id: str) -> RunProof:
+    """Get the receipt proving a run is recorded, unaltered, in the run ledger.
+
+    The proof is checked by hashing the run's leaf up ``path`` to
+    ``merkle_root`` (see ``utils.merkle.verify_proof``).
+    """
+    proof = await executor.run(decision_service.get_run_proof, run_id)
+    if proof is None:
+        raise HTTPException(status_code=404, detail=f"Decision run {run_id} not found")
+    return proof
 
 
 @router.post("/run", response_model=DecisionRun)
-async def run_decision(request: DecisionRunRequest) -> DecisionRun:
-    """Execute a decision run for a claim."""
-    return decision_service.run_decision(request)
+async def run_decision(
+    request: DecisionRunRequest,
+    idempotency_key: str | None = Header(default=None),
+) -> DecisionRun:
+    """Execute a decision run for a claim.
+
+    Retries with the same ``Idempotency-Key`` header (or, without one, an
+    identical request body) within the dedup window return the original run.
+    """
+    try:
+        return await executor.run(decision_service.run_decision, request, idempotency_key)
+    except (IdempotencyConflictError, RunRegenerationError) as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/counterfactual", response_model=CounterfactualRun)
 async def run_counterfactual(request: CounterfactualRequest) -> CounterfactualRun:
     """Execute a counterfactual simulation."""
-    return decision_service.run_counterfactual(request)
+    try:
+        return await executor.run(decision_service.run_counterfactual, request)
+    except RunRegenerationError as e:
+        raise HTTPException(status_code=409, detail=str(e))
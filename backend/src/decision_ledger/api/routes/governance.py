@@ -1,43 +1,81 @@
 """Governance API routes."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
 from decision_ledger.schemas.governance import (
     ChangeProposal,
     ChangeProposalCreate,
     ChangeProposalUpdate,
+    GovernanceEvent,
+    ProposalStatus,
 )
+from decision_ledger.schemas.job import Job
+from decision_ledger.api.executor import get_executor
+from decision_ledger.api.routes import qa
+from decision_ledger.api.services.backfill_service import BackfillService
 from decision_ledger.api.services.governance_service import GovernanceService
 
 router = APIRouter()
-governance_service = GovernanceService()
+governance_service = GovernanceService(qa_service=qa.qa_service)
+backfill_service = BackfillService()
+executor = get_executor()
 
 
 @router.get("/proposals", response_model=list[ChangeProposal])
-async def list_proposals() -> list[ChangeProposal]:
-    """List all change proposals."""
-    return governance_service.list_proposals()
+async def list_proposals(
+    status: ProposalStatus | None = Query(None),
+    actor: str | None = Query(None),
+) -> list[ChangeProposal]:
+    """List change proposals, optionally by status and by an actor who acted on them."""
+    return await executor.run(governance_service.list_proposals, status, actor)
 
 
 @router.get("/proposals/{proposal_id}", response_model=ChangeProposal)
 async def get_proposal(proposal_id: str) -> ChangeProposal:
     """Get a single proposal by ID."""
-    proposal = governance_service.get_proposal(proposal_id)
+    proposal = await executor.run(governance_service.get_proposal, proposal_id)
     if not proposal:
         raise HTTPException(status_code=404, detail=f"Proposal {proposal_id} not found")
     return proposal
 
 
+@router.get("/proposals/{proposal_id}/events", response_model=list[GovernanceEvent])
+async def get_proposal_events(proposal_id: str) -> list[GovernanceEvent]:
+    """Get a proposal's audit trail from the governance log."""
+    events = await executor.run(governance_service.get_proposal_events, proposal_id)
+    if events is None:
+        raise HTTPException(status_code=404, detail=f"Proposal {proposal_id} not found")
+    return events
+
+
 @router.post("/proposals", response_model=ChangeProposal)
 async def create_proposal(request: ChangeProposalCreate) -> ChangeProposal:
     """Create a new change proposal."""
-    return governance_service.create_proposal(request)
+    return await executor.run(governance_service.create_proposal, request)
 
 
 @router.patch("/proposals/{proposal_id}", response_model=ChangeProposal)
 async def update_proposal(proposal_id: str, request: ChangeProposalUpdate) -> ChangeProposal:
-    """Update a proposal (submit, approve, publish)."""
-    proposal = governance_service.update_proposal(proposal_id, request)
+    """Update a proposal (submit, approve, publish, reject)."""
+    try:
+        proposal = await executor.run(governance_service.update_proposal, proposal_id, request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not proposal:
         raise HTTPException(status_code=404, detail=f"Proposal {proposal_id} not found")
     return proposal
+
+
+@router.post("/proposals/{proposal_id}/backfill", response_model=Job, status_code=202)
+async def start_backfill(proposal_id: str, open_claims_only: bool = Query(True)) -> Job:
+    """Re-adjudicate the decisions affected by a published proposal.
+
+    Runs as a background job; follow it at ``/api/qa/jobs/{job_id}/events``.
+    """
+    try:
+        job = await executor.run(backfill_service.start_backfill, proposal_id, open_claims_only)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Proposal {proposal_id} not found")
+    return job
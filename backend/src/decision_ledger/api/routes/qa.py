@@ -1,33 +1,169 @@
 """QA Impact API routes."""
 
-from fastapi import APIRouter
+import asyncio
+from typing import AsyncIterator
 
-from decision_ledger.schemas.qa import QAStudyResult, QACohort, QAProposedChange
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from decision_ledger.config import get_settings
+from decision_ledger.schemas.job import TERMINAL_JOB_STATUSES, Job, QAStudyJobCreate
+from decision_ledger.schemas.qa import (
+    QAStudyResult,
+    QACohort,
+    QACohortOverlap,
+    QAProposedChange,
+    QASimulationResult,
+)
+from decision_ledger.api.executor import get_executor
 from decision_ledger.api.services.qa_service import QAService
 
 router = APIRouter()
 qa_service = QAService()
+executor = get_executor()
 
 
 @router.get("/cohorts", response_model=list[QACohort])
 async def list_cohorts() -> list[QACohort]:
     """List available cohorts for QA simulation."""
-    return qa_service.list_cohorts()
+    return await executor.run(qa_service.list_cohorts)
+
+
+@router.get("/cohorts/{cohort_id}/overlap/{other_cohort_id}", response_model=QACohortOverlap)
+async def compare_cohorts(cohort_id: str, other_cohort_id: str) -> QACohortOverlap:
+    """Compare the claim membership of two cohorts."""
+    try:
+        overlap = await executor.run(qa_service.compare_cohorts, cohort_id, other_cohort_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not overlap:
+        raise HTTPException(
+            status_code=404, detail=f"Cohort {cohort_id} or {other_cohort_id} not found"
+        )
+    return overlap
 
 
 @router.get("/proposed-changes", response_model=list[QAProposedChange])
 async def list_proposed_changes() -> list[QAProposedChange]:
     """List available proposed changes for QA simulation."""
-    return qa_service.list_proposed_changes()
+    return await executor.run(qa_service.list_proposed_changes)
 
 
 @router.get("/results", response_model=list[QAStudyResult])
 async def list_results() -> list[QAStudyResult]:
     """List all pre-computed QA study results."""
-    return qa_service.list_results()
+    return await executor.run(qa_service.list_results)
 
 
 @router.get("/results/{cohort_id}/{proposal_id}", response_model=QAStudyResult)
 async def get_result(cohort_id: str, proposal_id: str) -> QAStudyResult:
     """Get a specific QA study result."""
-    return qa_service.get_result(cohort_id, proposal_id)
+    try:
+        result = await executor.run(qa_service.get_result, cohort_id, proposal_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not result:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No result found for cohort {cohort_id} and proposal {proposal_id}",
+        )
+    return result
+
+
+@router.get("/simulations/{cohort_id}/{proposal_id}", response_model=QASimulationResult)
+async def simulate(
+    cohort_id: str,
+    proposal_id: str,
+    draws: int = Query(1000, ge=1, le=100_000),
+    seed: int = Query(0, ge=0),
+) -> QASimulationResult:
+    """Simulate payout distributions under uncertain assumptions."""
+    try:
+        result = await executor.run(qa_service.simulate, cohort_id, proposal_id, draws, seed)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not result:
+        raise HTTPException(
+            status_code=404, detail=f"Cohort {cohort_id} or proposal {proposal_id} not found"
+        )
+    return result
+
+
+@router.post("/jobs", response_model=Job, status_code=202)
+async def submit_study_job(request: QAStudyJobCreate) -> Job:
+    """Run a QA study as a background job."""
+    try:
+        job = await executor.run(qa_service.submit_study_job, request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not job:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Cohort {request.cohort_id} or proposal {request.proposal_id} not found",
+        )
+    return job
+
+
+@router.get("/jobs", response_model=list[Job])
+async def list_jobs(kind: str | None = None) -> list[Job]:
+    """List background jobs, newest first."""
+    return await executor.run(qa_service.jobs.list_jobs, kind)
+
+
+@router.get("/jobs/{job_id}", response_model=Job)
+async def get_job(job_id: str) -> Job:
+    """Get a background job's status, progress and result."""
+    job = await executor.run(qa_service.jobs.get, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.post("/jobs/{job_id}/cancel", response_model=Job)
+async def cancel_job(job_id: str) -> Job:
+    """Cancel a background job; a running job stops at its next progress report."""
+    job = await executor.run(qa_service.jobs.cancel, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.post("/jobs/{job_id}/resume", response_model=Job)
+async def resume_job(job_id: str) -> Job:
+    """Resume a cancelled or failed job from its last checkpoint."""
+    job = await executor.run(qa_service.jobs.resume, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.get("/jobs/{job_id}/events")
+async def job_events(job_id: str) -> StreamingResponse:
+    """Stream a job's progress as server-sent events.
+
+    A ``progress`` event is sent whenever the job changes, and a final event
+    named after its terminal status (``succeeded``, ``failed`` or
+    ``cancelled``) ends the stream.
+    """
+    job = await executor.run(qa_service.jobs.get, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    poll_seconds = get_settings().job_events_poll_seconds
+
+    async def events() -> AsyncIterator[str]:
+        current: Job | None = job
+        last_update = None
+        while current is not None:
+            terminal = current.status in TERMINAL_JOB_STATUSES
+            if current.updated_at != last_update or terminal:
+                last_update = current.updated_at
+                event = current.status.value.lower() if terminal else "progress"
+                yield f"event: {event}\ndata: {current.model_dump_json()}\n\n"
+            if terminal:
+                return
+            await asyncio.sleep(poll_seconds)
+            current = await executor.run(qa_service.jobs.get, job_id)
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
+    )
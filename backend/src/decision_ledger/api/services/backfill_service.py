@@ -0,0 +1,192 @@
+"""Re-adjudication backfill business logic service."""
+
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any
+
+from decision_ledger.api.executor import get_batch_executor
+from decision_ledger.api.jobs import (
+    JobCancelledError,
+    JobContext,
+    JobInterruptedError,
+    get_job_runner,
+)
+from decision_ledger.config import get_settings
+from decision_ledger.core.backfill import PublishedChange, readjudicate_batch
+from decision_ledger.core.catalog_registry import get_catalog_registry
+from decision_ledger.core.engine import DecisionEngine
+from decision_ledger.core.catalog_types import Catalog
+from decision_ledger.core.qa_engine import DELTA_TOLERANCE
+from decision_ledger.core.qa_stats import DeltaAggregate
+from decision_ledger.schemas.claim import Claim, ClaimStatus
+from decision_ledger.schemas.decision import DecisionRun, StoredDecisionRun
+from decision_ledger.schemas.governance import BackfillResult, ProposalStatus
+from decision_ledger.schemas.job import Job
+from decision_ledger.storage.filesystem import get_file_storage
+from decision_ledger.storage.governance_log import get_governance_log
+from decision_ledger.storage.sqlite import get_state_store
+from decision_ledger.utils.hashing import content_hash
+from decision_ledger.utils.rate_limit import TokenBucket
+
+BACKFILL_JOB = "backfill"
+
+
+class BackfillService:
+    """Service for re-issuing decisions affected by a published change."""
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        self.storage = get_file_storage()
+        self.state = get_state_store()
+        self.governance_log = get_governance_log()
+        self.catalogs = get_catalog_registry()
+        self.engine = DecisionEngine()
+        self.executor = get_batch_executor()
+        self.batch_size = settings.backfill_batch_size
+        self.max_pending = settings.backfill_max_pending_batches
+        self.rate_limiter = TokenBucket(settings.backfill_max_runs_per_second)
+        self.jobs = get_job_runner()
+        self.jobs.register(BACKFILL_JOB, self._run_backfill)
+
+    def start_backfill(self, proposal_id: str, open_claims_only: bool = True) -> Job | None:
+        """Re-adjudicate, in the background, the runs a published proposal affects.
+
+        Args:
+            proposal_id: A published proposal with a catalog change
+            open_claims_only: Skip claims that are no longer open
+
+        Returns:
+            The queued job, or None if the proposal does not exist
+
+        Raises:
+            ValueError: If the proposal has no published catalog change
+        """
+        proposal = self.governance_log.get(proposal_id)
+        if proposal is None:
+            return None
+        if proposal.status != ProposalStatus.PUBLISHED or not proposal.has_change:
+            raise ValueError(f"Proposal {proposal_id} has no published catalog change")
+        return self.jobs.submit(
+            BACKFILL_JOB, {"proposal_id": proposal_id, "open_claims_only": open_claims_only}
+        )
+
+    def _run_backfill(self, job: Job, context: JobContext) -> dict[str, Any]:
+        """Job handler for backfills.
+
+        Affected runs are paged in run ID order. Each page is re-adjudicated
+        as one batch (on the batch pool when configured, with up to
+        ``max_pending`` batches in flight) and its new runs are written in
+        the same transaction as the checkpoint, so a resumed job neither
+        skips nor duplicates runs.
+        """
+        proposal_id = job.params["proposal_id"]
+        open_claims_only = job.params["open_claims_only"]
+        proposal = self.governance_log.get(proposal_id)
+        if proposal is None or not proposal.has_change:
+            raise ValueError(f"Proposal {proposal_id} has no published catalog change")
+        change = PublishedChange(
+            proposal_id, proposal.change_type, proposal.target_item_id, proposal.to_value
+        )
+        refs = [change.target_item_id]
+        catalogs = self.catalogs.snapshot(self.storage).effective
+        claims = {claim.claim_id: claim for claim in self.storage.load_claims()}
+        total = self.state.count_latest_runs_depending_on(refs, job.created_at)
+
+        checkpoint = context.checkpoint or {}
+        after_run_id = checkpoint.get("after_run_id", "")
+        counts = checkpoint.get("counts", {"processed": 0, "reissued": 0, "skipped": 0})
+        aggregate = (
+            DeltaAggregate.from_state(checkpoint["aggregate"], tolerance=DELTA_TOLERANCE)
+            if checkpoint
+            else DeltaAggregate(tolerance=DELTA_TOLERANCE)
+        )
+        started_at = time.monotonic() - checkpoint.get("elapsed_seconds", 0.0)
+        context.report(counts["processed"], total, force=True)
+
+        def commit(
+            pending: tuple[Future | list[DecisionRun], list[StoredDecisionRun], int],
+        ) -> None:
+            result, page, skipped = pending
+            new_runs = result.result() if isinstance(result, Future) else result
+            originals = {run.run_id: run for run in page}
+            for new_run in new_runs:
+                original = originals[new_run.supersedes_run_id]
+                aggregate.add(
+                    new_run.claim_id,
+                    new_run.outcome.payout_total - original.payout_total,
+                )
+            counts["processed"] += len(page)
+            counts["reissued"] += len(new_runs)
+            counts["skipped"] += skipped
+            stop: JobCancelledError | JobInterruptedError | None = None
+            with self.state.transaction():
+                for new_run in new_runs:
+                    self.state.save_run(
+                        new_run, claim_hash=content_hash(claims[new_run.claim_id])
+                    )
+                try:
+                    context.save_checkpoint(
+                        {
+                            "after_run_id": page[-1].run_id,
+                            "counts": counts,
+                            "aggregate": aggregate.to_state(),
+                            "elapsed_seconds": time.monotonic() - started_at,
+                        },
+                        counts["processed"],
+                        total,
+                    )
+                except (JobCancelledError, JobInterruptedError) as e:
+                    if context.lease_lost:
+                        raise  # Roll back: the runner now owning the job redoes the batch
+                    # Raise after the batch is committed, not inside the transaction
+                    stop = e
+            if stop is not None:
+                raise stop
+
+        in_flight: deque[tuple[Future | list[DecisionRun], list[StoredDecisionRun], int]] = deque()
+        cursor = after_run_id
+        while True:
+            page = self.state.latest_runs_depending_on(
+                refs, job.created_at, cursor, self.batch_size
+            )
+            if not page:
+                break
+            cursor = page[-1].run_id
+            items: list[tuple[StoredDecisionRun, Claim, Catalog]] = []
+            for run in page:
+                claim = claims.get(run.claim_id)
+                compiled = (
+                    catalogs.lookup(claim.jurisdiction, claim.product_line, claim.loss_date)
+                    if claim
+                    else None
+                )
+                if compiled is None or (open_claims_only and claim.status != ClaimStatus.READY):
+                    continue
+                items.append((run, claim, compiled.catalog))
+            self.rate_limiter.acquire(len(items))
+            if self.executor is None:
+                result: Future | list[DecisionRun] = readjudicate_batch(self.engine, items, change)
+            else:
+                result = self.executor.submit(readjudicate_batch, self.engine, items, change)
+            in_flight.append((result, page, len(page) - len(items)))
+            while len(in_flight) > self.max_pending:
+                commit(in_flight.popleft())
+        while in_flight:
+            commit(in_flight.popleft())
+
+        elapsed = time.monotonic() - started_at
+        impacted = aggregate.impacted
+        return BackfillResult(
+            proposal_id=proposal_id,
+            runs_selected=total,
+            runs_processed=counts["processed"],
+            runs_reissued=counts["reissued"],
+            runs_skipped=counts["skipped"],
+            runs_changed=impacted.count,
+            total_delta_payout=round(impacted.total, 2),
+            delta_stats=aggregate.delta_stats(),
+            top_changed_claims=aggregate.impacted_claims(),
+            elapsed_seconds=round(elapsed, 3),
+            runs_per_second=round(counts["processed"] / elapsed, 1) if elapsed > 0 else 0.0,
+        ).model_dump(mode="json")
@@ -1,22 +1,25 @@
 """Catalog business logic service."""
 
-from decision_ledger.schemas.catalog import InterpretationSet, AssumptionSet
-from decision_ledger.storage.filesystem import FileStorage
+from decision_ledger.core.catalog_diff import diff_sets
+from decision_ledger.core.catalog_registry import get_catalog_registry
+from decision_ledger.schemas.catalog import CatalogDiff, InterpretationSet, AssumptionSet
+from decision_ledger.storage.filesystem import get_file_storage
 
 
 class CatalogService:
     """Service for managing interpretation and assumption catalogs."""
 
     def __init__(self) -> None:
-        self.storage = FileStorage()
+        self.storage = get_file_storage()
+        self.catalogs = get_catalog_registry()
 
     def list_interpretation_sets(
         self,
         jurisdiction: str | None = None,
         product_line: str | None = None,
     ) -> list[InterpretationSet]:
-        """List all interpretation sets with optional filters."""
-        sets = self.storage.load_interpretation_sets()
+        """List all interpretation sets, including published versions, with optional filters."""
+        sets = list(self.catalogs.snapshot(self.storage).interpretation_sets.values())
 
         if jurisdiction:
             sets = [s for s in sets if s.jurisdiction == jurisdiction]
@@ -27,15 +30,15 @@ class CatalogService:
 
     def get_interpretation_set(self, set_id: str) -> InterpretationSet | None:
         """Get a single interpretation set by ID."""
-        return self.storage.get_interpretation_set(set_id)
+        return self.catalogs.snapshot(self.storage).interpretation_sets.get(set_id)
 
     def list_assumption_sets(
         self,
         jurisdiction: str | None = None,
         product_line: str | None = None,
     ) -> list[AssumptionSet]:
-        """List all assumption sets with optional filters."""
-        sets = self.storage.load_assumption_sets()
+        """List all assumption sets, including published versions, with optional filters."""
+        sets = list(self.catalogs.snapshot(self.storage).assumption_sets.values())
 
         if jurisdiction:
             sets = [s for s in sets if s.jurisdiction == jurisdiction]
@@ -46,4 +49,24 @@ class CatalogService:
 
     def get_assumption_set(self, set_id: str) -> AssumptionSet | None:
         """Get a single assumption set by ID."""
-        return self.storage.get_assumption_set(set_id)
+        return self.catalogs.snapshot(self.storage).assumption_sets.get(set_id)
+
+    def diff(self, from_set_id: str, to_set_id: str) -> CatalogDiff | None:
+        """Structural diff between two interpretation or two assumption set versions.
+
+        Returns:
+            The diff, or None if either set does not exist
+
+        Raises:
+            ValueError: If one set is an interpretation set and the other an assumption set
+        """
+        snapshot = self.catalogs.snapshot(self.storage)
+        before = snapshot.interpretation_sets.get(from_set_id) or snapshot.assumption_sets.get(
+            from_set_id
+        )
+        after = snapshot.interpretation_sets.get(to_set_id) or snapshot.assumption_sets.get(
+            to_set_id
+        )
+        if before is None or after is None:
+            return None
+        return diff_sets(before, after, self.catalogs.trees)
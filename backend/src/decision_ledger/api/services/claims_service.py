@@ -1,14 +1,14 @@
 """Claims business logic service."""
 
 from decision_ledger.schemas.claim import Claim, ClaimSummary
-from decision_ledger.storage.filesystem import FileStorage
+from decision_ledger.storage.filesystem import get_file_storage
 
 
 class ClaimsService:
     """Service for managing claims data."""
 
     def __init__(self) -> None:
-        self.storage = FileStorage()
+        self.storage = get_file_storage()
 
     def list_claims(
         self,
@@ -1,50 +1,314 @@
 """Decision execution business logic service."""
 
+import threading
+from collections import OrderedDict
 from datetime import datetime
-import uuid
+from typing import Any
 
 from decision_ledger.schemas.decision import (
     DecisionRun,
     DecisionRunRequest,
+    DecisionRunSummary,
+    CompactTraceStep,
     CounterfactualRequest,
     CounterfactualRun,
+    DecisionDependencies,
+    DecisionOutcome,
+    RunProof,
+    StoredDecisionRun,
+    TraceEncoding,
+    TraceStep,
+    TraceStepTemplate,
 )
+from decision_ledger.api.executor import get_engine_executor
+from decision_ledger.config import get_settings
+from decision_ledger.core.catalog_registry import get_catalog_registry
 from decision_ledger.core.engine import DecisionEngine
-from decision_ledger.storage.filesystem import FileStorage
+from decision_ledger.core.resolution import trigger_map
+from decision_ledger.core.run_codec import RunRegenerationError, expand_run
+from decision_ledger.core.trace_codec import TraceStepPool, encode_trace
+from decision_ledger.utils.hashing import content_hash
+from decision_ledger.utils.ids import new_id
+from decision_ledger.utils.projection import project, validate_fields
+from decision_ledger.utils.singleflight import SingleFlight
+from decision_ledger.storage.filesystem import get_file_storage
+from decision_ledger.storage.idempotency import IdempotencyConflictError, IdempotencyStore
+from decision_ledger.storage.sqlite import get_state_store
+
+
+def needs_full_runs(fields: list[str] | None, trace: TraceEncoding) -> bool:
+    """Whether a listing with ``fields`` and ``trace`` needs regenerated runs.
+
+    Only the payout breakdown, trace and dependencies are regenerated; every
+    other field is served from the stored run.
+    """
+    if fields is None:
+        return trace == TraceEncoding.COMPACT
+    return any(
+        path == "outcome"
+        or path.startswith("outcome.payout_breakdown")
+        or path.split(".", 1)[0] in ("trace_steps", "dependencies")
+        for path in fields
+    )
+
+
+
+def _split_compact_fields(fields: list[str]) -> tuple[list[str], list[str] | None]:
+    """Split a projection between compact steps and their templates.
+
+    Returns:
+        The run projection, with template fields replaced by the step's
+        ``template_id``, and the template projection (None if no template
+        field was requested)
+
+    Raises:
+        ValueError: If a ``trace_steps`` sub-field exists on neither model
+    """
+    run_fields: list[str] = []
+    template_fields: list[str] = []
+    for path in fields:
+        head, _, rest = path.partition(".")
+        name = rest.split(".", 1)[0]
+        if head != "trace_steps" or not rest or name in CompactTraceStep.model_fields:
+            run_fields.append(path)
+        elif name in TraceStepTemplate.model_fields:
+            run_fields.append("trace_steps.template_id")
+            template_fields.append(rest)
+        else:
+            raise ValueError(f"Unknown fields: {path}")
+    if not template_fields:
+        return run_fields, None
+    return run_fields, ["template_id", *template_fields]
 
 
 class DecisionService:
     """Service for executing decisions and counterfactuals."""
 
     def __init__(self) -> None:
-        self.storage = FileStorage()
+        self.storage = get_file_storage()
+        self.catalogs = get_catalog_registry()
         self.engine = DecisionEngine()
-        self._runs: dict[str, DecisionRun] = {}
+        self.engine_executor = get_engine_executor()
+        self.state = get_state_store()
+        settings = get_settings()
+        # Idempotency key -> (request fingerprint, run_id), shared by all workers
+        self.idempotency = IdempotencyStore(
+            self.state,
+            window_seconds=settings.idempotency_window_seconds,
+            max_entries=settings.idempotency_max_entries,
+        )
+        self._counterfactuals: SingleFlight[CounterfactualRun] = SingleFlight()
+        # Full runs regenerated from their stored form, least recently used first
+        self._runs: OrderedDict[str, DecisionRun] = OrderedDict()
+        self._runs_lock = threading.Lock()
+        self._max_cached_runs = settings.run_cache_entries
+        self._regenerations: SingleFlight[DecisionRun] = SingleFlight()
+        # Identical trace steps of cached runs are held once
+        self._trace_steps = TraceStepPool()
 
-    def list_runs(self, claim_id: str | None = None) -> list[DecisionRun]:
-        """List all decision runs, optionally filtered by claim."""
-        runs = list(self._runs.values())
-        if claim_id:
-            runs = [r for r in runs if r.claim_id == claim_id]
-        return sorted(runs, key=lambda r: r.timestamp, reverse=True)
+    def _run_engine(
+        self, **kwargs: Any
+    ) -> tuple[DecisionOutcome, list[TraceStep], DecisionDependencies]:
+        """Run the engine inline or on the configured engine pool."""
+        if self.engine_executor is None:
+            return self.engine.run_with_dependencies(**kwargs)
+        return self.engine_executor.call(self.engine.run_with_dependencies, **kwargs)
+
+    def list_runs(
+        self,
+        claim_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+        full: bool = False,
+    ) -> list[DecisionRun | DecisionRunSummary]:
+        """List decision runs, newest first, optionally filtered by claim and time.
+
+        Runs are listed as summaries from their stored totals. With ``full``
+        they are regenerated; a run that can no longer be regenerated is
+        listed as a summary marked ``unavailable``.
+
+        Args:
+            claim_id: Only this claim's runs
+            since: Only runs created at or after this time
+            until: Only runs created before this time
+            cursor: Only runs older than this run (the previous page's last)
+            limit: Page size (None = all)
+            full: Regenerate the payout breakdown, trace and dependencies
+
+        Raises:
+            ValueError: If ``cursor`` is not a stored run
+        """
+        stored_runs = self.state.list_runs(
+            claim_id=claim_id, since=since, until=until, before_run_id=cursor, limit=limit
+        )
+        if not full:
+            return [stored.summary() for stored in stored_runs]
+        runs: list[DecisionRun | DecisionRunSummary] = []
+        for stored in stored_runs:
+            try:
+                runs.append(self._expand(stored))
+            except RunRegenerationError as e:
+                runs.append(stored.summary(unavailable=str(e)))
+        return runs
 
     def get_run(self, run_id: str) -> DecisionRun | None:
-        """Get a single decision run by ID."""
-        return self._runs.get(run_id)
+        """Get a single decision run by ID.
 
-    def run_decision(self, request: DecisionRunRequest) -> DecisionRun:
-        """Execute a decision run for a claim."""
+        Raises:
+            RunRegenerationError: If the run can no longer be regenerated
+        """
+        stored = self.state.get_run(run_id)
+        return self._expand(stored) if stored is not None else None
+
+    def _expand(self, stored: StoredDecisionRun) -> DecisionRun:
+        """The full run, regenerated once and then served from the run cache."""
+        with self._runs_lock:
+            run = self._runs.get(stored.run_id)
+            if run is not None:
+                self._runs.move_to_end(stored.run_id)
+                return run
+        run = self._regenerations.do(stored.run_id, lambda: self._regenerate(stored))
+        self._remember(run)
+        return run
+
+    def _regenerate(self, stored: StoredDecisionRun) -> DecisionRun:
+        catalogs = self.catalogs.snapshot(self.storage)
+        catalog = (
+            catalogs.interpretation_sets.get(stored.inputs.interpretation_set_id),
+            catalogs.assumption_sets.get(stored.inputs.assumption_set_id),
+        )
+        return expand_run(self.engine, stored, self.storage.get_claim(stored.claim_id), catalog)
+
+    def _remember(self, run: DecisionRun) -> None:
+        run.trace_steps = self._trace_steps.share(run.trace_steps)
+        with self._runs_lock:
+            self._runs[run.run_id] = run
+            self._runs.move_to_end(run.run_id)
+            while len(self._runs) > self._max_cached_runs:
+                self._runs.popitem(last=False)
+
+    def get_run_proof(self, run_id: str) -> RunProof | None:
+        """Get the ledger inclusion proof of a decision run."""
+        return self.state.run_proof(run_id)
+
+    def render_runs(
+        self,
+        runs: list[DecisionRun | DecisionRunSummary],
+        fields: list[str] | None = None,
+        trace: TraceEncoding = TraceEncoding.FULL,
+    ) -> dict[str, Any]:
+        """Serialize runs with an optional field projection and trace encoding.
+
+        Args:
+            runs: Runs to serialize
+            fields: Dotted field paths to keep, or None for all fields
+            trace: Trace encoding; COMPACT replaces repeated step content
+                with references into a shared ``trace_templates`` map
+
+        Returns:
+            Dict with ``runs`` and, for compact traces, ``trace_templates``
+
+        With COMPACT, a projected step field that lives on the template
+        (``trace_steps.label``) keeps each step's ``template_id`` and projects
+        ``trace_templates`` to that field instead.
+
+        Raises:
+            ValueError: If ``fields`` references an unknown field
+        """
+        template_fields: list[str] | None = None
+        if fields is not None:
+            validate_fields(fields, {*DecisionRun.model_fields, *DecisionRunSummary.model_fields})
+            if trace == TraceEncoding.COMPACT:
+                fields, template_fields = _split_compact_fields(fields)
+
+        with_trace = fields is None or any(f.split(".", 1)[0] == "trace_steps" for f in fields)
+        templates: dict[str, TraceStepTemplate] = {}
+        rendered: list[dict[str, Any]] = []
+        for run in runs:
+            data = run.model_dump(mode="json", exclude={"trace_steps"})
+            if with_trace and isinstance(run, DecisionRun):
+                if trace == TraceEncoding.COMPACT:
+                    steps = encode_trace(run.trace_steps, templates)
+                    data["trace_steps"] = [
+                        s.model_dump(mode="json", exclude_none=True) for s in steps
+                    ]
+                else:
+                    data["trace_steps"] = [s.model_dump(mode="json") for s in run.trace_steps]
+            rendered.append(project(data, fields) if fields is not None else data)
+
+        result: dict[str, Any] = {"runs": rendered}
+        if trace == TraceEncoding.COMPACT:
+            result["trace_templates"] = {
+                tid: project(t.model_dump(mode="json"), template_fields)
+                if template_fields is not None
+                else t.model_dump(mode="json")
+                for tid, t in templates.items()
+            }
+        return result
+
+    def run_decision(
+        self, request: DecisionRunRequest, idempotency_key: str | None = None
+    ) -> DecisionRun:
+        """Execute a decision run for a claim, deduplicating retries.
+
+        A repeated submission within the idempotency window returns the
+        existing run instead of re-running the engine. Without an explicit
+        key, the canonical hash of the request is used as the key.
+
+        Raises:
+            IdempotencyConflictError: If ``idempotency_key`` was already used
+                for a different request
+            ValueError: If the claim or its catalog is missing, or a role
+                resolved an assumption with an alternative it may not choose
+        """
+        fingerprint = content_hash(request)
+        key = idempotency_key or fingerprint
+
+        run_id = self.idempotency.reserve(key, fingerprint)
+        if run_id is not None:
+            existing = self.get_run(run_id)
+            if existing is not None:
+                return existing
+        try:
+            return self._execute_decision(request, key)
+        except BaseException:
+            self.idempotency.release(key)
+            raise
+
+    def _execute_decision(self, request: DecisionRunRequest, key: str) -> DecisionRun:
+        """Run the engine for a request and store the resulting run under ``key``."""
         # Get claim data
         claim = self.storage.get_claim(request.claim_id)
         if not claim:
             raise ValueError(f"Claim {request.claim_id} not found")
 
-        # Get interpretation and assumption sets
-        interpretation_set = self.storage.get_interpretation_set(request.interpretation_set_id)
-        assumption_set = self.storage.get_assumption_set(request.assumption_set_id)
+        # Get interpretation and assumption sets, including published versions
+        catalogs = self.catalogs.snapshot(self.storage)
+        interpretation_set_id = request.interpretation_set_id
+        assumption_set_id = request.assumption_set_id
+        if interpretation_set_id is None or assumption_set_id is None:
+            in_force = catalogs.effective.lookup(
+                claim.jurisdiction, claim.product_line, claim.loss_date
+            )
+            if in_force is None:
+                raise ValueError(
+                    f"No approved catalog in force for claim {claim.claim_id} "
+                    f"on {claim.loss_date}"
+                )
+            if interpretation_set_id is None and in_force.interpretation_set is not None:
+                interpretation_set_id = in_force.interpretation_set.interpretation_set_id
+            if assumption_set_id is None and in_force.assumption_set is not None:
+                assumption_set_id = in_force.assumption_set.assumption_set_id
+        interpretation_set = catalogs.interpretation_sets.get(interpretation_set_id or "")
+        assumption_set = catalogs.assumption_sets.get(assumption_set_id or "")
+        triggers = trigger_map(assumption_set)
+        for resolution in request.resolved_assumptions:
+            triggers.check_resolution(resolution)
 
         # Run the decision engine
-        outcome, trace_steps = self.engine.run(
+        outcome, trace_steps, dependencies = self._run_engine(
             claim=claim,
             interpretation_set=interpretation_set,
             assumption_set=assumption_set,
@@ -53,27 +317,41 @@ class DecisionService:
         )
 
         # Create the decision run
+        now = datetime.now()
         run = DecisionRun(
-            run_id=f"RUN-{uuid.uuid4().hex[:8].upper()}",
+            run_id=new_id("RUN", now),
             claim_id=request.claim_id,
-            timestamp=datetime.now(),
-            interpretation_set_id=request.interpretation_set_id,
+            timestamp=now,
+            interpretation_set_id=interpretation_set_id or "unknown",
             interpretation_set_version=interpretation_set.version if interpretation_set else "unknown",
-            assumption_set_id=request.assumption_set_id,
+            assumption_set_id=assumption_set_id or "unknown",
             assumption_set_version=assumption_set.version if assumption_set else "unknown",
             resolved_assumptions=request.resolved_assumptions,
             selected_interpretations=request.selected_interpretations,
             outcome=outcome,
             trace_steps=trace_steps,
             generated_by_role=request.role,
+            dependencies=dependencies,
         )
 
-        # Store the run
-        self._runs[run.run_id] = run
+        # Store the run and record it for the idempotency key
+        with self.state.transaction():
+            self.state.save_run(run, claim_hash=content_hash(claim))
+            self.idempotency.complete(key, run.run_id)
+        self._remember(run)
         return run
 
     def run_counterfactual(self, request: CounterfactualRequest) -> CounterfactualRun:
-        """Execute a counterfactual simulation."""
+        """Execute a counterfactual simulation.
+
+        Concurrent identical requests share a single engine run.
+        """
+        return self._counterfactuals.do(
+            content_hash(request), lambda: self._compute_counterfactual(request)
+        )
+
+    def _compute_counterfactual(self, request: CounterfactualRequest) -> CounterfactualRun:
+        """Run the engine with the requested change applied to the base run."""
         base_run = self.get_run(request.base_run_id)
         if not base_run:
             raise ValueError(f"Base run {request.base_run_id} not found")
@@ -81,9 +359,10 @@ class DecisionService:
         # Get claim data
         claim = self.storage.get_claim(base_run.claim_id)
 
-        # Get interpretation and assumption sets
-        interpretation_set = self.storage.get_interpretation_set(base_run.interpretation_set_id)
-        assumption_set = self.storage.get_assumption_set(base_run.assumption_set_id)
+        # Get interpretation and assumption sets, including published versions
+        catalogs = self.catalogs.snapshot(self.storage)
+        interpretation_set = catalogs.interpretation_sets.get(base_run.interpretation_set_id)
+        assumption_set = catalogs.assumption_sets.get(base_run.assumption_set_id)
 
         # Apply the change to create modified inputs
         resolved_assumptions = list(base_run.resolved_assumptions)
@@ -107,7 +386,7 @@ class DecisionService:
                     break
 
         # Run the engine with modified inputs
-        new_outcome, new_trace = self.engine.run(
+        new_outcome, new_trace, _ = self._run_engine(
             claim=claim,
             interpretation_set=interpretation_set,
             assumption_set=assumption_set,
@@ -1,67 +1,183 @@
 """Governance business logic service."""
 
 from datetime import datetime
-import uuid
+from typing import Any
 
+from decision_ledger.api.services.qa_service import QAService
+from decision_ledger.core.catalog_registry import (
+    PreparedPublish,
+    StalePublishError,
+    get_catalog_registry,
+)
 from decision_ledger.schemas.governance import (
     ChangeProposal,
     ChangeProposalCreate,
     ChangeProposalUpdate,
+    GovernanceEvent,
     ProposalStatus,
 )
+from decision_ledger.storage.filesystem import get_file_storage
+from decision_ledger.storage.governance_log import (
+    PROPOSAL_APPROVED,
+    PROPOSAL_CREATED,
+    PROPOSAL_PUBLISHED,
+    PROPOSAL_REJECTED,
+    PROPOSAL_SUBMITTED,
+    get_governance_log,
+)
+from decision_ledger.storage.sqlite import get_state_store
+from decision_ledger.utils.ids import new_id
+
+# Update action -> (logged event, status it applies to, resulting status)
+_ACTIONS: dict[str, tuple[str, ProposalStatus, ProposalStatus]] = {
+    "submit": (PROPOSAL_SUBMITTED, ProposalStatus.DRAFT, ProposalStatus.PENDING_APPROVAL),
+    "approve": (PROPOSAL_APPROVED, ProposalStatus.PENDING_APPROVAL, ProposalStatus.APPROVED),
+    "publish": (PROPOSAL_PUBLISHED, ProposalStatus.APPROVED, ProposalStatus.PUBLISHED),
+    "reject": (PROPOSAL_REJECTED, ProposalStatus.PENDING_APPROVAL, ProposalStatus.REJECTED),
+}
 
 
 class GovernanceService:
-    """Service for managing change proposals."""
+    """Service for managing change proposals.
 
-    def __init__(self) -> None:
-        self._proposals: dict[str, ChangeProposal] = {}
+    Proposals are never updated in place: every action is appended to the
+    governance log, and reads come from the log's projection.
+    """
 
-    def list_proposals(self) -> list[ChangeProposal]:
-        """List all change proposals."""
-        return sorted(
-            self._proposals.values(),
-            key=lambda p: p.created_at,
-            reverse=True,
-        )
+    def __init__(self, qa_service: QAService | None = None) -> None:
+        self.state = get_state_store()
+        self.log = get_governance_log()
+        self.qa_service = qa_service or QAService()
+        self.storage = get_file_storage()
+        self.catalogs = get_catalog_registry()
+
+    def list_proposals(
+        self, status: ProposalStatus | None = None, actor: str | None = None
+    ) -> list[ChangeProposal]:
+        """List change proposals, optionally by status and by an actor involved."""
+        return self.log.list_proposals(status=status, actor=actor)
 
     def get_proposal(self, proposal_id: str) -> ChangeProposal | None:
         """Get a single proposal by ID."""
-        return self._proposals.get(proposal_id)
+        return self.log.get(proposal_id)
+
+    def get_proposal_events(self, proposal_id: str) -> list[GovernanceEvent] | None:
+        """Get a proposal's audit trail, or None if the proposal does not exist."""
+        if self.log.get(proposal_id) is None:
+            return None
+        return self.log.events(proposal_id)
 
     def create_proposal(self, request: ChangeProposalCreate) -> ChangeProposal:
         """Create a new change proposal."""
+        now = datetime.now()
         proposal = ChangeProposal(
-            proposal_id=f"PROP-{uuid.uuid4().hex[:8].upper()}",
+            proposal_id=new_id("PROP", now),
             title=request.title,
             proposal_type=request.proposal_type,
             proposed_version=request.proposed_version,
             rationale=request.rationale,
+            jurisdiction=request.jurisdiction,
+            product_line=request.product_line,
+            change_type=request.change_type,
+            target_item_id=request.target_item_id,
+            to_value=request.to_value,
             qa_impact_summary=request.qa_impact_summary,
             status=ProposalStatus.DRAFT,
-            created_at=datetime.now(),
+            created_at=now,
             created_by=request.created_by,
         )
-        self._proposals[proposal.proposal_id] = proposal
+        self.log.append(
+            proposal.proposal_id,
+            PROPOSAL_CREATED,
+            request.created_by,
+            proposal.model_dump(mode="json"),
+        )
         return proposal
 
     def update_proposal(
         self, proposal_id: str, request: ChangeProposalUpdate
     ) -> ChangeProposal | None:
-        """Update a proposal status."""
-        proposal = self._proposals.get(proposal_id)
-        if not proposal:
-            return None
+        """Apply an action (submit, approve, publish or reject) to a proposal.
 
-        if request.action == "submit":
-            proposal.status = ProposalStatus.PENDING_APPROVAL
-        elif request.action == "approve":
-            proposal.status = ProposalStatus.APPROVED
-            proposal.approved_at = datetime.now()
-            proposal.approved_by = request.actor_role
-        elif request.action == "publish":
-            proposal.status = ProposalStatus.PUBLISHED
-            proposal.published_at = datetime.now()
-            # TODO: Update active interpretation/assumption sets
+        A draft is submitted for approval, a pending proposal approved or
+        rejected, and an approved one published. The proposal's status is
+        checked under the write lock, so concurrent requests cannot both
+        apply an action to it.
 
-        return proposal
+        For a proposal that names a catalog change, submitting starts a
+        background QA impact study of it, and publishing creates the new
+        catalog version and makes it active in the same transaction as the
+        logged event. The version is derived and compiled before that
+        transaction, and again if another publish commits first.
+
+        Raises:
+            ValueError: If the action is unknown or not allowed in the
+                proposal's status, or the proposal's change cannot be published
+        """
+        if request.action not in _ACTIONS:
+            raise ValueError(f"Unknown proposal action: {request.action}")
+        while True:
+            prepared = None
+            if request.action == "publish":
+                proposal = self.log.get(proposal_id)
+                if proposal and proposal.status == ProposalStatus.APPROVED and proposal.has_change:
+                    prepared = self._prepare_publish(proposal)
+            try:
+                return self._apply_action(proposal_id, request, prepared)
+            except StalePublishError:
+                continue
+
+    def _apply_action(
+        self,
+        proposal_id: str,
+        request: ChangeProposalUpdate,
+        prepared: PreparedPublish | None,
+    ) -> ChangeProposal | None:
+        """Check the proposal's status and log the action, in one transaction.
+
+        Args:
+            prepared: The proposal's catalog version for ``publish``, if
+                already prepared; it is prepared under the lock otherwise
+        """
+        event, required, status = _ACTIONS[request.action]
+        changes: dict[str, Any] = {"status": status}
+        with self.state.transaction():
+            proposal = self.log.load(proposal_id)
+            if proposal is None:
+                return None
+            if proposal.status != required:
+                raise ValueError(
+                    f"Cannot {request.action} proposal {proposal_id}: it is "
+                    f"{proposal.status.value}, not {required.value}"
+                )
+            if request.action == "submit":
+                if proposal.has_change:
+                    # Logs the QA impact summaries once the studies finish
+                    job = self.qa_service.submit_proposal_impact(proposal)
+                    changes["qa_impact_job_id"] = job.job_id
+            elif request.action == "approve":
+                changes["approved_at"] = datetime.now()
+                changes["approved_by"] = request.actor_role
+            elif request.action == "publish":
+                if proposal.has_change:
+                    changes["published_set_id"], changes["catalog_generation"] = (
+                        self.catalogs.commit_publish(
+                            prepared or self._prepare_publish(proposal), proposal_id
+                        )
+                    )
+                changes["published_at"] = datetime.now()
+            self.log.append(proposal_id, event, request.actor_role, changes)
+
+        return self.log.get(proposal_id)
+
+    def _prepare_publish(self, proposal: ChangeProposal) -> PreparedPublish:
+        """Derive and compile the catalog version a proposal publishes."""
+        return self.catalogs.prepare_publish(
+            self.storage,
+            jurisdiction=proposal.jurisdiction,
+            product_line=proposal.product_line,
+            change_type=proposal.change_type,
+            target_item_id=proposal.target_item_id,
+            to_value=proposal.to_value,
+            version=proposal.proposed_version,
+        )
@@ -1,14 +1,78 @@
 """QA Impact business logic service."""
 
-from decision_ledger.schemas.qa import QAStudyResult, QACohort, QAProposedChange
-from decision_ledger.storage.filesystem import FileStorage
+from typing import Any, Callable
 
+from decision_ledger.api.executor import get_batch_executor
+from decision_ledger.api.jobs import JobContext, get_job_runner
+from decision_ledger.config import get_settings
+from decision_ledger.core.catalog_registry import EffectiveDateIndex, get_catalog_registry
+from decision_ledger.core.cohort import CohortCache, compile_cohort
+from decision_ledger.core.catalog_types import Catalog
+from decision_ledger.core.qa_engine import DELTA_TOLERANCE, BaselineCache, QAImpactEngine
+from decision_ledger.core.qa_flags import QAFlagRules
+from decision_ledger.core.qa_simulation import AssumptionSimulator
+from decision_ledger.core.qa_stats import DeltaAggregate
+from decision_ledger.core.resolution import SYSTEM_ROLE
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.governance import ChangeProposal, QAImpactSummary
+from decision_ledger.schemas.job import Job, QAStudyJobCreate
+from decision_ledger.schemas.qa import (
+    QAStudyResult,
+    QACohort,
+    QACohortOverlap,
+    QAProposedChange,
+    QASimulationResult,
+)
+from decision_ledger.storage.claim_index import ClaimIndex
+from decision_ledger.storage.dependency_index import ClaimDependencyIndex
+from decision_ledger.storage.filesystem import get_file_storage
+from decision_ledger.storage.governance_log import QA_IMPACT_COMPUTED, get_governance_log
+from decision_ledger.storage.result_cache import QAResultCache
+from decision_ledger.storage.sqlite import get_state_store
+from decision_ledger.utils.bitmap import Bitmap
+from decision_ledger.utils.hashing import content_hash
+from decision_ledger.utils.singleflight import SingleFlight
+
+QA_STUDY_JOB = "qa_study"
+PROPOSAL_IMPACT_JOB = "proposal_impact"
+
+
+def _study_id(study_key: str) -> str:
+    """ID of a live study; the same inputs always get the same ID."""
+    return f"QA-{study_key[:12].upper()}"
 
 class QAService:
     """Service for QA impact analysis."""
 
     def __init__(self) -> None:
-        self.storage = FileStorage()
+        self.storage = get_file_storage()
+        self.governance_log = get_governance_log()
+        self.catalogs = get_catalog_registry()
+        self.baselines = BaselineCache(get_settings().qa_baseline_cache_entries)
+        self.impact_engine = QAImpactEngine(
+            executor=get_batch_executor(),
+            batch_size=get_settings().qa_batch_size,
+            flag_rules=QAFlagRules.from_settings(get_settings()),
+            baselines=self.baselines,
+        )
+        self.simulator = AssumptionSimulator(
+            executor=get_batch_executor(),
+            batch_size=get_settings().qa_batch_size,
+        )
+        self.dependency_index = ClaimDependencyIndex(get_state_store())
+        self.result_cache = QAResultCache(
+            get_state_store(),
+            max_memory_entries=get_settings().qa_result_cache_memory_entries,
+            max_disk_entries=get_settings().qa_result_cache_disk_entries,
+        )
+        self._studies: SingleFlight[QAStudyResult | None] = SingleFlight()
+        self._claim_index: ClaimIndex | None = None
+        self._cohort_cache = CohortCache()
+        self.standard_cohort_ids = get_settings().qa_standard_cohort_ids
+        self.job_chunk_size = get_settings().job_chunk_size
+        self.jobs = get_job_runner()
+        self.jobs.register(QA_STUDY_JOB, self._run_study_job)
+        self.jobs.register(PROPOSAL_IMPACT_JOB, self._run_proposal_impact_job)
 
     def list_cohorts(self) -> list[QACohort]:
         """List available cohorts for QA simulation."""
@@ -22,10 +86,348 @@ class QAService:
         """List all pre-computed QA study results."""
         return self.storage.load_qa_results()
 
-    def get_result(self, cohort_id: str, proposal_id: str) -> QAStudyResult:
-        """Get a specific QA study result."""
+    def get_result(self, cohort_id: str, proposal_id: str) -> QAStudyResult | None:
+        """Get a specific QA study result.
+
+        Concurrent requests for the same cohort and proposal share one
+        computation.
+
+        Returns:
+            The result, or None if there is none for the cohort and proposal
+
+        Raises:
+            ValueError: If the cohort's query or the proposed change is invalid
+        """
+        return self._studies.do(
+            f"{cohort_id}|{proposal_id}", lambda: self._find_result(cohort_id, proposal_id)
+        )
+
+    def _find_result(self, cohort_id: str, proposal_id: str) -> QAStudyResult | None:
+        """Compute the study live, falling back to pre-computed results.
+
+        Proposed changes that name a target item and value are evaluated by
+        re-running the cohort through the engine. Others can only be served
+        from the pre-computed fixture.
+        """
+        cohort = self._get_cohort(cohort_id)
+        change = self._get_proposed_change(proposal_id)
+        if cohort and change and change.target_item_id and change.to_value:
+            return self.run_study(cohort, change)
+
         results = self.storage.load_qa_results()
         for result in results:
             if result.cohort_id == cohort_id and result.proposal_id == proposal_id:
                 return result
-        raise ValueError(f"No result found for cohort {cohort_id} and proposal {proposal_id}")
+        return None
+
+    def run_study(
+        self,
+        cohort: QACohort,
+        change: QAProposedChange,
+        on_progress: Callable[[QAStudyResult], None] | None = None,
+    ) -> QAStudyResult:
+        """Evaluate a proposed change against a cohort with the QA engine.
+
+        Results are cached under a key derived from every input version, so
+        a repeated request is served from cache until an input changes.
+
+        Args:
+            cohort: Cohort to study
+            change: The proposed change
+            on_progress: Called with a partial result after each batch
+        """
+        catalogs = self._current_catalogs()
+        key = self._study_key(cohort, change, catalogs)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self.impact_engine.run_study(
+            cohort=cohort,
+            change=change,
+            claims=self.materialize_cohort(cohort),
+            catalog_for=self._catalog_lookup(catalogs),
+            index=self.dependency_index,
+            on_progress=on_progress,
+            study_id=_study_id(key),
+        )
+        self.result_cache.put(key, result)
+        return result
+
+    def submit_study_job(self, request: QAStudyJobCreate) -> Job | None:
+        """Run a QA study in the background.
+
+        Returns:
+            The queued job, or None if the cohort or change does not exist
+
+        Raises:
+            ValueError: If the change names no target item and value
+        """
+        change = self._get_proposed_change(request.proposal_id)
+        if self._get_cohort(request.cohort_id) is None or change is None:
+            return None
+        if not (change.target_item_id and change.to_value):
+            raise ValueError(
+                f"Proposed change {change.proposal_id} has no target item and value to evaluate"
+            )
+        return self.jobs.submit(QA_STUDY_JOB, request.model_dump())
+
+    def _run_study_job(self, job: Job, context: JobContext) -> dict[str, Any]:
+        """Job handler for QA studies.
+
+        The cohort is evaluated in chunks of ``job_chunk_size`` claims, and
+        the running aggregate is checkpointed after each chunk. A resumed
+        job continues after the last finished chunk unless an input changed
+        in the meantime, in which case it starts over.
+        """
+        request = QAStudyJobCreate.model_validate(job.params)
+        cohort = self._get_cohort(request.cohort_id)
+        change = self._get_proposed_change(request.proposal_id)
+        if cohort is None or change is None:
+            raise ValueError(
+                f"Cohort {request.cohort_id} or proposed change {request.proposal_id} not found"
+            )
+        catalogs = self._current_catalogs()
+        key = self._study_key(cohort, change, catalogs)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            return cached.model_dump(mode="json")
+
+        claims = self.materialize_cohort(cohort)
+        total = len(claims)
+        top_k = self.impact_engine.top_k
+        checkpoint = context.checkpoint
+        if checkpoint is not None and checkpoint["study_key"] == key:
+            offset = checkpoint["offset"]
+            aggregate = DeltaAggregate.from_state(
+                checkpoint["aggregate"], top_k=top_k, tolerance=DELTA_TOLERANCE
+            )
+        else:
+            offset = 0
+            aggregate = DeltaAggregate(top_k=top_k, tolerance=DELTA_TOLERANCE)
+        context.report(offset, total, force=True)
+
+        catalog_for = self._catalog_lookup(catalogs)
+        for start in range(offset, total, self.job_chunk_size):
+            chunk = claims[start : start + self.job_chunk_size]
+            aggregate.merge(
+                self.impact_engine.evaluate(
+                    chunk,
+                    change,
+                    catalog_for,
+                    index=self.dependency_index,
+                    on_progress=lambda partial, start=start: context.report(
+                        start + partial.claim_count, total
+                    ),
+                )
+            )
+            offset = start + len(chunk)
+            context.save_checkpoint(
+                {"study_key": key, "offset": offset, "aggregate": aggregate.to_state()},
+                offset,
+                total,
+            )
+
+        result = self.impact_engine.build_result(
+            cohort, change, aggregate, partial=False, study_id=_study_id(key)
+        )
+        self.result_cache.put(key, result)
+        return result.model_dump(mode="json")
+
+    def _study_key(
+        self,
+        cohort: QACohort,
+        change: QAProposedChange,
+        catalogs: EffectiveDateIndex,
+    ) -> str:
+        """Cache key covering every input that can change a study's result."""
+        return content_hash(
+            {
+                "cohort": compile_cohort(cohort).hash,
+                "proposal": change.model_dump(mode="json"),
+                "catalogs": sorted(compiled.context for compiled in catalogs.catalogs()),
+                "claims": self.storage.claims_version(),
+                "flag_rules": self.impact_engine.flag_rules.model_dump(),
+                "top_k": self.impact_engine.top_k,
+            }
+        )
+
+    def submit_proposal_impact(self, proposal: ChangeProposal) -> Job:
+        """Study a proposal's change against the standard cohorts in the background.
+
+        When the job finishes, the proposal's QA impact summaries are filled in.
+        """
+        return self.jobs.submit(PROPOSAL_IMPACT_JOB, {"proposal_id": proposal.proposal_id})
+
+    def standard_cohorts(self) -> list[QACohort]:
+        """Cohorts every submitted proposal is studied against."""
+        cohorts = self.storage.load_qa_cohorts()
+        if not self.standard_cohort_ids:
+            return cohorts
+        by_id = {cohort.cohort_id: cohort for cohort in cohorts}
+        return [by_id[cohort_id] for cohort_id in self.standard_cohort_ids if cohort_id in by_id]
+
+    def _run_proposal_impact_job(self, job: Job, context: JobContext) -> dict[str, Any]:
+        """Job handler computing a proposal's impact on the standard cohorts.
+
+        Studies of different proposals share the loaded claims, cohort
+        bitmaps and, through the baseline cache, baseline outcomes; only
+        the runs under each proposed catalog are specific to a proposal.
+        """
+        proposal_id = job.params["proposal_id"]
+        proposal = self.governance_log.get(proposal_id)
+        if proposal is None or not proposal.has_change:
+            raise ValueError(f"Proposal {proposal_id} has no catalog change to study")
+        change = QAProposedChange(
+            proposal_id=proposal.proposal_id,
+            label=proposal.title,
+            description=proposal.rationale,
+            change_type=proposal.change_type,
+            target_item_id=proposal.target_item_id,
+            to_value=proposal.to_value,
+        )
+        cohorts = self.standard_cohorts()
+        summaries: list[QAImpactSummary] = []
+        context.report(0, len(cohorts), force=True)
+        for done, cohort in enumerate(cohorts, start=1):
+            # Report during each study too, so a long one keeps the job's lease
+            result = self.run_study(
+                cohort,
+                change,
+                on_progress=lambda _, done=done: context.report(done - 1, len(cohorts)),
+            )
+            summaries.append(
+                QAImpactSummary(
+                    cohort_id=cohort.cohort_id,
+                    cohort_label=cohort.label,
+                    impacted_claims_count=result.impacted_claims_count,
+                    total_delta_payout=result.total_delta_payout,
+                )
+            )
+            context.report(done, len(cohorts))
+
+        self.governance_log.append(
+            proposal_id,
+            QA_IMPACT_COMPUTED,
+            SYSTEM_ROLE,
+            {
+                "qa_impact_summaries": summaries,
+                "qa_impact_summary": max(
+                    summaries, key=lambda summary: abs(summary.total_delta_payout), default=None
+                ),
+            },
+        )
+        return {"qa_impact_summaries": [s.model_dump(mode="json") for s in summaries]}
+
+    def simulate(
+        self, cohort_id: str, proposal_id: str, draws: int, seed: int
+    ) -> QASimulationResult | None:
+        """Simulate assumption uncertainty for a cohort and proposed change.
+
+        Returns:
+            The simulation result, or None if the cohort or change does not exist
+
+        Raises:
+            ValueError: If the change has no target or assumption
+                probabilities are invalid
+        """
+        cohort = self._get_cohort(cohort_id)
+        change = self._get_proposed_change(proposal_id)
+        if cohort is None or change is None:
+            return None
+        catalogs = self._current_catalogs()
+        return self.simulator.run(
+            cohort=cohort,
+            change=change,
+            claims=self.materialize_cohort(cohort),
+            catalog_for=self._catalog_lookup(catalogs),
+            draws=draws,
+            seed=seed,
+        )
+
+    def materialize_cohort(self, cohort: QACohort) -> list[Claim]:
+        """Return the claims that belong to a cohort."""
+        return self.claim_index().claims_at(self.cohort_members(cohort))
+
+    def cohort_members(self, cohort: QACohort) -> Bitmap:
+        """Membership bitmap of a cohort over the current claims.
+
+        Bitmaps are cached by query hash and claim data version.
+
+        Raises:
+            ValueError: If the cohort's query is malformed
+        """
+        query = compile_cohort(cohort)
+        index = self.claim_index()
+        members = self._cohort_cache.get(query.hash, index.version)
+        if members is None:
+            members = query.evaluate(index)
+            self._cohort_cache.put(query.hash, index.version, members)
+        return members
+
+    def compare_cohorts(self, cohort_id: str, other_cohort_id: str) -> QACohortOverlap | None:
+        """Compare the membership of two cohorts.
+
+        Returns:
+            The overlap, or None if either cohort does not exist
+        """
+        cohort = self._get_cohort(cohort_id)
+        other = self._get_cohort(other_cohort_id)
+        if cohort is None or other is None:
+            return None
+        members = self.cohort_members(cohort)
+        other_members = self.cohort_members(other)
+        union_count = len(members | other_members)
+        intersection_count = len(members & other_members)
+        return QACohortOverlap(
+            cohort_id=cohort_id,
+            other_cohort_id=other_cohort_id,
+            cohort_count=len(members),
+            other_count=len(other_members),
+            intersection_count=intersection_count,
+            union_count=union_count,
+            jaccard=intersection_count / union_count if union_count else 0.0,
+        )
+
+    def claim_index(self) -> ClaimIndex:
+        """Index over the current claims, rebuilt when their data version changes.
+
+        A new claim data version also clears the baseline cache, and the
+        dependency index if it was recorded for other claims (also by an
+        earlier process), since their entries describe previous claim contents.
+        """
+        version = self.storage.claims_version()
+        index = self._claim_index
+        if index is None or index.version != version:
+            index = self._claim_index = ClaimIndex(self.storage.load_claims(), version)
+            self.dependency_index.use_claims_version(version)
+            self.baselines.clear()
+        return index
+
+    def _current_catalogs(self) -> EffectiveDateIndex:
+        """Approved catalogs per line of business, indexed by effective date."""
+        return self.catalogs.snapshot(self.storage).effective
+
+    @staticmethod
+    def _catalog_lookup(catalogs: EffectiveDateIndex) -> Callable[[Claim], Catalog]:
+        """Function returning the catalog in force at a claim's loss date."""
+
+        def catalog_for(claim: Claim) -> Catalog:
+            compiled = catalogs.lookup(claim.jurisdiction, claim.product_line, claim.loss_date)
+            return compiled.catalog if compiled is not None else (None, None)
+
+        return catalog_for
+
+    def _get_cohort(self, cohort_id: str) -> QACohort | None:
+        """Get a cohort by ID."""
+        for cohort in self.storage.load_qa_cohorts():
+            if cohort.cohort_id == cohort_id:
+                return cohort
+        return None
+
+    def _get_proposed_change(self, proposal_id: str) -> QAProposedChange | None:
+        """Get a proposed change by ID."""
+        for change in self.storage.load_qa_proposed_changes():
+            if change.proposal_id == proposal_id:
+                return change
+        return None
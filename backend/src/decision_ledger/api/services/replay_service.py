@@ -0,0 +1,66 @@
+"""Replay verification business logic service."""
+
+import time
+from concurrent.futures import Executor
+
+from decision_ledger.api.executor import get_batch_executor
+from decision_ledger.config import get_settings
+from decision_ledger.core.catalog_registry import get_catalog_registry
+from decision_ledger.core.engine import DecisionEngine
+from decision_ledger.core.catalog_types import Catalog
+from decision_ledger.core.replay import RunReplayer
+from decision_ledger.schemas.decision import ReplayReport
+from decision_ledger.storage.filesystem import get_file_storage
+from decision_ledger.storage.sqlite import get_state_store
+
+
+class ReplayService:
+    """Service for checking that stored runs still replay to the same outcome and trace."""
+
+    def __init__(self) -> None:
+        self.storage = get_file_storage()
+        self.state = get_state_store()
+        self.catalogs = get_catalog_registry()
+        self.engine = DecisionEngine()
+        self.executor = get_batch_executor()
+        self.batch_size = get_settings().replay_batch_size
+
+    def replay(
+        self,
+        claim_id: str | None = None,
+        executor: Executor | None = None,
+        max_reported: int = 100,
+    ) -> ReplayReport:
+        """Replay every stored run (or a claim's runs) with its recorded inputs.
+
+        Args:
+            claim_id: Only replay this claim's runs
+            executor: Executor for batches (default: the batch pool, if configured)
+            max_reported: Drifts listed in the report; all are counted
+        """
+        started = time.perf_counter()
+        snapshot = self.catalogs.snapshot(self.storage)
+        claims = {claim.claim_id: claim for claim in self.storage.load_claims()}
+
+        def catalog_for(interpretation_set_id: str, assumption_set_id: str) -> Catalog:
+            return (
+                snapshot.interpretation_sets.get(interpretation_set_id),
+                snapshot.assumption_sets.get(assumption_set_id),
+            )
+
+        replayer = RunReplayer(
+            self.engine,
+            executor or self.executor,
+            batch_size=self.batch_size,
+            max_reported=max_reported,
+        )
+        replayed, drift_count, drifts = replayer.replay(
+            self.state.iter_stored_runs(claim_id), claims, catalog_for
+        )
+        return ReplayReport(
+            runs_replayed=replayed,
+            drift_count=drift_count,
+            drifts=drifts,
+            ok=drift_count == 0,
+            elapsed_seconds=time.perf_counter() - started,
+        )
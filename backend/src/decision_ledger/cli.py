@@ -0,0 +1,96 @@
+"""Command-line tools for operating a Decision Ledger deployment.
+
+    decision-ledger verify [--db PATH] [--workers N]
+    decision-ledger replay [--claim ID] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from decision_ledger.config import get_settings
+from decision_ledger.storage.run_ledger import verify_ledger
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a command; returns the process exit code."""
+    parser = argparse.ArgumentParser(prog="decision-ledger")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    verify = commands.add_parser(
+        "verify", help="Check every stored run against the hash-chained run ledger"
+    )
+    verify.add_argument(
+        "--db", type=Path, default=None, help="State database (default: from settings)"
+    )
+    verify.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes checking ranges of batches in parallel",
+    )
+
+    replay = commands.add_parser(
+        "replay", help="Re-execute stored runs and report outcome or trace drift"
+    )
+    replay.add_argument("--claim", default=None, help="Only replay this claim's runs")
+    replay.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes replaying batches in parallel",
+    )
+    replay.add_argument(
+        "--max-reported", type=int, default=100, help="Drifts listed in the report"
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "replay":
+        return _replay(args.claim, args.workers, args.max_reported)
+    return _verify(args.db, args.workers)
+
+
+def _verify(db_path: Path | None, workers: int) -> int:
+    if db_path is None:
+        settings = get_settings()
+        db_path = settings.data_dir / settings.state_db_filename
+    if not db_path.exists():
+        print(f"No state database at {db_path}", file=sys.stderr)
+        return 2
+    result = verify_ledger(db_path, workers=workers)
+    print(
+        f"Checked {result.runs_checked} runs in {result.batches_checked} sealed batches "
+        f"in {result.elapsed_seconds:.1f}s"
+    )
+    print(f"Head: entry {result.head_seq}, chain hash {result.head_hash}")
+    for failure in result.failures:
+        print(f"FAIL {failure}")
+    if result.failure_count > len(result.failures):
+        print(f"... and {result.failure_count - len(result.failures)} more failures")
+    print("OK" if result.ok else f"FAILED ({result.failure_count} failures)")
+    return 0 if result.ok else 1
+
+
+def _replay(claim_id: str | None, workers: int, max_reported: int) -> int:
+    # Imported here so that ``verify`` does not load the engine and catalogs
+    from decision_ledger.api.services.replay_service import ReplayService
+
+    service = ReplayService()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            result = service.replay(claim_id, executor=pool, max_reported=max_reported)
+    else:
+        result = service.replay(claim_id, max_reported=max_reported)
+    print(f"Replayed {result.runs_replayed} runs in {result.elapsed_seconds:.1f}s")
+    for drift in result.drifts:
+        print(f"DRIFT {drift.run_id} ({drift.claim_id}) {drift.kind}: {drift.detail}")
+    if result.drift_count > len(result.drifts):
+        print(f"... and {result.drift_count - len(result.drifts)} more drifts")
+    print("OK" if result.ok else f"FAILED ({result.drift_count} runs drifted)")
+    return 0 if result.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
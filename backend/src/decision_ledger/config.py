@@ -20,6 +20,68 @@ class Settings(BaseSettings):
     # Data directory
     data_dir: Path = Path("../data")
 
+    # Shared run/proposal state (SQLite file inside data_dir)
+    state_db_filename: str = "state.db"
+
+    # Run ledger: runs per sealed Merkle batch
+    ledger_batch_size: int = 1024
+
+    # Full runs regenerated from their compact stored form, cached per worker
+    run_cache_entries: int = 10_000
+
+    # Execution settings: blocking service calls run on a bounded thread
+    # pool; engine calls run inline or on a separate thread/process pool
+    executor_max_workers: int = 8
+    executor_max_queue_depth: int = 64
+    executor_retry_after_seconds: int = 1
+    engine_executor_kind: str = "inline"  # "inline", "thread" or "process"
+    engine_executor_max_workers: int = 4
+
+    # Batch engine work (QA studies): worker processes, 0 = run inline
+    batch_max_workers: int = 0
+    qa_batch_size: int = 2000
+
+    # Computed QA flag thresholds (see core.qa_flags.QAFlagRules)
+    qa_flag_high_impact_total_delta: float = 10_000.0
+    qa_flag_high_impact_claim_delta: float = 5_000.0
+    qa_flag_high_impact_claim_share: float = 0.25
+    qa_flag_low_confidence_assumption_share: float = 0.5
+    qa_flag_inconsistency_min_bucket_claims: int = 5
+    qa_flag_inconsistency_min_share: float = 0.1
+
+    # QA study result cache (memory LRU + disk tier in the state database)
+    qa_result_cache_memory_entries: int = 128
+    qa_result_cache_disk_entries: int = 1000
+
+    # Impact studies computed when a proposal is submitted: cohorts to study
+    # (empty = all cohorts), and baseline outcomes shared between studies
+    qa_standard_cohort_ids: list[str] = []
+    qa_baseline_cache_entries: int = 100_000
+
+    # Background jobs (long QA studies, backfills): worker threads, lease
+    # after which another runner may take over a silent job, claims
+    # evaluated between checkpoints, and SSE progress polling interval
+    job_max_workers: int = 2
+    job_lease_seconds: float = 60.0
+    job_chunk_size: int = 10_000
+    job_events_poll_seconds: float = 0.5
+
+    # Re-adjudication backfills: runs per batch, batches in flight on the
+    # batch pool, and a rate limit so backfills run alongside live traffic
+    backfill_batch_size: int = 100
+    backfill_max_pending_batches: int = 4
+    backfill_max_runs_per_second: float = 200.0
+
+    # Replay verification of stored runs: runs per batch
+    replay_batch_size: int = 2000
+
+    # Governance log: events between snapshots of the proposal projection
+    governance_snapshot_interval: int = 1000
+
+    # Idempotent decision submission
+    idempotency_window_seconds: int = 600
+    idempotency_max_entries: int = 10_000
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,121 @@
+"""Re-adjudicate decision runs after a catalog change is published.
+
+A run is re-issued with the same user choices except the one the change
+governs: for an interpretation change the decision point's selection becomes
+the new option, and for an assumption change the assumption's resolution
+becomes the new recommendation. The new run is evaluated against the catalog
+in force at the claim's loss date and links to the run it supersedes.
+"""
+
+from datetime import datetime
+from typing import NamedTuple
+
+from decision_ledger.core.catalog_changes import INTERPRETATION_CHANGE
+from decision_ledger.core.engine import DecisionEngine
+from decision_ledger.core.catalog_types import Catalog
+from decision_ledger.core.resolution import SYSTEM_ROLE
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.decision import (
+    DecisionRun,
+    ResolvedAssumption,
+    SelectedInterpretation,
+    StoredDecisionRun,
+)
+from decision_ledger.utils.ids import new_id
+
+
+class PublishedChange(NamedTuple):
+    """The catalog change a backfill re-adjudicates for."""
+
+    proposal_id: str
+    change_type: str
+    target_item_id: str
+    to_value: str
+
+
+def _updated_choices(
+    run: StoredDecisionRun, change: PublishedChange
+) -> tuple[list[ResolvedAssumption], list[SelectedInterpretation]]:
+    """The run's choices with the changed decision point or assumption updated."""
+    resolved = list(run.inputs.resolved_assumptions)
+    selected = list(run.inputs.selected_interpretations)
+    if change.change_type == INTERPRETATION_CHANGE:
+        for i, si in enumerate(selected):
+            if si.decision_point_id == change.target_item_id:
+                selected[i] = si.model_copy(update={"option": change.to_value})
+                break
+        else:
+            selected.append(
+                SelectedInterpretation(
+                    decision_point_id=change.target_item_id, option=change.to_value
+                )
+            )
+    else:
+        for i, ra in enumerate(resolved):
+            if ra.assumption_id == change.target_item_id:
+                resolved[i] = ra.model_copy(
+                    update={
+                        "chosen_resolution": change.to_value,
+                        "chosen_by_role": SYSTEM_ROLE,
+                        "reason": f"Re-adjudicated after {change.proposal_id} was published",
+                    }
+                )
+                break
+    return resolved, selected
+
+
+def readjudicate(
+    engine: DecisionEngine,
+    run: StoredDecisionRun,
+    claim: Claim,
+    catalog: Catalog,
+    change: PublishedChange,
+) -> DecisionRun:
+    """Re-run a decision under the catalog in force for the claim, with the change applied."""
+    interpretation_set, assumption_set = catalog
+    resolved, selected = _updated_choices(run, change)
+    outcome, trace_steps, dependencies = engine.run_with_dependencies(
+        claim=claim,
+        interpretation_set=interpretation_set,
+        assumption_set=assumption_set,
+        resolved_assumptions=resolved,
+        selected_interpretations=selected,
+    )
+    now = datetime.now()
+    return DecisionRun(
+        run_id=new_id("RUN", now),
+        claim_id=run.claim_id,
+        timestamp=now,
+        interpretation_set_id=(
+            interpretation_set.interpretation_set_id
+            if interpretation_set
+            else run.inputs.interpretation_set_id
+        ),
+        interpretation_set_version=(
+            interpretation_set.version
+            if interpretation_set
+            else run.inputs.interpretation_set_version
+        ),
+        assumption_set_id=(
+            assumption_set.assumption_set_id if assumption_set else run.inputs.assumption_set_id
+        ),
+        assumption_set_version=(
+            assumption_set.version if assumption_set else run.inputs.assumption_set_version
+        ),
+        resolved_assumptions=resolved,
+        selected_interpretations=selected,
+        outcome=outcome,
+        trace_steps=trace_steps,
+        generated_by_role=SYSTEM_ROLE,
+        dependencies=dependencies,
+        supersedes_run_id=run.run_id,
+    )
+
+
+def readjudicate_batch(
+    engine: DecisionEngine,
+    items: list[tuple[StoredDecisionRun, Claim, Catalog]],
+    change: PublishedChange,
+) -> list[DecisionRun]:
+    """Re-adjudicate a batch of runs (module-level so it can go to a process pool)."""
+    return [readjudicate(engine, run, claim, catalog, change) for run, claim, catalog in items]
@@ -0,0 +1,85 @@
+"""Apply proposed changes to interpretation and assumption sets.
+
+Changes never mutate the input set. The returned set shares every decision
+point and assumption that did not change with the original, so deriving a
+proposed catalog costs one copy of the changed node and its parent.
+"""
+
+from decision_ledger.schemas.catalog import AssumptionSet, InterpretationSet
+
+INTERPRETATION_CHANGE = "INTERPRETATION"
+ASSUMPTION_CHANGE = "ASSUMPTION"
+
+
+def apply_interpretation_change(
+    interpretation_set: InterpretationSet,
+    decision_point_id: str,
+    option: str,
+) -> InterpretationSet:
+    """Return a copy of the set with a decision point's default option changed.
+
+    Raises:
+        ValueError: If the decision point or option does not exist
+    """
+    decision_points = list(interpretation_set.decision_points)
+    for i, dp in enumerate(decision_points):
+        if dp.decision_point_id == decision_point_id:
+            if option not in {o.option_id for o in dp.options}:
+                raise ValueError(f"Option {option} not defined for {decision_point_id}")
+            decision_points[i] = dp.model_copy(update={"default_option": option})
+            return interpretation_set.model_copy(update={"decision_points": decision_points})
+    raise ValueError(
+        f"Decision point {decision_point_id} not found in "
+        f"{interpretation_set.interpretation_set_id}"
+    )
+
+
+def apply_assumption_change(
+    assumption_set: AssumptionSet,
+    assumption_id: str,
+    resolution: str,
+) -> AssumptionSet:
+    """Return a copy of the set with an assumption's recommended resolution changed.
+
+    Raises:
+        ValueError: If the assumption or alternative does not exist
+    """
+    assumptions = list(assumption_set.assumptions)
+    for i, assumption in enumerate(assumptions):
+        if assumption.assumption_id == assumption_id:
+            if resolution not in {a.alternative_id for a in assumption.alternatives}:
+                raise ValueError(f"Alternative {resolution} not defined for {assumption_id}")
+            assumptions[i] = assumption.model_copy(update={"recommended_resolution": resolution})
+            return assumption_set.model_copy(update={"assumptions": assumptions})
+    raise ValueError(
+        f"Assumption {assumption_id} not found in {assumption_set.assumption_set_id}"
+    )
+
+
+def apply_change(
+    interpretation_set: InterpretationSet | None,
+    assumption_set: AssumptionSet | None,
+    change_type: str,
+    target_item_id: str,
+    to_value: str,
+) -> tuple[InterpretationSet | None, AssumptionSet | None]:
+    """Apply a single INTERPRETATION or ASSUMPTION change to a catalog pair.
+
+    Raises:
+        ValueError: If the change type is unknown or its target is missing
+    """
+    if change_type == INTERPRETATION_CHANGE:
+        if interpretation_set is None:
+            raise ValueError("No interpretation set to apply the change to")
+        return (
+            apply_interpretation_change(interpretation_set, target_item_id, to_value),
+            assumption_set,
+        )
+    if change_type == ASSUMPTION_CHANGE:
+        if assumption_set is None:
+            raise ValueError("No assumption set to apply the change to")
+        return (
+            interpretation_set,
+            apply_assumption_change(assumption_set, target_item_id, to_value),
+        )
+    raise ValueError(f"Unknown change type: {change_type}")
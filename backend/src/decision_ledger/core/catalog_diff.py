@@ -0,0 +1,239 @@
+"""Structural diff between two versions of an interpretation or assumption set.
+
+Each set version is summarized by a two-level Merkle tree: every decision
+point or assumption is hashed by content, nodes are grouped into buckets by
+a hash of their ID (so adding a node only changes its own bucket), each
+bucket is hashed over its sorted (ID, hash) pairs, and the root hashes the
+set's header together with the bucket hashes.
+
+Comparing two versions compares the roots, then the bucket hashes, and
+only descends into nodes of buckets that differ; only those nodes get a
+field-level diff. Copy-on-write versions share unchanged node objects,
+whose hashes are computed once and cached, so building the tree of a new
+version rehashes only its changed nodes.
+"""
+
+import hashlib
+import threading
+import weakref
+from typing import Any, NamedTuple, TypeVar
+
+from pydantic import BaseModel
+
+from decision_ledger.schemas.catalog import (
+    AssumptionSet,
+    CatalogDiff,
+    CatalogNodeChange,
+    FieldChange,
+    InterpretationSet,
+)
+from decision_ledger.utils.hashing import content_hash
+
+CatalogSet = InterpretationSet | AssumptionSet
+
+V = TypeVar("V")
+
+# Buckets per tree; a node's bucket is the first byte of its ID's hash
+_BUCKET_BITS = 8
+
+# kind -> (set ID field, node list field, node ID field, item list field, item ID field)
+_KINDS: dict[str, tuple[str, str, str, str, str]] = {
+    "interpretation": (
+        "interpretation_set_id",
+        "decision_points",
+        "decision_point_id",
+        "options",
+        "option_id",
+    ),
+    "assumption": (
+        "assumption_set_id",
+        "assumptions",
+        "assumption_id",
+        "alternatives",
+        "alternative_id",
+    ),
+}
+
+
+class CatalogTree(NamedTuple):
+    """Merkle summary of one catalog set version."""
+
+    root: str
+    header: dict[str, Any]
+    buckets: dict[int, str]  # bucket -> hash over its nodes
+    nodes: dict[int, dict[str, str]]  # bucket -> node ID -> node hash
+    by_id: dict[str, BaseModel]
+
+
+def _kind_of(catalog_set: CatalogSet) -> str:
+    return "interpretation" if isinstance(catalog_set, InterpretationSet) else "assumption"
+
+
+def _bucket(node_id: str) -> int:
+    return hashlib.sha256(node_id.encode("utf-8")).digest()[0] >> (8 - _BUCKET_BITS)
+
+
+class CatalogTreeCache:
+    """Builds catalog trees, caching node hashes and trees by object.
+
+    Entries are keyed by ``id`` and hold only a weak reference to their
+    object; an entry is dropped when its object is garbage collected, so
+    the cache only holds the sets and nodes still in use. Catalog objects
+    are immutable once built (see ``core.catalog_changes``).
+    """
+
+    def __init__(self) -> None:
+        self._node_hashes: dict[int, tuple[weakref.ref[BaseModel], str]] = {}
+        self._trees: dict[int, tuple[weakref.ref[CatalogSet], CatalogTree]] = {}
+        self._lock = threading.Lock()
+
+    def tree(self, catalog_set: CatalogSet) -> CatalogTree:
+        """Merkle tree of a set version."""
+        cached = self._trees.get(id(catalog_set))
+        if cached is not None and cached[0]() is catalog_set:
+            return cached[1]
+        tree = self._build(catalog_set)
+        self._remember(self._trees, catalog_set, tree)
+        return tree
+
+    def node_hash(self, node: BaseModel) -> str:
+        """Content hash of a decision point or assumption."""
+        cached = self._node_hashes.get(id(node))
+        if cached is not None and cached[0]() is node:
+            return cached[1]
+        node_hash = content_hash(node)
+        self._remember(self._node_hashes, node, node_hash)
+        return node_hash
+
+    def __len__(self) -> int:
+        """Number of cached trees and node hashes."""
+        return len(self._trees) + len(self._node_hashes)
+
+    def _remember(
+        self, entries: dict[int, tuple[weakref.ref[Any], V]], obj: BaseModel, value: V
+    ) -> None:
+        key = id(obj)
+
+        # Runs during garbage collection, possibly while this thread holds the
+        # lock, so it must not take it; a single dict operation is atomic
+        def forget(ref: weakref.ref[Any]) -> None:
+            if entries.get(key, (None,))[0] is ref:
+                entries.pop(key, None)
+
+        with self._lock:
+            entries[key] = (weakref.ref(obj, forget), value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._node_hashes.clear()
+            self._trees.clear()
+
+    def _build(self, catalog_set: CatalogSet) -> CatalogTree:
+        kind = _kind_of(catalog_set)
+        _, nodes_field, node_id_field, _, _ = _KINDS[kind]
+        header = catalog_set.model_dump(mode="json", exclude={nodes_field})
+        nodes: dict[int, dict[str, str]] = {}
+        by_id: dict[str, BaseModel] = {}
+        for node in getattr(catalog_set, nodes_field):
+            node_id = getattr(node, node_id_field)
+            nodes.setdefault(_bucket(node_id), {})[node_id] = self.node_hash(node)
+            by_id[node_id] = node
+        buckets = {
+            bucket: content_hash(sorted(entries.items())) for bucket, entries in nodes.items()
+        }
+        # Set ID and version are identity, not content: equal content hashes equally
+        content_header = {
+            k: v for k, v in header.items() if k not in (_KINDS[kind][0], "version")
+        }
+        root = content_hash([content_hash(content_header), sorted(buckets.items())])
+        return CatalogTree(root, header, buckets, nodes, by_id)
+
+
+def diff_sets(before: CatalogSet, after: CatalogSet, trees: CatalogTreeCache) -> CatalogDiff:
+    """Structural diff between two versions of a set.
+
+    Raises:
+        ValueError: If one is an interpretation set and the other an assumption set
+    """
+    kind = _kind_of(before)
+    if _kind_of(after) != kind:
+        raise ValueError("Cannot diff an interpretation set against an assumption set")
+    set_id_field, _, _, items_field, item_id_field = _KINDS[kind]
+    old, new = trees.tree(before), trees.tree(after)
+    diff = CatalogDiff(
+        kind=kind,
+        from_set_id=getattr(before, set_id_field),
+        from_version=before.version,
+        to_set_id=getattr(after, set_id_field),
+        to_version=after.version,
+        from_hash=old.root,
+        to_hash=new.root,
+        identical=old.root == new.root,
+    )
+    if diff.identical:
+        return diff
+
+    diff.header_changes = [
+        change
+        for change in _field_changes(old.header, new.header)
+        if change.field not in (set_id_field, "version")
+    ]
+    for bucket in sorted(old.buckets.keys() | new.buckets.keys()):
+        if old.buckets.get(bucket) == new.buckets.get(bucket):
+            continue
+        old_nodes = old.nodes.get(bucket, {})
+        new_nodes = new.nodes.get(bucket, {})
+        for node_id in old_nodes.keys() | new_nodes.keys():
+            if node_id not in new_nodes:
+                diff.node_changes.append(CatalogNodeChange(node_id=node_id, change="removed"))
+            elif node_id not in old_nodes:
+                diff.node_changes.append(CatalogNodeChange(node_id=node_id, change="added"))
+            elif old_nodes[node_id] != new_nodes[node_id]:
+                diff.node_changes.append(
+                    _node_change(
+                        node_id,
+                        old.by_id[node_id],
+                        new.by_id[node_id],
+                        items_field,
+                        item_id_field,
+                        trees,
+                    )
+                )
+    diff.node_changes.sort(key=lambda change: change.node_id)
+    return diff
+
+
+def _node_change(
+    node_id: str,
+    before: BaseModel,
+    after: BaseModel,
+    items_field: str,
+    item_id_field: str,
+    trees: CatalogTreeCache,
+) -> CatalogNodeChange:
+    """Field-level diff of a decision point or assumption."""
+    old_items = {getattr(item, item_id_field): item for item in getattr(before, items_field)}
+    new_items = {getattr(item, item_id_field): item for item in getattr(after, items_field)}
+    return CatalogNodeChange(
+        node_id=node_id,
+        change="changed",
+        fields=_field_changes(
+            before.model_dump(mode="json", exclude={items_field}),
+            after.model_dump(mode="json", exclude={items_field}),
+        ),
+        added_items=sorted(new_items.keys() - old_items.keys()),
+        removed_items=sorted(old_items.keys() - new_items.keys()),
+        changed_items=sorted(
+            item_id
+            for item_id in old_items.keys() & new_items.keys()
+            if trees.node_hash(old_items[item_id]) != trees.node_hash(new_items[item_id])
+        ),
+    )
+
+
+def _field_changes(before: dict[str, Any], after: dict[str, Any]) -> list[FieldChange]:
+    return [
+        FieldChange(field=field, before=before.get(field), after=after.get(field))
+        for field in sorted(before.keys() | after.keys())
+        if before.get(field) != after.get(field)
+    ]
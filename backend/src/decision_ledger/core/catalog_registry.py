@@ -0,0 +1,412 @@
+"""Versioned view of the catalogs with atomic publishing.
+
+A ``CatalogSnapshot`` is an immutable view of every catalog set and the
+active catalog per line of business at one generation. Callers take a
+snapshot once per request and use it throughout, so a decision in flight
+finishes against the versions it started with even if a proposal is
+published meanwhile.
+
+Publishing derives the new set from the active one with copy-on-write
+(see ``core.catalog_changes``) and compiles it without holding the write
+lock (``prepare_publish``). ``commit_publish`` then stores it and moves the
+active-version pointer in one state store transaction, provided no other
+publish moved the catalog generation in between; otherwise the change is
+derived again from the new catalog. Readers are never blocked: they keep
+using their snapshot, and the next ``snapshot()`` call sees the new
+generation and swaps in a new snapshot, which shares every unchanged set,
+decision point, assumption and compiled catalog with the previous one.
+
+Each snapshot also indexes the approved interpretation sets of every line of
+business by ``effective_from``, so batch work looks up the set in force at a
+claim's loss date by bisection instead of scanning the catalog per claim.
+"""
+
+import threading
+from bisect import bisect_right
+from datetime import date
+from functools import lru_cache
+from typing import NamedTuple
+
+from decision_ledger.core.catalog_changes import INTERPRETATION_CHANGE, apply_change
+from decision_ledger.core.catalog_diff import CatalogTreeCache
+from decision_ledger.core.catalog_types import Catalog, catalog_context
+from decision_ledger.core.resolution import (
+    AssumptionTriggerMap,
+    default_interpretations,
+    trigger_map,
+)
+from decision_ledger.schemas.catalog import AssumptionSet, InterpretationSet, SetStatus
+from decision_ledger.schemas.decision import SelectedInterpretation
+from decision_ledger.storage.catalog_versions import CatalogVersionStore
+from decision_ledger.storage.filesystem import FileStorage
+from decision_ledger.storage.sqlite import get_state_store
+
+LineOfBusiness = tuple[str, str]
+
+
+class StalePublishError(Exception):
+    """Raised when the catalog changed since a publish was prepared."""
+
+
+class CompiledCatalog(NamedTuple):
+    """An active catalog with the lookups derived from it precomputed."""
+
+    interpretation_set: InterpretationSet | None
+    assumption_set: AssumptionSet | None
+    context: str
+    default_interpretations: list[SelectedInterpretation]
+    assumption_triggers: AssumptionTriggerMap
+
+    @property
+    def catalog(self) -> Catalog:
+        """The (interpretation set, assumption set) pair."""
+        return self.interpretation_set, self.assumption_set
+
+
+def compile_catalog(catalog: Catalog) -> CompiledCatalog:
+    """Precompute the lookups batch and interactive runs need from a catalog."""
+    interpretation_set, assumption_set = catalog
+    return CompiledCatalog(
+        interpretation_set=interpretation_set,
+        assumption_set=assumption_set,
+        context=catalog_context(catalog),
+        default_interpretations=default_interpretations(interpretation_set),
+        assumption_triggers=trigger_map(assumption_set),
+    )
+
+
+class EffectiveDateIndex:
+    """Catalog in force per line of business, by date.
+
+    Each line of business has a sorted list of the dates its catalogs take
+    effect; the catalog in force on a date is the last one starting on or
+    before it.
+    """
+
+    def __init__(self, entries: dict[LineOfBusiness, list[tuple[date, CompiledCatalog]]]) -> None:
+        """Initialize the index.
+
+        Args:
+            entries: (effective from, catalog) pairs per line of business,
+                sorted by date with at most one catalog per date
+        """
+        self._starts = {key: [start for start, _ in items] for key, items in entries.items()}
+        self._catalogs = {
+            key: [compiled for _, compiled in items] for key, items in entries.items()
+        }
+
+    def lookup(self, jurisdiction: str, product_line: str, on: date) -> CompiledCatalog | None:
+        """Catalog in force on a date, or None if none had taken effect yet."""
+        key = (jurisdiction, product_line)
+        starts = self._starts.get(key)
+        if not starts:
+            return None
+        i = bisect_right(starts, on) - 1
+        return self._catalogs[key][i] if i >= 0 else None
+
+    def catalogs(self) -> list[CompiledCatalog]:
+        """Every catalog in the index."""
+        return [compiled for items in self._catalogs.values() for compiled in items]
+
+
+class CatalogSnapshot:
+    """Immutable view of all catalog versions at one generation."""
+
+    def __init__(
+        self,
+        generation: int,
+        interpretation_sets: dict[str, InterpretationSet],
+        assumption_sets: dict[str, AssumptionSet],
+        active: dict[LineOfBusiness, CompiledCatalog],
+        effective: EffectiveDateIndex,
+        sources: tuple[list[InterpretationSet], list[AssumptionSet]],
+    ) -> None:
+        self.generation = generation
+        self.interpretation_sets = interpretation_sets
+        self.assumption_sets = assumption_sets
+        # Latest catalog per line of business
+        self.active = active
+        # Catalog per line of business in force at a given (loss) date
+        self.effective = effective
+        # Fixture lists the snapshot was built from, to notice reloads
+        self.sources = sources
+
+
+class PreparedPublish(NamedTuple):
+    """A new catalog version derived and compiled, ready to be stored."""
+
+    generation: int  # Catalog generation it was derived from
+    key: LineOfBusiness
+    published: InterpretationSet | AssumptionSet
+    catalog: Catalog
+
+
+class CatalogRegistry:
+    """Builds catalog snapshots and publishes new catalog versions."""
+
+    def __init__(self, versions: CatalogVersionStore) -> None:
+        self.versions = versions
+        self._snapshot: CatalogSnapshot | None = None
+        # Compiled catalogs by context; shared across snapshots
+        self._compiled: dict[str, CompiledCatalog] = {}
+        # Merkle trees of set versions, for diffs
+        self.trees = CatalogTreeCache()
+        self._lock = threading.Lock()
+
+    def snapshot(self, storage: FileStorage) -> CatalogSnapshot:
+        """Current snapshot; rebuilt only after a publish or a fixture reload."""
+        generation = self.versions.generation()
+        sources = (storage.load_interpretation_sets(), storage.load_assumption_sets())
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_current(snapshot, generation, sources):
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or not self._is_current(snapshot, generation, sources):
+                snapshot = self._snapshot = self._build(generation, sources)
+        return snapshot
+
+    @staticmethod
+    def _is_current(
+        snapshot: CatalogSnapshot,
+        generation: int,
+        sources: tuple[list[InterpretationSet], list[AssumptionSet]],
+    ) -> bool:
+        return (
+            snapshot.generation == generation
+            and snapshot.sources[0] is sources[0]
+            and snapshot.sources[1] is sources[1]
+        )
+
+    def _build(
+        self,
+        generation: int,
+        sources: tuple[list[InterpretationSet], list[AssumptionSet]],
+    ) -> CatalogSnapshot:
+        """Assemble a snapshot from the fixtures, published sets and pointers."""
+        fixture_interpretation_sets, fixture_assumption_sets = sources
+        interpretation_sets = {s.interpretation_set_id: s for s in fixture_interpretation_sets}
+        assumption_sets = {s.assumption_set_id: s for s in fixture_assumption_sets}
+        for published in self.versions.load_sets():
+            if isinstance(published, InterpretationSet):
+                interpretation_sets[published.interpretation_set_id] = published
+            else:
+                assumption_sets[published.assumption_set_id] = published
+
+        # Without a pointer, the latest approved fixture set is active
+        active_ids: dict[LineOfBusiness, tuple[str | None, str | None]] = {}
+        for iset in sorted(
+            fixture_interpretation_sets, key=lambda s: (s.effective_from, s.version)
+        ):
+            if iset.status == SetStatus.APPROVED:
+                key = (iset.jurisdiction, iset.product_line)
+                active_ids[key] = (iset.interpretation_set_id, active_ids.get(key, (None, None))[1])
+        for aset in sorted(fixture_assumption_sets, key=lambda s: s.version):
+            if aset.status == SetStatus.APPROVED:
+                key = (aset.jurisdiction, aset.product_line)
+                active_ids[key] = (active_ids.get(key, (None, None))[0], aset.assumption_set_id)
+        active_ids.update(self.versions.active())
+
+        active = {
+            key: self._compile(
+                (
+                    interpretation_sets.get(iset_id) if iset_id else None,
+                    assumption_sets.get(aset_id) if aset_id else None,
+                )
+            )
+            for key, (iset_id, aset_id) in active_ids.items()
+        }
+        effective = self._effective_index(interpretation_sets, active)
+        return CatalogSnapshot(
+            generation, interpretation_sets, assumption_sets, active, effective, sources
+        )
+
+    def _effective_index(
+        self,
+        interpretation_sets: dict[str, InterpretationSet],
+        active: dict[LineOfBusiness, CompiledCatalog],
+    ) -> EffectiveDateIndex:
+        """Index the approved interpretation sets of each line of business by date.
+
+        Assumption sets are not dated, so every entry uses the line's active
+        assumption set. Of several versions taking effect on the same date,
+        the active one wins, otherwise the highest version; a line without
+        dated sets is covered by its active catalog for all dates.
+        """
+        by_line: dict[LineOfBusiness, dict[date, InterpretationSet]] = {}
+        ordered = sorted(interpretation_sets.values(), key=lambda s: (s.effective_from, s.version))
+        for iset in ordered:
+            if iset.status == SetStatus.APPROVED:
+                key = (iset.jurisdiction, iset.product_line)
+                by_line.setdefault(key, {})[iset.effective_from] = iset
+        entries: dict[LineOfBusiness, list[tuple[date, CompiledCatalog]]] = {}
+        for key, compiled in active.items():
+            dated = by_line.get(key, {})
+            if compiled.interpretation_set is not None:
+                dated[compiled.interpretation_set.effective_from] = compiled.interpretation_set
+            if not dated:
+                entries[key] = [(date.min, compiled)]
+                continue
+            entries[key] = [
+                (
+                    start,
+                    compiled
+                    if iset is compiled.interpretation_set
+                    else self._compile((iset, compiled.assumption_set)),
+                )
+                for start, iset in sorted(dated.items())
+            ]
+        return EffectiveDateIndex(entries)
+
+    def _compile(self, catalog: Catalog) -> CompiledCatalog:
+        """Compile a catalog, reusing an earlier compilation of the same versions."""
+        context = catalog_context(catalog)
+        compiled = self._compiled.get(context)
+        if compiled is None:
+            compiled = self._compiled[context] = compile_catalog(catalog)
+        return compiled
+
+    def publish(
+        self,
+        storage: FileStorage,
+        jurisdiction: str,
+        product_line: str,
+        change_type: str,
+        target_item_id: str,
+        to_value: str,
+        version: str,
+        proposal_id: str | None = None,
+    ) -> tuple[str, int]:
+        """Publish a change as a new catalog version and make it active.
+
+        Prepares the version and commits it, preparing it again if another
+        publish committed first.
+
+        Returns:
+            Tuple of (ID of the new set, new catalog generation)
+
+        Raises:
+            ValueError: If the line of business has no active catalog, the
+                change does not apply to it, or the version already exists
+        """
+        while True:
+            prepared = self.prepare_publish(
+                storage, jurisdiction, product_line, change_type, target_item_id, to_value, version
+            )
+            try:
+                return self.commit_publish(prepared, proposal_id)
+            except StalePublishError:
+                continue
+
+    def prepare_publish(
+        self,
+        storage: FileStorage,
+        jurisdiction: str,
+        product_line: str,
+        change_type: str,
+        target_item_id: str,
+        to_value: str,
+        version: str,
+    ) -> PreparedPublish:
+        """Derive and compile a new catalog version from the active one.
+
+        Takes no lock; call it before the transaction that commits it.
+
+        Raises:
+            ValueError: If the line of business has no active catalog or
+                the change does not apply to it
+        """
+        key = (jurisdiction, product_line)
+        snapshot = self.snapshot(storage)
+        current = snapshot.active.get(key)
+        if current is None:
+            raise ValueError(f"No active catalog for {jurisdiction} {product_line}")
+        interpretation_set, assumption_set = apply_change(
+            current.interpretation_set,
+            current.assumption_set,
+            change_type,
+            target_item_id,
+            to_value,
+        )
+        if change_type == INTERPRETATION_CHANGE:
+            interpretation_set = interpretation_set.model_copy(
+                update={
+                    "interpretation_set_id": _versioned_id(
+                        interpretation_set.interpretation_set_id,
+                        interpretation_set.version,
+                        version,
+                    ),
+                    "version": version,
+                    # Supersedes the current version for the same period
+                    "status": SetStatus.APPROVED,
+                }
+            )
+            published = interpretation_set
+        else:
+            assumption_set = assumption_set.model_copy(
+                update={
+                    "assumption_set_id": _versioned_id(
+                        assumption_set.assumption_set_id, assumption_set.version, version
+                    ),
+                    "version": version,
+                    "status": SetStatus.APPROVED,
+                }
+            )
+            published = assumption_set
+        catalog = (interpretation_set, assumption_set)
+        self._compile(catalog)
+        return PreparedPublish(snapshot.generation, key, published, catalog)
+
+    def commit_publish(
+        self, prepared: PreparedPublish, proposal_id: str | None = None
+    ) -> tuple[str, int]:
+        """Store a prepared version and make it active.
+
+        Joins the caller's transaction if there is one, which makes the
+        publish atomic with the caller's own updates.
+
+        Returns:
+            Tuple of (ID of the new set, new catalog generation)
+
+        Raises:
+            StalePublishError: If another publish committed since the
+                version was prepared; nothing is stored
+            ValueError: If the version already exists
+        """
+        interpretation_set, assumption_set = prepared.catalog
+        with self.versions.state.transaction():
+            if self.versions.generation() != prepared.generation:
+                raise StalePublishError(f"Catalog changed since generation {prepared.generation}")
+            self.versions.save_set(prepared.published, proposal_id)
+            generation = self.versions.set_active(
+                *prepared.key,
+                interpretation_set.interpretation_set_id if interpretation_set else None,
+                assumption_set.assumption_set_id if assumption_set else None,
+            )
+        published_id = (
+            prepared.published.interpretation_set_id
+            if isinstance(prepared.published, InterpretationSet)
+            else prepared.published.assumption_set_id
+        )
+        return published_id, generation
+
+    def clear(self) -> None:
+        """Drop published versions and cached snapshots (for reset functionality)."""
+        self.versions.clear()
+        with self._lock:
+            self._snapshot = None
+            self._compiled.clear()
+        self.trees.clear()
+
+
+def _versioned_id(set_id: str, old_version: str, new_version: str) -> str:
+    """ID for a new version of a set, e.g. INT-CH-MOTOR-2025.1 -> INT-CH-MOTOR-2025.2."""
+    if set_id.endswith(old_version):
+        return set_id.removesuffix(old_version) + new_version
+    return f"{set_id}-{new_version}"
+
+
+@lru_cache
+def get_catalog_registry() -> CatalogRegistry:
+    """Get the catalog registry for this process."""
+    return CatalogRegistry(CatalogVersionStore(get_state_store()))
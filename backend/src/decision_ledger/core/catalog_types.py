@@ -0,0 +1,25 @@
+"""The catalog a claim is evaluated under.
+
+A ``Catalog`` pairs the interpretation set and assumption set in force for
+a claim; either may be missing. It is shared by the QA engine, the catalog
+registry, replay and run regeneration, so it lives apart from all of them.
+"""
+
+from decision_ledger.schemas.catalog import AssumptionSet, InterpretationSet
+
+Catalog = tuple[InterpretationSet | None, AssumptionSet | None]
+
+
+def catalog_context(catalog: Catalog) -> str:
+    """Key identifying the exact catalog versions a claim was evaluated under."""
+    interpretation_set, assumption_set = catalog
+    return "|".join(
+        [
+            f"{interpretation_set.interpretation_set_id}@{interpretation_set.version}"
+            if interpretation_set
+            else "-",
+            f"{assumption_set.assumption_set_id}@{assumption_set.version}"
+            if assumption_set
+            else "-",
+        ]
+    )
@@ -0,0 +1,466 @@
+"""Cohort query language.
+
+A cohort query selects claims by their fields::
+
+    jurisdiction = CH and product_line in (MOTOR, HOME)
+    and loss_date >= 2025-01-01 and loss_date < 2025-07-01
+    and fact(FACT.ACCESSORY_DECLARED).status = UNKNOWN
+    and line_item(category = accessory and amount > 500)
+    and not status = Decided
+
+Supported fields:
+
+- ``jurisdiction``, ``product_line``, ``status``: ``=``, ``!=``, ``in``
+- ``loss_date``: ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=`` on ISO dates
+- ``fact(<fact_id>).status`` and ``fact(<fact_id>).value``: ``=``, ``!=``, ``in``
+- ``line_item.category`` and ``line_item.amount``: true if any line item
+  matches. ``line_item(...)`` requires a single line item to match all
+  the conditions in the parentheses.
+
+Conditions combine with ``and``, ``or``, ``not`` and parentheses. Values
+may be bare words or quoted strings.
+
+Queries compile to an expression tree. Each node can test a single claim
+(``matches``) or evaluate to a membership ``Bitmap`` against a
+``ClaimIndex`` (``evaluate``), which answers most nodes from posting
+bitmaps and sorted keys without visiting claims.
+"""
+
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import date
+from typing import Any
+
+from decision_ledger.schemas.claim import Claim, ClaimStatus, FactStatus
+from decision_ledger.schemas.qa import QACohort
+from decision_ledger.storage.claim_index import ClaimIndex
+from decision_ledger.utils.bitmap import Bitmap
+from decision_ledger.utils.hashing import content_hash
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<op>>=|<=|!=|=|<|>)"
+    r"|(?P<punct>[(),.])"
+    r"|(?P<string>\"[^\"]*\"|'[^']*')"
+    r"|(?P<word>[A-Za-z0-9_][A-Za-z0-9_.\-:]*))"
+)
+
+_KEYWORDS = {"and", "or", "not", "in"}
+_ORDERED_OPS = {"<", "<=", ">", ">="}
+_CLAIM_FIELDS = {"jurisdiction", "product_line", "status", "loss_date"}
+_LINE_ITEM_FIELDS = {"category", "amount"}
+
+
+class Node(ABC):
+    """A node of a compiled cohort query."""
+
+    # Relative evaluation cost; ``And`` evaluates cheaper parts first
+    cost = 0
+
+    @abstractmethod
+    def matches(self, claim: Claim) -> bool:
+        """Whether a single claim satisfies the node."""
+
+    @abstractmethod
+    def evaluate(self, index: ClaimIndex, within: Bitmap | None = None) -> Bitmap:
+        """Bitmap of indexed claims satisfying the node.
+
+        Args:
+            index: Index over the claims
+            within: Candidate claims; if given, the result is only exact
+                inside this set, which lets costly nodes skip other claims
+        """
+
+    @abstractmethod
+    def canonical(self) -> str:
+        """Normalized text form, equal for equivalent spellings."""
+
+
+class All(Node):
+    """Matches every claim."""
+
+    def matches(self, claim: Claim) -> bool:
+        return True
+
+    def evaluate(self, index: ClaimIndex, within: Bitmap | None = None) -> Bitmap:
+        return index.universe()
+
+    def canonical(self) -> str:
+        return "all"
+
+
+class And(Node):
+    """Conjunction of nodes."""
+
+    def __init__(self, parts: list[Node]) -> None:
+        self.parts = sorted(parts, key=lambda part: part.cost)
+        self.cost = max(part.cost for part in parts)
+
+    def matches(self, claim: Claim) -> bool:
+        return all(part.matches(claim) for part in self.parts)
+
+    def evaluate(self, index: ClaimIndex, within: Bitmap | None = None) -> Bitmap:
+        result = within if within is not None else index.universe()
+        for part in self.parts:
+            result &= part.evaluate(index, result)
+            if not result.bits:
+                break
+        return result
+
+    def canonical(self) -> str:
+        return "and(" + ",".join(sorted(p.canonical() for p in self.parts)) + ")"
+
+
+class Or(Node):
+    """Disjunction of nodes."""
+
+    def __init__(self, parts: list[Node]) -> None:
+        self.parts = parts
+        self.cost = max(part.cost for part in parts)
+
+    def matches(self, claim: Claim) -> bool:
+        return any(part.matches(claim) for part in self.parts)
+
+    def evaluate(self, index: ClaimIndex, within: Bitmap | None = None) -> Bitmap:
+        result = Bitmap.empty(index.size)
+        for part in self.parts:
+            result |= part.evaluate(index, within)
+        return result
+
+    def canonical(self) -> str:
+        return "or(" + ",".join(sorted(p.canonical() for p in self.parts)) + ")"
+
+
+class Not(Node):
+    """Negation of a node."""
+
+    def __init__(self, part: Node) -> None:
+        self.part = part
+        self.cost = part.cost
+
+    def matches(self, claim: Claim) -> bool:
+        return not self.part.matches(claim)
+
+    def evaluate(self, index: ClaimIndex, within: Bitmap | None = None) -> Bitmap:
+        result = ~self.part.evaluate(index, within)
+        return result & within if within is not None else result
+
+    def canonical(self) -> str:
+        return f"not({self.part.canonical()})"
+
+
+class Compare(Node):
+    """A comparison of one claim field with a value (``!=`` is compiled to ``Not``)."""
+
+    def __init__(self, field: str, op: str, value: Any, fact_id: str | None = None) -> None:
+        self.field = field
+        self.op = op
+        self.value = value
+        self.fact_id = fact_id
+
+    def accepts(self, actual: Any) -> bool:
+        """Whether a field value satisfies the comparison."""
+        if actual is None:
+            return False
+        if self.op == "=":
+            return actual == self.value
+        if self.op == "<":
+            return actual < self.value
+        if self.op == "<=":
+            return actual <= self.value
+        if self.op == ">":
+            return actual > self.value
+        return actual >= self.value
+
+    def matches(self, claim: Claim) -> bool:
+        if self.field == "jurisdiction":
+            return self.accepts(claim.jurisdiction)
+        if self.field == "product_line":
+            return self.accepts(claim.product_line)
+        if self.field == "status":
+            return self.accepts(claim.status.value)
+        if self.field == "loss_date":
+            return self.accepts(claim.loss_date)
+        if self.field in ("fact.status", "fact.value"):
+            for fact in claim.facts:
+                if fact.fact_id == self.fact_id:
+                    actual = fact.status.value if self.field == "fact.status" else fact.value
+                    if self.accepts(actual):
+                        return True
+            return False
+        if self.field == "line_item.category":
+            return any(self.accepts(item.category) for item in claim.line_items)
+        return any(self.accepts(item.amount_chf) for item in claim.line_items)
+
+    def evaluate(self, index: ClaimIndex, within: Bitmap | None = None) -> Bitmap:
+        if self.field in ("jurisdiction", "product_line", "status"):
+            return index.postings(self.field, self.value)
+        if self.field == "loss_date":
+            return index.loss_date_range(self.op, self.value)
+        if self.field == "fact.status":
+            return index.postings("fact_status", self.fact_id, self.value)
+        if self.field == "fact.value":
+            return index.postings("fact_value", self.fact_id, self.value)
+        if self.field == "line_item.category":
+            return index.postings("line_item_category", self.value)
+        return index.line_item_amount_range(self.op, self.value)
+
+    def canonical(self) -> str:
+        field = f"fact({self.fact_id}).{self.field[5:]}" if self.fact_id else self.field
+        return f"{field}{self.op}{self.value!r}"
+
+
+class LineItemMatch(Node):
+    """True if a single line item satisfies every condition."""
+
+    cost = 1
+
+    def __init__(self, conditions: list[Compare]) -> None:
+        self.conditions = conditions
+
+    def _item_matches(self, item: Any) -> bool:
+        for condition in self.conditions:
+            actual = item.category if condition.field == "line_item.category" else item.amount_chf
+            if not condition.accepts(actual):
+                return False
+        return True
+
+    def matches(self, claim: Claim) -> bool:
+        return any(self._item_matches(item) for item in claim.line_items)
+
+    def evaluate(self, index: ClaimIndex, within: Bitmap | None = None) -> Bitmap:
+        # Each condition alone gives a superset; only those candidates are checked
+        candidates = within if within is not None else index.universe()
+        for condition in self.conditions:
+            candidates &= condition.evaluate(index)
+        return Bitmap.from_positions(
+            (pos for pos in candidates if self.matches(index.claims[pos])), index.size
+        )
+
+    def canonical(self) -> str:
+        return "line_item(" + ",".join(sorted(c.canonical() for c in self.conditions)) + ")"
+
+
+class _Parser:
+    """Recursive-descent parser for the cohort query language."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens = self._tokenize(text)
+        self.pos = 0
+
+    def _tokenize(self, text: str) -> list[tuple[str, str]]:
+        tokens: list[tuple[str, str]] = []
+        pos = 0
+        while pos < len(text):
+            match = _TOKEN.match(text, pos)
+            if match is None:
+                if text[pos:].strip():
+                    raise self._error(f"unexpected {text[pos:].strip()!r}")
+                break
+            pos = match.end()
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == "string":
+                tokens.append(("value", value[1:-1]))
+            elif kind == "word" and value.lower() in _KEYWORDS:
+                tokens.append(("keyword", value.lower()))
+            else:
+                tokens.append((kind if kind != "word" else "value", value))
+        return tokens
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"Invalid cohort query: {message}")
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _accept(self, kind: str, value: str | None = None) -> bool:
+        token = self._peek()
+        if token and token[0] == kind and (value is None or token[1] == value):
+            self.pos += 1
+            return True
+        return False
+
+    def _expect(self, kind: str, value: str | None = None) -> str:
+        token = self._peek()
+        if not token or token[0] != kind or (value is not None and token[1] != value):
+            found = token[1] if token else "end of query"
+            raise self._error(f"expected {value or kind}, found {found!r}")
+        self.pos += 1
+        return token[1]
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            return All()
+        node = self._or()
+        if self._peek() is not None:
+            raise self._error(f"unexpected {self._peek()[1]!r}")
+        return node
+
+    def _or(self) -> Node:
+        parts = [self._and()]
+        while self._accept("keyword", "or"):
+            parts.append(self._and())
+        return parts[0] if len(parts) == 1 else Or(parts)
+
+    def _and(self) -> Node:
+        parts = [self._unary()]
+        while self._accept("keyword", "and"):
+            parts.append(self._unary())
+        return parts[0] if len(parts) == 1 else And(parts)
+
+    def _unary(self) -> Node:
+        if self._accept("keyword", "not"):
+            return Not(self._unary())
+        if self._accept("punct", "("):
+            node = self._or()
+            self._expect("punct", ")")
+            return node
+        return self._condition()
+
+    def _condition(self) -> Node:
+        name = self._expect("value")
+        if name == "fact":
+            self._expect("punct", "(")
+            fact_id = self._expect("value")
+            self._expect("punct", ")")
+            self._expect("punct", ".")
+            attribute = self._expect("value")
+            if attribute not in ("status", "value"):
+                raise self._error(f"unknown fact attribute {attribute!r}")
+            return self._comparison(f"fact.{attribute}", fact_id)
+        if name == "line_item" and self._accept("punct", "("):
+            conditions = [self._line_item_condition()]
+            while self._accept("keyword", "and"):
+                conditions.append(self._line_item_condition())
+            self._expect("punct", ")")
+            return LineItemMatch(conditions)
+        if name in ("line_item.category", "line_item.amount") or name in _CLAIM_FIELDS:
+            return self._comparison(name)
+        raise self._error(f"unknown field {name!r}")
+
+    def _line_item_condition(self) -> Compare:
+        name = self._expect("value")
+        if name not in _LINE_ITEM_FIELDS:
+            raise self._error(f"unknown line item field {name!r}")
+        node = self._comparison(f"line_item.{name}")
+        if not isinstance(node, Compare):
+            raise self._error("line_item(...) only supports =, <, <=, > and >=")
+        return node
+
+    def _comparison(self, field: str, fact_id: str | None = None) -> Node:
+        if self._accept("keyword", "in"):
+            self._expect("punct", "(")
+            values = [self._value(field)]
+            while self._accept("punct", ","):
+                values.append(self._value(field))
+            self._expect("punct", ")")
+            nodes: list[Node] = [Compare(field, "=", v, fact_id) for v in values]
+            return nodes[0] if len(nodes) == 1 else Or(nodes)
+
+        op = self._expect("op")
+        ordered = field in ("loss_date", "line_item.amount")
+        if op in _ORDERED_OPS and not ordered:
+            raise self._error(f"operator {op} is not supported for {field}")
+        value = self._value(field)
+        if op == "!=":
+            return Not(Compare(field, "=", value, fact_id))
+        return Compare(field, op, value, fact_id)
+
+    def _value(self, field: str) -> Any:
+        raw = self._expect("value")
+        try:
+            if field == "loss_date":
+                return date.fromisoformat(raw)
+            if field == "line_item.amount":
+                return float(raw)
+            if field == "status":
+                return ClaimStatus(raw).value
+            if field == "fact.status":
+                return FactStatus(raw.upper()).value
+        except ValueError:
+            raise self._error(f"invalid value {raw!r} for {field}") from None
+        return raw
+
+
+def parse_query(text: str) -> Node:
+    """Parse a cohort query.
+
+    Raises:
+        ValueError: If the query is malformed
+    """
+    return _Parser(text).parse()
+
+
+class CohortQuery:
+    """A compiled cohort definition with a stable hash."""
+
+    def __init__(self, node: Node) -> None:
+        self.node = node
+        self.canonical = node.canonical()
+        self.hash = content_hash(self.canonical)
+
+    def matches(self, claim: Claim) -> bool:
+        """Whether a single claim belongs to the cohort."""
+        return self.node.matches(claim)
+
+    def evaluate(self, index: ClaimIndex) -> Bitmap:
+        """Membership bitmap over the indexed claims."""
+        return self.node.evaluate(index)
+
+
+def compile_cohort(cohort: QACohort) -> CohortQuery:
+    """Compile a cohort's query together with its jurisdiction and product line.
+
+    Raises:
+        ValueError: If the cohort's query is malformed
+    """
+    parts: list[Node] = []
+    if cohort.query:
+        parts.append(parse_query(cohort.query))
+    if cohort.jurisdiction:
+        parts.append(Compare("jurisdiction", "=", cohort.jurisdiction))
+    if cohort.product_line:
+        parts.append(Compare("product_line", "=", cohort.product_line))
+    if not parts:
+        return CohortQuery(All())
+    return CohortQuery(parts[0] if len(parts) == 1 else And(parts))
+
+
+class CohortCache:
+    """LRU cache of compressed membership bitmaps.
+
+    Keys combine the query hash with the claim data version, so entries for
+    superseded claim data are never returned and simply age out.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[bytes, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, query_hash: str, data_version: str) -> Bitmap | None:
+        """Return the cached bitmap, if any."""
+        with self._lock:
+            entry = self._entries.get((query_hash, data_version))
+            if entry is None:
+                return None
+            self._entries.move_to_end((query_hash, data_version))
+        data, size = entry
+        return Bitmap.decompress(data, size)
+
+    def put(self, query_hash: str, data_version: str, bitmap: Bitmap) -> None:
+        """Cache a bitmap."""
+        entry = (bitmap.compress(), bitmap.size)
+        with self._lock:
+            self._entries[(query_hash, data_version)] = entry
+            self._entries.move_to_end((query_hash, data_version))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
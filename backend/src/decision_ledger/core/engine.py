@@ -3,6 +3,7 @@
 from decision_ledger.schemas.claim import Claim, FactStatus
 from decision_ledger.schemas.catalog import InterpretationSet, AssumptionSet
 from decision_ledger.schemas.decision import (
+    DecisionDependencies,
     DecisionOutcome,
     DecisionStatus,
     PayoutItem,
@@ -46,6 +47,33 @@ class DecisionEngine:
         Returns:
             Tuple of (DecisionOutcome, list[TraceStep])
         """
+        outcome, trace_steps, _ = self.run_with_dependencies(
+            claim=claim,
+            interpretation_set=interpretation_set,
+            assumption_set=assumption_set,
+            resolved_assumptions=resolved_assumptions,
+            selected_interpretations=selected_interpretations,
+        )
+        return outcome, trace_steps
+
+    def run_with_dependencies(
+        self,
+        claim: Claim,
+        interpretation_set: InterpretationSet | None,
+        assumption_set: AssumptionSet | None,
+        resolved_assumptions: list[ResolvedAssumption],
+        selected_interpretations: list[SelectedInterpretation],
+    ) -> tuple[DecisionOutcome, list[TraceStep], DecisionDependencies]:
+        """Run the decision engine and also report what the outcome depended on.
+
+        A decision point, assumption or fact is recorded only when its value
+        was consulted on the path that produced the outcome. Changing
+        anything not recorded cannot change the outcome for this claim.
+
+        Returns:
+            Tuple of (DecisionOutcome, list[TraceStep], DecisionDependencies)
+        """
+        dependencies = DecisionDependencies()
         trace_steps: list[TraceStep] = []
         payout_items: list[PayoutItem] = []
         step_number = 0
@@ -84,8 +112,10 @@ class DecisionEngine:
         # Step 3: Apply assumptions for unknown facts
         step_number += 1
         assumed_values: dict[str, str] = {}
+        assuming_ids: dict[str, str] = {}
         for ra in resolved_assumptions:
             assumed_values[ra.fact_id] = ra.chosen_resolution
+            assuming_ids[ra.fact_id] = ra.assumption_id
 
         trace_steps.append(
             TraceStep(
@@ -144,6 +174,15 @@ class DecisionEngine:
         # Get the accessory_declared assumption resolution
         accessory_declared = assumed_values.get("FACT.ACCESSORY_DECLARED", "NOT_DECLARED")
 
+        # Coverage only matters when there is something to cover; the
+        # declaration is only consulted under INCLUDED_IF_DECLARED
+        if accessory_items:
+            dependencies.decision_point_ids.append("DP.ACCESSORY_COVERAGE")
+            if accessory_interpretation == "INCLUDED_IF_DECLARED":
+                dependencies.fact_ids.append("FACT.ACCESSORY_DECLARED")
+                if "FACT.ACCESSORY_DECLARED" in assuming_ids:
+                    dependencies.assumption_ids.append(assuming_ids["FACT.ACCESSORY_DECLARED"])
+
         # Determine coverage based on interpretation + assumption
         accessory_covered = False
         coverage_reason = ""
@@ -253,7 +292,7 @@ class DecisionEngine:
             deductible_applied=deductible,
         )
 
-        return outcome, trace_steps
+        return outcome, trace_steps, dependencies
 
     def diff_traces(
         self,
@@ -0,0 +1,464 @@
+"""QA impact engine: evaluate proposed catalog changes against a cohort.
+
+Each claim in the cohort runs through ``DecisionEngine`` twice, once under
+its current catalog and once under the catalog with the proposed change
+applied. Both runs use catalog defaults (see ``core.resolution``), so the
+difference in payout is attributable to the change alone.
+
+Claims are grouped by catalog and evaluated in fixed-size batches. Batches
+can run on any ``concurrent.futures.Executor``; with a process pool, large
+cohorts are spread over all cores.
+
+With a ``ClaimDependencyIndex``, each baseline run also records which
+decision points, assumptions and facts its outcome depended on. Later
+studies under the same catalog only re-run the indexed claims that depend
+on the changed entry; every other indexed claim has a delta of zero.
+
+Results are aggregated as they stream in (see ``core.qa_stats``): workers
+return mergeable per-batch aggregates instead of per-claim deltas, so a
+study over millions of claims only keeps O(top_k) results in memory and
+can report partial results after every batch.
+
+Baseline outcomes depend only on the claim and its current catalog, not on
+the proposed change. A ``BaselineCache`` shares them between studies, e.g.
+the studies of several pending proposals: batches receive the baselines
+already known and return the ones they computed.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from datetime import datetime
+from typing import Callable, Iterable, NamedTuple
+
+from decision_ledger.core.catalog_changes import (
+    ASSUMPTION_CHANGE,
+    INTERPRETATION_CHANGE,
+    apply_change,
+)
+from decision_ledger.core.catalog_types import Catalog, catalog_context
+from decision_ledger.core.engine import DecisionEngine
+from decision_ledger.core.qa_flags import QAFlagRules, evaluate_flags, similarity_key
+from decision_ledger.core.qa_stats import DeltaAggregate
+from decision_ledger.core.resolution import default_interpretations, recommended_assumptions
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.decision import ResolvedAssumption, SelectedInterpretation
+from decision_ledger.schemas.qa import QACohort, QAProposedChange, QAStudyResult
+from decision_ledger.storage.dependency_index import ClaimDependencyIndex
+
+# Net payout and the IDs it depended on, of a claim run under a catalog
+Baseline = tuple[float, tuple[str, ...]]
+
+# Payout differences below half a centime are rounding noise
+DELTA_TOLERANCE = 0.005
+
+
+def run_under_catalog(
+    engine: DecisionEngine,
+    claim: Claim,
+    catalog: Catalog,
+    interpretations: list[SelectedInterpretation] | None = None,
+    resolved_assumptions: list[ResolvedAssumption] | None = None,
+) -> tuple[float, tuple[str, ...]]:
+    """Run a claim with the catalog's defaults.
+
+    ``interpretations`` may be passed in when the caller has already derived
+    the catalog's default selections, which are the same for every claim.
+    ``resolved_assumptions`` overrides the recommended resolutions.
+
+    Returns:
+        Tuple of (net payout, IDs the outcome depended on)
+    """
+    interpretation_set, assumption_set = catalog
+    if interpretations is None:
+        interpretations = default_interpretations(interpretation_set)
+    outcome, _, dependencies = engine.run_with_dependencies(
+        claim=claim,
+        interpretation_set=interpretation_set,
+        assumption_set=assumption_set,
+        resolved_assumptions=(
+            resolved_assumptions
+            if resolved_assumptions is not None
+            else recommended_assumptions(claim, assumption_set)
+        ),
+        selected_interpretations=interpretations,
+    )
+    return outcome.payout_total, tuple(dependencies.refs())
+
+
+class BatchResult(NamedTuple):
+    """Aggregated deltas of one batch, plus dependencies to index."""
+
+    aggregate: DeltaAggregate
+    dependencies: list[tuple[str, tuple[str, ...]]]
+    # (claim_id, baseline) for baselines the batch had to compute
+    baselines: list[tuple[str, Baseline]] = []
+
+
+def evaluate_batch(
+    engine: DecisionEngine,
+    claims: list[Claim],
+    current: Catalog,
+    proposed: Catalog,
+    top_k: int = 10,
+    record_dependencies: bool = False,
+    baselines: dict[str, Baseline] | None = None,
+) -> BatchResult:
+    """Evaluate a batch of claims that share the same catalogs.
+
+    Deltas are folded into a ``DeltaAggregate`` inside the worker, so only
+    O(top_k) data travels back to the coordinator. Module-level so that it
+    can be sent to a process pool.
+
+    Args:
+        baselines: Known baselines under ``current`` by claim ID; those
+            claims are only run under ``proposed``
+    """
+    current_interpretations = default_interpretations(current[0])
+    proposed_interpretations = default_interpretations(proposed[0])
+    assumption_ids = assumption_ids_of(current) | assumption_ids_of(proposed)
+    aggregate = DeltaAggregate(top_k=top_k, tolerance=DELTA_TOLERANCE)
+    dependencies: list[tuple[str, tuple[str, ...]]] = []
+    computed: list[tuple[str, Baseline]] = []
+    for claim in claims:
+        known = baselines.get(claim.claim_id) if baselines else None
+        if known is None:
+            known = run_under_catalog(engine, claim, current, current_interpretations)
+            computed.append((claim.claim_id, known))
+        baseline, refs = known
+        proposed_payout, proposed_refs = run_under_catalog(
+            engine, claim, proposed, proposed_interpretations
+        )
+        aggregate.add(
+            claim.claim_id,
+            proposed_payout - baseline,
+            bucket=similarity_key(claim),
+            assumption_driven=not assumption_ids.isdisjoint(refs + proposed_refs),
+        )
+        if record_dependencies:
+            dependencies.append((claim.claim_id, refs))
+    return BatchResult(aggregate, dependencies, computed)
+
+
+def assumption_ids_of(catalog: Catalog) -> set[str]:
+    """IDs of the assumptions in a catalog."""
+    assumption_set = catalog[1]
+    return {a.assumption_id for a in assumption_set.assumptions} if assumption_set else set()
+
+
+def propose_catalog(catalog: Catalog, change: QAProposedChange) -> Catalog:
+    """Apply a proposed change to a catalog.
+
+    Catalogs that do not contain the change's target are returned unchanged,
+    so a cohort spanning several jurisdictions only changes where the
+    targeted decision point or assumption exists.
+
+    Raises:
+        ValueError: If the change is malformed, or names a ``from_value``
+            the target does not currently have
+    """
+    if not change.target_item_id or not change.to_value:
+        raise ValueError(f"Proposed change {change.proposal_id} has no target or value")
+    interpretation_set, assumption_set = catalog
+    # Target ID -> its current value
+    targets: dict[str, str]
+    if change.change_type == INTERPRETATION_CHANGE:
+        targets = (
+            {dp.decision_point_id: dp.default_option for dp in interpretation_set.decision_points}
+            if interpretation_set
+            else {}
+        )
+    elif change.change_type == ASSUMPTION_CHANGE:
+        targets = (
+            {a.assumption_id: a.recommended_resolution for a in assumption_set.assumptions}
+            if assumption_set
+            else {}
+        )
+    else:
+        raise ValueError(f"Unknown change type: {change.change_type}")
+    if change.target_item_id not in targets:
+        return catalog
+    current = targets[change.target_item_id]
+    if change.from_value is not None and current != change.from_value:
+        raise ValueError(
+            f"Proposed change {change.proposal_id} expects {change.target_item_id} to be "
+            f"{change.from_value}, but it is {current}"
+        )
+    return apply_change(
+        interpretation_set, assumption_set, change.change_type, change.target_item_id, change.to_value
+    )
+
+
+class BaselineCache:
+    """Bounded, thread-safe LRU of baselines keyed by catalog context and claim.
+
+    Entries describe the claim contents they were computed from, so the
+    cache must be cleared when the claim data changes.
+    """
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], Baseline] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, context: str, claim_ids: list[str]) -> dict[str, Baseline]:
+        """Known baselines under ``context`` for the given claims."""
+        found: dict[str, Baseline] = {}
+        with self._lock:
+            for claim_id in claim_ids:
+                baseline = self._entries.get((context, claim_id))
+                if baseline is not None:
+                    self._entries.move_to_end((context, claim_id))
+                    found[claim_id] = baseline
+            self.hits += len(found)
+            self.misses += len(claim_ids) - len(found)
+        return found
+
+    def put_many(self, context: str, baselines: list[tuple[str, Baseline]]) -> None:
+        """Store baselines computed under ``context``, evicting the oldest."""
+        with self._lock:
+            for claim_id, baseline in baselines:
+                self._entries[(context, claim_id)] = baseline
+                self._entries.move_to_end((context, claim_id))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all baselines."""
+        with self._lock:
+            self._entries.clear()
+
+
+class _ContextState:
+    """Per-catalog state while streaming a cohort into batches."""
+
+    __slots__ = ("current", "proposed", "indexed", "affected", "assumption_driven", "batches")
+
+    def __init__(
+        self,
+        current: Catalog,
+        proposed: Catalog,
+        indexed: set[str],
+        affected: set[str],
+        assumption_driven: set[str],
+    ) -> None:
+        self.current = current
+        self.proposed = proposed
+        self.indexed = indexed
+        self.affected = affected
+        # Indexed claims whose outcome depended on an assumption
+        self.assumption_driven = assumption_driven
+        # Open batches keyed by whether their claims' dependencies are recorded
+        self.batches: dict[bool, list[Claim]] = {False: [], True: []}
+
+
+class QAImpactEngine:
+    """Computes QAStudyResults by re-running cohorts through DecisionEngine."""
+
+    def __init__(
+        self,
+        engine: DecisionEngine | None = None,
+        executor: Executor | None = None,
+        batch_size: int = 2000,
+        top_k: int = 10,
+        max_pending: int = 16,
+        flag_rules: QAFlagRules | None = None,
+        baselines: BaselineCache | None = None,
+    ) -> None:
+        """Initialize the QA engine.
+
+        Args:
+            engine: Decision engine to use (a new one by default)
+            executor: Executor for batches; None evaluates inline
+            batch_size: Claims per batch
+            top_k: Number of top impacted claims to report
+            max_pending: Batches allowed in flight on the executor
+            flag_rules: Thresholds for computed flags (defaults if None)
+            baselines: Cache of baseline outcomes shared between studies
+        """
+        self.engine = engine or DecisionEngine()
+        self.executor = executor
+        self.batch_size = batch_size
+        self.top_k = top_k
+        self.max_pending = max_pending
+        self.flag_rules = flag_rules or QAFlagRules()
+        self.baselines = baselines
+
+    def evaluate(
+        self,
+        claims: Iterable[Claim],
+        change: QAProposedChange,
+        catalog_for: Callable[[Claim], Catalog],
+        index: ClaimDependencyIndex | None = None,
+        on_progress: Callable[[DeltaAggregate], None] | None = None,
+    ) -> DeltaAggregate:
+        """Evaluate claims under their current and proposed catalog.
+
+        Claims are streamed into per-catalog batches; at most
+        ``max_pending`` batches are in flight at once and each finished
+        batch is merged into a running aggregate, so memory stays bounded
+        by the batch size and ``top_k`` rather than the cohort size.
+
+        Args:
+            claims: Claims to evaluate
+            change: The proposed change
+            catalog_for: Returns the current catalog for a claim
+            index: Dependency index used to skip claims known to be
+                unaffected, and updated with newly evaluated claims
+            on_progress: Called with the running aggregate after each batch
+
+        Returns:
+            Aggregate of the deltas of all claims seen
+        """
+        total = DeltaAggregate(top_k=self.top_k, tolerance=DELTA_TOLERANCE)
+        contexts: dict[str, _ContextState] = {}
+        pending: dict[Future[BatchResult], str] = {}
+
+        def merge(context: str, result: BatchResult) -> None:
+            total.merge(result.aggregate)
+            if self.baselines is not None and result.baselines:
+                self.baselines.put_many(context, result.baselines)
+            if index is not None and result.dependencies:
+                index.record(context, result.dependencies)
+            if on_progress is not None:
+                on_progress(total)
+
+        def drain(limit: int) -> None:
+            while len(pending) > limit:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    merge(pending.pop(future), future.result())
+
+        def flush(context: str, state: "_ContextState", record: bool) -> None:
+            batch = state.batches[record]
+            if not batch:
+                return
+            state.batches[record] = []
+            known = (
+                self.baselines.get_many(context, [claim.claim_id for claim in batch])
+                if self.baselines is not None
+                else None
+            )
+            args = (self.engine, batch, state.current, state.proposed, self.top_k, record, known)
+            if self.executor is None:
+                merge(context, evaluate_batch(*args))
+                return
+            pending[self.executor.submit(evaluate_batch, *args)] = context
+            drain(self.max_pending)
+
+        for claim in claims:
+            current = catalog_for(claim)
+            context = catalog_context(current)
+            state = contexts.get(context)
+            if state is None:
+                state = contexts[context] = self._context_state(current, change, index, context)
+
+            claim_id = claim.claim_id
+            record = index is not None and claim_id not in state.indexed
+            if index is not None and not record and claim_id not in state.affected:
+                total.add_unchanged(
+                    1,
+                    bucket=similarity_key(claim),
+                    assumption_driven=claim_id in state.assumption_driven,
+                )
+                continue
+            state.batches[record].append(claim)
+            if len(state.batches[record]) >= self.batch_size:
+                flush(context, state, record)
+
+        for context, state in contexts.items():
+            flush(context, state, False)
+            flush(context, state, True)
+        drain(0)
+        return total
+
+    @staticmethod
+    def _context_state(
+        current: Catalog,
+        change: QAProposedChange,
+        index: ClaimDependencyIndex | None,
+        context: str,
+    ) -> "_ContextState":
+        """Look up the index and build the proposed catalog for a context."""
+        indexed: set[str] = set()
+        affected: set[str] = set()
+        assumption_driven: set[str] = set()
+        if index is not None:
+            indexed = index.indexed_claims(context)
+            affected = index.claims_depending_on(context, [change.target_item_id or ""])
+            assumption_driven = index.claims_depending_on(context, assumption_ids_of(current))
+        return _ContextState(
+            current, propose_catalog(current, change), indexed, affected, assumption_driven
+        )
+
+    def run_study(
+        self,
+        cohort: QACohort,
+        change: QAProposedChange,
+        claims: Iterable[Claim],
+        catalog_for: Callable[[Claim], Catalog],
+        index: ClaimDependencyIndex | None = None,
+        on_progress: Callable[[QAStudyResult], None] | None = None,
+        study_id: str | None = None,
+    ) -> QAStudyResult:
+        """Run a full QA impact study for a cohort and proposed change.
+
+        Args:
+            cohort: Cohort being studied
+            change: The proposed change
+            claims: The cohort's claims
+            catalog_for: Returns the current catalog for a claim
+            index: Optional dependency index (see ``evaluate``)
+            on_progress: Called with a partial result after each batch
+            study_id: ID recorded on the results
+
+        Returns:
+            The final study result
+        """
+        def emit(aggregate: DeltaAggregate) -> None:
+            on_progress(
+                self.build_result(cohort, change, aggregate, partial=True, study_id=study_id)
+            )
+
+        aggregate = self.evaluate(
+            claims, change, catalog_for, index, emit if on_progress is not None else None
+        )
+        return self.build_result(cohort, change, aggregate, partial=False, study_id=study_id)
+
+    def build_result(
+        self,
+        cohort: QACohort,
+        change: QAProposedChange,
+        aggregate: DeltaAggregate,
+        partial: bool,
+        study_id: str | None = None,
+    ) -> QAStudyResult:
+        """Build a (possibly partial) study result from an aggregate."""
+        impacted = aggregate.impacted
+        flags, flag_reasons = evaluate_flags(aggregate, self.flag_rules)
+        return QAStudyResult(
+            study_id=study_id,
+            cohort_id=cohort.cohort_id,
+            cohort_label=cohort.label,
+            proposal_id=change.proposal_id,
+            proposal_label=change.label,
+            impacted_claims_count=impacted.count,
+            total_delta_payout=round(impacted.total, 2),
+            top_impacted_claims=aggregate.impacted_claims(),
+            flags=flags,
+            flag_reasons=flag_reasons,
+            summary=(
+                f"{impacted.count} of {aggregate.claim_count} claims impacted; "
+                f"total payout delta CHF {impacted.total:+,.2f} "
+                f"({aggregate.evaluated} claims re-evaluated)"
+            ),
+            run_date=datetime.now(),
+            delta_stats=aggregate.delta_stats(),
+            claims_processed=aggregate.claim_count,
+            is_partial=partial,
+        )
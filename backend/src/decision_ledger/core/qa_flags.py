@@ -0,0 +1,103 @@
+"""Flags computed from a QA study's streaming aggregates.
+
+Flags are derived from counters that ``DeltaAggregate`` collects while the
+deltas are computed, so flagging needs no second pass over the cohort:
+
+- ``HIGH_IMPACT``: the total or a single claim's payout delta, or the share
+  of impacted claims, reaches a configured threshold.
+- ``LOW_CONFIDENCE``: too many outcomes depended on an assumption rather
+  than a known fact.
+- ``INCONSISTENCY_DETECTED``: claims in the same similarity bucket (same
+  line of business, line-item categories and claimed amount band) reacted
+  differently to the change, e.g. some gained and others were unaffected.
+"""
+
+import math
+
+from pydantic import BaseModel
+
+from decision_ledger.config import Settings
+from decision_ledger.core.qa_stats import DeltaAggregate
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.qa import QAFlag
+
+SimilarityKey = tuple[str, str, tuple[str, ...], int]
+
+
+class QAFlagRules(BaseModel):
+    """Thresholds for computed QA flags."""
+
+    high_impact_total_delta: float = 10_000.0
+    high_impact_claim_delta: float = 5_000.0
+    high_impact_claim_share: float = 0.25
+    low_confidence_assumption_share: float = 0.5
+    inconsistency_min_bucket_claims: int = 5
+    inconsistency_min_share: float = 0.1
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "QAFlagRules":
+        """Build the rules from ``qa_flag_*`` settings."""
+        return cls(
+            **{
+                name: getattr(settings, f"qa_flag_{name}")
+                for name in cls.model_fields
+                if hasattr(settings, f"qa_flag_{name}")
+            }
+        )
+
+
+def similarity_key(claim: Claim) -> SimilarityKey:
+    """Bucket of claims that should react alike to a catalog change.
+
+    Claimed amounts are banded by powers of two, so claims of roughly the
+    same size share a bucket.
+    """
+    total = sum(item.amount_chf for item in claim.line_items)
+    band = int(math.log2(total)) if total >= 1 else 0
+    categories = tuple(sorted({item.category for item in claim.line_items}))
+    return (claim.jurisdiction, claim.product_line, categories, band)
+
+
+def evaluate_flags(aggregate: DeltaAggregate, rules: QAFlagRules) -> tuple[list[QAFlag], list[str]]:
+    """Evaluate flag rules against a study's aggregate.
+
+    Returns:
+        Tuple of (flags raised, one human-readable reason per flag)
+    """
+    flags: list[QAFlag] = []
+    reasons: list[str] = []
+    count = aggregate.claim_count
+    if not count:
+        return flags, reasons
+
+    impacted = aggregate.impacted
+    largest = max(abs(impacted.min), abs(impacted.max)) if impacted.count else 0.0
+    share = impacted.count / count
+    if abs(impacted.total) >= rules.high_impact_total_delta:
+        flags.append(QAFlag.HIGH_IMPACT)
+        reasons.append(f"Total payout delta CHF {impacted.total:+,.2f} exceeds threshold")
+    elif largest >= rules.high_impact_claim_delta:
+        flags.append(QAFlag.HIGH_IMPACT)
+        reasons.append(f"A single claim's payout changes by CHF {largest:,.2f}")
+    elif share >= rules.high_impact_claim_share:
+        flags.append(QAFlag.HIGH_IMPACT)
+        reasons.append(f"{share:.0%} of claims are impacted")
+
+    assumption_share = aggregate.assumption_driven / count
+    if assumption_share >= rules.low_confidence_assumption_share:
+        flags.append(QAFlag.LOW_CONFIDENCE)
+        reasons.append(f"{assumption_share:.0%} of outcomes depend on assumptions")
+
+    inconsistent = 0
+    for reactions in aggregate.buckets.values():
+        size = sum(reactions)
+        if size < rules.inconsistency_min_bucket_claims:
+            continue
+        minority = size - max(reactions)
+        if minority / size >= rules.inconsistency_min_share:
+            inconsistent += 1
+    if inconsistent:
+        flags.append(QAFlag.INCONSISTENCY_DETECTED)
+        reasons.append(f"Similar claims react differently in {inconsistent} bucket(s)")
+
+    return flags, reasons
@@ -0,0 +1,351 @@
+"""Monte Carlo simulation of assumption uncertainty over a QA cohort.
+
+A deterministic QA study resolves every UNKNOWN fact with its recommended
+resolution. A simulation instead treats each governed assumption as a
+random choice between its alternatives, weighted by
+``AssumptionAlternative.probability``, and reports the distribution of the
+cohort's total payout under the current and the proposed catalog.
+
+Running the engine once per draw would be far too slow, so the engine only
+runs once per claim and resolution combination to build a *payout table*:
+the probability of each combination and the payout it yields under both
+catalogs. Claims whose outcome does not depend on any uncertain assumption
+collapse to a single entry. Claims with identical tables are grouped, and
+each draw samples how many claims of a group land on each combination
+(a multinomial), so sampling cost depends on the number of distinct tables
+rather than the number of claims. Both catalogs see the same sampled
+resolutions, so deltas reflect the change and not sampling noise.
+
+Sampling uses numpy when it is installed (``pip install
+decision-ledger[simulation]``) and falls back to pure Python otherwise.
+Results are reproducible for a given seed and sampler.
+"""
+
+import itertools
+import math
+import random
+from collections import Counter
+from concurrent.futures import Executor, as_completed
+from datetime import datetime
+from typing import Callable, Iterable, NamedTuple
+
+from decision_ledger.core.engine import DecisionEngine
+from decision_ledger.core.catalog_types import Catalog, catalog_context
+from decision_ledger.core.qa_engine import propose_catalog, run_under_catalog
+from decision_ledger.core.qa_stats import RunningStats
+from decision_ledger.core.resolution import (
+    SYSTEM_ROLE,
+    default_interpretations,
+    recommended_assumptions,
+)
+from decision_ledger.schemas.catalog import Assumption
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.decision import ResolvedAssumption
+from decision_ledger.schemas.qa import (
+    QACohort,
+    QAPayoutDistribution,
+    QAProposedChange,
+    QASimulationResult,
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional extra
+    np = None
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Upper bound on draws x groups x outcomes sampled at once with numpy
+_CHUNK_ELEMENTS = 4_000_000
+
+
+class PayoutTable(NamedTuple):
+    """Probability and payout of each resolution combination for a claim."""
+
+    probabilities: tuple[float, ...]
+    current: tuple[float, ...]
+    proposed: tuple[float, ...]
+
+
+def alternative_probabilities(assumption: Assumption) -> tuple[float, ...]:
+    """Probabilities of an assumption's alternatives, in list order.
+
+    Alternatives without a probability share the remaining mass equally.
+
+    Raises:
+        ValueError: If probabilities are negative or do not sum to 1
+    """
+    given = [a.probability for a in assumption.alternatives]
+    if any(p is not None and p < 0 for p in given):
+        raise ValueError(f"Assumption {assumption.assumption_id} has a negative probability")
+    assigned = sum(p for p in given if p is not None)
+    missing = given.count(None)
+    if assigned > 1 + 1e-9 or (missing == 0 and abs(assigned - 1) > 1e-9):
+        raise ValueError(
+            f"Probabilities of assumption {assumption.assumption_id} must sum to 1"
+        )
+    share = (1 - assigned) / missing if missing else 0.0
+    return tuple(p if p is not None else share for p in given)
+
+
+def build_payout_tables(
+    engine: DecisionEngine,
+    claims: list[Claim],
+    current: Catalog,
+    proposed: Catalog,
+) -> list[PayoutTable]:
+    """Build the payout table of each claim in a batch sharing the same catalogs.
+
+    Module-level so that it can be sent to a process pool.
+    """
+    assumption_set = current[1]
+    current_interpretations = default_interpretations(current[0])
+    proposed_interpretations = default_interpretations(proposed[0])
+    assumptions = {a.assumption_id: a for a in (assumption_set.assumptions if assumption_set else [])}
+    probabilities = {a_id: alternative_probabilities(a) for a_id, a in assumptions.items()}
+
+    tables: list[PayoutTable] = []
+    for claim in claims:
+        recommended = recommended_assumptions(claim, assumption_set)
+        base_current, current_refs = run_under_catalog(
+            engine, claim, current, current_interpretations, recommended
+        )
+        base_proposed, proposed_refs = run_under_catalog(
+            engine, claim, proposed, proposed_interpretations, recommended
+        )
+        consulted = set(current_refs) | set(proposed_refs)
+        uncertain = [
+            (i, assumptions[ra.assumption_id])
+            for i, ra in enumerate(recommended)
+            if ra.assumption_id in consulted
+        ]
+        if not uncertain:
+            tables.append(PayoutTable((1.0,), (base_current,), (base_proposed,)))
+            continue
+
+        combo_probabilities: list[float] = []
+        current_payouts: list[float] = []
+        proposed_payouts: list[float] = []
+        choices = [range(len(assumption.alternatives)) for _, assumption in uncertain]
+        for combo in itertools.product(*choices):
+            resolved = list(recommended)
+            probability = 1.0
+            for (position, assumption), choice in zip(uncertain, combo):
+                alternative = assumption.alternatives[choice]
+                probability *= probabilities[assumption.assumption_id][choice]
+                resolved[position] = ResolvedAssumption(
+                    assumption_id=assumption.assumption_id,
+                    fact_id=recommended[position].fact_id,
+                    fact_label=recommended[position].fact_label,
+                    chosen_resolution=alternative.alternative_id,
+                    chosen_by_role=SYSTEM_ROLE,
+                    reason="Sampled in QA simulation",
+                )
+            if all(r.chosen_resolution == ra.chosen_resolution for r, ra in zip(resolved, recommended)):
+                payouts = (base_current, base_proposed)
+            else:
+                payouts = (
+                    run_under_catalog(engine, claim, current, current_interpretations, resolved)[0],
+                    run_under_catalog(engine, claim, proposed, proposed_interpretations, resolved)[0],
+                )
+            combo_probabilities.append(probability)
+            current_payouts.append(payouts[0])
+            proposed_payouts.append(payouts[1])
+        tables.append(
+            PayoutTable(tuple(combo_probabilities), tuple(current_payouts), tuple(proposed_payouts))
+        )
+    return tables
+
+
+def sample_totals(
+    groups: dict[PayoutTable, int],
+    draws: int,
+    seed: int,
+    use_numpy: bool = True,
+) -> tuple[list[float], list[float]]:
+    """Sample the cohort's total payout under both catalogs.
+
+    Args:
+        groups: Number of claims sharing each payout table
+        draws: Number of Monte Carlo draws
+        seed: Random seed
+        use_numpy: Use numpy if it is installed
+
+    Returns:
+        Tuple of (current totals, proposed totals), one entry per draw
+    """
+    fixed_current = 0.0
+    fixed_proposed = 0.0
+    uncertain: dict[tuple[float, ...], list[tuple[PayoutTable, int]]] = {}
+    for table, count in groups.items():
+        if len(table.probabilities) == 1:
+            fixed_current += count * table.current[0]
+            fixed_proposed += count * table.proposed[0]
+        else:
+            uncertain.setdefault(table.probabilities, []).append((table, count))
+
+    if use_numpy and np is not None:
+        current, proposed = _sample_numpy(uncertain, draws, seed)
+    else:
+        current, proposed = _sample_python(uncertain, draws, seed)
+    return (
+        [fixed_current + total for total in current],
+        [fixed_proposed + total for total in proposed],
+    )
+
+
+def _sample_numpy(
+    uncertain: dict[tuple[float, ...], list[tuple[PayoutTable, int]]], draws: int, seed: int
+) -> tuple[list[float], list[float]]:
+    """Vectorized multinomial sampling, chunked over draws to bound memory."""
+    rng = np.random.default_rng(seed)
+    current = np.zeros(draws)
+    proposed = np.zeros(draws)
+    for probabilities, tables in uncertain.items():
+        counts = np.array([count for _, count in tables])
+        current_payouts = np.array([table.current for table, _ in tables])
+        proposed_payouts = np.array([table.proposed for table, _ in tables])
+        pvals = np.array(probabilities) / sum(probabilities)
+        chunk = max(1, _CHUNK_ELEMENTS // (len(tables) * len(pvals)))
+        for start in range(0, draws, chunk):
+            size = min(chunk, draws - start)
+            sampled = rng.multinomial(counts, pvals, size=(size, len(tables)))
+            current[start : start + size] += np.einsum("dgk,gk->d", sampled, current_payouts)
+            proposed[start : start + size] += np.einsum("dgk,gk->d", sampled, proposed_payouts)
+    return current.tolist(), proposed.tolist()
+
+
+def _sample_python(
+    uncertain: dict[tuple[float, ...], list[tuple[PayoutTable, int]]], draws: int, seed: int
+) -> tuple[list[float], list[float]]:
+    """Pure-Python fallback: one categorical draw per claim and draw."""
+    rng = random.Random(seed)
+    current = [0.0] * draws
+    proposed = [0.0] * draws
+    for probabilities, tables in uncertain.items():
+        outcomes = range(len(probabilities))
+        cum_weights = list(itertools.accumulate(probabilities))
+        for table, count in tables:
+            for d in range(draws):
+                for k in rng.choices(outcomes, cum_weights=cum_weights, k=count):
+                    current[d] += table.current[k]
+                    proposed[d] += table.proposed[k]
+    return current, proposed
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Linearly interpolated percentile of pre-sorted values (numpy's default)."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(values: list[float]) -> QAPayoutDistribution:
+    """Summarize sampled totals."""
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    ordered = sorted(values)
+    return QAPayoutDistribution(
+        mean=round(stats.mean, 2),
+        std_dev=round(math.sqrt(stats.variance), 2),
+        min=round(stats.min, 2) if values else 0.0,
+        max=round(stats.max, 2) if values else 0.0,
+        percentiles={f"p{q}": round(percentile(ordered, q), 2) for q in PERCENTILES},
+    )
+
+
+class AssumptionSimulator:
+    """Monte Carlo simulation of assumption uncertainty for a cohort."""
+
+    def __init__(
+        self,
+        engine: DecisionEngine | None = None,
+        executor: Executor | None = None,
+        batch_size: int = 2000,
+    ) -> None:
+        """Initialize the simulator.
+
+        Args:
+            engine: Decision engine to use (a new one by default)
+            executor: Executor for building payout tables; None runs inline
+            batch_size: Claims per batch
+        """
+        self.engine = engine or DecisionEngine()
+        self.executor = executor
+        self.batch_size = batch_size
+
+    def payout_groups(
+        self,
+        claims: Iterable[Claim],
+        change: QAProposedChange,
+        catalog_for: Callable[[Claim], Catalog],
+    ) -> dict[PayoutTable, int]:
+        """Build payout tables for all claims and count identical tables."""
+        contexts: dict[str, tuple[Catalog, Catalog, list[Claim]]] = {}
+        for claim in claims:
+            current = catalog_for(claim)
+            key = catalog_context(current)
+            if key not in contexts:
+                contexts[key] = (current, propose_catalog(current, change), [])
+            contexts[key][2].append(claim)
+
+        batches = [
+            (group[start : start + self.batch_size], current, proposed)
+            for current, proposed, group in contexts.values()
+            for start in range(0, len(group), self.batch_size)
+        ]
+        groups: Counter[PayoutTable] = Counter()
+        if self.executor is None:
+            for batch in batches:
+                groups.update(build_payout_tables(self.engine, *batch))
+        else:
+            futures = [self.executor.submit(build_payout_tables, self.engine, *b) for b in batches]
+            for future in as_completed(futures):
+                groups.update(future.result())
+        return groups
+
+    def run(
+        self,
+        cohort: QACohort,
+        change: QAProposedChange,
+        claims: Iterable[Claim],
+        catalog_for: Callable[[Claim], Catalog],
+        draws: int = 1000,
+        seed: int = 0,
+        use_numpy: bool = True,
+    ) -> QASimulationResult:
+        """Simulate the cohort's payout under the current and proposed catalog.
+
+        Args:
+            cohort: Cohort being simulated
+            change: The proposed change
+            claims: The cohort's claims
+            catalog_for: Returns the current catalog for a claim
+            draws: Number of Monte Carlo draws
+            seed: Random seed
+            use_numpy: Use numpy if it is installed
+
+        Returns:
+            Payout distributions for both catalogs and their difference
+        """
+        groups = self.payout_groups(claims, change, catalog_for)
+        current, proposed = sample_totals(groups, draws, seed, use_numpy)
+        return QASimulationResult(
+            cohort_id=cohort.cohort_id,
+            proposal_id=change.proposal_id,
+            draws=draws,
+            seed=seed,
+            sampler="numpy" if use_numpy and np is not None else "python",
+            claim_count=sum(groups.values()),
+            uncertain_claim_count=sum(
+                count for table, count in groups.items() if len(table.probabilities) > 1
+            ),
+            current=summarize(current),
+            proposed=summarize(proposed),
+            delta=summarize([p - c for c, p in zip(current, proposed)]),
+            run_date=datetime.now(),
+        )
@@ -0,0 +1,284 @@
+"""Streaming, mergeable aggregates for QA study deltas.
+
+Every structure here has constant (or O(K)) memory and a ``merge`` method,
+so worker shards can aggregate their own batches and the coordinator only
+combines the partial aggregates. Nothing keeps per-claim deltas around.
+"""
+
+import heapq
+import math
+from bisect import bisect_right
+from typing import Any, Hashable
+
+from decision_ledger.schemas.qa import ImpactedClaim, QADeltaStats, QAHistogramBucket
+
+# Bucket edges (CHF) for the delta histogram; the outer buckets are open
+DEFAULT_HISTOGRAM_EDGES: tuple[float, ...] = (
+    -10000.0, -5000.0, -1000.0, -500.0, -100.0, -0.005,
+    0.005, 100.0, 500.0, 1000.0, 5000.0, 10000.0,
+)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn JSON lists back into (nested) tuples so they can key a dict."""
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class TopK:
+    """The K entries with the largest absolute delta, kept in a min-heap."""
+
+    def __init__(self, k: int) -> None:
+        self.k = k
+        # (abs delta, claim_id, delta); the smallest kept entry is at the root
+        self._heap: list[tuple[float, str, float]] = []
+
+    def push(self, claim_id: str, delta: float) -> None:
+        """Offer an entry; it is kept only if it ranks in the top K."""
+        if self.k <= 0:
+            return
+        entry = (abs(delta), claim_id, delta)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def merge(self, other: "TopK") -> None:
+        """Fold another shard's top entries into this one."""
+        for _, claim_id, delta in other._heap:
+            self.push(claim_id, delta)
+
+    def items(self) -> list[tuple[str, float]]:
+        """(claim_id, delta) pairs ordered by absolute delta, largest first."""
+        return [(claim_id, delta) for _, claim_id, delta in sorted(self._heap, reverse=True)]
+
+    def to_state(self) -> list[list[Any]]:
+        """JSON-serializable state (see ``DeltaAggregate.to_state``)."""
+        return [list(entry) for entry in self._heap]
+
+    def load_state(self, state: list[list[Any]]) -> None:
+        """Restore state produced by ``to_state``."""
+        self._heap = [tuple(entry) for entry in state]
+        heapq.heapify(self._heap)
+
+
+class RunningStats:
+    """Count, sum, mean, variance, min and max via Welford's algorithm."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add a single observation."""
+        self.count += 1
+        d = value - self.mean
+        self.mean += d / self.count
+        self.m2 += d * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def add_repeated(self, value: float, n: int) -> None:
+        """Add ``n`` observations of the same value in O(1)."""
+        if n <= 0:
+            return
+        block = RunningStats()
+        block.count, block.mean, block.min, block.max = n, value, value, value
+        self.merge(block)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Combine with another shard (Chan et al. parallel update)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        total = self.count + other.count
+        d = other.mean - self.mean
+        self.mean += d * other.count / total
+        self.m2 += other.m2 + d * d * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def to_state(self) -> list[float]:
+        """JSON-serializable state (see ``DeltaAggregate.to_state``)."""
+        return [self.count, self.mean, self.m2, self.min, self.max]
+
+    def load_state(self, state: list[float]) -> None:
+        """Restore state produced by ``to_state``."""
+        count, self.mean, self.m2, self.min, self.max = state
+        self.count = int(count)
+
+    @property
+    def total(self) -> float:
+        """Sum of all observations."""
+        return self.mean * self.count
+
+    @property
+    def variance(self) -> float:
+        """Population variance."""
+        return self.m2 / self.count if self.count else 0.0
+
+
+class Histogram:
+    """Fixed-edge histogram; bucket i covers [edges[i-1], edges[i])."""
+
+    def __init__(self, edges: tuple[float, ...] = DEFAULT_HISTOGRAM_EDGES) -> None:
+        self.edges = edges
+        self.counts = [0] * (len(edges) + 1)
+
+    def add(self, value: float, n: int = 1) -> None:
+        """Count ``n`` observations of ``value``."""
+        self.counts[bisect_right(self.edges, value)] += n
+
+    def merge(self, other: "Histogram") -> None:
+        """Combine with a histogram that uses the same edges."""
+        if other.edges != self.edges:
+            raise ValueError("Cannot merge histograms with different edges")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+
+    def buckets(self) -> list[QAHistogramBucket]:
+        """Non-empty buckets with their bounds (None for open ends)."""
+        bounds = [None, *self.edges, None]
+        return [
+            QAHistogramBucket(lower=bounds[i], upper=bounds[i + 1], count=count)
+            for i, count in enumerate(self.counts)
+            if count
+        ]
+
+
+class DeltaAggregate:
+    """All streaming aggregates of a QA study, mergeable across shards."""
+
+    def __init__(
+        self,
+        top_k: int = 10,
+        tolerance: float = 0.005,
+        edges: tuple[float, ...] = DEFAULT_HISTOGRAM_EDGES,
+    ) -> None:
+        self.tolerance = tolerance
+        self.evaluated = 0
+        # Claims whose outcome depended on an assumption (see core.qa_flags)
+        self.assumption_driven = 0
+        # Similarity bucket -> [decreased, unchanged, increased] claim counts
+        self.buckets: dict[Hashable, list[int]] = {}
+        self.stats = RunningStats()
+        self.impacted = RunningStats()
+        self.top = TopK(top_k)
+        self.histogram = Histogram(edges)
+
+    def add(
+        self,
+        claim_id: str,
+        delta: float,
+        bucket: Hashable | None = None,
+        assumption_driven: bool = False,
+    ) -> None:
+        """Add one claim's delta.
+
+        Args:
+            claim_id: The claim
+            delta: Proposed minus baseline payout
+            bucket: Similarity bucket of the claim, if tracked
+            assumption_driven: Whether the outcome depended on an assumption
+        """
+        self.evaluated += 1
+        self.stats.add(delta)
+        self.histogram.add(delta)
+        reaction = 1
+        if abs(delta) > self.tolerance:
+            self.impacted.add(delta)
+            self.top.push(claim_id, delta)
+            reaction = 2 if delta > 0 else 0
+        self._track(bucket, reaction, 1, assumption_driven)
+
+    def add_unchanged(
+        self, n: int, bucket: Hashable | None = None, assumption_driven: bool = False
+    ) -> None:
+        """Add ``n`` claims known to have a zero delta without evaluating them."""
+        self.stats.add_repeated(0.0, n)
+        if n > 0:
+            self.histogram.add(0.0, n)
+            self._track(bucket, 1, n, assumption_driven)
+
+    def _track(self, bucket: Hashable | None, reaction: int, n: int, assumption_driven: bool) -> None:
+        if assumption_driven:
+            self.assumption_driven += n
+        if bucket is not None:
+            counts = self.buckets.get(bucket)
+            if counts is None:
+                counts = self.buckets[bucket] = [0, 0, 0]
+            counts[reaction] += n
+
+    def merge(self, other: "DeltaAggregate") -> None:
+        """Combine with another shard's aggregate."""
+        self.evaluated += other.evaluated
+        self.assumption_driven += other.assumption_driven
+        for bucket, counts in other.buckets.items():
+            mine = self.buckets.setdefault(bucket, [0, 0, 0])
+            for i, n in enumerate(counts):
+                mine[i] += n
+        self.stats.merge(other.stats)
+        self.impacted.merge(other.impacted)
+        self.top.merge(other.top)
+        self.histogram.merge(other.histogram)
+
+    def to_state(self) -> dict[str, Any]:
+        """JSON-serializable state, e.g. for a job checkpoint."""
+        return {
+            "evaluated": self.evaluated,
+            "assumption_driven": self.assumption_driven,
+            "stats": self.stats.to_state(),
+            "impacted": self.impacted.to_state(),
+            "top": self.top.to_state(),
+            "histogram": self.histogram.counts,
+            "buckets": [[bucket, counts] for bucket, counts in self.buckets.items()],
+        }
+
+    @classmethod
+    def from_state(
+        cls,
+        state: dict[str, Any],
+        top_k: int = 10,
+        tolerance: float = 0.005,
+        edges: tuple[float, ...] = DEFAULT_HISTOGRAM_EDGES,
+    ) -> "DeltaAggregate":
+        """Rebuild an aggregate from ``to_state`` output."""
+        aggregate = cls(top_k=top_k, tolerance=tolerance, edges=edges)
+        aggregate.evaluated = state["evaluated"]
+        aggregate.assumption_driven = state["assumption_driven"]
+        aggregate.stats.load_state(state["stats"])
+        aggregate.impacted.load_state(state["impacted"])
+        aggregate.top.load_state(state["top"])
+        aggregate.histogram.counts = list(state["histogram"])
+        aggregate.buckets = {_freeze(bucket): list(counts) for bucket, counts in state["buckets"]}
+        return aggregate
+
+    @property
+    def claim_count(self) -> int:
+        """Number of claims aggregated so far."""
+        return self.stats.count
+
+    def impacted_claims(self) -> list[ImpactedClaim]:
+        """Top impacted claims, largest absolute delta first."""
+        return [ImpactedClaim(claim_id=c, delta=round(d, 2)) for c, d in self.top.items()]
+
+    def delta_stats(self) -> QADeltaStats:
+        """Summary statistics of the per-claim deltas."""
+        stats = self.stats
+        return QADeltaStats(
+            count=stats.count,
+            total=round(stats.total, 2),
+            mean=stats.mean,
+            variance=stats.variance,
+            std_dev=math.sqrt(stats.variance),
+            min=stats.min if stats.count else 0.0,
+            max=stats.max if stats.count else 0.0,
+            histogram=self.histogram.buckets(),
+        )
@@ -0,0 +1,183 @@
+"""Deterministic replay of stored decision runs.
+
+Each run is re-executed with the interpretation and assumption set versions
+it recorded and its recorded ``resolved_assumptions`` and
+``selected_interpretations``. The replayed outcome totals are compared with
+the stored ones, and the replayed outcome and trace, as canonical JSON,
+with the stored hash of the original ones (see ``storage.run_records``), so
+any drift (e.g. after an engine change) is reported. Runs whose claim was
+edited since they were recorded are reported as such, not as drift.
+
+Runs arrive as the raw JSON stored in the state database and are grouped
+into fixed-size batches per catalog, like QA studies (see
+``core.qa_engine``). Parsing happens in ``replay_batch``, so with a process
+pool the coordinator only streams rows and collects drifts.
+"""
+
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Callable, Iterable
+
+from decision_ledger.core.engine import DecisionEngine
+from decision_ledger.core.catalog_types import Catalog
+from decision_ledger.core.run_codec import claim_changed, missing_versions, regenerate_run
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.decision import ReplayDrift, StoredDecisionRun
+from decision_ledger.storage.run_records import result_hash
+from decision_ledger.storage.sqlite import StoredRun
+
+
+def replay_batch(
+    engine: DecisionEngine, items: list[tuple[StoredRun, Claim | None]], catalog: Catalog
+) -> list[ReplayDrift]:
+    """Replay runs that recorded the same catalog.
+
+    Module-level so that it can be sent to a process pool.
+
+    Args:
+        items: (stored run, its claim or None if it no longer exists)
+        catalog: The recorded sets; None for a set that is not available
+    """
+    drifts: list[ReplayDrift] = []
+    for stored, claim in items:
+        drift = _replay(engine, stored.decode(), claim, catalog)
+        if drift is not None:
+            drifts.append(drift)
+    return drifts
+
+
+def _replay(
+    engine: DecisionEngine, stored: StoredDecisionRun, claim: Claim | None, catalog: Catalog
+) -> ReplayDrift | None:
+    if claim is None:
+        return ReplayDrift(
+            run_id=stored.run_id,
+            claim_id=stored.claim_id,
+            kind="missing_claim",
+            detail=f"Claim {stored.claim_id} not found",
+        )
+    missing = missing_versions(stored.inputs, catalog)
+    if missing:
+        return ReplayDrift(
+            run_id=stored.run_id,
+            claim_id=stored.claim_id,
+            kind="missing_catalog",
+            detail=f"Recorded set versions not available: {', '.join(missing)}",
+        )
+    run = regenerate_run(engine, stored, claim, catalog)
+    outcome = run.outcome
+    recorded = (stored.approved, stored.status, stored.payout_total, stored.deductible_applied)
+    replayed = (outcome.approved, outcome.status, outcome.payout_total, outcome.deductible_applied)
+    reproduced = result_hash(outcome, run.trace_steps) == stored.result_hash
+    if not reproduced and claim_changed(stored.inputs, claim):
+        return ReplayDrift(
+            run_id=stored.run_id,
+            claim_id=stored.claim_id,
+            kind="claim_changed",
+            detail=(
+                f"Claim changed since the run; recorded {stored.status.value} "
+                f"{stored.payout_total:.2f}, replayed {outcome.status.value} "
+                f"{outcome.payout_total:.2f}"
+            ),
+        )
+    if recorded != replayed:
+        return ReplayDrift(
+            run_id=stored.run_id,
+            claim_id=stored.claim_id,
+            kind="outcome",
+            detail=(
+                f"Recorded {stored.status.value} {stored.payout_total:.2f}, "
+                f"replayed {outcome.status.value} {outcome.payout_total:.2f}"
+            ),
+        )
+    if not reproduced:
+        return ReplayDrift(
+            run_id=stored.run_id,
+            claim_id=stored.claim_id,
+            kind="trace",
+            detail="Payout breakdown or trace differs from the recorded result",
+        )
+    return None
+
+
+class RunReplayer:
+    """Replays streams of stored runs, inline or on an executor."""
+
+    def __init__(
+        self,
+        engine: DecisionEngine | None = None,
+        executor: Executor | None = None,
+        batch_size: int = 2000,
+        max_pending: int = 16,
+        max_reported: int = 100,
+    ) -> None:
+        """Initialize the replayer.
+
+        Args:
+            engine: Decision engine to replay with (a new one by default)
+            executor: Executor for batches; None replays inline
+            batch_size: Runs per batch
+            max_pending: Batches allowed in flight on the executor
+            max_reported: Drifts kept for the report; all are counted
+        """
+        self.engine = engine or DecisionEngine()
+        self.executor = executor
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.max_reported = max_reported
+
+    def replay(
+        self,
+        runs: Iterable[StoredRun],
+        claims: dict[str, Claim],
+        catalog_for: Callable[[str, str], Catalog],
+    ) -> tuple[int, int, list[ReplayDrift]]:
+        """Replay runs, with at most ``max_pending`` batches in flight.
+
+        Args:
+            runs: Stored runs, e.g. streamed from the state store
+            claims: Claims by ID
+            catalog_for: Returns the sets with a recorded interpretation set ID
+                and assumption set ID (None for a set that does not exist)
+
+        Returns:
+            Tuple of (runs replayed, drift count, first ``max_reported`` drifts)
+        """
+        replayed = 0
+        drift_count = 0
+        reported: list[ReplayDrift] = []
+        batches: dict[tuple[str, str], list[tuple[StoredRun, Claim | None]]] = {}
+        catalogs: dict[tuple[str, str], Catalog] = {}
+        pending: deque[Future[list[ReplayDrift]]] = deque()
+
+        def collect(drifts: list[ReplayDrift]) -> None:
+            nonlocal drift_count
+            drift_count += len(drifts)
+            reported.extend(drifts[: self.max_reported - len(reported)])
+
+        def flush(key: tuple[str, str]) -> None:
+            batch = batches.pop(key, None)
+            if not batch:
+                return
+            args = (self.engine, batch, catalogs[key])
+            if self.executor is None:
+                collect(replay_batch(*args))
+                return
+            pending.append(self.executor.submit(replay_batch, *args))
+            while len(pending) > self.max_pending:
+                collect(pending.popleft().result())
+
+        for run in runs:
+            key = (run.interpretation_set_id, run.assumption_set_id)
+            if key not in catalogs:
+                catalogs[key] = catalog_for(*key)
+            batch = batches.setdefault(key, [])
+            batch.append((run, claims.get(run.claim_id)))
+            replayed += 1
+            if len(batch) >= self.batch_size:
+                flush(key)
+        for key in list(batches):
+            flush(key)
+        while pending:
+            collect(pending.popleft().result())
+        return replayed, drift_count, reported
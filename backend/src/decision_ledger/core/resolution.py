@@ -0,0 +1,165 @@
+"""Derive engine inputs from a catalog's defaults.
+
+Interactive runs take interpretations and assumption resolutions from the
+user. Batch work (QA studies, backfills) instead runs each claim "under a
+catalog": every decision point uses its default option and every UNKNOWN
+fact with a governed assumption uses the recommended resolution.
+
+An ``AssumptionTriggerMap``, built once per assumption set version, maps
+each fact ID to the assumption it triggers, so resolving a claim is one
+pass over its facts. It also holds, per alternative, the roles allowed to
+choose it as a bitmask, so checking a user's resolution is one AND.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Iterable, NamedTuple
+
+from decision_ledger.schemas.claim import Claim, FactStatus
+from decision_ledger.schemas.catalog import Assumption, AssumptionSet, InterpretationSet, Role
+from decision_ledger.schemas.decision import ResolvedAssumption, SelectedInterpretation
+
+SYSTEM_ROLE = "System"
+
+# One bit per role; the system role may only apply recommended resolutions
+ROLE_BITS: dict[str, int] = {role.value: 1 << i for i, role in enumerate(Role)}
+
+_RECOMMENDED_REASON = "Recommended resolution applied automatically"
+
+
+def role_mask(roles: Iterable[str]) -> int:
+    """Bitmask of the given roles (unknown roles contribute nothing)."""
+    mask = 0
+    for role in roles:
+        mask |= ROLE_BITS.get(role, 0)
+    return mask
+
+
+class AssumptionTrigger(NamedTuple):
+    """An assumption with its alternatives' role permissions precomputed."""
+
+    assumption: Assumption
+    allowed_roles: dict[str, int]  # alternative ID -> role bitmask
+
+
+class AssumptionTriggerMap:
+    """Lookups of one assumption set version by trigger fact and by assumption ID."""
+
+    def __init__(self, assumption_set: AssumptionSet | None) -> None:
+        self.by_fact: dict[str, AssumptionTrigger] = {}
+        self.by_assumption: dict[str, AssumptionTrigger] = {}
+        for assumption in assumption_set.assumptions if assumption_set else []:
+            trigger = AssumptionTrigger(
+                assumption,
+                {a.alternative_id: role_mask(a.allowed_roles) for a in assumption.alternatives},
+            )
+            # The first assumption on a fact wins, as in catalog order
+            self.by_fact.setdefault(assumption.trigger_fact_id, trigger)
+            self.by_assumption.setdefault(assumption.assumption_id, trigger)
+        # Recommended resolutions by (fact ID, fact label); the same for every claim
+        self._recommended: dict[tuple[str, str], ResolvedAssumption] = {}
+
+    def recommended(self, claim: Claim) -> list[ResolvedAssumption]:
+        """Resolve each UNKNOWN fact of the claim with its recommended resolution.
+
+        The returned resolutions are shared between claims and must not be
+        modified.
+        """
+        resolved: list[ResolvedAssumption] = []
+        for fact in claim.facts:
+            if fact.status != FactStatus.UNKNOWN:
+                continue
+            trigger = self.by_fact.get(fact.fact_id)
+            if trigger is None:
+                continue
+            key = (fact.fact_id, fact.label)
+            resolution = self._recommended.get(key)
+            if resolution is None:
+                resolution = self._recommended.setdefault(
+                    key,
+                    ResolvedAssumption(
+                        assumption_id=trigger.assumption.assumption_id,
+                        fact_id=fact.fact_id,
+                        fact_label=fact.label,
+                        chosen_resolution=trigger.assumption.recommended_resolution,
+                        chosen_by_role=SYSTEM_ROLE,
+                        reason=_RECOMMENDED_REASON,
+                    ),
+                )
+            resolved.append(resolution)
+        return resolved
+
+    def check_resolution(self, resolution: ResolvedAssumption) -> None:
+        """Check that the resolving role may choose the resolution.
+
+        Assumptions outside the set are not checked.
+
+        Raises:
+            ValueError: If the alternative does not exist or the role may not choose it
+        """
+        trigger = self.by_assumption.get(resolution.assumption_id)
+        if trigger is None:
+            return
+        assumption = trigger.assumption
+        allowed = trigger.allowed_roles.get(resolution.chosen_resolution)
+        if allowed is None:
+            raise ValueError(
+                f"Alternative {resolution.chosen_resolution} not defined for "
+                f"{assumption.assumption_id}"
+            )
+        if resolution.chosen_by_role == SYSTEM_ROLE:
+            permitted = resolution.chosen_resolution == assumption.recommended_resolution
+        else:
+            permitted = bool(allowed & ROLE_BITS.get(resolution.chosen_by_role, 0))
+        if not permitted:
+            raise ValueError(
+                f"Role {resolution.chosen_by_role} may not choose "
+                f"{resolution.chosen_resolution} for {assumption.assumption_id}"
+            )
+
+
+# Trigger maps of recently used assumption set versions, by object identity
+_TRIGGER_MAPS: "OrderedDict[int, tuple[AssumptionSet | None, AssumptionTriggerMap]]" = OrderedDict()
+_TRIGGER_MAPS_MAX = 64
+_trigger_maps_lock = threading.Lock()
+
+
+def trigger_map(assumption_set: AssumptionSet | None) -> AssumptionTriggerMap:
+    """The trigger map of an assumption set version, built on first use.
+
+    Sets are immutable once built (see ``core.catalog_changes``), so maps
+    are cached by object; each entry keeps its set alive so the ``id`` is
+    not reused while cached.
+    """
+    key = id(assumption_set)
+    with _trigger_maps_lock:
+        entry = _TRIGGER_MAPS.get(key)
+        if entry is not None and entry[0] is assumption_set:
+            _TRIGGER_MAPS.move_to_end(key)
+            return entry[1]
+    triggers = AssumptionTriggerMap(assumption_set)
+    with _trigger_maps_lock:
+        _TRIGGER_MAPS[key] = (assumption_set, triggers)
+        while len(_TRIGGER_MAPS) > _TRIGGER_MAPS_MAX:
+            _TRIGGER_MAPS.popitem(last=False)
+    return triggers
+
+
+def default_interpretations(
+    interpretation_set: InterpretationSet | None,
+) -> list[SelectedInterpretation]:
+    """Select the default option of every decision point in the set."""
+    if interpretation_set is None:
+        return []
+    return [
+        SelectedInterpretation(decision_point_id=dp.decision_point_id, option=dp.default_option)
+        for dp in interpretation_set.decision_points
+    ]
+
+
+def recommended_assumptions(
+    claim: Claim,
+    assumption_set: AssumptionSet | None,
+) -> list[ResolvedAssumption]:
+    """Resolve each UNKNOWN fact of the claim with its recommended resolution."""
+    return trigger_map(assumption_set).recommended(claim)
@@ -0,0 +1,108 @@
+"""Regeneration of full decision runs from their compact stored form.
+
+Runs are stored without their payout breakdown, trace and dependencies
+(see ``storage.run_records``). Those are reproduced by running the engine
+again on the claim with the recorded set versions and choices, and the
+result is checked against the stored hash of the original outcome and
+trace, so a regenerated receipt is exactly the one originally issued.
+"""
+
+from decision_ledger.core.engine import DecisionEngine
+from decision_ledger.core.catalog_types import Catalog
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.decision import DecisionRun, RunInputs, StoredDecisionRun
+from decision_ledger.storage.run_records import result_hash
+from decision_ledger.utils.hashing import content_hash
+
+
+class RunRegenerationError(Exception):
+    """A stored run cannot be regenerated, or regenerates differently."""
+
+
+def missing_versions(inputs: RunInputs, catalog: Catalog) -> list[str]:
+    """Recorded set versions that ``catalog`` does not provide."""
+    interpretation_set, assumption_set = catalog
+    missing = []
+    if inputs.interpretation_set_id != "unknown" and (
+        interpretation_set is None
+        or interpretation_set.version != inputs.interpretation_set_version
+    ):
+        missing.append(f"{inputs.interpretation_set_id} {inputs.interpretation_set_version}")
+    if inputs.assumption_set_id != "unknown" and (
+        assumption_set is None or assumption_set.version != inputs.assumption_set_version
+    ):
+        missing.append(f"{inputs.assumption_set_id} {inputs.assumption_set_version}")
+    return missing
+
+
+def claim_changed(inputs: RunInputs, claim: Claim) -> bool:
+    """Whether ``claim`` differs from the claim content a run recorded."""
+    return inputs.claim_hash is not None and content_hash(claim) != inputs.claim_hash
+
+
+def regenerate_run(
+    engine: DecisionEngine, stored: StoredDecisionRun, claim: Claim, catalog: Catalog
+) -> DecisionRun:
+    """Run the engine again on a stored run's inputs, without checking the result."""
+    interpretation_set, assumption_set = catalog
+    inputs = stored.inputs
+    outcome, trace_steps, dependencies = engine.run_with_dependencies(
+        claim=claim,
+        interpretation_set=interpretation_set,
+        assumption_set=assumption_set,
+        resolved_assumptions=inputs.resolved_assumptions,
+        selected_interpretations=inputs.selected_interpretations,
+    )
+    return DecisionRun(
+        run_id=stored.run_id,
+        claim_id=stored.claim_id,
+        timestamp=stored.timestamp,
+        interpretation_set_id=inputs.interpretation_set_id,
+        interpretation_set_version=inputs.interpretation_set_version,
+        assumption_set_id=inputs.assumption_set_id,
+        assumption_set_version=inputs.assumption_set_version,
+        resolved_assumptions=inputs.resolved_assumptions,
+        selected_interpretations=inputs.selected_interpretations,
+        outcome=outcome,
+        trace_steps=trace_steps,
+        generated_by_role=stored.generated_by_role,
+        dependencies=dependencies,
+        supersedes_run_id=stored.supersedes_run_id,
+    )
+
+
+def expand_run(
+    engine: DecisionEngine, stored: StoredDecisionRun, claim: Claim | None, catalog: Catalog
+) -> DecisionRun:
+    """Regenerate the full run and check it against the stored result hash.
+
+    A run stored in full is returned as stored.
+
+    Raises:
+        RunRegenerationError: If the claim or a recorded set version is no
+            longer available, or the run no longer reproduces because the
+            claim was edited or the engine changed
+    """
+    if stored.full_run is not None:
+        return stored.full_run
+    if claim is None:
+        raise RunRegenerationError(
+            f"Cannot regenerate run {stored.run_id}: claim {stored.claim_id} not found"
+        )
+    missing = missing_versions(stored.inputs, catalog)
+    if missing:
+        raise RunRegenerationError(
+            f"Cannot regenerate run {stored.run_id}: set versions not available: "
+            + ", ".join(missing)
+        )
+    run = regenerate_run(engine, stored, claim, catalog)
+    if result_hash(run.outcome, run.trace_steps) != stored.result_hash:
+        if claim_changed(stored.inputs, claim):
+            raise RunRegenerationError(
+                f"Cannot regenerate run {stored.run_id}: claim {stored.claim_id} "
+                "changed since the run was recorded"
+            )
+        raise RunRegenerationError(
+            f"Run {stored.run_id} no longer reproduces its recorded outcome and trace"
+        )
+    return run
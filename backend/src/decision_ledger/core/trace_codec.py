@@ -0,0 +1,132 @@
+"""Compact trace encoding with shared step templates.
+
+Trace steps produced by the engine repeat the same labels, descriptions,
+inputs and rule references across every run. The compact encoding moves
+those run-independent parts into templates keyed by a content hash, so a
+list of runs carries each distinct template once.
+
+In memory, ``TraceStepPool`` shares whole steps: runs kept in the run
+cache refer to one instance per distinct step content.
+"""
+
+import threading
+import weakref
+
+from decision_ledger.schemas.decision import (
+    CompactTraceStep,
+    TraceStep,
+    TraceStepTemplate,
+)
+from decision_ledger.utils.hashing import content_hash
+
+
+def template_id_for(step: TraceStep) -> str:
+    """Return the content-addressed template ID for a trace step."""
+    digest = content_hash(
+        [step.label, step.description, step.inputs_used, step.rule_refs, step.evidence_refs]
+    )
+    return "TPL-" + digest[:12]
+
+
+def encode_trace(
+    steps: list[TraceStep],
+    templates: dict[str, TraceStepTemplate],
+) -> list[CompactTraceStep]:
+    """Encode trace steps, registering any new templates in ``templates``.
+
+    Args:
+        steps: Full trace steps of a single run
+        templates: Template registry shared across the runs being encoded
+
+    Returns:
+        Compact steps referencing entries in ``templates``
+    """
+    compact: list[CompactTraceStep] = []
+    for step in steps:
+        template_id = template_id_for(step)
+        if template_id not in templates:
+            templates[template_id] = TraceStepTemplate(
+                template_id=template_id,
+                label=step.label,
+                description=step.description,
+                inputs_used=step.inputs_used,
+                rule_refs=step.rule_refs,
+                evidence_refs=step.evidence_refs,
+            )
+        compact.append(
+            CompactTraceStep(
+                template_id=template_id,
+                step_number=step.step_number,
+                output=step.output,
+                output_value=step.output_value,
+                step_id=None if step.step_id == f"STEP-{step.step_number}" else step.step_id,
+            )
+        )
+    return compact
+
+
+def decode_trace(
+    steps: list[CompactTraceStep],
+    templates: dict[str, TraceStepTemplate],
+) -> list[TraceStep]:
+    """Expand compact steps back into full trace steps.
+
+    Raises:
+        KeyError: If a step references a template missing from ``templates``
+    """
+    decoded: list[TraceStep] = []
+    for step in steps:
+        template = templates[step.template_id]
+        decoded.append(
+            TraceStep(
+                step_id=step.step_id or f"STEP-{step.step_number}",
+                step_number=step.step_number,
+                label=template.label,
+                description=template.description,
+                inputs_used=list(template.inputs_used),
+                rule_refs=list(template.rule_refs),
+                evidence_refs=list(template.evidence_refs),
+                output=step.output,
+                output_value=step.output_value,
+            )
+        )
+    return decoded
+
+
+class TraceStepPool:
+    """Content-addressed pool of trace steps shared between runs.
+
+    Runs of similar claims produce many identical steps. Steps passed
+    through ``share`` are replaced by the pooled instance with the same
+    content, so each distinct step is held once however many runs contain
+    it. Entries are weak and disappear with the last run using them.
+    Pooled steps are shared and must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self._steps: weakref.WeakValueDictionary[tuple, TraceStep] = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def share(self, steps: list[TraceStep]) -> list[TraceStep]:
+        """The steps, each replaced by its pooled equal."""
+        shared = []
+        with self._lock:
+            for step in steps:
+                key = (
+                    step.step_id,
+                    step.step_number,
+                    step.label,
+                    step.description,
+                    tuple(step.inputs_used),
+                    tuple(step.rule_refs),
+                    tuple(step.evidence_refs),
+                    step.output,
+                    step.output_value,
+                )
+                shared.append(self._steps.setdefault(key, step))
+        return shared
+
+    def __len__(self) -> int:
+        return len(self._steps)
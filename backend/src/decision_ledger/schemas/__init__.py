@@ -8,26 +8,54 @@ from decision_ledger.schemas.catalog import (
     AssumptionSet,
     Assumption,
     AssumptionAlternative,
+    CatalogDiff,
+    CatalogNodeChange,
 )
 from decision_ledger.schemas.decision import (
     DecisionRun,
     DecisionRunRequest,
+    DecisionRunSummary,
+    OutcomeTotals,
+    RunInputs,
+    StoredDecisionRun,
+    DecisionDependencies,
     DecisionOutcome,
     PayoutItem,
     TraceStep,
+    TraceEncoding,
+    TraceStepTemplate,
+    CompactTraceStep,
     ResolvedAssumption,
     SelectedInterpretation,
     CounterfactualRun,
     CounterfactualRequest,
     TraceDiff,
+    MerkleProofStep,
+    RunProof,
+    LedgerVerification,
+    ReplayDrift,
+    ReplayReport,
 )
 from decision_ledger.schemas.governance import (
     ChangeProposal,
     ChangeProposalCreate,
     ChangeProposalUpdate,
     ProposalStatus,
+    GovernanceEvent,
+    BackfillResult,
+)
+from decision_ledger.schemas.job import Job, JobStatus, QAStudyJobCreate
+from decision_ledger.schemas.qa import (
+    QAStudyResult,
+    QACohort,
+    QACohortOverlap,
+    QAProposedChange,
+    ImpactedClaim,
+    QADeltaStats,
+    QAPayoutDistribution,
+    QASimulationResult,
+    QAHistogramBucket,
 )
-from decision_ledger.schemas.qa import QAStudyResult, QACohort, QAProposedChange, ImpactedClaim
 
 __all__ = [
     "Claim",
@@ -41,22 +69,47 @@ __all__ = [
     "AssumptionSet",
     "Assumption",
     "AssumptionAlternative",
+    "CatalogDiff",
+    "CatalogNodeChange",
     "DecisionRun",
     "DecisionRunRequest",
+    "DecisionRunSummary",
+    "OutcomeTotals",
+    "RunInputs",
+    "StoredDecisionRun",
+    "DecisionDependencies",
     "DecisionOutcome",
     "PayoutItem",
     "TraceStep",
+    "TraceEncoding",
+    "TraceStepTemplate",
+    "CompactTraceStep",
     "ResolvedAssumption",
     "SelectedInterpretation",
     "CounterfactualRun",
     "CounterfactualRequest",
     "TraceDiff",
+    "MerkleProofStep",
+    "RunProof",
+    "LedgerVerification",
+    "ReplayDrift",
+    "ReplayReport",
+    "Job",
+    "JobStatus",
+    "QAStudyJobCreate",
+    "BackfillResult",
     "ChangeProposal",
     "ChangeProposalCreate",
     "ChangeProposalUpdate",
     "ProposalStatus",
+    "GovernanceEvent",
     "QAStudyResult",
     "QACohort",
+    "QACohortOverlap",
     "QAProposedChange",
     "ImpactedClaim",
+    "QADeltaStats",
+    "QAPayoutDistribution",
+    "QASimulationResult",
+    "QAHistogramBucket",
 ]
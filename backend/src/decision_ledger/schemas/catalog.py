@@ -2,8 +2,12 @@
 
 from datetime import date
 from enum import Enum
+from typing import Any
+
 from pydantic import BaseModel
 
+from decision_ledger.utils.interning import Interned
+
 
 class SetStatus(str, Enum):
     """Status of an interpretation or assumption set."""
@@ -54,8 +58,8 @@ class InterpretationSet(BaseModel):
     """A versioned set of interpretation decision points."""
 
     interpretation_set_id: str
-    jurisdiction: str
-    product_line: str
+    jurisdiction: Interned
+    product_line: Interned
     effective_from: date
     version: str
     status: SetStatus
@@ -69,6 +73,7 @@ class AssumptionAlternative(BaseModel):
     label: str
     description: str
     allowed_roles: list[Role]
+    probability: float | None = None  # Prior likelihood, used by QA simulations
 
 
 class Assumption(BaseModel):
@@ -88,8 +93,57 @@ class AssumptionSet(BaseModel):
     """A versioned set of assumptions."""
 
     assumption_set_id: str
-    jurisdiction: str
-    product_line: str
+    jurisdiction: Interned
+    product_line: Interned
     version: str
     status: SetStatus
     assumptions: list[Assumption]
+
+
+class FieldChange(BaseModel):
+    """A scalar field whose value differs between two versions."""
+
+    field: str
+    before: Any = None
+    after: Any = None
+
+
+class CatalogNodeChange(BaseModel):
+    """How a decision point or assumption differs between two set versions.
+
+    Attributes:
+        node_id: Decision point or assumption ID
+        change: "added", "removed" or "changed"
+        fields: Changed scalar fields, e.g. ``default_option`` or
+            ``recommended_resolution``
+        added_items: Options or alternatives only in the newer version
+        removed_items: Options or alternatives only in the older version
+        changed_items: Options or alternatives present in both but different
+    """
+
+    node_id: str
+    change: str
+    fields: list[FieldChange] = []
+    added_items: list[str] = []
+    removed_items: list[str] = []
+    changed_items: list[str] = []
+
+
+class CatalogDiff(BaseModel):
+    """Structural difference between two versions of a catalog set."""
+
+    kind: str  # "interpretation" or "assumption"
+    from_set_id: str
+    from_version: str
+    to_set_id: str
+    to_version: str
+    from_hash: str
+    to_hash: str
+    identical: bool
+    header_changes: list[FieldChange] = []
+    node_changes: list[CatalogNodeChange] = []
+
+    @property
+    def changed_node_ids(self) -> list[str]:
+        """IDs of the decision points or assumptions that differ."""
+        return [change.node_id for change in self.node_changes]
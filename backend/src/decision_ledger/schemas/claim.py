@@ -4,6 +4,8 @@ from datetime import date
 from enum import Enum
 from pydantic import BaseModel
 
+from decision_ledger.utils.interning import Interned
+
 
 class FactStatus(str, Enum):
     """Status of a fact."""
@@ -15,29 +17,29 @@ class FactStatus(str, Enum):
 class Fact(BaseModel):
     """A fact about a claim."""
 
-    fact_id: str
-    label: str
-    value: str | None
+    fact_id: Interned
+    label: Interned
+    value: Interned | None
     status: FactStatus
-    source: str
+    source: Interned
 
 
 class Evidence(BaseModel):
     """Evidence document attached to a claim."""
 
     evidence_id: str
-    label: str
-    type: str
+    label: Interned
+    type: Interned
     url: str
 
 
 class LineItem(BaseModel):
     """A line item on a claim."""
 
-    item_id: str
-    label: str
+    item_id: Interned
+    label: Interned
     amount_chf: float
-    category: str
+    category: Interned
 
 
 class ClaimStatus(str, Enum):
@@ -51,8 +53,8 @@ class ClaimSummary(BaseModel):
     """Summary view of a claim for list display."""
 
     claim_id: str
-    jurisdiction: str
-    product_line: str
+    jurisdiction: Interned
+    product_line: Interned
     loss_date: date
     status: ClaimStatus
 
@@ -61,8 +63,8 @@ class Claim(BaseModel):
     """Full claim model with all details."""
 
     claim_id: str
-    jurisdiction: str
-    product_line: str
+    jurisdiction: Interned
+    product_line: Interned
     loss_date: date
     policy_id: str
     status: ClaimStatus
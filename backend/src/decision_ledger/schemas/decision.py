@@ -2,8 +2,12 @@
 
 from datetime import datetime
 from enum import Enum
+from typing import Literal
+
 from pydantic import BaseModel
 
+from decision_ledger.utils.interning import Interned
+
 
 class DecisionStatus(str, Enum):
     """Status of a decision."""
@@ -16,10 +20,10 @@ class DecisionStatus(str, Enum):
 class PayoutItem(BaseModel):
     """A payout breakdown item."""
 
-    item_id: str
-    label: str
+    item_id: Interned
+    label: Interned
     covered_amount: float
-    notes: str
+    notes: Interned
 
 
 class DecisionOutcome(BaseModel):
@@ -35,58 +39,203 @@ class DecisionOutcome(BaseModel):
 class ResolvedAssumption(BaseModel):
     """A resolved assumption in a decision run."""
 
-    assumption_id: str
-    fact_id: str
-    fact_label: str
-    chosen_resolution: str
-    chosen_by_role: str
+    assumption_id: Interned
+    fact_id: Interned
+    fact_label: Interned
+    chosen_resolution: Interned
+    chosen_by_role: Interned
     reason: str | None = None
 
 
 class SelectedInterpretation(BaseModel):
     """A selected interpretation option in a decision run."""
 
-    decision_point_id: str
-    option: str
+    decision_point_id: Interned
+    option: Interned
 
 
 class TraceStep(BaseModel):
     """A step in the decision trace."""
 
-    step_id: str
+    step_id: Interned
     step_number: int
+    label: Interned
+    description: Interned
+    inputs_used: list[Interned]
+    rule_refs: list[Interned]
+    evidence_refs: list[Interned]
+    output: str
+    output_value: str | None = None
+
+
+class TraceEncoding(str, Enum):
+    """Wire encoding for trace steps in decision run responses."""
+
+    FULL = "full"
+    COMPACT = "compact"
+
+
+class TraceStepTemplate(BaseModel):
+    """The run-independent part of a trace step, shared across runs."""
+
+    template_id: str
     label: str
     description: str
     inputs_used: list[str]
     rule_refs: list[str]
     evidence_refs: list[str]
+
+
+class CompactTraceStep(BaseModel):
+    """A trace step that references its template instead of repeating it."""
+
+    template_id: str
+    step_number: int
     output: str
     output_value: str | None = None
+    step_id: str | None = None  # Only set when not "STEP-<step_number>"
+
+
+class DecisionDependencies(BaseModel):
+    """Catalog entries and facts that a decision run's outcome depended on."""
+
+    decision_point_ids: list[str] = []
+    assumption_ids: list[str] = []
+    fact_ids: list[str] = []
+
+    def refs(self) -> list[str]:
+        """All dependency IDs as a flat list."""
+        return [*self.decision_point_ids, *self.assumption_ids, *self.fact_ids]
 
 
 class DecisionRun(BaseModel):
     """A complete decision run (ledger event)."""
 
     run_id: str
-    claim_id: str
+    claim_id: Interned
     timestamp: datetime
-    interpretation_set_id: str
-    interpretation_set_version: str
-    assumption_set_id: str
-    assumption_set_version: str
+    interpretation_set_id: Interned
+    interpretation_set_version: Interned
+    assumption_set_id: Interned
+    assumption_set_version: Interned
     resolved_assumptions: list[ResolvedAssumption]
     selected_interpretations: list[SelectedInterpretation]
     outcome: DecisionOutcome
     trace_steps: list[TraceStep]
-    generated_by_role: str
+    generated_by_role: Interned
+    dependencies: DecisionDependencies | None = None
+    supersedes_run_id: str | None = None  # Set on re-adjudicated runs
+
+
+class OutcomeTotals(BaseModel):
+    """A decision outcome without its payout breakdown."""
+
+    approved: bool
+    status: DecisionStatus
+    payout_total: float
+    deductible_applied: float
+
+
+class DecisionRunSummary(BaseModel):
+    """Summary view of a decision run for list display.
+
+    Served from the stored run without regenerating its payout breakdown
+    and trace. ``unavailable`` gives the reason when the full run was
+    requested but can no longer be regenerated.
+    """
+
+    run_id: str
+    claim_id: Interned
+    timestamp: datetime
+    interpretation_set_id: Interned
+    interpretation_set_version: Interned
+    assumption_set_id: Interned
+    assumption_set_version: Interned
+    resolved_assumptions: list[ResolvedAssumption]
+    selected_interpretations: list[SelectedInterpretation]
+    outcome: OutcomeTotals
+    generated_by_role: Interned
+    supersedes_run_id: str | None = None
+    unavailable: str | None = None
+
+
+class RunInputs(BaseModel):
+    """What a decision run was computed from: claim content, set versions and choices.
+
+    Stored once per distinct content and shared by every run with the same
+    claim content, set versions and choices. ``claim_hash`` is the content
+    hash of the claim when the run was made (None for earlier runs), so a
+    run that no longer reproduces can be told apart from a changed claim.
+    """
+
+    claim_hash: str | None = None
+    interpretation_set_id: Interned
+    interpretation_set_version: Interned
+    assumption_set_id: Interned
+    assumption_set_version: Interned
+    resolved_assumptions: list[ResolvedAssumption]
+    selected_interpretations: list[SelectedInterpretation]
+
+
+class StoredDecisionRun(BaseModel):
+    """Persisted form of a decision run: references, choices and outcome totals.
+
+    The payout breakdown, trace and dependencies are reproduced by running
+    the engine again on the claim with ``inputs``. ``result_hash`` is the
+    content hash of the full outcome and trace, so a regenerated run is
+    checked against what was originally decided. Runs stored in full before
+    the compact form existed carry that run as ``full_run`` and are served
+    as stored.
+    """
+
+    run_id: str
+    claim_id: Interned
+    timestamp: datetime
+    inputs: RunInputs
+    approved: bool
+    status: DecisionStatus
+    payout_total: float
+    deductible_applied: float
+    result_hash: str
+    generated_by_role: Interned
+    supersedes_run_id: str | None = None
+    full_run: DecisionRun | None = None  # Set for runs stored in full
+
+    def summary(self, unavailable: str | None = None) -> DecisionRunSummary:
+        """The run's summary view, from its stored totals."""
+        inputs = self.inputs
+        return DecisionRunSummary(
+            run_id=self.run_id,
+            claim_id=self.claim_id,
+            timestamp=self.timestamp,
+            interpretation_set_id=inputs.interpretation_set_id,
+            interpretation_set_version=inputs.interpretation_set_version,
+            assumption_set_id=inputs.assumption_set_id,
+            assumption_set_version=inputs.assumption_set_version,
+            resolved_assumptions=inputs.resolved_assumptions,
+            selected_interpretations=inputs.selected_interpretations,
+            outcome=OutcomeTotals(
+                approved=self.approved,
+                status=self.status,
+                payout_total=self.payout_total,
+                deductible_applied=self.deductible_applied,
+            ),
+            generated_by_role=self.generated_by_role,
+            supersedes_run_id=self.supersedes_run_id,
+            unavailable=unavailable,
+        )
 
 
 class DecisionRunRequest(BaseModel):
-    """Request to run a decision."""
+    """Request to run a decision.
+
+    Omitted set IDs default to the approved sets in force at the claim's
+    loss date.
+    """
 
     claim_id: str
-    interpretation_set_id: str
-    assumption_set_id: str
+    interpretation_set_id: str | None = None
+    assumption_set_id: str | None = None
     resolved_assumptions: list[ResolvedAssumption]
     selected_interpretations: list[SelectedInterpretation]
     role: str
@@ -130,3 +279,70 @@ class CounterfactualRequest(BaseModel):
     change_ref: str
     original_value: str
     new_value: str
+
+
+class MerkleProofStep(BaseModel):
+    """A sibling hash on the path from a run's leaf to its batch root."""
+
+    side: Literal["left", "right"]
+    hash: str
+
+
+class RunProof(BaseModel):
+    """Receipt proving a run is recorded, unaltered, in the run ledger.
+
+    ``run_hash`` is the SHA-256 of the run's stored record. Hashing the
+    leaf up ``path`` yields ``merkle_root``; the batch's ``batch_chain_hash``
+    ties the root to the hash chain over all earlier runs.
+    """
+
+    run_id: str
+    seq: int
+    run_hash: str
+    record: str  # The stored record; its SHA-256 is run_hash
+    inputs_record: str | None  # Stored inputs; their SHA-256 is the record's inputs_hash
+    chain_hash: str
+    batch_first_seq: int
+    batch_last_seq: int
+    sealed: bool  # False: the open batch, proven against the entries recorded so far
+    merkle_root: str
+    batch_chain_hash: str
+    path: list[MerkleProofStep]
+
+
+class LedgerVerification(BaseModel):
+    """Result of verifying the whole run ledger."""
+
+    runs_checked: int
+    batches_checked: int
+    head_seq: int
+    head_hash: str
+    failure_count: int
+    failures: list[str]  # First failures found, for the report
+    ok: bool
+    elapsed_seconds: float
+
+
+class ReplayDrift(BaseModel):
+    """A stored run whose replay did not reproduce it.
+
+    ``kind`` is "outcome" when the replayed totals differ, "trace" when only
+    the payout breakdown or trace does, "claim_changed" when either differs
+    because the claim was edited after the run, or "missing_claim" /
+    "missing_catalog" when the run cannot be replayed.
+    """
+
+    run_id: str
+    claim_id: str
+    kind: Literal["outcome", "trace", "claim_changed", "missing_claim", "missing_catalog"]
+    detail: str
+
+
+class ReplayReport(BaseModel):
+    """Result of replaying stored runs against the current engine."""
+
+    runs_replayed: int
+    drift_count: int
+    drifts: list[ReplayDrift]  # First drifts found, in replay order
+    ok: bool
+    elapsed_seconds: float
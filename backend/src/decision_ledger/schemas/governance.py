@@ -2,8 +2,12 @@
 
 from datetime import datetime
 from enum import Enum
+from typing import Any
+
 from pydantic import BaseModel
 
+from decision_ledger.schemas.qa import ImpactedClaim, QADeltaStats
+
 
 class ProposalStatus(str, Enum):
     """Status of a change proposal."""
@@ -49,15 +53,37 @@ class ChangeProposal(BaseModel):
     proposal_type: ProposalType
     proposed_version: str
     rationale: str
+    jurisdiction: str | None = None
+    product_line: str | None = None
+    change_type: str | None = None  # "INTERPRETATION" or "ASSUMPTION"
+    target_item_id: str | None = None
+    to_value: str | None = None
     qa_impact_summary: QAImpactSummary | None = None
+    # Computed on submit, one per standard cohort (see QAService); the
+    # summary above is then the most impacted cohort
+    qa_impact_summaries: list[QAImpactSummary] = []
+    qa_impact_job_id: str | None = None
     status: ProposalStatus
     created_at: datetime
     created_by: str
     approved_at: datetime | None = None
     approved_by: str | None = None
     published_at: datetime | None = None
+    published_set_id: str | None = None
+    catalog_generation: int | None = None
     approval_steps: list[ApprovalStep] = []
 
+    @property
+    def has_change(self) -> bool:
+        """Whether the proposal names a catalog change that publishing applies."""
+        return bool(
+            self.jurisdiction
+            and self.product_line
+            and self.change_type
+            and self.target_item_id
+            and self.to_value
+        )
+
 
 class ChangeProposalCreate(BaseModel):
     """Request to create a change proposal."""
@@ -66,6 +92,11 @@ class ChangeProposalCreate(BaseModel):
     proposal_type: ProposalType
     proposed_version: str
     rationale: str
+    jurisdiction: str | None = None
+    product_line: str | None = None
+    change_type: str | None = None  # "INTERPRETATION" or "ASSUMPTION"
+    target_item_id: str | None = None
+    to_value: str | None = None
     qa_impact_summary: QAImpactSummary | None = None
     created_by: str
 
@@ -75,3 +106,39 @@ class ChangeProposalUpdate(BaseModel):
 
     action: str  # "submit", "approve", "publish", "reject"
     actor_role: str
+
+
+class GovernanceEvent(BaseModel):
+    """An entry in the append-only governance log.
+
+    Attributes:
+        seq: Position in the log (increasing)
+        proposal_id: Proposal the event applies to
+        action: What happened, e.g. "created", "submitted" or "published"
+        actor: Role (or user) that performed the action
+        occurred_at: When the event was recorded
+        changes: Proposal fields set by the event; all of them for "created"
+    """
+
+    seq: int
+    proposal_id: str
+    action: str
+    actor: str
+    occurred_at: datetime
+    changes: dict[str, Any]
+
+
+class BackfillResult(BaseModel):
+    """Outcome of re-adjudicating the runs affected by a published change."""
+
+    proposal_id: str
+    runs_selected: int
+    runs_processed: int
+    runs_reissued: int
+    runs_skipped: int  # Claims no longer open, missing, or without a catalog in force
+    runs_changed: int
+    total_delta_payout: float
+    delta_stats: QADeltaStats
+    top_changed_claims: list[ImpactedClaim]
+    elapsed_seconds: float
+    runs_per_second: float
@@ -0,0 +1,45 @@
+"""Background job Pydantic models."""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class JobStatus(str, Enum):
+    """Status of a background job."""
+
+    QUEUED = "Queued"
+    RUNNING = "Running"
+    SUCCEEDED = "Succeeded"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
+
+
+TERMINAL_JOB_STATUSES = {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+
+class Job(BaseModel):
+    """A long-running unit of work executed by the job runner."""
+
+    job_id: str
+    kind: str
+    status: JobStatus
+    params: dict[str, Any]
+    processed: int = 0
+    total: int | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    cancel_requested: bool = False
+    created_at: datetime
+    updated_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
+class QAStudyJobCreate(BaseModel):
+    """Request to run a QA study as a background job."""
+
+    cohort_id: str
+    proposal_id: str
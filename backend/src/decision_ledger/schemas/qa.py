@@ -1,5 +1,6 @@
 """QA Impact-related Pydantic models."""
 
+from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel
 
@@ -19,6 +20,27 @@ class ImpactedClaim(BaseModel):
     delta: float
 
 
+class QAHistogramBucket(BaseModel):
+    """A histogram bucket of per-claim payout deltas (None = unbounded)."""
+
+    lower: float | None
+    upper: float | None
+    count: int
+
+
+class QADeltaStats(BaseModel):
+    """Distribution of per-claim payout deltas across a cohort."""
+
+    count: int
+    total: float
+    mean: float
+    variance: float
+    std_dev: float
+    min: float
+    max: float
+    histogram: list[QAHistogramBucket] = []
+
+
 class QACohort(BaseModel):
     """A cohort for QA simulation."""
 
@@ -26,6 +48,21 @@ class QACohort(BaseModel):
     label: str
     description: str
     claim_count: int
+    jurisdiction: str | None = None
+    product_line: str | None = None
+    query: str | None = None
+
+
+class QACohortOverlap(BaseModel):
+    """Membership overlap between two cohorts."""
+
+    cohort_id: str
+    other_cohort_id: str
+    cohort_count: int
+    other_count: int
+    intersection_count: int
+    union_count: int
+    jaccard: float
 
 
 class QAProposedChange(BaseModel):
@@ -34,7 +71,36 @@ class QAProposedChange(BaseModel):
     proposal_id: str
     label: str
     description: str
-    change_type: str
+    change_type: str  # "INTERPRETATION" or "ASSUMPTION"
+    target_item_id: str | None = None
+    from_value: str | None = None  # If set, the target's current value; checked before applying
+    to_value: str | None = None
+
+
+class QAPayoutDistribution(BaseModel):
+    """Distribution of a simulated cohort payout total across draws."""
+
+    mean: float
+    std_dev: float
+    min: float
+    max: float
+    percentiles: dict[str, float]
+
+
+class QASimulationResult(BaseModel):
+    """Result of a Monte Carlo assumption-uncertainty simulation."""
+
+    cohort_id: str
+    proposal_id: str
+    draws: int
+    seed: int
+    sampler: str  # "numpy" or "python"
+    claim_count: int
+    uncertain_claim_count: int
+    current: QAPayoutDistribution
+    proposed: QAPayoutDistribution
+    delta: QAPayoutDistribution
+    run_date: datetime
 
 
 class QAStudyResult(BaseModel):
@@ -48,3 +114,10 @@ class QAStudyResult(BaseModel):
     total_delta_payout: float
     top_impacted_claims: list[ImpactedClaim]
     flags: list[QAFlag] = []
+    flag_reasons: list[str] = []
+    study_id: str | None = None  # Derived from the study's inputs for live results
+    summary: str | None = None
+    run_date: datetime | None = None
+    delta_stats: QADeltaStats | None = None
+    claims_processed: int | None = None
+    is_partial: bool = False
@@ -1,6 +1,13 @@
 """Storage layer for Decision Ledger."""
 
 from decision_ledger.storage.protocol import StorageProtocol
-from decision_ledger.storage.filesystem import FileStorage
+from decision_ledger.storage.filesystem import FileStorage, get_file_storage
+from decision_ledger.storage.sqlite import SqliteStateStore, get_state_store
 
-__all__ = ["StorageProtocol", "FileStorage"]
+__all__ = [
+    "StorageProtocol",
+    "FileStorage",
+    "SqliteStateStore",
+    "get_file_storage",
+    "get_state_store",
+]
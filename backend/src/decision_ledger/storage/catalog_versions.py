@@ -0,0 +1,219 @@
+"""Published catalog versions and the active-version pointers.
+
+Catalog sets created by publishing a change proposal are stored here, next
+to the read-only fixture sets. Published sets are immutable. Their decision
+points and assumptions are stored once per distinct content hash, so a new
+version that changes one decision point adds one node row and re-references
+the rest; loaded nodes are likewise shared between the versions in memory.
+
+``catalog_pointers`` records which interpretation and assumption set is
+active per jurisdiction and product line. Each pointer update bumps a
+global generation, which readers compare to notice that a publish happened,
+possibly in another worker process. The generation never goes back, not
+even on reset, so a reader never mistakes new pointers for ones it saw.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from decision_ledger.schemas.catalog import (
+    Assumption,
+    AssumptionSet,
+    DecisionPoint,
+    InterpretationSet,
+)
+from decision_ledger.storage.sqlite import SqliteStateStore
+from decision_ledger.utils.hashing import canonical_json, content_hash
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog_nodes (
+    node_hash TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS catalog_sets (
+    set_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    header TEXT NOT NULL,
+    node_hashes TEXT NOT NULL,
+    proposal_id TEXT,
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS catalog_pointers (
+    jurisdiction TEXT NOT NULL,
+    product_line TEXT NOT NULL,
+    interpretation_set_id TEXT,
+    assumption_set_id TEXT,
+    PRIMARY KEY (jurisdiction, product_line)
+);
+
+-- Single row; bumped by every pointer update and by clear()
+CREATE TABLE IF NOT EXISTS catalog_generation (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generation INTEGER NOT NULL
+);
+"""
+
+CatalogSet = InterpretationSet | AssumptionSet
+
+INTERPRETATION_KIND = "interpretation"
+ASSUMPTION_KIND = "assumption"
+
+# kind -> (set model, field holding the nodes, node model)
+_KINDS: dict[str, tuple[type[BaseModel], str, type[BaseModel]]] = {
+    INTERPRETATION_KIND: (InterpretationSet, "decision_points", DecisionPoint),
+    ASSUMPTION_KIND: (AssumptionSet, "assumptions", Assumption),
+}
+
+
+def _kind_of(catalog_set: CatalogSet) -> str:
+    return INTERPRETATION_KIND if isinstance(catalog_set, InterpretationSet) else ASSUMPTION_KIND
+
+
+class CatalogVersionStore:
+    """Content-addressed store for published catalog sets."""
+
+    def __init__(self, state: SqliteStateStore) -> None:
+        self.state = state
+        self.state.connection().executescript(_SCHEMA)
+        # Immutable, so loaded nodes and sets are cached for the process
+        self._nodes: dict[str, BaseModel] = {}
+        self._sets: dict[str, CatalogSet] = {}
+        self._lock = threading.Lock()
+
+    def save_set(self, catalog_set: CatalogSet, proposal_id: str | None = None) -> None:
+        """Store a new catalog set version.
+
+        Raises:
+            ValueError: If a set with the same ID already exists
+        """
+        kind = _kind_of(catalog_set)
+        _, field, _ = _KINDS[kind]
+        set_id = getattr(catalog_set, f"{kind}_set_id")
+        conn = self.state.connection()
+        hashes: list[str] = []
+        with self.state.transaction():
+            for node in getattr(catalog_set, field):
+                node_hash = content_hash(node)
+                conn.execute(
+                    "INSERT OR IGNORE INTO catalog_nodes (node_hash, data) VALUES (?, ?)",
+                    (node_hash, canonical_json(node)),
+                )
+                hashes.append(node_hash)
+            try:
+                conn.execute(
+                    "INSERT INTO catalog_sets "
+                    "(set_id, kind, header, node_hashes, proposal_id, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        set_id,
+                        kind,
+                        catalog_set.model_dump_json(exclude={field}),
+                        json.dumps(hashes),
+                        proposal_id,
+                        datetime.now().isoformat(),
+                    ),
+                )
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Catalog set {set_id} already exists") from None
+        with self._lock:
+            for node_hash, node in zip(hashes, getattr(catalog_set, field)):
+                self._nodes.setdefault(node_hash, node)
+
+    def load_sets(self) -> list[CatalogSet]:
+        """All published sets, oldest first."""
+        rows = self.state.connection().execute(
+            "SELECT set_id, kind, header, node_hashes FROM catalog_sets ORDER BY created_at"
+        ).fetchall()
+        sets: list[CatalogSet] = []
+        for set_id, kind, header, node_hashes in rows:
+            catalog_set = self._sets.get(set_id)
+            if catalog_set is None:
+                catalog_set = self._build_set(kind, header, json.loads(node_hashes))
+                with self._lock:
+                    catalog_set = self._sets.setdefault(set_id, catalog_set)
+            sets.append(catalog_set)
+        return sets
+
+    def _build_set(self, kind: str, header: str, node_hashes: list[str]) -> CatalogSet:
+        """Assemble a set from its header and (shared) nodes."""
+        set_model, field, node_model = _KINDS[kind]
+        missing = [h for h in node_hashes if h not in self._nodes]
+        if missing:
+            placeholders = ",".join("?" * len(missing))
+            rows = self.state.connection().execute(
+                f"SELECT node_hash, data FROM catalog_nodes WHERE node_hash IN ({placeholders})",
+                missing,
+            )
+            with self._lock:
+                for node_hash, data in rows:
+                    self._nodes.setdefault(node_hash, node_model.model_validate_json(data))
+        data = json.loads(header)
+        data[field] = []
+        catalog_set = set_model.model_validate(data)
+        # Assign the shared node objects directly rather than validating copies
+        setattr(catalog_set, field, [self._nodes[h] for h in node_hashes])
+        return catalog_set
+
+    def set_active(
+        self,
+        jurisdiction: str,
+        product_line: str,
+        interpretation_set_id: str | None,
+        assumption_set_id: str | None,
+    ) -> int:
+        """Point a line of business at new catalog sets.
+
+        Returns:
+            The new catalog generation
+        """
+        conn = self.state.connection()
+        with self.state.transaction():
+            conn.execute(
+                "INSERT OR REPLACE INTO catalog_pointers "
+                "(jurisdiction, product_line, interpretation_set_id, assumption_set_id) "
+                "VALUES (?, ?, ?, ?)",
+                (jurisdiction, product_line, interpretation_set_id, assumption_set_id),
+            )
+            return self._bump_generation()
+
+    def _bump_generation(self) -> int:
+        """Increment the generation (caller holds a transaction)."""
+        generation = self.generation() + 1
+        self.state.connection().execute(
+            "INSERT OR REPLACE INTO catalog_generation (id, generation) VALUES (1, ?)",
+            (generation,),
+        )
+        return generation
+
+    def active(self) -> dict[tuple[str, str], tuple[str | None, str | None]]:
+        """Active (interpretation set ID, assumption set ID) per line of business."""
+        rows = self.state.connection().execute(
+            "SELECT jurisdiction, product_line, interpretation_set_id, assumption_set_id "
+            "FROM catalog_pointers"
+        )
+        return {(row[0], row[1]): (row[2], row[3]) for row in rows}
+
+    def generation(self) -> int:
+        """Counter identifying the current pointers (0 if nothing was published)."""
+        row = self.state.connection().execute(
+            "SELECT generation FROM catalog_generation WHERE id = 1"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def clear(self) -> None:
+        """Delete all published sets and pointers (for reset functionality)."""
+        conn = self.state.connection()
+        with self.state.transaction():
+            conn.execute("DELETE FROM catalog_pointers")
+            conn.execute("DELETE FROM catalog_sets")
+            conn.execute("DELETE FROM catalog_nodes")
+            self._bump_generation()
+        with self._lock:
+            self._nodes.clear()
+            self._sets.clear()
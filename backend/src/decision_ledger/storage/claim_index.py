@@ -0,0 +1,96 @@
+"""In-memory secondary indexes over a claims list.
+
+Each claim gets a position (its index in the list). Equality lookups are
+served from posting bitmaps and range lookups from sorted arrays, so cohort
+queries (see ``core.cohort``) rarely have to look at individual claims.
+"""
+
+import hashlib
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Any, Sequence
+
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.utils.bitmap import Bitmap
+
+
+def _range(keys: list[Any], positions: list[int], op: str, value: Any, size: int) -> Bitmap:
+    """Positions whose sorted key satisfies ``key <op> value``."""
+    if op == "=":
+        lo, hi = bisect_left(keys, value), bisect_right(keys, value)
+    elif op == ">=":
+        lo, hi = bisect_left(keys, value), len(keys)
+    elif op == ">":
+        lo, hi = bisect_right(keys, value), len(keys)
+    elif op == "<=":
+        lo, hi = 0, bisect_right(keys, value)
+    elif op == "<":
+        lo, hi = 0, bisect_left(keys, value)
+    else:
+        raise ValueError(f"Unsupported range operator: {op}")
+    return Bitmap.from_positions(positions[lo:hi], size)
+
+
+class ClaimIndex:
+    """Posting bitmaps and sorted keys for a fixed list of claims."""
+
+    def __init__(self, claims: Sequence[Claim], version: str | None = None) -> None:
+        """Build the indexes.
+
+        Args:
+            claims: Claims to index; positions refer to this sequence
+            version: Data version of the claims (e.g. a hash of the source
+                file); derived from the claims' content if omitted
+        """
+        self.claims = claims
+        self.size = len(claims)
+
+        postings: dict[tuple[str, ...], list[int]] = defaultdict(list)
+        loss_dates: list[tuple[Any, int]] = []
+        amounts: list[tuple[float, int]] = []
+        digest = hashlib.sha256() if version is None else None
+        for pos, claim in enumerate(claims):
+            if digest is not None:
+                digest.update(claim.model_dump_json().encode("utf-8"))
+            postings[("jurisdiction", claim.jurisdiction)].append(pos)
+            postings[("product_line", claim.product_line)].append(pos)
+            postings[("status", claim.status.value)].append(pos)
+            loss_dates.append((claim.loss_date, pos))
+            for fact in claim.facts:
+                postings[("fact_status", fact.fact_id, fact.status.value)].append(pos)
+                if fact.value is not None:
+                    postings[("fact_value", fact.fact_id, fact.value)].append(pos)
+            for item in claim.line_items:
+                postings[("line_item_category", item.category)].append(pos)
+                amounts.append((item.amount_chf, pos))
+
+        self.version = version if digest is None else digest.hexdigest()
+        self._postings = {
+            key: Bitmap.from_positions(positions, self.size) for key, positions in postings.items()
+        }
+        loss_dates.sort()
+        self._loss_date_keys = [d for d, _ in loss_dates]
+        self._loss_date_positions = [p for _, p in loss_dates]
+        amounts.sort()
+        self._amount_keys = [a for a, _ in amounts]
+        self._amount_positions = [p for _, p in amounts]
+
+    def universe(self) -> Bitmap:
+        """Bitmap of every claim."""
+        return Bitmap.full(self.size)
+
+    def postings(self, *key: str) -> Bitmap:
+        """Claims with an exact field value, e.g. ``("jurisdiction", "CH")``."""
+        return self._postings.get(key) or Bitmap.empty(self.size)
+
+    def loss_date_range(self, op: str, value: Any) -> Bitmap:
+        """Claims whose loss date satisfies ``loss_date <op> value``."""
+        return _range(self._loss_date_keys, self._loss_date_positions, op, value, self.size)
+
+    def line_item_amount_range(self, op: str, value: float) -> Bitmap:
+        """Claims with at least one line item satisfying ``amount <op> value``."""
+        return _range(self._amount_keys, self._amount_positions, op, value, self.size)
+
+    def claims_at(self, bitmap: Bitmap) -> list[Claim]:
+        """Claims at the positions set in ``bitmap``, in list order."""
+        return [self.claims[pos] for pos in bitmap]
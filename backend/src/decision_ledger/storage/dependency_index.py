@@ -0,0 +1,115 @@
+"""Reverse index from decision points, assumptions and facts to claims.
+
+For each catalog context (a pair of interpretation and assumption set
+versions), the index records which claims have been evaluated and which
+catalog entries or facts each claim's outcome depended on. A QA study for
+a change to one entry then only needs to re-run the claims listed under
+that entry. Claims that were indexed but are not listed are known to be
+unaffected.
+
+The index lives in the state database and outlasts the process, so it also
+records the claim data version its entries describe; ``use_claims_version``
+drops them when the claims changed, e.g. between two runs of the API.
+"""
+
+from typing import Iterable
+
+from decision_ledger.storage.sqlite import SqliteStateStore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS claim_index_members (
+    context TEXT NOT NULL,
+    claim_id TEXT NOT NULL,
+    PRIMARY KEY (context, claim_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS claim_dependencies (
+    context TEXT NOT NULL,
+    ref TEXT NOT NULL,
+    claim_id TEXT NOT NULL,
+    PRIMARY KEY (context, ref, claim_id)
+) WITHOUT ROWID;
+
+-- Claim data version the entries were recorded for
+CREATE TABLE IF NOT EXISTS claim_index_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    claims_version TEXT NOT NULL
+);
+"""
+
+
+class ClaimDependencyIndex:
+    """Per-catalog reverse index from dependency IDs to claim IDs."""
+
+    def __init__(self, state: SqliteStateStore) -> None:
+        self.state = state
+        self.state.connection().executescript(_SCHEMA)
+
+    def indexed_claims(self, context: str) -> set[str]:
+        """Return the IDs of claims already indexed under ``context``."""
+        rows = self.state.connection().execute(
+            "SELECT claim_id FROM claim_index_members WHERE context = ?", (context,)
+        )
+        return {row[0] for row in rows}
+
+    def claims_depending_on(self, context: str, refs: Iterable[str]) -> set[str]:
+        """Return IDs of claims whose outcome under ``context`` used any of ``refs``."""
+        refs = list(refs)
+        if not refs:
+            return set()
+        placeholders = ",".join("?" * len(refs))
+        rows = self.state.connection().execute(
+            f"SELECT claim_id FROM claim_dependencies WHERE context = ? AND ref IN ({placeholders})",
+            [context, *refs],
+        )
+        return {row[0] for row in rows}
+
+    def record(self, context: str, entries: Iterable[tuple[str, Iterable[str]]]) -> None:
+        """Record the dependencies of evaluated claims.
+
+        Args:
+            context: Catalog context the claims were evaluated under
+            entries: (claim_id, dependency IDs) pairs
+        """
+        members: list[tuple[str, str]] = []
+        dependencies: list[tuple[str, str, str]] = []
+        for claim_id, refs in entries:
+            members.append((context, claim_id))
+            dependencies.extend((context, ref, claim_id) for ref in refs)
+
+        conn = self.state.connection()
+        with self.state.transaction():
+            conn.executemany(
+                "INSERT OR IGNORE INTO claim_index_members (context, claim_id) VALUES (?, ?)",
+                members,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO claim_dependencies (context, ref, claim_id) VALUES (?, ?, ?)",
+                dependencies,
+            )
+
+    def use_claims_version(self, claims_version: str) -> bool:
+        """Drop the entries if they were recorded for other claim data.
+
+        Returns:
+            Whether entries were dropped
+        """
+        conn = self.state.connection()
+        with self.state.transaction():
+            row = conn.execute("SELECT claims_version FROM claim_index_version").fetchone()
+            if row is not None and row[0] == claims_version:
+                return False
+            self.clear()
+            conn.execute(
+                "INSERT INTO claim_index_version (id, claims_version) VALUES (1, ?)",
+                (claims_version,),
+            )
+        return True
+
+    def clear(self) -> None:
+        """Drop all index entries (e.g. after claim data changed)."""
+        conn = self.state.connection()
+        with self.state.transaction():
+            conn.execute("DELETE FROM claim_index_members")
+            conn.execute("DELETE FROM claim_dependencies")
+            conn.execute("DELETE FROM claim_index_version")
@@ -1,5 +1,6 @@
 """File-based storage implementation using JSON fixtures."""
 
+import hashlib
 import json
 from pathlib import Path
 from functools import lru_cache
@@ -38,6 +39,13 @@ class FileStorage:
         data = self._load_json("claims.json")
         return [Claim.model_validate(item) for item in data]
 
+    @lru_cache(maxsize=1)
+    def claims_version(self) -> str:
+        """Content hash of the claims fixture, identifying the claim data version."""
+        filepath = self.fixtures_path / "claims.json"
+        data = filepath.read_bytes() if filepath.exists() else b""
+        return hashlib.sha256(data).hexdigest()
+
     def get_claim(self, claim_id: str) -> Claim | None:
         """Get a single claim by ID."""
         for claim in self.load_claims():
@@ -92,8 +100,19 @@ class FileStorage:
     def clear_cache(self) -> None:
         """Clear all cached data (for reset functionality)."""
         self.load_claims.cache_clear()
+        self.claims_version.cache_clear()
         self.load_interpretation_sets.cache_clear()
         self.load_assumption_sets.cache_clear()
         self.load_qa_results.cache_clear()
         self.load_qa_cohorts.cache_clear()
         self.load_qa_proposed_changes.cache_clear()
+
+
+@lru_cache
+def get_file_storage() -> FileStorage:
+    """Get the fixture storage shared by the services of this process.
+
+    ``FileStorage`` caches its loaders per class, one entry each, so
+    services with their own instances would evict each other's data.
+    """
+    return FileStorage()
@@ -0,0 +1,305 @@
+"""Append-only governance log with snapshots.
+
+Every change to a proposal (creation, submit, approve, publish, reject and
+the QA impact computed after submission) is appended to
+``governance_events``. The log is the source of truth for proposals and is
+also the audit trail. Current proposals are a projection of the log, held
+in memory with indexes by status and by actor.
+
+Every ``snapshot_interval`` events the projection is written to
+``governance_snapshots``, so a new process loads the latest snapshot and
+replays only the events after it. Before each read the projection applies
+the events other threads or processes committed since, which is one range
+query on the log's primary key.
+
+Events are only applied once committed: inside a transaction, reads see the
+projection as of the last read outside it. Every event is a self-contained
+update of the proposal's fields, so writers never need to read under the
+write lock.
+"""
+
+import json
+import threading
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+from pydantic import ValidationError
+from pydantic_core import to_json
+
+from decision_ledger.config import get_settings
+from decision_ledger.schemas.governance import ChangeProposal, GovernanceEvent, ProposalStatus
+from decision_ledger.storage.sqlite import SqliteStateStore, get_state_store
+from decision_ledger.utils.ids import sort_key
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS governance_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    proposal_id TEXT NOT NULL,
+    action TEXT NOT NULL,
+    actor TEXT NOT NULL,
+    occurred_at TEXT NOT NULL,
+    changes TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_governance_events_proposal_id
+    ON governance_events (proposal_id, seq);
+
+-- Projection as of event ``seq``; only the latest is kept
+CREATE TABLE IF NOT EXISTS governance_snapshots (
+    seq INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+PROPOSAL_CREATED = "created"
+PROPOSAL_SUBMITTED = "submitted"
+PROPOSAL_APPROVED = "approved"
+PROPOSAL_PUBLISHED = "published"
+PROPOSAL_REJECTED = "rejected"
+QA_IMPACT_COMPUTED = "qa_impact_computed"
+# Written by clear(); empties the projection of every process that applies it
+LOG_CLEARED = "cleared"
+
+
+class GovernanceLog:
+    """Event log of proposal changes and the projection of current proposals."""
+
+    def __init__(self, state: SqliteStateStore, snapshot_interval: int = 1000) -> None:
+        """Open the log and build the projection from the latest snapshot.
+
+        Args:
+            state: Shared state store holding the log
+            snapshot_interval: Events between snapshots of the projection
+        """
+        self.state = state
+        self.snapshot_interval = snapshot_interval
+        self.state.connection().executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._proposals: dict[str, ChangeProposal] = {}
+        self._by_status: dict[ProposalStatus, set[str]] = defaultdict(set)
+        self._by_actor: dict[str, set[str]] = defaultdict(set)
+        self._seq = 0
+        self._snapshot_seq = 0
+        self._import_legacy_proposals()
+        self._load_snapshot()
+        self._refresh()
+
+    def append(
+        self, proposal_id: str, action: str, actor: str, changes: dict[str, Any]
+    ) -> GovernanceEvent:
+        """Record an event; joins the caller's transaction if there is one.
+
+        Args:
+            proposal_id: Proposal the event applies to
+            action: Event type, e.g. ``PROPOSAL_SUBMITTED``
+            actor: Role (or user) performing the action
+            changes: Proposal fields the event sets; all of them for
+                ``PROPOSAL_CREATED``
+        """
+        occurred_at = datetime.now()
+        cursor = self.state.connection().execute(
+            "INSERT INTO governance_events (proposal_id, action, actor, occurred_at, changes) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (proposal_id, action, actor, occurred_at.isoformat(), to_json(changes).decode()),
+        )
+        return GovernanceEvent(
+            seq=cursor.lastrowid,
+            proposal_id=proposal_id,
+            action=action,
+            actor=actor,
+            occurred_at=occurred_at,
+            changes=json.loads(to_json(changes)),
+        )
+
+    def get(self, proposal_id: str) -> ChangeProposal | None:
+        """Current state of a proposal."""
+        self._refresh()
+        with self._lock:
+            proposal = self._proposals.get(proposal_id)
+        return proposal.model_copy() if proposal else None
+
+    def load(self, proposal_id: str) -> ChangeProposal | None:
+        """Current state of a proposal, read from its events.
+
+        Unlike ``get`` this reads the log rather than the projection, so
+        inside a transaction it sees every event committed before the write
+        lock was taken, and the transaction's own.
+        """
+        rows = self.state.connection().execute(
+            "SELECT action, changes FROM governance_events WHERE proposal_id = ? ORDER BY seq",
+            (proposal_id,),
+        )
+        proposal = None
+        for action, changes in rows:
+            proposal = _updated(proposal, action, json.loads(changes))
+        return proposal
+
+    def list_proposals(
+        self, status: ProposalStatus | None = None, actor: str | None = None
+    ) -> list[ChangeProposal]:
+        """Proposals, newest first, optionally filtered by status and by an actor
+        who created or acted on them."""
+        self._refresh()
+        with self._lock:
+            ids: set[str] | None = None
+            if status is not None:
+                ids = set(self._by_status.get(status, ()))
+            if actor is not None:
+                actor_ids = self._by_actor.get(actor, set())
+                ids = ids & actor_ids if ids is not None else set(actor_ids)
+            proposals = (
+                [self._proposals[i] for i in ids]
+                if ids is not None
+                else list(self._proposals.values())
+            )
+        proposals.sort(key=lambda p: sort_key(p.proposal_id, p.created_at), reverse=True)
+        return [proposal.model_copy() for proposal in proposals]
+
+    def events(self, proposal_id: str) -> list[GovernanceEvent]:
+        """A proposal's audit trail, oldest first."""
+        rows = self.state.connection().execute(
+            "SELECT seq, proposal_id, action, actor, occurred_at, changes "
+            "FROM governance_events WHERE proposal_id = ? ORDER BY seq",
+            (proposal_id,),
+        )
+        return [
+            GovernanceEvent(
+                seq=seq,
+                proposal_id=pid,
+                action=action,
+                actor=actor,
+                occurred_at=datetime.fromisoformat(occurred_at),
+                changes=json.loads(changes),
+            )
+            for seq, pid, action, actor, occurred_at, changes in rows
+        ]
+
+    def clear(self) -> None:
+        """Delete the log and snapshots (for reset functionality)."""
+        conn = self.state.connection()
+        with self.state.transaction():
+            conn.execute("DELETE FROM governance_events")
+            conn.execute("DELETE FROM governance_snapshots")
+            # AUTOINCREMENT keeps counting, so other processes see this event
+            self.append("", LOG_CLEARED, "System", {})
+        self._refresh()
+
+    # Projection
+
+    def _refresh(self) -> None:
+        """Apply committed events appended since the projection was last updated."""
+        conn = self.state.connection()
+        if conn.in_transaction:
+            # This connection's uncommitted events would show up too
+            return
+        with self._lock:
+            rows = conn.execute(
+                "SELECT seq, proposal_id, action, actor, changes FROM governance_events "
+                "WHERE seq > ? ORDER BY seq",
+                (self._seq,),
+            ).fetchall()
+            for seq, proposal_id, action, actor, changes in rows:
+                self._apply(proposal_id, action, actor, json.loads(changes))
+                self._seq = seq
+            snapshot = None
+            if self._seq - self._snapshot_seq >= self.snapshot_interval:
+                snapshot = self._seq, self._dump()
+                self._snapshot_seq = self._seq
+        if snapshot is not None:
+            self._save_snapshot(*snapshot)
+
+    def _apply(self, proposal_id: str, action: str, actor: str, changes: dict[str, Any]) -> None:
+        """Apply one event to the projection (caller holds the lock)."""
+        if action == LOG_CLEARED:
+            self._proposals.clear()
+            self._by_status.clear()
+            self._by_actor.clear()
+            return
+        current = self._proposals.get(proposal_id)
+        proposal = _updated(current, action, changes)
+        if proposal is None:
+            return
+        if current is not None:
+            self._by_status[current.status].discard(proposal_id)
+        self._proposals[proposal_id] = proposal
+        self._by_status[proposal.status].add(proposal_id)
+        self._by_actor[actor].add(proposal_id)
+
+    def _dump(self) -> str:
+        """Serialize the projection (caller holds the lock)."""
+        return json.dumps(
+            {
+                "proposals": [p.model_dump(mode="json") for p in self._proposals.values()],
+                "actors": {actor: sorted(ids) for actor, ids in self._by_actor.items() if ids},
+            }
+        )
+
+    def _save_snapshot(self, seq: int, data: str) -> None:
+        conn = self.state.connection()
+        with self.state.transaction():
+            conn.execute(
+                "INSERT OR REPLACE INTO governance_snapshots (seq, created_at, data) "
+                "VALUES (?, ?, ?)",
+                (seq, datetime.now().isoformat(), data),
+            )
+            conn.execute("DELETE FROM governance_snapshots WHERE seq < ?", (seq,))
+
+    def _load_snapshot(self) -> None:
+        """Start the projection from the latest snapshot, if it is still readable."""
+        row = self.state.connection().execute(
+            "SELECT seq, data FROM governance_snapshots ORDER BY seq DESC LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return
+        seq, data = row
+        snapshot = json.loads(data)
+        try:
+            proposals = [ChangeProposal.model_validate(p) for p in snapshot["proposals"]]
+        except ValidationError:
+            # Written by an incompatible version; replay the whole log instead
+            return
+        with self._lock:
+            for proposal in proposals:
+                self._proposals[proposal.proposal_id] = proposal
+                self._by_status[proposal.status].add(proposal.proposal_id)
+            for actor, ids in snapshot["actors"].items():
+                self._by_actor[actor].update(ids)
+            self._seq = self._snapshot_seq = seq
+
+    def _import_legacy_proposals(self) -> None:
+        """Turn proposals saved before the log existed into creation events."""
+        conn = self.state.connection()
+        with self.state.transaction():
+            legacy = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'proposals'"
+            ).fetchone()
+            if legacy is None:
+                return
+            for (data,) in conn.execute("SELECT data FROM proposals ORDER BY created_at"):
+                proposal = ChangeProposal.model_validate_json(data)
+                self.append(
+                    proposal.proposal_id,
+                    PROPOSAL_CREATED,
+                    proposal.created_by,
+                    proposal.model_dump(mode="json"),
+                )
+            conn.execute("DROP TABLE proposals")
+
+
+def _updated(
+    current: ChangeProposal | None, action: str, changes: dict[str, Any]
+) -> ChangeProposal | None:
+    """A proposal after one of its events (None before it was created)."""
+    if action == PROPOSAL_CREATED:
+        return ChangeProposal.model_validate(changes)
+    if current is None:
+        return None
+    return ChangeProposal.model_validate({**current.model_dump(), **changes})
+
+
+@lru_cache
+def get_governance_log() -> GovernanceLog:
+    """Get the governance log for this process."""
+    return GovernanceLog(get_state_store(), get_settings().governance_snapshot_interval)
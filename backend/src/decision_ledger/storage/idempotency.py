@@ -0,0 +1,123 @@
+"""Idempotency keys of decision submissions in the shared SQLite database.
+
+Each key records the fingerprint of the request first submitted with it
+and the run that request produced, so a retry reaching any worker process
+returns that run instead of running the engine again. A new key is
+reserved, without a run, in the same transaction that checks it; a
+concurrent submission with the same key waits until the run is recorded.
+Keys expire after the idempotency window, and a reservation whose
+submission never finished (e.g. its process died) after
+``reservation_seconds``.
+"""
+
+import time
+
+from decision_ledger.storage.sqlite import SqliteStateStore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    run_id TEXT,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_idempotency_keys_expires_at ON idempotency_keys (expires_at);
+"""
+
+
+class IdempotencyConflictError(ValueError):
+    """Raised when an idempotency key is reused with a different request."""
+
+
+class IdempotencyStore:
+    """Store for idempotency keys and the runs they produced."""
+
+    def __init__(
+        self,
+        state: SqliteStateStore,
+        window_seconds: float = 600.0,
+        max_entries: int = 10_000,
+        reservation_seconds: float = 60.0,
+        poll_seconds: float = 0.05,
+    ) -> None:
+        """Open the store.
+
+        Args:
+            state: Shared state store holding the keys
+            window_seconds: How long a key returns its run
+            max_entries: Keys kept; the ones expiring first are dropped beyond it
+            reservation_seconds: How long a key stays reserved without a run
+            poll_seconds: Interval at which a waiting submission checks the key
+        """
+        self.state = state
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self.reservation_seconds = reservation_seconds
+        self.poll_seconds = poll_seconds
+        self.state.connection().executescript(_SCHEMA)
+
+    def reserve(self, key: str, fingerprint: str) -> str | None:
+        """Check a key and reserve it if it is new.
+
+        Waits while another submission holds the key without a run yet.
+
+        Returns:
+            The run recorded for the key, or None if the caller reserved it
+            and must ``complete`` (or ``release``) it
+
+        Raises:
+            IdempotencyConflictError: If the key was used for a request with
+                a different fingerprint
+        """
+        conn = self.state.connection()
+        while True:
+            with self.state.transaction():
+                now = time.time()
+                self._evict(now)
+                row = conn.execute(
+                    "SELECT fingerprint, run_id FROM idempotency_keys WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    conn.execute(
+                        "INSERT INTO idempotency_keys (key, fingerprint, run_id, expires_at) "
+                        "VALUES (?, ?, NULL, ?)",
+                        (key, fingerprint, now + self.reservation_seconds),
+                    )
+                    return None
+            if row[0] != fingerprint:
+                raise IdempotencyConflictError(
+                    f"Idempotency key {key} was already used for a different request"
+                )
+            if row[1] is not None:
+                return row[1]
+            time.sleep(self.poll_seconds)
+
+    def complete(self, key: str, run_id: str) -> None:
+        """Record the run a key produced; joins the caller's transaction."""
+        self.state.connection().execute(
+            "UPDATE idempotency_keys SET run_id = ?, expires_at = ? WHERE key = ?",
+            (run_id, time.time() + self.window_seconds, key),
+        )
+
+    def release(self, key: str) -> None:
+        """Drop a reservation whose submission failed, so the key can be retried."""
+        self.state.connection().execute(
+            "DELETE FROM idempotency_keys WHERE key = ? AND run_id IS NULL", (key,)
+        )
+
+    def clear(self) -> None:
+        """Delete all keys (for reset functionality)."""
+        self.state.connection().execute("DELETE FROM idempotency_keys")
+
+    def _evict(self, now: float) -> None:
+        """Delete expired keys, and the recorded ones expiring first beyond ``max_entries``."""
+        conn = self.state.connection()
+        conn.execute("DELETE FROM idempotency_keys WHERE expires_at <= ?", (now,))
+        excess = conn.execute("SELECT COUNT(*) FROM idempotency_keys").fetchone()[0]
+        excess -= self.max_entries - 1
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM idempotency_keys WHERE key IN (SELECT key FROM idempotency_keys "
+                "WHERE run_id IS NOT NULL ORDER BY expires_at LIMIT ?)",
+                (excess,),
+            )
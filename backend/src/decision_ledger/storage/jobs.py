@@ -0,0 +1,200 @@
+"""Persistent job state in the shared SQLite database.
+
+Besides the job itself, each row records which runner owns the job and
+when it last reported progress (its lease). A job whose owner stopped
+reporting, e.g. because the process was restarted, can be claimed by any
+runner and resumed from its last checkpoint.
+"""
+
+import json
+import time
+from datetime import datetime
+from typing import Any
+
+from decision_ledger.schemas.job import TERMINAL_JOB_STATUSES, Job, JobStatus
+from decision_ledger.storage.sqlite import SqliteStateStore
+from decision_ledger.utils.hashing import canonical_json
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    owner TEXT,
+    heartbeat_at REAL,
+    data TEXT NOT NULL,
+    checkpoint TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status);
+CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs (created_at);
+"""
+
+
+class JobLeaseLostError(Exception):
+    """Raised when a runner reports on a job that another runner has taken over."""
+
+
+class JobStore:
+    """Store for background jobs, their leases and checkpoints."""
+
+    def __init__(self, state: SqliteStateStore) -> None:
+        self.state = state
+        self.state.connection().executescript(_SCHEMA)
+
+    def create(self, job: Job) -> None:
+        """Insert a new job."""
+        self.state.connection().execute(
+            "INSERT INTO jobs (job_id, kind, status, created_at, data) VALUES (?, ?, ?, ?, ?)",
+            (job.job_id, job.kind, job.status.value, job.created_at.isoformat(), job.model_dump_json()),
+        )
+
+    def get(self, job_id: str) -> Job | None:
+        """Get a job by ID."""
+        row = self.state.connection().execute(
+            "SELECT data FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return Job.model_validate_json(row[0]) if row else None
+
+    def list_jobs(self, kind: str | None = None) -> list[Job]:
+        """List jobs, newest first, optionally filtered by kind."""
+        if kind:
+            rows = self.state.connection().execute(
+                "SELECT data FROM jobs WHERE kind = ? ORDER BY created_at DESC", (kind,)
+            )
+        else:
+            rows = self.state.connection().execute("SELECT data FROM jobs ORDER BY created_at DESC")
+        return [Job.model_validate_json(row[0]) for row in rows]
+
+    def save(self, job: Job, owner: str | None = None) -> None:
+        """Persist a job's state and renew its owner's lease."""
+        job.updated_at = datetime.now()
+        self.state.connection().execute(
+            "UPDATE jobs SET status = ?, data = ?, owner = ?, heartbeat_at = ? WHERE job_id = ?",
+            (job.status.value, job.model_dump_json(), owner, time.time(), job.job_id),
+        )
+
+    def claim(self, job_id: str, owner: str, lease_seconds: float) -> Job | None:
+        """Take ownership of a job if it is queued or its owner's lease expired.
+
+        Returns:
+            The job, now Running and owned by ``owner``, or None if it is
+            finished or owned by a live runner
+        """
+        conn = self.state.connection()
+        with self.state.transaction():
+            row = conn.execute(
+                "SELECT data, owner, heartbeat_at FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            job = Job.model_validate_json(row[0])
+            if job.status in TERMINAL_JOB_STATUSES:
+                return None
+            lease_expired = row[2] is None or time.time() - row[2] > lease_seconds
+            if row[1] not in (None, owner) and not lease_expired:
+                return None
+            if job.cancel_requested:
+                job.status = JobStatus.CANCELLED
+                job.finished_at = datetime.now()
+                self.save(job)
+                return None
+            job.status = JobStatus.RUNNING
+            job.started_at = job.started_at or datetime.now()
+            self.save(job, owner)
+            return job
+
+    def claimable(self, lease_seconds: float) -> list[str]:
+        """IDs of unfinished jobs that are unowned or whose lease expired."""
+        rows = self.state.connection().execute(
+            "SELECT job_id FROM jobs WHERE status IN (?, ?) "
+            "AND (owner IS NULL OR heartbeat_at IS NULL OR heartbeat_at < ?) "
+            "ORDER BY created_at",
+            (JobStatus.QUEUED.value, JobStatus.RUNNING.value, time.time() - lease_seconds),
+        )
+        return [row[0] for row in rows]
+
+    def request_cancel(self, job_id: str) -> Job | None:
+        """Ask for a job to stop; unowned queued jobs are cancelled immediately."""
+        conn = self.state.connection()
+        with self.state.transaction():
+            row = conn.execute(
+                "SELECT data, owner FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            job = Job.model_validate_json(row[0])
+            if job.status in TERMINAL_JOB_STATUSES:
+                return job
+            job.cancel_requested = True
+            if job.status == JobStatus.QUEUED and row[1] is None:
+                job.status = JobStatus.CANCELLED
+                job.finished_at = datetime.now()
+            self.save(job, row[1])
+            return job
+
+    def requeue(self, job_id: str) -> Job | None:
+        """Queue a cancelled or failed job again, keeping its checkpoint."""
+        conn = self.state.connection()
+        with self.state.transaction():
+            job = self.get(job_id)
+            if job is None or job.status not in (JobStatus.CANCELLED, JobStatus.FAILED):
+                return job
+            job.status = JobStatus.QUEUED
+            job.cancel_requested = False
+            job.error = None
+            job.finished_at = None
+            self.save(job)
+            conn.execute("UPDATE jobs SET heartbeat_at = NULL WHERE job_id = ?", (job_id,))
+            return job
+
+    def release(self, job: Job) -> None:
+        """Give up ownership of a running job so any runner can resume it."""
+        with self.state.transaction():
+            job.status = JobStatus.QUEUED
+            self.save(job)
+            self.state.connection().execute(
+                "UPDATE jobs SET heartbeat_at = NULL WHERE job_id = ?", (job.job_id,)
+            )
+
+    def heartbeat(
+        self, job: Job, owner: str, checkpoint: dict[str, Any] | None = None
+    ) -> bool:
+        """Persist a running job's progress (and checkpoint), renewing its lease.
+
+        A cancellation requested in the meantime is preserved and reported.
+        Nothing is written if ``owner`` no longer owns the job.
+
+        Returns:
+            Whether cancellation was requested
+
+        Raises:
+            JobLeaseLostError: If another runner took over the job
+        """
+        conn = self.state.connection()
+        with self.state.transaction():
+            row = conn.execute(
+                "SELECT data, owner FROM jobs WHERE job_id = ?", (job.job_id,)
+            ).fetchone()
+            if row is not None and row[1] != owner:
+                raise JobLeaseLostError(job.job_id)
+            if row is None or Job.model_validate_json(row[0]).cancel_requested:
+                job.cancel_requested = True
+            self.save(job, owner)
+            if checkpoint is not None:
+                conn.execute(
+                    "UPDATE jobs SET checkpoint = ? WHERE job_id = ?",
+                    (canonical_json(checkpoint), job.job_id),
+                )
+        return job.cancel_requested
+
+    def load_checkpoint(self, job_id: str) -> dict[str, Any] | None:
+        """Return a job's last checkpoint, if any."""
+        row = self.state.connection().execute(
+            "SELECT checkpoint FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return None if row is None or row[0] is None else json.loads(row[0])
+
+    def clear(self) -> None:
+        """Delete all jobs (for reset functionality)."""
+        self.state.connection().execute("DELETE FROM jobs")
@@ -14,6 +14,10 @@ class StorageProtocol(Protocol):
         """Load all claims."""
         ...
 
+    def claims_version(self) -> str:
+        """Identifier that changes whenever the claim data changes."""
+        ...
+
     def get_claim(self, claim_id: str) -> Claim | None:
         """Get a single claim by ID."""
         ...
@@ -0,0 +1,115 @@
+"""Two-tier cache for computed QA study results.
+
+Keys are content hashes of everything a study depends on (cohort definition,
+proposed change, catalog versions, claim data version and flag rules), so a
+change to any input yields a new key and stale entries are never served.
+They are simply evicted: least recently used first in memory, and oldest
+last use first on disk.
+
+The memory tier is a per-process LRU. The disk tier is a table in the
+shared SQLite state store, so results survive restarts and are shared
+between API worker processes.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from decision_ledger.schemas.qa import QAStudyResult
+from decision_ledger.storage.sqlite import SqliteStateStore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS qa_result_cache (
+    cache_key TEXT PRIMARY KEY,
+    last_used_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_qa_result_cache_last_used ON qa_result_cache (last_used_at);
+"""
+
+
+class QAResultCache:
+    """LRU memory tier in front of a SQLite disk tier."""
+
+    def __init__(
+        self,
+        state: SqliteStateStore,
+        max_memory_entries: int = 128,
+        max_disk_entries: int = 1000,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            state: State store holding the disk tier
+            max_memory_entries: Results kept in this process
+            max_disk_entries: Results kept on disk
+        """
+        self.state = state
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, QAStudyResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.state.connection().executescript(_SCHEMA)
+
+    def get(self, key: str) -> QAStudyResult | None:
+        """Return the cached result for ``key``, checking memory then disk."""
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return result
+
+        conn = self.state.connection()
+        row = conn.execute(
+            "SELECT data FROM qa_result_cache WHERE cache_key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        conn.execute(
+            "UPDATE qa_result_cache SET last_used_at = ? WHERE cache_key = ?", (time.time(), key)
+        )
+        result = QAStudyResult.model_validate_json(row[0])
+        with self._lock:
+            self.hits += 1
+            self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: QAStudyResult) -> None:
+        """Store a result in both tiers."""
+        with self._lock:
+            self._remember(key, result)
+
+        conn = self.state.connection()
+        with self.state.transaction():
+            conn.execute(
+                "INSERT OR REPLACE INTO qa_result_cache (cache_key, last_used_at, data) "
+                "VALUES (?, ?, ?)",
+                (key, time.time(), result.model_dump_json()),
+            )
+            conn.execute(
+                "DELETE FROM qa_result_cache WHERE cache_key IN ("
+                "SELECT cache_key FROM qa_result_cache ORDER BY last_used_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_disk_entries,),
+            )
+
+    def _remember(self, key: str, result: QAStudyResult) -> None:
+        """Insert into the memory tier (caller holds the lock)."""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        conn = self.state.connection()
+        with self.state.transaction():
+            conn.execute("DELETE FROM qa_result_cache")
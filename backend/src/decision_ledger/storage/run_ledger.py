@@ -0,0 +1,310 @@
+"""Tamper-evident ledger of persisted decision runs.
+
+Every run is stored as a canonical JSON record (see ``storage.run_records``)
+and the SHA-256 of those bytes is appended to ``run_ledger`` together with
+a chain hash linking it to the entry before it, so altering, removing or
+reordering any stored run breaks the chain from that point on. A record
+references its inputs by their content hash, so the ledger commits to the
+inputs too.
+
+Every ``batch_size`` entries the ledger is sealed into ``ledger_batches``:
+a Merkle root over the batch's run hashes, plus the chain hash of its last
+entry. A receipt for one run is its hash and the O(log n) Merkle path to
+its batch root (``run_proof``). Full verification (``verify_ledger``)
+checks ranges of batches independently, each starting from the stored
+chain hash before the range, so ranges can be checked on separate
+processes; every stored chain hash is itself recomputed by the range
+containing it, so the ranges together check the whole chain.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from decision_ledger.schemas.decision import LedgerVerification, MerkleProofStep, RunProof
+from decision_ledger.utils.hashing import content_hash
+from decision_ledger.utils.merkle import (
+    GENESIS_HASH,
+    chain_hash,
+    merkle_proof,
+    merkle_root,
+)
+
+LEDGER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_ledger (
+    seq INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL UNIQUE,
+    run_hash TEXT NOT NULL,
+    chain_hash TEXT NOT NULL
+);
+
+-- Sealed batches: Merkle root over entries first_seq..last_seq
+CREATE TABLE IF NOT EXISTS ledger_batches (
+    last_seq INTEGER PRIMARY KEY,
+    first_seq INTEGER NOT NULL,
+    merkle_root TEXT NOT NULL,
+    chain_hash TEXT NOT NULL,
+    sealed_at TEXT NOT NULL
+);
+"""
+
+# Failures reported per verified range; the total is always counted
+_MAX_REPORTED_FAILURES = 100
+
+
+class _Batch(NamedTuple):
+    first_seq: int
+    last_seq: int
+    merkle_root: str
+    chain_hash: str
+
+
+def run_hash(data: str) -> str:
+    """Hash of a run's stored canonical JSON."""
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def append_entry(conn: sqlite3.Connection, run_id: str, data: str, batch_size: int) -> None:
+    """Append a run to the ledger, sealing a batch when it is full.
+
+    Must run inside the transaction that stores the run.
+    """
+    head = conn.execute(
+        "SELECT seq, chain_hash FROM run_ledger ORDER BY seq DESC LIMIT 1"
+    ).fetchone()
+    seq, previous = (head[0] + 1, head[1]) if head else (1, GENESIS_HASH)
+    entry_hash = run_hash(data)
+    chained = chain_hash(previous, entry_hash)
+    conn.execute(
+        "INSERT INTO run_ledger (seq, run_id, run_hash, chain_hash) VALUES (?, ?, ?, ?)",
+        (seq, run_id, entry_hash, chained),
+    )
+    sealed = _sealed_seq(conn)
+    if seq - sealed < batch_size:
+        return
+    hashes = [
+        row[0]
+        for row in conn.execute(
+            "SELECT run_hash FROM run_ledger WHERE seq > ? ORDER BY seq", (sealed,)
+        )
+    ]
+    conn.execute(
+        "INSERT INTO ledger_batches (last_seq, first_seq, merkle_root, chain_hash, sealed_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (seq, sealed + 1, merkle_root(hashes), chained, datetime.now().isoformat()),
+    )
+
+
+def _sealed_seq(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT COALESCE(MAX(last_seq), 0) FROM ledger_batches").fetchone()[0]
+
+
+def run_proof(conn: sqlite3.Connection, run_id: str) -> RunProof | None:
+    """Inclusion proof of a run in its batch, or None if it is not in the ledger.
+
+    A run in the open (not yet sealed) batch is proven against the root of
+    the entries recorded so far.
+    """
+    entry = conn.execute(
+        "SELECT seq, run_hash, chain_hash FROM run_ledger WHERE run_id = ?", (run_id,)
+    ).fetchone()
+    if entry is None:
+        return None
+    seq, entry_hash, chained = entry
+    record, inputs = conn.execute(
+        "SELECT r.data, i.data FROM runs r LEFT JOIN run_inputs i "
+        "ON i.inputs_hash = json_extract(r.data, '$.inputs_hash') WHERE r.run_id = ?",
+        (run_id,),
+    ).fetchone() or (None, None)
+    if record is None:
+        return None
+    batch = conn.execute(
+        "SELECT first_seq, last_seq, merkle_root, chain_hash FROM ledger_batches "
+        "WHERE last_seq >= ? ORDER BY last_seq LIMIT 1",
+        (seq,),
+    ).fetchone()
+    if batch is not None:
+        first_seq, last_seq, root, batch_chain = batch
+    else:
+        first_seq = _sealed_seq(conn) + 1
+        last_seq, batch_chain = conn.execute(
+            "SELECT seq, chain_hash FROM run_ledger ORDER BY seq DESC LIMIT 1"
+        ).fetchone()
+    hashes = [
+        row[0]
+        for row in conn.execute(
+            "SELECT run_hash FROM run_ledger WHERE seq BETWEEN ? AND ? ORDER BY seq",
+            (first_seq, last_seq),
+        )
+    ]
+    if batch is None:
+        root = merkle_root(hashes)
+    return RunProof(
+        run_id=run_id,
+        seq=seq,
+        run_hash=entry_hash,
+        record=record,
+        inputs_record=inputs,
+        chain_hash=chained,
+        batch_first_seq=first_seq,
+        batch_last_seq=last_seq,
+        sealed=batch is not None,
+        merkle_root=root,
+        batch_chain_hash=batch_chain,
+        path=[
+            MerkleProofStep(side=side, hash=sibling)
+            for side, sibling in merkle_proof(hashes, seq - first_seq)
+        ],
+    )
+
+
+def verify_ledger(
+    db_path: Path, workers: int = 1, batches_per_unit: int = 64
+) -> LedgerVerification:
+    """Check every stored run against the ledger, the chain and the batch roots.
+
+    Entries appended after verification starts are not checked.
+
+    Args:
+        db_path: Path of the state database
+        workers: Processes checking ranges in parallel (1 = in this process)
+        batches_per_unit: Sealed batches per independently checked range
+    """
+    started = time.perf_counter()
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        head = conn.execute(
+            "SELECT seq, chain_hash FROM run_ledger ORDER BY seq DESC LIMIT 1"
+        ).fetchone()
+        head_seq, head_hash = head if head else (0, GENESIS_HASH)
+        batches = [
+            _Batch(*row)
+            for row in conn.execute(
+                "SELECT first_seq, last_seq, merkle_root, chain_hash FROM ledger_batches "
+                "WHERE last_seq <= ? ORDER BY last_seq",
+                (head_seq,),
+            )
+        ]
+        unrecorded = conn.execute(
+            "SELECT COUNT(*) FROM runs r "
+            "WHERE NOT EXISTS (SELECT 1 FROM run_ledger l WHERE l.run_id = r.run_id)"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+    units: list[tuple[Path, int, int, list[_Batch]]] = []
+    for i in range(0, len(batches), batches_per_unit):
+        group = batches[i : i + batches_per_unit]
+        units.append((db_path, group[0].first_seq, group[-1].last_seq, group))
+    sealed = batches[-1].last_seq if batches else 0
+    if head_seq > sealed:
+        units.append((db_path, sealed + 1, head_seq, []))
+
+    if workers > 1 and len(units) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_verify_range, *zip(*units)))
+    else:
+        results = [_verify_range(*unit) for unit in units]
+
+    failures = [failure for _, unit_failures, _ in results for failure in unit_failures]
+    failure_count = sum(count for _, _, count in results)
+    if batches and batches[0].first_seq != 1:
+        failures.insert(0, f"Entries before {batches[0].first_seq} are not in any batch")
+        failure_count += 1
+    if unrecorded:
+        failures.append(f"{unrecorded} stored runs are not in the ledger")
+        failure_count += 1
+    return LedgerVerification(
+        runs_checked=sum(checked for checked, _, _ in results),
+        batches_checked=len(batches),
+        head_seq=head_seq,
+        head_hash=head_hash,
+        failure_count=failure_count,
+        failures=failures,
+        ok=failure_count == 0,
+        elapsed_seconds=time.perf_counter() - started,
+    )
+
+
+def _verify_range(
+    db_path: Path, first_seq: int, last_seq: int, batches: list[_Batch]
+) -> tuple[int, list[str], int]:
+    """Check entries first_seq..last_seq and the batches sealing them.
+
+    Returns:
+        (entries checked, reported failures, total failures)
+    """
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    failures: list[str] = []
+    failure_count = 0
+
+    def fail(message: str) -> None:
+        nonlocal failure_count
+        failure_count += 1
+        if len(failures) < _MAX_REPORTED_FAILURES:
+            failures.append(message)
+
+    try:
+        if first_seq == 1:
+            previous = GENESIS_HASH
+        else:
+            row = conn.execute(
+                "SELECT chain_hash FROM run_ledger WHERE seq = ?", (first_seq - 1,)
+            ).fetchone()
+            previous = row[0] if row else GENESIS_HASH
+        pending = iter(batches)
+        batch = next(pending, None)
+        if batch is not None and batch.first_seq != first_seq:
+            fail(f"Batch {batch.first_seq}-{batch.last_seq} does not follow entry {first_seq - 1}")
+        expected = first_seq
+        checked = 0
+        hashes: list[str] = []
+        checked_inputs: set[str] = set()
+        rows = conn.execute(
+            "SELECT l.seq, l.run_id, l.run_hash, l.chain_hash, r.data, "
+            "json_extract(r.data, '$.inputs_hash'), i.data "
+            "FROM run_ledger l LEFT JOIN runs r ON r.run_id = l.run_id "
+            "LEFT JOIN run_inputs i ON i.inputs_hash = json_extract(r.data, '$.inputs_hash') "
+            "WHERE l.seq BETWEEN ? AND ? ORDER BY l.seq",
+            (first_seq, last_seq),
+        )
+        for seq, run_id, entry_hash, chained, data, inputs_hash, inputs in rows:
+            if seq != expected:
+                fail(f"Entries {expected}-{seq - 1} are missing from the ledger")
+            if data is None:
+                fail(f"Run {run_id} (entry {seq}) is missing")
+            elif run_hash(data) != entry_hash:
+                fail(f"Run {run_id} (entry {seq}) does not match its ledger hash")
+            elif inputs_hash is not None and inputs_hash not in checked_inputs:
+                # Inputs are shared between runs: check (and report) each once per range
+                checked_inputs.add(inputs_hash)
+                if inputs is None:
+                    fail(f"Inputs {inputs_hash} of run {run_id} are missing")
+                elif content_hash(json.loads(inputs)) != inputs_hash:
+                    fail(f"Inputs {inputs_hash} of run {run_id} do not match their hash")
+            if chain_hash(previous, entry_hash) != chained:
+                fail(f"Chain is broken at entry {seq} (run {run_id})")
+            previous = chained
+            hashes.append(entry_hash)
+            checked += 1
+            expected = seq + 1
+            if batch is not None and seq == batch.last_seq:
+                if merkle_root(hashes) != batch.merkle_root:
+                    fail(f"Merkle root of batch {batch.first_seq}-{batch.last_seq} does not match")
+                if chained != batch.chain_hash:
+                    fail(f"Chain hash of batch {batch.first_seq}-{batch.last_seq} does not match")
+                hashes = []
+                following = next(pending, None)
+                if following is not None and following.first_seq != seq + 1:
+                    fail(f"Batch {following.first_seq}-{following.last_seq} does not follow {seq}")
+                batch = following
+        if expected != last_seq + 1:
+            fail(f"Entries {expected}-{last_seq} are missing from the ledger")
+    finally:
+        conn.close()
+    return checked, failures, failure_count
@@ -0,0 +1,106 @@
+"""Compact persisted form of decision runs.
+
+A run's payout breakdown, trace and dependencies follow deterministically
+from its claim, the catalog versions and the recorded choices, and make up
+most of its size. A run is therefore stored as a record holding only its
+references, the outcome totals and ``result_hash``, a hash of the full
+outcome and trace; the full run is regenerated on demand (see
+``core.run_codec``) and checked against that hash.
+
+The claim's content hash, set versions and choices (``RunInputs``) are stored once per distinct
+content in ``run_inputs``, keyed by their content hash, and the record
+references them by that hash. The ledger hashes the record, so it commits
+to the inputs as well.
+
+Runs stored in full before this format existed are read and served as they
+are, with their stored outcome and trace; they are never regenerated or
+rewritten.
+"""
+
+import json
+
+from decision_ledger.schemas.decision import (
+    DecisionOutcome,
+    DecisionRun,
+    RunInputs,
+    StoredDecisionRun,
+    TraceStep,
+)
+from decision_ledger.utils.hashing import canonical_json, content_hash
+
+RUN_INPUTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_inputs (
+    inputs_hash TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+
+def result_hash(outcome: DecisionOutcome, trace_steps: list[TraceStep]) -> str:
+    """Content hash of a run's full outcome and trace."""
+    return content_hash(
+        {
+            "outcome": outcome.model_dump(mode="json"),
+            "trace_steps": [step.model_dump(mode="json") for step in trace_steps],
+        }
+    )
+
+
+def compact_run(run: DecisionRun, claim_hash: str | None = None) -> StoredDecisionRun:
+    """The persisted form of a run.
+
+    Args:
+        run: The full run
+        claim_hash: Content hash of the claim the run was computed from
+    """
+    return StoredDecisionRun(
+        run_id=run.run_id,
+        claim_id=run.claim_id,
+        timestamp=run.timestamp,
+        inputs=RunInputs(
+            claim_hash=claim_hash,
+            interpretation_set_id=run.interpretation_set_id,
+            interpretation_set_version=run.interpretation_set_version,
+            assumption_set_id=run.assumption_set_id,
+            assumption_set_version=run.assumption_set_version,
+            resolved_assumptions=run.resolved_assumptions,
+            selected_interpretations=run.selected_interpretations,
+        ),
+        approved=run.outcome.approved,
+        status=run.outcome.status,
+        payout_total=run.outcome.payout_total,
+        deductible_applied=run.outcome.deductible_applied,
+        result_hash=result_hash(run.outcome, run.trace_steps),
+        generated_by_role=run.generated_by_role,
+        supersedes_run_id=run.supersedes_run_id,
+    )
+
+
+def encode_record(stored: StoredDecisionRun) -> tuple[str, str, str]:
+    """Serialize a run for storage.
+
+    Returns:
+        Tuple of (record, inputs hash, inputs), all canonical JSON but the hash
+    """
+    inputs = canonical_json(stored.inputs)
+    inputs_hash = content_hash(stored.inputs)
+    record = stored.model_dump(mode="json", exclude={"inputs", "full_run"}, exclude_none=True)
+    record["inputs_hash"] = inputs_hash
+    return canonical_json(record), inputs_hash, inputs
+
+
+def decode_record(record: str, inputs: str | None) -> StoredDecisionRun:
+    """Read a stored run, in the compact or the earlier full form.
+
+    Args:
+        record: The run's stored JSON
+        inputs: The JSON of the inputs it references (None for a full run)
+    """
+    data = json.loads(record)
+    if "inputs_hash" not in data:
+        run = DecisionRun.model_validate(data)
+        return compact_run(run).model_copy(update={"full_run": run})
+    if inputs is None:
+        raise ValueError(f"Inputs {data['inputs_hash']} of run {data['run_id']} are missing")
+    data["inputs"] = json.loads(inputs)
+    return StoredDecisionRun.model_validate(data)
@@ -0,0 +1,387 @@
+"""SQLite-backed state shared across API worker processes.
+
+Decision runs and change proposals used to live in per-process dicts, so a
+run created on one ``uvicorn`` worker was invisible to the others. This store
+keeps them in a single SQLite database on the local host instead (proposals
+through the governance log, see ``storage.governance_log``).
+
+The database runs in WAL mode: readers never block each other or the
+writer, and each thread uses its own connection, so reads do not serialize
+behind a global lock. Read-modify-write sequences use ``transaction()``,
+which takes SQLite's write lock for the duration of the block; work that
+must only see committed rows (e.g. starting a job) is deferred to the
+commit with ``on_commit()``.
+
+Runs are stored in a compact form without their trace (see
+``storage.run_records``) and are immutable once saved: each is appended to
+the hash-chained run ledger in the same transaction (see
+``storage.run_ledger``).
+
+``run_order`` indexes runs by a key that sorts by creation time (the run
+ID's ULID, see ``utils.ids``), so new runs are appended at its end and
+listing runs newest first, by time range or by cursor is a scan of the
+index, with no sort.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterator, NamedTuple
+
+from decision_ledger.config import get_settings
+from decision_ledger.schemas.decision import DecisionRun, RunProof, StoredDecisionRun
+from decision_ledger.storage import run_ledger
+from decision_ledger.storage.run_records import (
+    RUN_INPUTS_SCHEMA,
+    compact_run,
+    decode_record,
+    encode_record,
+)
+from decision_ledger.utils.ids import sort_key, time_bound
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    claim_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_claim_id ON runs (claim_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON runs (timestamp);
+
+-- Reverse index: decision point / assumption / fact ID -> runs that depended on it
+CREATE TABLE IF NOT EXISTS run_dependencies (
+    ref TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    claim_id TEXT NOT NULL,
+    PRIMARY KEY (ref, run_id)
+);
+CREATE INDEX IF NOT EXISTS idx_run_dependencies_run_id ON run_dependencies (run_id);
+
+-- Runs in creation order (see utils.ids.sort_key)
+CREATE TABLE IF NOT EXISTS run_order (
+    sort_key TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL UNIQUE,
+    claim_id TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_run_order_claim_id ON run_order (claim_id, sort_key);
+"""
+
+
+class StoredRun(NamedTuple):
+    """A run's stored JSON and the set IDs it recorded, without parsing the run."""
+
+    run_id: str
+    claim_id: str
+    interpretation_set_id: str
+    assumption_set_id: str
+    data: str
+    inputs: str | None  # None for runs stored in full
+
+    def decode(self) -> StoredDecisionRun:
+        """Parse the run."""
+        return decode_record(self.data, self.inputs)
+
+
+# Joins a run ``r`` to the inputs ``i`` it references
+_WITH_INPUTS = (
+    "runs r LEFT JOIN run_inputs i ON i.inputs_hash = json_extract(r.data, '$.inputs_hash')"
+)
+
+
+class SqliteStateStore:
+    """Store for decision runs in a local SQLite file, shared by the other stores."""
+
+    def __init__(self, db_path: Path, ledger_batch_size: int = 1024) -> None:
+        """Open (and if needed create) the state database.
+
+        Args:
+            db_path: Path of the SQLite database file
+            ledger_batch_size: Runs per sealed Merkle batch of the run ledger
+        """
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ledger_batch_size = ledger_batch_size
+        self._local = threading.local()
+        self.connection().executescript(_SCHEMA + RUN_INPUTS_SCHEMA + run_ledger.LEDGER_SCHEMA)
+        self._record_legacy_runs()
+        self._order_legacy_runs()
+
+    def connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None: autocommit unless inside transaction()
+            conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run a block atomically while holding the database write lock.
+
+        Nested calls join the outer transaction.
+        """
+        conn = self.connection()
+        if conn.in_transaction:
+            yield
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.on_commit = []
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            self._local.on_commit = []
+            raise
+        conn.execute("COMMIT")
+        callbacks, self._local.on_commit = self._local.on_commit, []
+        for callback in callbacks:
+            callback()
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` once this thread's transaction commits.
+
+        Outside a transaction it is called immediately; if the transaction
+        rolls back it is never called.
+        """
+        if self.connection().in_transaction:
+            self._local.on_commit.append(callback)
+        else:
+            callback()
+
+    # Decision runs
+
+    def save_run(self, run: DecisionRun, claim_hash: str | None = None) -> None:
+        """Insert a decision run, its dependency index entries and its ledger entry.
+
+        Only the compact form of the run is stored.
+
+        Args:
+            run: The run
+            claim_hash: Content hash of the claim the run was computed from
+
+        Raises:
+            ValueError: If a run with the same ID was already saved
+        """
+        conn = self.connection()
+        record, inputs_hash, inputs = encode_record(compact_run(run, claim_hash))
+        with self.transaction():
+            try:
+                conn.execute(
+                    "INSERT INTO runs (run_id, claim_id, timestamp, data) VALUES (?, ?, ?, ?)",
+                    (run.run_id, run.claim_id, run.timestamp.isoformat(), record),
+                )
+            except sqlite3.IntegrityError:
+                raise ValueError(f"Decision run {run.run_id} is already recorded") from None
+            conn.execute(
+                "INSERT INTO run_order (sort_key, run_id, claim_id) VALUES (?, ?, ?)",
+                (sort_key(run.run_id, run.timestamp), run.run_id, run.claim_id),
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO run_inputs (inputs_hash, data) VALUES (?, ?)",
+                (inputs_hash, inputs),
+            )
+            if run.dependencies is not None:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO run_dependencies (ref, run_id, claim_id) VALUES (?, ?, ?)",
+                    [(ref, run.run_id, run.claim_id) for ref in run.dependencies.refs()],
+                )
+            run_ledger.append_entry(conn, run.run_id, record, self.ledger_batch_size)
+
+    def run_proof(self, run_id: str) -> RunProof | None:
+        """Ledger inclusion proof of a run, or None if it is not recorded."""
+        return run_ledger.run_proof(self.connection(), run_id)
+
+    def get_run(self, run_id: str) -> StoredDecisionRun | None:
+        """Get a single stored decision run by ID."""
+        row = self.connection().execute(
+            f"SELECT r.data, i.data FROM {_WITH_INPUTS} WHERE r.run_id = ?", (run_id,)
+        ).fetchone()
+        return decode_record(*row) if row else None
+
+    def list_runs(
+        self,
+        claim_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        before_run_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[StoredDecisionRun]:
+        """List stored decision runs, newest first.
+
+        Args:
+            claim_id: Only this claim's runs
+            since: Only runs created at or after this time
+            until: Only runs created before this time
+            before_run_id: Only runs older than this one (the previous page's last)
+            limit: Page size (None = all)
+
+        Raises:
+            ValueError: If ``before_run_id`` is not a stored run
+        """
+        conditions = ["r.run_id = o.run_id"]
+        params: list[str | int] = []
+        if claim_id:
+            conditions.append("o.claim_id = ?")
+            params.append(claim_id)
+        if since is not None:
+            conditions.append("o.sort_key >= ?")
+            params.append(time_bound(since))
+        if until is not None:
+            conditions.append("o.sort_key < ?")
+            params.append(time_bound(until))
+        if before_run_id is not None:
+            cursor = self.connection().execute(
+                "SELECT sort_key FROM run_order WHERE run_id = ?", (before_run_id,)
+            ).fetchone()
+            if cursor is None:
+                raise ValueError(f"Unknown cursor: {before_run_id}")
+            conditions.append("o.sort_key < ?")
+            params.append(cursor[0])
+        query = (
+            f"SELECT r.data, i.data FROM run_order o JOIN {_WITH_INPUTS} "
+            f"WHERE {' AND '.join(conditions)} ORDER BY o.sort_key DESC"
+        )
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = self.connection().execute(query, params)
+        return [decode_record(*row) for row in rows]
+
+    def iter_stored_runs(
+        self, claim_id: str | None = None, page_size: int = 1000
+    ) -> Iterator[StoredRun]:
+        """Stream stored runs in run ID order, one page per query.
+
+        Pages are read by run ID, so no read transaction is held open while
+        the caller processes them.
+        """
+        where = "r.run_id > ?" + (" AND r.claim_id = ?" if claim_id else "")
+        set_id = "COALESCE(json_extract(i.data, '$.{0}'), json_extract(r.data, '$.{0}'))"
+        after = ""
+        while True:
+            rows = self.connection().execute(
+                f"SELECT r.run_id, r.claim_id, {set_id.format('interpretation_set_id')}, "
+                f"{set_id.format('assumption_set_id')}, r.data, i.data FROM {_WITH_INPUTS} "
+                f"WHERE {where} ORDER BY r.run_id LIMIT ?",
+                [after, *([claim_id] if claim_id else []), page_size],
+            ).fetchall()
+            yield from (StoredRun(*row) for row in rows)
+            if len(rows) < page_size:
+                return
+            after = rows[-1][0]
+
+    def find_runs_depending_on(self, refs: list[str]) -> list[str]:
+        """Return IDs of runs whose outcome depended on any of ``refs``."""
+        if not refs:
+            return []
+        placeholders = ",".join("?" * len(refs))
+        rows = self.connection().execute(
+            f"SELECT DISTINCT run_id FROM run_dependencies WHERE ref IN ({placeholders})",
+            refs,
+        )
+        return [row[0] for row in rows]
+
+    def latest_runs_depending_on(
+        self,
+        refs: list[str],
+        created_before: datetime,
+        after_run_id: str = "",
+        limit: int = 100,
+    ) -> list[StoredDecisionRun]:
+        """Page through each claim's latest run, if it depended on any of ``refs``.
+
+        Only runs created up to ``created_before`` are considered, so runs
+        written while paging (e.g. by a backfill) do not change the pages.
+
+        Args:
+            refs: Decision point, assumption or fact IDs
+            created_before: Ignore runs created after this time
+            after_run_id: Return runs with a greater ID (the previous page's last)
+            limit: Page size
+
+        Returns:
+            Runs ordered by run ID
+        """
+        if not refs:
+            return []
+        where, params = self._latest_dependent_filter(refs, created_before)
+        rows = self.connection().execute(
+            f"SELECT r.data, i.data FROM {_WITH_INPUTS} WHERE {where} AND r.run_id > ? "
+            "ORDER BY r.run_id LIMIT ?",
+            [*params, after_run_id, limit],
+        )
+        return [decode_record(*row) for row in rows]
+
+    def count_latest_runs_depending_on(self, refs: list[str], created_before: datetime) -> int:
+        """Number of runs ``latest_runs_depending_on`` pages through."""
+        if not refs:
+            return 0
+        where, params = self._latest_dependent_filter(refs, created_before)
+        return self.connection().execute(
+            f"SELECT COUNT(*) FROM runs r WHERE {where}", params
+        ).fetchone()[0]
+
+    @staticmethod
+    def _latest_dependent_filter(
+        refs: list[str], created_before: datetime
+    ) -> tuple[str, list[str]]:
+        cutoff = created_before.isoformat()
+        placeholders = ",".join("?" * len(refs))
+        where = (
+            f"r.run_id IN (SELECT run_id FROM run_dependencies WHERE ref IN ({placeholders})) "
+            "AND r.timestamp <= ? "
+            "AND NOT EXISTS (SELECT 1 FROM runs newer WHERE newer.claim_id = r.claim_id "
+            "AND newer.timestamp > r.timestamp AND newer.timestamp <= ?)"
+        )
+        return where, [*refs, cutoff, cutoff]
+
+    def clear(self) -> None:
+        """Delete all runs (for reset functionality)."""
+        with self.transaction():
+            self.connection().execute("DELETE FROM runs")
+            self.connection().execute("DELETE FROM run_dependencies")
+            self.connection().execute("DELETE FROM run_order")
+            self.connection().execute("DELETE FROM run_inputs")
+            self.connection().execute("DELETE FROM run_ledger")
+            self.connection().execute("DELETE FROM ledger_batches")
+
+    def _record_legacy_runs(self) -> None:
+        """Add runs saved before the ledger existed, oldest first, as they are stored."""
+        conn = self.connection()
+        with self.transaction():
+            if conn.execute("SELECT 1 FROM run_ledger LIMIT 1").fetchone() is not None:
+                return
+            rows = conn.execute("SELECT run_id, data FROM runs ORDER BY timestamp, run_id")
+            for run_id, data in rows.fetchall():
+                run_ledger.append_entry(conn, run_id, data, self.ledger_batch_size)
+
+    def _order_legacy_runs(self) -> None:
+        """Index runs saved before ``run_order`` existed."""
+        conn = self.connection()
+        with self.transaction():
+            if conn.execute("SELECT 1 FROM run_order LIMIT 1").fetchone() is not None:
+                return
+            rows = conn.execute("SELECT run_id, claim_id, timestamp FROM runs").fetchall()
+            conn.executemany(
+                "INSERT INTO run_order (sort_key, run_id, claim_id) VALUES (?, ?, ?)",
+                [
+                    (sort_key(run_id, datetime.fromisoformat(timestamp)), run_id, claim_id)
+                    for run_id, claim_id, timestamp in rows
+                ],
+            )
+
+
+@lru_cache
+def get_state_store() -> SqliteStateStore:
+    """Get the shared state store for this process."""
+    settings = get_settings()
+    return SqliteStateStore(
+        settings.data_dir / settings.state_db_filename, settings.ledger_batch_size
+    )
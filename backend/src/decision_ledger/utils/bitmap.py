@@ -0,0 +1,86 @@
+"""Dense membership bitmaps over claim positions.
+
+A ``Bitmap`` is a set of integer positions backed by a Python ``int``, so
+intersection, union and difference are single big-integer operations.
+Bitmaps compress well with zlib for caching.
+"""
+
+import zlib
+from typing import Iterable, Iterator
+
+
+class Bitmap:
+    """An immutable set of positions in ``range(size)``."""
+
+    __slots__ = ("bits", "size")
+
+    def __init__(self, bits: int, size: int) -> None:
+        self.bits = bits
+        self.size = size
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[int], size: int) -> "Bitmap":
+        """Build a bitmap from positions (duplicates are allowed)."""
+        buf = bytearray((size + 7) // 8)
+        for pos in positions:
+            buf[pos >> 3] |= 1 << (pos & 7)
+        return cls(int.from_bytes(buf, "little"), size)
+
+    @classmethod
+    def empty(cls, size: int) -> "Bitmap":
+        """A bitmap with no positions set."""
+        return cls(0, size)
+
+    @classmethod
+    def full(cls, size: int) -> "Bitmap":
+        """A bitmap with every position in ``range(size)`` set."""
+        return cls((1 << size) - 1, size)
+
+    def _check(self, other: "Bitmap") -> None:
+        if other.size != self.size:
+            raise ValueError("Bitmaps cover different universes")
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        self._check(other)
+        return Bitmap(self.bits & other.bits, self.size)
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        self._check(other)
+        return Bitmap(self.bits | other.bits, self.size)
+
+    def __sub__(self, other: "Bitmap") -> "Bitmap":
+        self._check(other)
+        return Bitmap(self.bits & ~other.bits, self.size)
+
+    def __invert__(self) -> "Bitmap":
+        return Bitmap(((1 << self.size) - 1) & ~self.bits, self.size)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Bitmap) and (self.bits, self.size) == (other.bits, other.size)
+
+    def __hash__(self) -> int:
+        return hash((self.bits, self.size))
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __contains__(self, pos: int) -> bool:
+        return 0 <= pos < self.size and bool(self.bits >> pos & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        """Yield set positions in ascending order."""
+        data = self.bits.to_bytes((self.size + 7) // 8, "little")
+        for byte_index, byte in enumerate(data):
+            while byte:
+                low = byte & -byte
+                yield (byte_index << 3) + low.bit_length() - 1
+                byte ^= low
+
+    def compress(self) -> bytes:
+        """Serialize to zlib-compressed bytes."""
+        return zlib.compress(self.bits.to_bytes((self.size + 7) // 8, "little"))
+
+    @classmethod
+    def decompress(cls, data: bytes, size: int) -> "Bitmap":
+        """Inverse of ``compress``."""
+        return cls(int.from_bytes(zlib.decompress(data), "little"), size)
@@ -0,0 +1,23 @@
+"""Canonical serialization and content hashing."""
+
+import hashlib
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def canonical_json(value: Any) -> str:
+    """Serialize a value (or Pydantic model) to canonical JSON.
+
+    Keys are sorted and whitespace is removed so that equal values always
+    produce identical bytes.
+    """
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json")
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def content_hash(value: Any) -> str:
+    """Return the SHA-256 hex digest of a value's canonical JSON."""
+    return hashlib.sha256(canonical_json(value).encode("utf-8")).hexdigest()
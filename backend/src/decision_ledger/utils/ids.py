@@ -0,0 +1,101 @@
+"""Time-sortable identifiers.
+
+New run and proposal IDs are a prefix and a ULID: 26 Crockford base32
+characters encoding a 48-bit millisecond timestamp followed by 80 random
+bits (e.g. ``RUN-01JB8ZQ3M4N5P6R7S8T9V0W1XY``). IDs sort by creation time as
+plain strings, so an index on them only ever appends, and a time range is a
+key range. Within a process, IDs created in the same millisecond increment
+the random part of the previous one, so they are strictly increasing.
+
+IDs issued before (``RUN-`` plus 8 random hex characters) stay valid. They
+carry no time, so ``sort_key`` orders them by their creation time instead.
+"""
+
+import secrets
+import threading
+import time
+from datetime import datetime
+
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_TIME_CHARS = 10
+_RANDOM_CHARS = 16
+_RANDOM_BITS = 80
+
+_lock = threading.Lock()
+_last_ms = -1
+_last_random = 0
+
+
+def _encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, digit = divmod(value, 32)
+        chars.append(_ALPHABET[digit])
+    return "".join(reversed(chars))
+
+
+def _decode(text: str) -> int:
+    value = 0
+    for char in text:
+        value = value * 32 + _ALPHABET.index(char)
+    return value
+
+
+def _ms(at: datetime) -> int:
+    return int(at.timestamp() * 1000)
+
+
+def new_id(prefix: str, at: datetime | None = None) -> str:
+    """A new time-sortable ID.
+
+    Args:
+        prefix: ID prefix, e.g. ``RUN``
+        at: Creation time (default: now)
+    """
+    global _last_ms, _last_random
+    ms = _ms(at) if at is not None else time.time_ns() // 1_000_000
+    with _lock:
+        if ms == _last_ms and not (_last_random + 1) >> _RANDOM_BITS:
+            entropy = _last_random + 1
+        else:
+            entropy = secrets.randbits(_RANDOM_BITS)
+        if ms >= _last_ms:
+            _last_ms, _last_random = ms, entropy
+    return f"{prefix}-{_encode(ms, _TIME_CHARS)}{_encode(entropy, _RANDOM_CHARS)}"
+
+
+def _ulid(identifier: str) -> str | None:
+    """The ULID part of a time-sortable ID, or None for an earlier ID."""
+    _, _, suffix = identifier.rpartition("-")
+    if len(suffix) != _TIME_CHARS + _RANDOM_CHARS or suffix[0] not in "01234567":
+        return None
+    if any(char not in _ALPHABET for char in suffix):
+        return None
+    return suffix
+
+
+def id_time(identifier: str) -> datetime | None:
+    """Creation time encoded in an ID, or None for an ID issued before ULIDs."""
+    ulid = _ulid(identifier)
+    if ulid is None:
+        return None
+    return datetime.fromtimestamp(_decode(ulid[:_TIME_CHARS]) / 1000)
+
+
+def sort_key(identifier: str, created_at: datetime) -> str:
+    """Key ordering records by creation time, for new and earlier IDs alike.
+
+    A time-sortable ID's key is its ULID. An earlier ID gets the ULID time
+    of ``created_at`` followed by its random suffix, padded to ULID length,
+    so the keys of old and new records interleave in time order.
+    """
+    ulid = _ulid(identifier)
+    if ulid is not None:
+        return ulid
+    suffix = identifier.rpartition("-")[2].upper()[-_RANDOM_CHARS:]
+    return _encode(_ms(created_at), _TIME_CHARS) + suffix.rjust(_RANDOM_CHARS, "0")
+
+
+def time_bound(at: datetime) -> str:
+    """Smallest sort key of a record created at or after ``at``."""
+    return _encode(_ms(at), _TIME_CHARS)
@@ -0,0 +1,18 @@
+"""Interning of strings that repeat across claims, catalogs and runs.
+
+Jurisdictions, product lines, categories, catalog IDs, rule references and
+trace step labels recur in every claim and run. Each JSON parse or engine
+run creates new copies of them, so fields holding such values are declared
+as ``Interned``: the string is interned when the model is validated, and
+every loaded or deserialized instance refers to a single copy.
+
+Interned strings are freed when no longer referenced, so interning values
+that turn out to be unique only costs a hash lookup.
+"""
+
+import sys
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+Interned = Annotated[str, AfterValidator(sys.intern)]
@@ -0,0 +1,76 @@
+"""Hash chains and Merkle trees over SHA-256 digests.
+
+Leaf and interior hashes are domain-separated, so a leaf can never be
+passed off as an interior node. A level with an odd number of nodes
+promotes its last node unchanged instead of pairing it with a copy of
+itself, so two different leaf lists never share a root.
+"""
+
+import hashlib
+from typing import Literal, NamedTuple
+
+# Chain hash preceding the first entry
+GENESIS_HASH = "0" * 64
+
+_LEAF = b"\x00"
+_NODE = b"\x01"
+
+
+class ProofStep(NamedTuple):
+    """A sibling on the path from a leaf to the root."""
+
+    side: Literal["left", "right"]
+    hash: str
+
+
+def chain_hash(previous: str, entry_hash: str) -> str:
+    """Link an entry's hash to the chain hash before it."""
+    return hashlib.sha256(bytes.fromhex(previous) + bytes.fromhex(entry_hash)).hexdigest()
+
+
+def _leaf(entry_hash: str) -> bytes:
+    return hashlib.sha256(_LEAF + bytes.fromhex(entry_hash)).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE + left + right).digest()
+
+
+def _next_level(level: list[bytes]) -> list[bytes]:
+    paired = [_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        paired.append(level[-1])
+    return paired
+
+
+def merkle_root(entry_hashes: list[str]) -> str:
+    """Root over a list of hex entry hashes (the empty list has the genesis root)."""
+    if not entry_hashes:
+        return GENESIS_HASH
+    level = [_leaf(h) for h in entry_hashes]
+    while len(level) > 1:
+        level = _next_level(level)
+    return level[0].hex()
+
+
+def merkle_proof(entry_hashes: list[str], index: int) -> list[ProofStep]:
+    """Siblings needed to recompute the root from the entry at ``index``."""
+    level = [_leaf(h) for h in entry_hashes]
+    proof: list[ProofStep] = []
+    while len(level) > 1:
+        sibling = index ^ 1
+        if sibling < len(level):
+            side: Literal["left", "right"] = "left" if sibling < index else "right"
+            proof.append(ProofStep(side, level[sibling].hex()))
+        level = _next_level(level)
+        index //= 2
+    return proof
+
+
+def verify_proof(entry_hash: str, proof: list[ProofStep], root: str) -> bool:
+    """Check that an entry is included under ``root``; O(log n) hashes."""
+    current = _leaf(entry_hash)
+    for side, sibling in proof:
+        sibling_bytes = bytes.fromhex(sibling)
+        current = _node(sibling_bytes, current) if side == "left" else _node(current, sibling_bytes)
+    return current.hex() == root
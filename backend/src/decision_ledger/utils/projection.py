@@ -0,0 +1,61 @@
+"""Field projection for API responses.
+
+Projections are comma-separated dotted paths such as
+``run_id,outcome.status,outcome.payout_total``. A path that reaches a list
+is applied to every element, so ``trace_steps.label`` keeps only the label
+of each step.
+"""
+
+from typing import Any
+
+
+def parse_fields(fields: str | None) -> list[str] | None:
+    """Parse a ``fields=`` query value into a list of dotted paths.
+
+    Returns None when no projection was requested.
+    """
+    if fields is None:
+        return None
+    paths = [f.strip() for f in fields.split(",") if f.strip()]
+    return paths or None
+
+
+def validate_fields(paths: list[str], allowed: set[str]) -> None:
+    """Check that every path starts with an allowed top-level field.
+
+    Raises:
+        ValueError: If a path references an unknown top-level field
+    """
+    unknown = sorted({p.split(".", 1)[0] for p in paths} - allowed)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+
+def project(data: dict[str, Any], paths: list[str]) -> dict[str, Any]:
+    """Return a copy of ``data`` restricted to the given dotted paths."""
+    result: dict[str, Any] = {}
+    for path in paths:
+        _merge(result, _extract(data, path.split(".")))
+    return result
+
+
+def _extract(value: Any, parts: list[str]) -> Any:
+    """Extract a nested sub-structure along ``parts``."""
+    if not parts:
+        return value
+    if isinstance(value, list):
+        return [_extract(item, parts) for item in value]
+    if isinstance(value, dict) and parts[0] in value:
+        return {parts[0]: _extract(value[parts[0]], parts[1:])}
+    return {}
+
+
+def _merge(target: Any, source: Any) -> Any:
+    """Deep-merge ``source`` into ``target`` and return the merged value."""
+    if isinstance(target, dict) and isinstance(source, dict):
+        for key, value in source.items():
+            target[key] = _merge(target[key], value) if key in target else value
+        return target
+    if isinstance(target, list) and isinstance(source, list):
+        return [_merge(t, s) for t, s in zip(target, source)]
+    return source
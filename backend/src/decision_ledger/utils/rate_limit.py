@@ -0,0 +1,58 @@
+"""Token-bucket rate limiting for background work."""
+
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill at ``rate`` per second up to ``capacity``. ``acquire``
+    takes tokens immediately and, if that leaves the bucket in debt, sleeps
+    until the debt is repaid, so callers asking for large amounts at once
+    are throttled in proportion rather than starved.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second; 0 or less disables limiting
+            capacity: Maximum burst (defaults to one second's worth)
+            clock: Monotonic time source
+            sleep: Sleep function
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take ``tokens``, sleeping as long as needed to respect the rate.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            self._sleep(wait)
+        return wait
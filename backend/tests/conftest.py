@@ -2,9 +2,10 @@
 
 import pytest
 from pathlib import Path
-from datetime import date
+from datetime import date, datetime
 
 from decision_ledger.schemas.claim import Claim, Fact, Evidence, LineItem, FactStatus, ClaimStatus
+from decision_ledger.schemas.decision import DecisionOutcome, DecisionRun, DecisionStatus
 from decision_ledger.schemas.catalog import (
     InterpretationSet,
     DecisionPoint,
@@ -16,7 +17,32 @@ from decision_ledger.schemas.catalog import (
     RiskTier,
     Role,
 )
+from decision_ledger.api.jobs import get_job_runner
+from decision_ledger.config import get_settings
+from decision_ledger.core.catalog_registry import get_catalog_registry
 from decision_ledger.storage.filesystem import FileStorage
+from decision_ledger.storage.governance_log import get_governance_log
+from decision_ledger.storage.sqlite import get_state_store
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point DATA_DIR at a per-test directory so state never leaks between tests."""
+    data_dir = tmp_path / "data"
+    monkeypatch.setenv("DATA_DIR", str(data_dir))
+    get_settings.cache_clear()
+    get_state_store.cache_clear()
+    get_job_runner.cache_clear()
+    get_catalog_registry.cache_clear()
+    get_governance_log.cache_clear()
+    yield data_dir
+    if get_job_runner.cache_info().currsize:
+        get_job_runner().shutdown()
+    get_job_runner.cache_clear()
+    get_catalog_registry.cache_clear()
+    get_governance_log.cache_clear()
+    get_settings.cache_clear()
+    get_state_store.cache_clear()
 
 
 @pytest.fixture
@@ -33,6 +59,35 @@ def temp_storage(fixtures_path: Path) -> FileStorage:
     return FileStorage(fixtures_path)
 
 
+def make_run(
+    run_id: str,
+    claim_id: str = "CLM-1",
+    timestamp: datetime = datetime(2025, 6, 1, 12, 0),
+    payout_total: float = 100.0,
+) -> DecisionRun:
+    """Create an approved run without trace under the sample catalog versions."""
+    return DecisionRun(
+        run_id=run_id,
+        claim_id=claim_id,
+        timestamp=timestamp,
+        interpretation_set_id="INT-CH-MOTOR-2025.1",
+        interpretation_set_version="2025.1",
+        assumption_set_id="ASM-CH-MOTOR-2025.1",
+        assumption_set_version="2025.1",
+        resolved_assumptions=[],
+        selected_interpretations=[],
+        outcome=DecisionOutcome(
+            approved=True,
+            status=DecisionStatus.APPROVED,
+            payout_total=payout_total,
+            payout_breakdown=[],
+            deductible_applied=0.0,
+        ),
+        trace_steps=[],
+        generated_by_role="Adjuster",
+    )
+
+
 @pytest.fixture
 def sample_claim() -> Claim:
     """Create a sample CH Motor claim for testing."""
@@ -0,0 +1,178 @@
+"""Unit tests for re-adjudication backfills."""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from decision_ledger.api.services import backfill_service as backfill_module
+from decision_ledger.api.services.backfill_service import BACKFILL_JOB, BackfillService
+from decision_ledger.api.services.decision_service import DecisionService
+from decision_ledger.api.services.governance_service import GovernanceService
+from decision_ledger.schemas.catalog import AssumptionSet, InterpretationSet
+from decision_ledger.schemas.claim import Claim, ClaimStatus
+from decision_ledger.schemas.decision import DecisionRunRequest, SelectedInterpretation
+from decision_ledger.schemas.governance import (
+    ChangeProposalCreate,
+    ChangeProposalUpdate,
+    ProposalType,
+)
+from decision_ledger.schemas.job import Job, JobStatus
+from decision_ledger.storage.filesystem import FileStorage
+from decision_ledger.utils.rate_limit import TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_throttles_to_rate(self):
+        """Test that acquiring beyond the burst waits in proportion to the debt."""
+        now = [0.0]
+        slept: list[float] = []
+        bucket = TokenBucket(rate=10, clock=lambda: now[0], sleep=slept.append)
+
+        assert bucket.acquire(10) == 0.0
+        assert bucket.acquire(5) == pytest.approx(0.5)
+        now[0] += 1.5
+        assert bucket.acquire(10) == 0.0
+        assert slept == [pytest.approx(0.5)]
+
+    def test_zero_rate_is_unlimited(self):
+        """Test that a non-positive rate disables limiting."""
+        assert TokenBucket(rate=0).acquire(1_000_000) == 0.0
+
+
+class TestBackfillService:
+    """Tests for BackfillService."""
+
+    @pytest.fixture
+    def published(
+        self,
+        fixtures_path: Path,
+        sample_claim: Claim,
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ) -> str:
+        """Three open claims with one run each, and a published proposal affecting them."""
+        claims = [
+            sample_claim.model_copy(update={"claim_id": f"CLM-CH-00{i}"}) for i in range(1, 4)
+        ]
+        decided = {"claim_id": "CLM-CH-009", "status": ClaimStatus.DECIDED}
+        claims.append(sample_claim.model_copy(update=decided))
+        for filename, items in [
+            ("claims.json", claims),
+            ("interpretation_sets.json", [sample_interpretation_set]),
+            ("assumption_sets.json", [sample_assumption_set]),
+        ]:
+            (fixtures_path / filename).write_text(
+                json.dumps([i.model_dump(mode="json") for i in items])
+            )
+
+        decisions = DecisionService()
+        decisions.storage = FileStorage(fixtures_path)
+        for claim in claims:
+            decisions.run_decision(
+                DecisionRunRequest(
+                    claim_id=claim.claim_id,
+                    interpretation_set_id="INT-CH-MOTOR-2025.1",
+                    assumption_set_id="ASM-CH-MOTOR-2025.1",
+                    resolved_assumptions=[],
+                    selected_interpretations=[
+                        SelectedInterpretation(
+                            decision_point_id="DP.ACCESSORY_COVERAGE",
+                            option="EXCLUDED",
+                        )
+                    ],
+                    role="Adjuster",
+                )
+            )
+
+        governance = GovernanceService()
+        governance.storage = FileStorage(fixtures_path)
+        proposal = governance.create_proposal(
+            ChangeProposalCreate(
+                title="Cover accessories by default",
+                proposal_type=ProposalType.INTERPRETATION,
+                proposed_version="2025.2",
+                rationale="",
+                jurisdiction="CH",
+                product_line="Motor/Casco",
+                change_type="INTERPRETATION",
+                target_item_id="DP.ACCESSORY_COVERAGE",
+                to_value="INCLUDED_BY_DEFAULT",
+                created_by="Policy Team",
+            )
+        )
+        for action in ("submit", "approve", "publish"):
+            governance.update_proposal(
+                proposal.proposal_id,
+                ChangeProposalUpdate(action=action, actor_role="Policy Owner"),
+            )
+        return proposal.proposal_id
+
+    @pytest.fixture
+    def service(self, fixtures_path: Path) -> BackfillService:
+        """A backfill service committing every batch of one run."""
+        service = BackfillService()
+        service.storage = FileStorage(fixtures_path)
+        service.batch_size = 1
+        service.max_pending = 0
+        return service
+
+    def wait_for(self, service: BackfillService, job_id: str, status: JobStatus) -> Job:
+        """Poll until a job reaches ``status``."""
+        deadline = time.monotonic() + 5
+        while (job := service.jobs.get(job_id)).status != status:
+            assert time.monotonic() < deadline, job
+            time.sleep(0.01)
+        return job
+
+    def test_reissues_affected_open_claims(self, service: BackfillService, published: str):
+        """Test that open claims get superseding runs under the new catalog."""
+        job = service.start_backfill(published)
+        result = self.wait_for(service, job.job_id, JobStatus.SUCCEEDED).result
+
+        assert result["runs_selected"] == 4
+        assert result["runs_reissued"] == 3
+        assert result["runs_skipped"] == 1
+        assert result["runs_changed"] == 3
+        assert result["total_delta_payout"] == 3600.0
+        reissued = [run for run in service.state.list_runs() if run.supersedes_run_id]
+        assert {run.inputs.interpretation_set_id for run in reissued} == {"INT-CH-MOTOR-2025.2"}
+        assert {run.inputs.selected_interpretations[0].option for run in reissued} == {
+            "INCLUDED_BY_DEFAULT"
+        }
+
+    def test_resume_after_cancel_does_not_duplicate(
+        self, service: BackfillService, published: str, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a cancelled backfill resumes after its last committed batch."""
+        calls = []
+        original = backfill_module.readjudicate_batch
+
+        def cancel_on_second_batch(*args):
+            calls.append(args)
+            if len(calls) == 2:
+                # The job may run before start_backfill returns it
+                (running,) = service.jobs.list_jobs(BACKFILL_JOB)
+                service.jobs.cancel(running.job_id)
+            return original(*args)
+
+        monkeypatch.setattr(backfill_module, "readjudicate_batch", cancel_on_second_batch)
+        job = service.start_backfill(published)
+        cancelled = self.wait_for(service, job.job_id, JobStatus.CANCELLED)
+        assert cancelled.processed == 2
+
+        service.jobs.resume(job.job_id)
+        result = self.wait_for(service, job.job_id, JobStatus.SUCCEEDED).result
+
+        superseded = [run.supersedes_run_id for run in service.state.list_runs()]
+        superseded = [run_id for run_id in superseded if run_id]
+        assert len(superseded) == len(set(superseded)) == 3
+        assert result["runs_processed"] == 4
+        assert result["total_delta_payout"] == 3600.0
+
+    def test_requires_published_change(self, service: BackfillService):
+        """Test that unknown proposals are not backfilled."""
+        assert service.start_backfill("PROP-MISSING") is None
@@ -0,0 +1,165 @@
+"""Unit tests for structural catalog diffs."""
+
+import gc
+
+import pytest
+
+from decision_ledger.core import catalog_diff
+from decision_ledger.core.catalog_changes import (
+    apply_assumption_change,
+    apply_interpretation_change,
+)
+from decision_ledger.core.catalog_diff import CatalogTreeCache, diff_sets
+from decision_ledger.schemas.catalog import (
+    AssumptionSet,
+    DecisionOption,
+    DecisionPoint,
+    InterpretationSet,
+    SetStatus,
+)
+
+
+def next_version(interpretation_set: InterpretationSet, **updates) -> InterpretationSet:
+    return interpretation_set.model_copy(
+        update={"interpretation_set_id": "INT-CH-MOTOR-2025.2", "version": "2025.2", **updates}
+    )
+
+
+class TestCatalogDiff:
+    """Tests for diff_sets and CatalogTreeCache."""
+
+    def test_same_content_is_identical(self, sample_interpretation_set: InterpretationSet):
+        """Test that a new version with unchanged content has the same root hash."""
+        diff = diff_sets(
+            sample_interpretation_set, next_version(sample_interpretation_set), CatalogTreeCache()
+        )
+
+        assert diff.identical
+        assert diff.from_hash == diff.to_hash
+        assert diff.node_changes == []
+
+    def test_changed_default_option(self, sample_interpretation_set: InterpretationSet):
+        """Test that a changed default is reported as a field change of its decision point."""
+        changed = next_version(
+            apply_interpretation_change(
+                sample_interpretation_set, "DP.ACCESSORY_COVERAGE", "EXCLUDED"
+            )
+        )
+
+        diff = diff_sets(sample_interpretation_set, changed, CatalogTreeCache())
+
+        assert not diff.identical
+        assert diff.header_changes == []
+        assert diff.changed_node_ids == ["DP.ACCESSORY_COVERAGE"]
+        (change,) = diff.node_changes
+        assert change.change == "changed"
+        assert [(f.field, f.before, f.after) for f in change.fields] == [
+            ("default_option", "INCLUDED_IF_DECLARED", "EXCLUDED")
+        ]
+        assert change.added_items == change.removed_items == change.changed_items == []
+
+    def test_added_removed_nodes_and_items(self, sample_interpretation_set: InterpretationSet):
+        """Test added decision points, options and header fields."""
+        dp = sample_interpretation_set.decision_points[0]
+        new_dp = DecisionPoint(
+            decision_point_id="DP.TOWING",
+            label="Towing",
+            description="Towing coverage",
+            options=[DecisionOption(option_id="COVERED", label="Covered", description="")],
+            default_option="COVERED",
+            owner="Policy Team",
+            status=SetStatus.APPROVED,
+        )
+        extended = dp.model_copy(
+            update={
+                "options": [
+                    *dp.options[:2],
+                    DecisionOption(option_id="CAPPED", label="Capped", description=""),
+                ],
+            }
+        )
+        changed = next_version(
+            sample_interpretation_set,
+            decision_points=[extended, new_dp],
+            status=SetStatus.DRAFT,
+        )
+
+        diff = diff_sets(sample_interpretation_set, changed, CatalogTreeCache())
+
+        assert [(f.field, f.after) for f in diff.header_changes] == [("status", "Draft")]
+        assert [(c.node_id, c.change) for c in diff.node_changes] == [
+            ("DP.ACCESSORY_COVERAGE", "changed"),
+            ("DP.TOWING", "added"),
+        ]
+        accessory = diff.node_changes[0]
+        assert accessory.added_items == ["CAPPED"]
+        assert accessory.removed_items == ["EXCLUDED"]
+
+        reverse = diff_sets(changed, sample_interpretation_set, CatalogTreeCache())
+        assert [(c.node_id, c.change) for c in reverse.node_changes][1] == ("DP.TOWING", "removed")
+
+    def test_assumption_alternatives(self, sample_assumption_set: AssumptionSet):
+        """Test that assumption diffs report the changed recommendation."""
+        changed = apply_assumption_change(
+            sample_assumption_set, "ASM.ACCESSORY_DECLARED", "DECLARED"
+        ).model_copy(update={"version": "2025.2"})
+
+        diff = diff_sets(sample_assumption_set, changed, CatalogTreeCache())
+
+        assert diff.kind == "assumption"
+        (change,) = diff.node_changes
+        assert [f.field for f in change.fields] == ["recommended_resolution"]
+
+    def test_kind_mismatch_rejected(
+        self,
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Test that sets of different kinds cannot be compared."""
+        with pytest.raises(ValueError):
+            diff_sets(sample_interpretation_set, sample_assumption_set, CatalogTreeCache())
+
+    def test_shared_nodes_hashed_once(
+        self, sample_interpretation_set: InterpretationSet, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a copy-on-write version only hashes its changed node."""
+        trees = CatalogTreeCache()
+        trees.tree(sample_interpretation_set)
+        unchanged = sample_interpretation_set.decision_points[0].model_copy(
+            update={"decision_point_id": "DP.OTHER"}
+        )
+        base = next_version(
+            sample_interpretation_set,
+            decision_points=[*sample_interpretation_set.decision_points, unchanged],
+        )
+        trees.tree(base)
+        changed = apply_interpretation_change(base, "DP.ACCESSORY_COVERAGE", "EXCLUDED")
+
+        hashed: list[object] = []
+        original = catalog_diff.content_hash
+
+        def counting_hash(value: object) -> str:
+            hashed.append(value)
+            return original(value)
+
+        monkeypatch.setattr(catalog_diff, "content_hash", counting_hash)
+        trees.tree(changed)
+
+        node_hashes = [value for value in hashed if isinstance(value, DecisionPoint)]
+        assert [dp.decision_point_id for dp in node_hashes] == ["DP.ACCESSORY_COVERAGE"]
+        assert trees.tree(changed) is trees.tree(changed)
+
+    def test_freed_sets_leave_the_cache(self, sample_interpretation_set: InterpretationSet):
+        """Test that trees and node hashes are dropped once their objects are freed."""
+        trees = CatalogTreeCache()
+        trees.tree(sample_interpretation_set)
+        cached = len(trees)
+        for option in ("EXCLUDED", "INCLUDED_BY_DEFAULT", "EXCLUDED"):
+            version = apply_interpretation_change(
+                sample_interpretation_set, "DP.ACCESSORY_COVERAGE", option
+            )
+            trees.tree(version)
+            del version
+            gc.collect()
+
+        assert len(trees) == cached
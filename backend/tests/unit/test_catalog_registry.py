@@ -0,0 +1,290 @@
+"""Unit tests for versioned catalogs and publishing."""
+
+import json
+import threading
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from decision_ledger.api.services.governance_service import GovernanceService
+from decision_ledger.core.catalog_registry import CatalogRegistry, StalePublishError
+from decision_ledger.schemas.catalog import AssumptionSet, InterpretationSet
+from decision_ledger.schemas.governance import (
+    ChangeProposalCreate,
+    ChangeProposalUpdate,
+    ProposalStatus,
+    ProposalType,
+)
+from decision_ledger.storage.catalog_versions import CatalogVersionStore
+from decision_ledger.storage.filesystem import FileStorage
+from decision_ledger.storage.sqlite import get_state_store
+
+MOTOR = ("CH", "Motor/Casco")
+
+
+class TestCatalogRegistry:
+    """Tests for CatalogRegistry."""
+
+    @pytest.fixture
+    def storage(
+        self,
+        fixtures_path: Path,
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ) -> FileStorage:
+        """Storage with the sample catalog as fixtures."""
+        (fixtures_path / "interpretation_sets.json").write_text(
+            json.dumps([sample_interpretation_set.model_dump(mode="json")])
+        )
+        (fixtures_path / "assumption_sets.json").write_text(
+            json.dumps([sample_assumption_set.model_dump(mode="json")])
+        )
+        return FileStorage(fixtures_path)
+
+    @pytest.fixture
+    def registry(self) -> CatalogRegistry:
+        """A registry over the test's state store."""
+        return CatalogRegistry(CatalogVersionStore(get_state_store()))
+
+    def publish_default(self, registry: CatalogRegistry, storage: FileStorage) -> tuple[str, int]:
+        """Publish the accessory coverage change as version 2025.2."""
+        return registry.publish(
+            storage,
+            *MOTOR,
+            change_type="INTERPRETATION",
+            target_item_id="DP.ACCESSORY_COVERAGE",
+            to_value="INCLUDED_BY_DEFAULT",
+            version="2025.2",
+        )
+
+    def test_publish_swaps_active_version(self, registry: CatalogRegistry, storage: FileStorage):
+        """Test that publishing activates a new version and keeps the old one readable."""
+        before = registry.snapshot(storage)
+
+        set_id, generation = self.publish_default(registry, storage)
+        after = registry.snapshot(storage)
+
+        assert set_id == "INT-CH-MOTOR-2025.2"
+        assert generation == after.generation == before.generation + 1
+        active = after.active[MOTOR].interpretation_set
+        assert active.interpretation_set_id == set_id
+        assert active.decision_points[0].default_option == "INCLUDED_BY_DEFAULT"
+        # A snapshot taken before the publish is unaffected
+        assert before.active[MOTOR].interpretation_set.version == "2025.1"
+        assert after.interpretation_sets["INT-CH-MOTOR-2025.1"].version == "2025.1"
+        # Unchanged parts are shared, not copied
+        assert after.active[MOTOR].assumption_set is before.active[MOTOR].assumption_set
+        assert after.active[MOTOR].context != before.active[MOTOR].context
+
+    def test_other_process_sees_publish(self, registry: CatalogRegistry, storage: FileStorage):
+        """Test that a registry with its own cache picks up a publish from the database."""
+        other = CatalogRegistry(CatalogVersionStore(get_state_store()))
+        assert other.snapshot(storage).active[MOTOR].interpretation_set.version == "2025.1"
+
+        self.publish_default(registry, storage)
+
+        assert other.snapshot(storage).active[MOTOR].interpretation_set.version == "2025.2"
+
+    def test_unchanged_nodes_stored_once(self, registry: CatalogRegistry, storage: FileStorage):
+        """Test that versions sharing nodes do not duplicate them on disk."""
+        self.publish_default(registry, storage)
+        registry.publish(
+            storage,
+            *MOTOR,
+            change_type="INTERPRETATION",
+            target_item_id="DP.ACCESSORY_COVERAGE",
+            to_value="INCLUDED_BY_DEFAULT",
+            version="2025.3",
+        )
+
+        conn = get_state_store().connection()
+        assert conn.execute("SELECT COUNT(*) FROM catalog_sets").fetchone()[0] == 2
+        assert conn.execute("SELECT COUNT(*) FROM catalog_nodes").fetchone()[0] == 1
+
+    def test_prepare_does_not_wait_for_write_lock(
+        self, registry: CatalogRegistry, storage: FileStorage
+    ):
+        """Test that a version is derived and compiled while another writer holds the lock."""
+        locked, release = threading.Event(), threading.Event()
+
+        def hold_lock() -> None:
+            with get_state_store().transaction():
+                locked.set()
+                release.wait(5)
+
+        writer = threading.Thread(target=hold_lock)
+        writer.start()
+        assert locked.wait(5)
+        try:
+            prepared = registry.prepare_publish(
+                storage,
+                *MOTOR,
+                change_type="INTERPRETATION",
+                target_item_id="DP.ACCESSORY_COVERAGE",
+                to_value="INCLUDED_BY_DEFAULT",
+                version="2025.2",
+            )
+        finally:
+            release.set()
+            writer.join()
+
+        assert registry.commit_publish(prepared) == ("INT-CH-MOTOR-2025.2", 1)
+
+    def test_stale_publish_not_committed(self, registry: CatalogRegistry, storage: FileStorage):
+        """Test that a version prepared before another publish is rejected, not stored."""
+        stale = registry.prepare_publish(
+            storage,
+            *MOTOR,
+            change_type="INTERPRETATION",
+            target_item_id="DP.ACCESSORY_COVERAGE",
+            to_value="EXCLUDED",
+            version="2025.3",
+        )
+        self.publish_default(registry, storage)
+
+        with pytest.raises(StalePublishError):
+            registry.commit_publish(stale)
+        snapshot = registry.snapshot(storage)
+        assert snapshot.generation == 1
+        assert "INT-CH-MOTOR-2025.3" not in snapshot.interpretation_sets
+
+    def test_invalid_change_rejected(self, registry: CatalogRegistry, storage: FileStorage):
+        """Test that a change to a missing option publishes nothing."""
+        with pytest.raises(ValueError, match="not defined"):
+            registry.publish(
+                storage,
+                *MOTOR,
+                change_type="INTERPRETATION",
+                target_item_id="DP.ACCESSORY_COVERAGE",
+                to_value="MISSING",
+                version="2025.2",
+            )
+
+        assert registry.snapshot(storage).generation == 0
+
+    def test_effective_date_lookup(
+        self,
+        fixtures_path: Path,
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Test that each loss date resolves to the approved set in force on it."""
+        older = sample_interpretation_set.model_copy(
+            update={
+                "interpretation_set_id": "INT-CH-MOTOR-2024.1",
+                "version": "2024.1",
+                "effective_from": date(2024, 1, 1),
+            }
+        )
+        (fixtures_path / "interpretation_sets.json").write_text(
+            json.dumps([s.model_dump(mode="json") for s in (sample_interpretation_set, older)])
+        )
+        (fixtures_path / "assumption_sets.json").write_text(
+            json.dumps([sample_assumption_set.model_dump(mode="json")])
+        )
+        storage = FileStorage(fixtures_path)
+        registry = CatalogRegistry(CatalogVersionStore(get_state_store()))
+
+        def in_force(on: date) -> str | None:
+            compiled = registry.snapshot(storage).effective.lookup(*MOTOR, on)
+            return compiled.interpretation_set.interpretation_set_id if compiled else None
+
+        assert in_force(date(2023, 12, 31)) is None
+        assert in_force(date(2024, 1, 1)) == "INT-CH-MOTOR-2024.1"
+        assert in_force(date(2024, 12, 31)) == "INT-CH-MOTOR-2024.1"
+        assert in_force(date(2025, 11, 15)) == "INT-CH-MOTOR-2025.1"
+        assert registry.snapshot(storage).effective.lookup("DE", "Motor", date.today()) is None
+
+        # A published version supersedes the active one for the same period only
+        self.publish_default(registry, storage)
+        assert in_force(date(2024, 6, 1)) == "INT-CH-MOTOR-2024.1"
+        assert in_force(date(2025, 11, 15)) == "INT-CH-MOTOR-2025.2"
+        compiled = registry.snapshot(storage).effective.lookup(*MOTOR, date(2024, 6, 1))
+        assert compiled.assumption_set.assumption_set_id == "ASM-CH-MOTOR-2025.1"
+
+
+class TestGovernancePublish:
+    """Tests for publishing through GovernanceService."""
+
+    @pytest.fixture
+    def approved(
+        self, fixtures_path: Path, sample_interpretation_set: InterpretationSet
+    ) -> tuple[GovernanceService, str]:
+        """A governance service and an approved proposal with a catalog change."""
+        (fixtures_path / "interpretation_sets.json").write_text(
+            json.dumps([sample_interpretation_set.model_dump(mode="json")])
+        )
+        service = GovernanceService()
+        service.storage = FileStorage(fixtures_path)
+        proposal = service.create_proposal(
+            ChangeProposalCreate(
+                title="Cover accessories by default",
+                proposal_type=ProposalType.INTERPRETATION,
+                proposed_version="2025.2",
+                rationale="",
+                jurisdiction="CH",
+                product_line="Motor/Casco",
+                change_type="INTERPRETATION",
+                target_item_id="DP.ACCESSORY_COVERAGE",
+                to_value="INCLUDED_BY_DEFAULT",
+                created_by="Policy Team",
+            )
+        )
+        for action in ("submit", "approve"):
+            service.update_proposal(
+                proposal.proposal_id,
+                ChangeProposalUpdate(action=action, actor_role="Policy Owner"),
+            )
+        return service, proposal.proposal_id
+
+    def test_publish_updates_active_catalog(self, approved: tuple[GovernanceService, str]):
+        """Test that publishing a proposal activates its catalog change."""
+        service, proposal_id = approved
+
+        published = service.update_proposal(
+            proposal_id, ChangeProposalUpdate(action="publish", actor_role="Policy Owner")
+        )
+
+        assert published.status == ProposalStatus.PUBLISHED
+        assert published.published_set_id == "INT-CH-MOTOR-2025.2"
+        snapshot = service.catalogs.snapshot(service.storage)
+        assert snapshot.generation == published.catalog_generation
+        active = snapshot.active[MOTOR].interpretation_set
+        assert active.interpretation_set_id == "INT-CH-MOTOR-2025.2"
+
+    def test_publish_rederived_after_concurrent_publish(
+        self, approved: tuple[GovernanceService, str], monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a publish prepared before another one commits is derived again."""
+        service, proposal_id = approved
+        registry = service.catalogs
+        original = registry.prepare_publish
+        prepared = []
+
+        def prepare_then_publish_other(storage, *args, **kwargs):
+            result = original(storage, *args, **kwargs)
+            if not prepared:
+                other = original(
+                    storage,
+                    *MOTOR,
+                    change_type="INTERPRETATION",
+                    target_item_id="DP.ACCESSORY_COVERAGE",
+                    to_value="EXCLUDED",
+                    version="2025.1b",
+                )
+                registry.commit_publish(other)
+            prepared.append(result)
+            return result
+
+        monkeypatch.setattr(registry, "prepare_publish", prepare_then_publish_other)
+        published = service.update_proposal(
+            proposal_id, ChangeProposalUpdate(action="publish", actor_role="Policy Owner")
+        )
+
+        assert len(prepared) == 2
+        assert published.catalog_generation == 2
+        snapshot = registry.snapshot(service.storage)
+        active = snapshot.active[MOTOR].interpretation_set
+        assert active.interpretation_set_id == "INT-CH-MOTOR-2025.2"
+        assert active.decision_points[0].default_option == "INCLUDED_BY_DEFAULT"
@@ -0,0 +1,146 @@
+"""Unit tests for the cohort query language."""
+
+from datetime import date
+
+import pytest
+
+from decision_ledger.core.cohort import CohortCache, Node, compile_cohort, parse_query
+from decision_ledger.schemas.claim import Claim, FactStatus
+from decision_ledger.schemas.qa import QACohort
+from decision_ledger.storage.claim_index import ClaimIndex
+from decision_ledger.utils.bitmap import Bitmap
+
+
+@pytest.fixture
+def claims(sample_claim: Claim) -> list[Claim]:
+    """Create claims that differ in jurisdiction, loss date, facts and line items."""
+    declared = sample_claim.model_copy(
+        update={
+            "claim_id": "CLM-CH-002",
+            "loss_date": date(2025, 3, 1),
+            "facts": [
+                f.model_copy(update={"value": "Yes", "status": FactStatus.KNOWN})
+                if f.fact_id == "FACT.ACCESSORY_DECLARED"
+                else f
+                for f in sample_claim.facts
+            ],
+        }
+    )
+    repair_only = sample_claim.model_copy(
+        update={
+            "claim_id": "CLM-DE-001",
+            "jurisdiction": "DE",
+            "line_items": [li for li in sample_claim.line_items if li.category == "repair"],
+        }
+    )
+    return [sample_claim, declared, repair_only]
+
+
+def select(query: str, claims: list[Claim]) -> list[str]:
+    """Evaluate a query against an index and check it agrees with a scan."""
+    node = parse_query(query)
+    indexed = [claims[pos].claim_id for pos in node.evaluate(ClaimIndex(claims))]
+    scanned = [c.claim_id for c in claims if node.matches(c)]
+    assert indexed == scanned
+    return indexed
+
+
+class TestCohortQuery:
+    """Tests for parsing and evaluating cohort queries."""
+
+    def test_field_comparisons(self, claims: list[Claim]):
+        """Test equality, membership and range conditions."""
+        assert select("jurisdiction = CH", claims) == ["CLM-CH-001", "CLM-CH-002"]
+        assert select("jurisdiction in (DE, FR)", claims) == ["CLM-DE-001"]
+        assert select("loss_date < 2025-06-01", claims) == ["CLM-CH-002"]
+        assert select('product_line = "Motor/Casco" and status != Decided', claims) == [
+            "CLM-CH-001",
+            "CLM-CH-002",
+            "CLM-DE-001",
+        ]
+
+    def test_fact_conditions(self, claims: list[Claim]):
+        """Test conditions on fact status and value."""
+        assert select("fact(FACT.ACCESSORY_DECLARED).status = unknown", claims) == [
+            "CLM-CH-001",
+            "CLM-DE-001",
+        ]
+        assert select("fact(FACT.ACCESSORY_DECLARED).value = Yes", claims) == ["CLM-CH-002"]
+
+    def test_line_item_conditions(self, claims: list[Claim]):
+        """Test any-item conditions and single-item conjunctions."""
+        assert select("line_item.category = accessory", claims) == ["CLM-CH-001", "CLM-CH-002"]
+        assert select("line_item.amount >= 2000", claims) == [
+            "CLM-CH-001",
+            "CLM-CH-002",
+            "CLM-DE-001",
+        ]
+        assert select("line_item(category = accessory and amount >= 2000)", claims) == []
+        assert select(
+            "not (jurisdiction = DE or line_item(category = accessory and amount < 2000))",
+            claims,
+        ) == []
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "jurisdiction > CH",
+            "unknown_field = 1",
+            "loss_date >= yesterday",
+            "fact(FACT.X).colour = red",
+            "jurisdiction = CH and",
+            "jurisdiction = CH @",
+        ],
+    )
+    def test_invalid_queries_are_rejected(self, query: str):
+        """Test that malformed queries raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_query(query)
+
+    def test_incomplete_node_rejected(self):
+        """Test that a node type missing part of the interface cannot be created."""
+
+        class MatchOnly(Node):
+            def matches(self, claim: Claim) -> bool:
+                return True
+
+        with pytest.raises(TypeError, match="evaluate"):
+            MatchOnly()
+
+    def test_cohort_hash_ignores_spelling(self):
+        """Test that equivalent cohorts share a query hash."""
+        a = QACohort(
+            cohort_id="A", label="", description="", claim_count=0,
+            query="loss_date >= 2025-01-01  AND  jurisdiction = 'CH'",
+        )
+        b = QACohort(
+            cohort_id="B", label="", description="", claim_count=0,
+            query="loss_date >= 2025-01-01", jurisdiction="CH",
+        )
+
+        assert compile_cohort(a).hash == compile_cohort(b).hash
+
+
+class TestBitmap:
+    """Tests for membership bitmaps and their cache."""
+
+    def test_set_operations(self):
+        """Test intersection, union, difference and complement."""
+        a = Bitmap.from_positions([0, 3, 9], 12)
+        b = Bitmap.from_positions([3, 4], 12)
+
+        assert list(a & b) == [3]
+        assert list(a | b) == [0, 3, 4, 9]
+        assert list(a - b) == [0, 9]
+        assert len(~a) == 9
+
+    def test_cache_round_trip(self):
+        """Test that cached bitmaps are compressed and keyed by data version."""
+        cache = CohortCache(max_entries=1)
+        bitmap = Bitmap.from_positions(range(0, 10_000, 7), 10_000)
+        cache.put("q", "v1", bitmap)
+
+        assert cache.get("q", "v1") == bitmap
+        assert cache.get("q", "v2") is None
+        cache.put("q2", "v1", bitmap)
+        assert cache.get("q", "v1") is None
@@ -0,0 +1,236 @@
+"""Unit tests for the decision service."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from decision_ledger.api.services.decision_service import (
+    DecisionService,
+    IdempotencyConflictError,
+    needs_full_runs,
+)
+from decision_ledger.core.engine import DecisionEngine
+from decision_ledger.core.run_codec import RunRegenerationError
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.catalog import InterpretationSet, AssumptionSet
+from decision_ledger.schemas.decision import (
+    DecisionRunRequest,
+    ResolvedAssumption,
+    SelectedInterpretation,
+    TraceEncoding,
+)
+from decision_ledger.storage.filesystem import FileStorage
+from decision_ledger.storage.run_records import encode_record
+
+
+class TestDecisionService:
+    """Tests for DecisionService."""
+
+    @pytest.fixture
+    def service(
+        self,
+        fixtures_path: Path,
+        sample_claim: Claim,
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ) -> DecisionService:
+        """Create a service backed by temporary fixtures."""
+        for filename, items in [
+            ("claims.json", [sample_claim]),
+            ("interpretation_sets.json", [sample_interpretation_set]),
+            ("assumption_sets.json", [sample_assumption_set]),
+        ]:
+            (fixtures_path / filename).write_text(
+                json.dumps([i.model_dump(mode="json") for i in items])
+            )
+        service = DecisionService()
+        service.storage = FileStorage(fixtures_path)
+        return service
+
+    @pytest.fixture
+    def request_(self) -> DecisionRunRequest:
+        """Create a decision request for the sample claim."""
+        return DecisionRunRequest(
+            claim_id="CLM-CH-001",
+            interpretation_set_id="INT-CH-MOTOR-2025.1",
+            assumption_set_id="ASM-CH-MOTOR-2025.1",
+            resolved_assumptions=[],
+            selected_interpretations=[
+                SelectedInterpretation(
+                    decision_point_id="DP.ACCESSORY_COVERAGE",
+                    option="INCLUDED_IF_DECLARED",
+                )
+            ],
+            role="Adjuster",
+        )
+
+    def test_omitted_sets_resolved_by_loss_date(
+        self, service: DecisionService, request_: DecisionRunRequest
+    ):
+        """Test that a request without set IDs uses the sets in force at the loss date."""
+        run = service.run_decision(
+            request_.model_copy(update={"interpretation_set_id": None, "assumption_set_id": None})
+        )
+
+        assert run.interpretation_set_id == "INT-CH-MOTOR-2025.1"
+        assert run.assumption_set_id == "ASM-CH-MOTOR-2025.1"
+        assert run.interpretation_set_version == "2025.1"
+
+    def test_resolution_outside_role_rejected(
+        self, service: DecisionService, request_: DecisionRunRequest
+    ):
+        """Test that a role cannot choose an alternative it is not allowed to."""
+        request_.resolved_assumptions = [
+            ResolvedAssumption(
+                assumption_id="ASM.ACCESSORY_DECLARED",
+                fact_id="FACT.ACCESSORY_DECLARED",
+                fact_label="Accessory Declared",
+                chosen_resolution="DECLARED",
+                chosen_by_role="Adjuster",
+            )
+        ]
+        with pytest.raises(ValueError, match="may not choose"):
+            service.run_decision(request_)
+
+        request_.resolved_assumptions[0].chosen_by_role = "Supervisor"
+        assert service.run_decision(request_).resolved_assumptions[0].chosen_resolution == (
+            "DECLARED"
+        )
+
+    def test_duplicate_request_returns_existing_run(
+        self, service: DecisionService, request_: DecisionRunRequest
+    ):
+        """Test that an identical retry returns the original run."""
+        first = service.run_decision(request_)
+        second = service.run_decision(request_.model_copy(deep=True))
+
+        assert second.run_id == first.run_id
+        assert len(service.list_runs()) == 1
+
+    def test_explicit_key_deduplicates(
+        self, service: DecisionService, request_: DecisionRunRequest
+    ):
+        """Test deduplication by explicit idempotency key."""
+        first = service.run_decision(request_, idempotency_key="key-1")
+        second = service.run_decision(request_, idempotency_key="key-1")
+        third = service.run_decision(request_, idempotency_key="key-2")
+
+        assert second.run_id == first.run_id
+        assert third.run_id != first.run_id
+
+    def test_key_reuse_with_different_request_conflicts(
+        self, service: DecisionService, request_: DecisionRunRequest
+    ):
+        """Test that reusing a key for a different body is rejected."""
+        service.run_decision(request_, idempotency_key="key-1")
+        changed = request_.model_copy(update={"role": "Supervisor"})
+
+        with pytest.raises(IdempotencyConflictError):
+            service.run_decision(changed, idempotency_key="key-1")
+
+    def test_stored_run_regenerates_exactly(
+        self, service: DecisionService, request_: DecisionRunRequest
+    ):
+        """Test that a run is stored compactly and read back as issued."""
+        run = service.run_decision(request_)
+        stored = service.state.get_run(run.run_id)
+        record, _, _ = encode_record(stored)
+        assert len(run.model_dump_json()) > 8 * len(record)
+
+        service._runs.clear()
+        assert service.get_run(run.run_id) == run
+        assert service.list_runs(full=True) == [run]
+
+    def test_changed_engine_cannot_regenerate(
+        self,
+        service: DecisionService,
+        request_: DecisionRunRequest,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that a run the engine no longer reproduces is refused, not altered."""
+        run = service.run_decision(request_)
+        assert service.get_run(run.run_id) == run  # cached
+        service._runs.clear()
+        monkeypatch.setattr(DecisionEngine, "DEDUCTIBLE", 400.0)
+
+        with pytest.raises(RunRegenerationError, match="no longer reproduces"):
+            service.get_run(run.run_id)
+
+    def test_listing_regenerates_only_when_needed(
+        self,
+        service: DecisionService,
+        request_: DecisionRunRequest,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that runs are listed from their totals, and unreproducible ones marked."""
+        run = service.run_decision(request_)
+        service._runs.clear()
+        monkeypatch.setattr(DecisionEngine, "DEDUCTIBLE", 400.0)
+
+        (summary,) = service.list_runs()
+        assert summary.outcome.payout_total == run.outcome.payout_total
+        assert summary.unavailable is None
+        assert not service._runs
+
+        assert needs_full_runs(["run_id", "outcome.payout_total"], TraceEncoding.FULL) is False
+        assert needs_full_runs(["outcome.payout_breakdown.label"], TraceEncoding.FULL)
+        (unavailable,) = service.list_runs(full=True)
+        assert unavailable.run_id == run.run_id
+        assert "no longer reproduces" in unavailable.unavailable
+
+    def test_changed_claim_reported(
+        self,
+        service: DecisionService,
+        request_: DecisionRunRequest,
+        fixtures_path: Path,
+        sample_claim: Claim,
+    ):
+        """Test that a run whose claim was edited is refused as such, not as drift."""
+        run = service.run_decision(request_)
+        service._runs.clear()
+        sample_claim.line_items[0].amount_chf += 1000.0
+        (fixtures_path / "claims.json").write_text(
+            json.dumps([sample_claim.model_dump(mode="json")])
+        )
+        service.storage = FileStorage(fixtures_path)
+
+        with pytest.raises(RunRegenerationError, match="changed since the run"):
+            service.get_run(run.run_id)
+
+    def test_full_run_served_as_stored(
+        self,
+        service: DecisionService,
+        request_: DecisionRunRequest,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that a run stored in full is not regenerated."""
+        run = service.run_decision(request_)
+        service.state.connection().execute(
+            "UPDATE runs SET data = ? WHERE run_id = ?", (run.model_dump_json(), run.run_id)
+        )
+        service._runs.clear()
+        monkeypatch.setattr(DecisionEngine, "DEDUCTIBLE", 400.0)
+
+        assert service.get_run(run.run_id) == run
+
+    def test_compact_trace_projects_template_fields(
+        self, service: DecisionService, request_: DecisionRunRequest
+    ):
+        """Test that projected template fields of compact steps come from the templates."""
+        run = service.run_decision(request_)
+
+        rendered = service.render_runs(
+            [run], fields=["trace_steps.label", "trace_steps.output"], trace=TraceEncoding.COMPACT
+        )
+        (step, *_) = rendered["runs"][0]["trace_steps"]
+        assert set(step) == {"template_id", "output"}
+        assert rendered["trace_templates"][step["template_id"]] == {
+            "template_id": step["template_id"],
+            "label": run.trace_steps[0].label,
+        }
+
+        with pytest.raises(ValueError, match="trace_steps.nonexistent"):
+            service.render_runs(
+                [run], fields=["trace_steps.nonexistent"], trace=TraceEncoding.COMPACT
+            )
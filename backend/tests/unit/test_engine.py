@@ -240,3 +240,46 @@ class TestDecisionEngine:
         # Should find difference at step 5 (Evaluate Accessory Coverage)
         assert diff.changed_step_number == 5
         assert "Accessory" in diff.summary
+
+    def test_dependencies_follow_consulted_path(
+        self,
+        engine: DecisionEngine,
+        sample_claim: Claim,
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Test that only entries consulted for the outcome are recorded."""
+        resolved = [
+            ResolvedAssumption(
+                assumption_id="ASM.ACCESSORY_DECLARED",
+                fact_id="FACT.ACCESSORY_DECLARED",
+                fact_label="Accessory Declared",
+                chosen_resolution="NOT_DECLARED",
+                chosen_by_role="Adjuster",
+            )
+        ]
+
+        def dependencies(claim: Claim, option: str) -> list[str]:
+            _, _, deps = engine.run_with_dependencies(
+                claim=claim,
+                interpretation_set=sample_interpretation_set,
+                assumption_set=sample_assumption_set,
+                resolved_assumptions=resolved,
+                selected_interpretations=[
+                    SelectedInterpretation(decision_point_id="DP.ACCESSORY_COVERAGE", option=option)
+                ],
+            )
+            return deps.refs()
+
+        assert dependencies(sample_claim, "INCLUDED_IF_DECLARED") == [
+            "DP.ACCESSORY_COVERAGE",
+            "ASM.ACCESSORY_DECLARED",
+            "FACT.ACCESSORY_DECLARED",
+        ]
+        # The declaration is irrelevant when accessories are always excluded
+        assert dependencies(sample_claim, "EXCLUDED") == ["DP.ACCESSORY_COVERAGE"]
+        # Nothing catalog-governed matters without accessory line items
+        repair_only = sample_claim.model_copy(
+            update={"line_items": [li for li in sample_claim.line_items if li.category == "repair"]}
+        )
+        assert dependencies(repair_only, "INCLUDED_IF_DECLARED") == []
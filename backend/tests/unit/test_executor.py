@@ -0,0 +1,51 @@
+"""Unit tests for the bounded executor."""
+
+import asyncio
+import threading
+
+import pytest
+
+from decision_ledger.api.executor import BoundedExecutor, ExecutorSaturatedError
+
+
+class TestBoundedExecutor:
+    """Tests for BoundedExecutor."""
+
+    @pytest.fixture
+    def executor(self):
+        """Create a small executor and shut it down afterwards."""
+        executor = BoundedExecutor(max_workers=1, max_queue_depth=1, retry_after_seconds=3)
+        yield executor
+        executor.shutdown()
+
+    def test_run_returns_result(self, executor: BoundedExecutor):
+        """Test that awaited calls return the function result."""
+        assert asyncio.run(executor.run(lambda a, b: a + b, 2, b=3)) == 5
+
+    def test_rejects_when_queue_full(self, executor: BoundedExecutor):
+        """Test admission control once workers and queue are occupied."""
+        release = threading.Event()
+        running = executor.submit(release.wait)
+        queued = executor.submit(lambda: "queued")
+
+        with pytest.raises(ExecutorSaturatedError) as exc_info:
+            executor.submit(lambda: "rejected")
+        assert exc_info.value.retry_after == 3
+
+        release.set()
+        running.result()
+        assert queued.result() == "queued"
+        metrics = executor.metrics()
+        assert metrics.rejected == 1
+        assert metrics.completed == 2
+        assert metrics.in_flight == 0
+
+    def test_exceptions_propagate(self, executor: BoundedExecutor):
+        """Test that worker exceptions reach the caller and free the slot."""
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            executor.call(fail)
+        assert executor.metrics().in_flight == 0
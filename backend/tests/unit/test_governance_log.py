@@ -0,0 +1,196 @@
+"""Unit tests for the governance event log."""
+
+import pytest
+
+from decision_ledger.api.services.governance_service import GovernanceService
+from decision_ledger.schemas.governance import (
+    ChangeProposalCreate,
+    ChangeProposalUpdate,
+    ProposalStatus,
+    ProposalType,
+)
+from decision_ledger.storage.governance_log import GovernanceLog
+from decision_ledger.storage.sqlite import get_state_store
+
+
+def create(service: GovernanceService, title: str, created_by: str = "QA Lead") -> str:
+    """Create a proposal without a catalog change and return its ID."""
+    return service.create_proposal(
+        ChangeProposalCreate(
+            title=title,
+            proposal_type=ProposalType.INTERPRETATION,
+            proposed_version="2025.2",
+            rationale="Test",
+            created_by=created_by,
+        )
+    ).proposal_id
+
+
+def act(service: GovernanceService, proposal_id: str, action: str, actor_role: str) -> None:
+    service.update_proposal(
+        proposal_id, ChangeProposalUpdate(action=action, actor_role=actor_role)
+    )
+
+
+class TestGovernanceLog:
+    """Tests for GovernanceLog and the governance service on top of it."""
+
+    @pytest.fixture
+    def service(self) -> GovernanceService:
+        return GovernanceService()
+
+    def test_actions_are_logged_as_events(self, service: GovernanceService):
+        """Test that each action appends an event and updates the projection."""
+        proposal_id = create(service, "Cover accessories")
+        act(service, proposal_id, "submit", "Adjuster")
+        act(service, proposal_id, "approve", "Policy Owner")
+
+        proposal = service.get_proposal(proposal_id)
+        assert proposal.status == ProposalStatus.APPROVED
+        assert proposal.approved_by == "Policy Owner"
+        events = service.get_proposal_events(proposal_id)
+        assert [(e.action, e.actor) for e in events] == [
+            ("created", "QA Lead"),
+            ("submitted", "Adjuster"),
+            ("approved", "Policy Owner"),
+        ]
+        assert events[2].changes["status"] == ProposalStatus.APPROVED.value
+        assert service.get_proposal_events("PROP-MISSING") is None
+
+    def test_list_by_status_and_actor(self, service: GovernanceService):
+        """Test the status and actor indexes."""
+        first = create(service, "First", created_by="QA Lead")
+        second = create(service, "Second", created_by="Adjuster")
+        act(service, first, "submit", "QA Lead")
+        act(service, first, "reject", "Policy Owner")
+        act(service, second, "submit", "Adjuster")
+
+        def ids(**filters) -> set[str]:
+            return {p.proposal_id for p in service.list_proposals(**filters)}
+
+        assert ids() == {first, second}
+        assert ids(status=ProposalStatus.REJECTED) == {first}
+        assert ids(status=ProposalStatus.DRAFT) == set()
+        assert ids(actor="Policy Owner") == {first}
+        assert ids(actor="Adjuster", status=ProposalStatus.PENDING_APPROVAL) == {second}
+        assert ids(actor="Adjuster", status=ProposalStatus.REJECTED) == set()
+
+    def test_unknown_action_rejected(self, service: GovernanceService):
+        """Test that an unknown action is an error and is not logged."""
+        proposal_id = create(service, "First")
+        with pytest.raises(ValueError):
+            act(service, proposal_id, "archive", "QA Lead")
+        assert len(service.get_proposal_events(proposal_id)) == 1
+
+    @pytest.mark.parametrize(
+        ("done", "action"),
+        [
+            ((), "approve"),
+            ((), "reject"),
+            ((), "publish"),
+            (("submit",), "submit"),
+            (("submit",), "publish"),
+            (("submit", "approve"), "submit"),
+            (("submit", "approve"), "approve"),
+            (("submit", "approve"), "reject"),
+            (("submit", "approve", "publish"), "publish"),
+            (("submit", "approve", "publish"), "reject"),
+            (("submit", "reject"), "approve"),
+            (("submit", "reject"), "submit"),
+        ],
+    )
+    def test_illegal_transition_rejected(
+        self, service: GovernanceService, done: tuple[str, ...], action: str
+    ):
+        """Test that an action not allowed in the proposal's status is an error."""
+        proposal_id = create(service, "First")
+        for previous in done:
+            act(service, proposal_id, previous, "Policy Owner")
+        status = service.get_proposal(proposal_id).status
+
+        with pytest.raises(ValueError, match=f"Cannot {action}"):
+            act(service, proposal_id, action, "Policy Owner")
+        assert service.get_proposal(proposal_id).status == status
+        assert len(service.get_proposal_events(proposal_id)) == len(done) + 1
+
+    def test_status_read_from_log_in_transaction(self, service: GovernanceService):
+        """Test that the status check sees events the projection has not applied."""
+        proposal_id = create(service, "First")
+        with get_state_store().transaction():
+            act(service, proposal_id, "submit", "Adjuster")
+            with pytest.raises(ValueError, match="Cannot submit"):
+                act(service, proposal_id, "submit", "Adjuster")
+            act(service, proposal_id, "approve", "Policy Owner")
+
+        assert service.get_proposal(proposal_id).status == ProposalStatus.APPROVED
+
+    def test_startup_replays_tail_after_snapshot(self, service: GovernanceService):
+        """Test that a new log starts from the latest snapshot and replays the rest."""
+        state = get_state_store()
+        writer = GovernanceLog(state, snapshot_interval=3)
+        service.log = writer
+        first = create(service, "First")
+        act(service, first, "submit", "Adjuster")
+        second = create(service, "Second")  # Snapshot taken at event 3
+        act(service, second, "submit", "Adjuster")
+        act(service, second, "reject", "Policy Owner")
+
+        snapshot_seq = state.connection().execute(
+            "SELECT seq FROM governance_snapshots"
+        ).fetchone()[0]
+        assert snapshot_seq >= 3
+        act(service, first, "approve", "Policy Owner")
+
+        reader = GovernanceLog(state, snapshot_interval=3)
+        assert reader._snapshot_seq >= snapshot_seq
+        assert reader.get(first) == writer.get(first)
+        assert reader.get(first).status == ProposalStatus.APPROVED
+        assert [p.proposal_id for p in reader.list_proposals(actor="Policy Owner")] == [
+            second,
+            first,
+        ]
+
+    def test_other_logs_catch_up(self, service: GovernanceService):
+        """Test that events written through another process's log are read back."""
+        other = GovernanceLog(get_state_store())
+        proposal_id = create(service, "First")
+        assert other.get(proposal_id).status == ProposalStatus.DRAFT
+        act(service, proposal_id, "submit", "Adjuster")
+        assert other.get(proposal_id).status == ProposalStatus.PENDING_APPROVAL
+
+        other.clear()
+        assert service.get_proposal(proposal_id) is None
+        assert service.list_proposals() == []
+
+    def test_rolled_back_events_not_applied(self, service: GovernanceService):
+        """Test that an event appended in a failed transaction never shows up."""
+        proposal_id = create(service, "First")
+        assert service.get_proposal(proposal_id).status == ProposalStatus.DRAFT
+        state = get_state_store()
+        with pytest.raises(RuntimeError):
+            with state.transaction():
+                service.log.append(proposal_id, "rejected", "QA Lead", {"status": "Rejected"})
+                assert service.get_proposal(proposal_id).status == ProposalStatus.DRAFT
+                raise RuntimeError("boom")
+        assert service.get_proposal(proposal_id).status == ProposalStatus.DRAFT
+        assert len(service.get_proposal_events(proposal_id)) == 1
+
+    def test_imports_legacy_proposals_table(self, service: GovernanceService):
+        """Test that proposals stored before the log existed become creation events."""
+        proposal = service.get_proposal(create(service, "Legacy"))
+        state = get_state_store()
+        conn = state.connection()
+        conn.execute("DELETE FROM governance_events")
+        conn.execute(
+            "CREATE TABLE proposals (proposal_id TEXT PRIMARY KEY, created_at TEXT, data TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO proposals VALUES (?, ?, ?)",
+            (proposal.proposal_id, proposal.created_at.isoformat(), proposal.model_dump_json()),
+        )
+
+        log = GovernanceLog(state)
+        assert log.get(proposal.proposal_id) == proposal
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'proposals'"
+        ).fetchone() is None
@@ -0,0 +1,83 @@
+"""Unit tests for time-sortable IDs and the run order index."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from decision_ledger.storage.sqlite import SqliteStateStore
+from decision_ledger.utils.ids import id_time, new_id, sort_key
+from tests.conftest import make_run
+
+
+class TestIds:
+    """Tests for utils.ids."""
+
+    def test_ids_increase(self):
+        """Test that IDs sort in creation order, also within one millisecond."""
+        ids = [new_id("RUN") for _ in range(1000)]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+        assert all(len(i) == len("RUN-") + 26 for i in ids)
+
+    def test_id_time(self):
+        """Test that the creation time is recovered to the millisecond."""
+        at = datetime(2021, 2, 3, 4, 5, 6, 789000)
+        assert id_time(new_id("PROP", at)) == at
+        assert id_time("RUN-1A2B3C4D") is None
+
+    def test_earlier_ids_sort_by_time(self):
+        """Test that earlier random IDs interleave with new IDs by creation time."""
+        start = datetime(2025, 6, 1, 12, 0)
+        keys = [
+            sort_key("RUN-FFFFFFFF", start),
+            sort_key(new_id("RUN", start + timedelta(seconds=1)), start),
+            sort_key("RUN-00000000", start + timedelta(seconds=2)),
+        ]
+        assert keys == sorted(keys)
+
+
+class TestRunOrder:
+    """Tests for listing runs through the run order index."""
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> SqliteStateStore:
+        """A store with runs every minute, alternating earlier and new IDs."""
+        store = SqliteStateStore(tmp_path / "state.db")
+        start = datetime(2025, 6, 1, 12, 0)
+        for minute in range(10):
+            at = start + timedelta(minutes=minute)
+            run_id = new_id("RUN", at) if minute % 2 else f"RUN-{minute:08X}"
+            store.save_run(make_run(run_id, claim_id=f"CLM-{minute % 2}", timestamp=at))
+        return store
+
+    def test_newest_first(self, store: SqliteStateStore):
+        """Test that runs are listed by creation time whatever their ID format."""
+        minutes = [run.timestamp.minute for run in store.list_runs()]
+        assert minutes == list(range(9, -1, -1))
+        assert [run.timestamp.minute for run in store.list_runs(claim_id="CLM-1")] == [
+            9, 7, 5, 3, 1
+        ]
+
+    def test_time_range_and_cursor(self, store: SqliteStateStore):
+        """Test paging through a time range with a cursor."""
+        since, until = datetime(2025, 6, 1, 12, 2), datetime(2025, 6, 1, 12, 8)
+        pages, cursor = [], None
+        while True:
+            page = store.list_runs(since=since, until=until, before_run_id=cursor, limit=4)
+            if not page:
+                break
+            pages.append([run.timestamp.minute for run in page])
+            cursor = page[-1].run_id
+        assert pages == [[7, 6, 5, 4], [3, 2]]
+
+    def test_earlier_runs_indexed_on_open(self, store: SqliteStateStore):
+        """Test that runs stored before the index existed are indexed when opened."""
+        store.connection().execute("DELETE FROM run_order")
+        reopened = SqliteStateStore(store.db_path)
+        assert [run.timestamp.minute for run in reopened.list_runs(limit=3)] == [9, 8, 7]
+
+    def test_unknown_cursor(self, store: SqliteStateStore):
+        """Test that a cursor naming no stored run is rejected."""
+        with pytest.raises(ValueError, match="Unknown cursor"):
+            store.list_runs(before_run_id="RUN-NOPE", limit=3)
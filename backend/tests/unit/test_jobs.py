@@ -0,0 +1,176 @@
+"""Unit tests for the background job runner."""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from decision_ledger.api.jobs import JobContext, JobRunner
+from decision_ledger.schemas.job import Job, JobStatus
+from decision_ledger.storage.jobs import JobLeaseLostError, JobStore
+from decision_ledger.storage.sqlite import get_state_store
+from decision_ledger.utils.ids import id_time
+
+
+def wait_for(runner: JobRunner, job_id: str, status: JobStatus, timeout: float = 5.0) -> Job:
+    """Poll until a job reaches ``status``."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = runner.get(job_id)
+        if job.status == status:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} is {runner.get(job_id).status}, expected {status}")
+
+
+def count_to(job: Job, context: JobContext) -> dict:
+    """Handler summing 0..n-1, checkpointing after every number."""
+    n = job.params["n"]
+    checkpoint = context.checkpoint or {"i": 0, "total": 0}
+    resumed_from = i = checkpoint["i"]
+    total = checkpoint["total"]
+    while i < n:
+        total += i
+        i += 1
+        context.save_checkpoint({"i": i, "total": total}, i, n)
+    return {"total": total, "resumed_from": resumed_from}
+
+
+class TestJobRunner:
+    """Tests for JobRunner."""
+
+    @pytest.fixture
+    def runner(self):
+        """A runner with a short lease over the test's state store."""
+        runner = JobRunner(JobStore(get_state_store()), lease_seconds=0.2, report_interval=0)
+        yield runner
+        runner.shutdown()
+
+    def test_submit_runs_to_completion(self, runner: JobRunner):
+        """Test that a submitted job runs and records its result and progress."""
+        runner.register("count", count_to)
+
+        job = runner.submit("count", {"n": 5})
+        done = wait_for(runner, job.job_id, JobStatus.SUCCEEDED)
+
+        assert done.result == {"total": 10, "resumed_from": 0}
+        assert (done.processed, done.total) == (5, 5)
+        assert done.finished_at is not None
+
+    def test_submit_in_transaction_starts_after_commit(
+        self, runner: JobRunner, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a job submitted in a transaction starts only if it commits."""
+        dispatched: list[str] = []
+        monkeypatch.setattr(runner, "_dispatch", dispatched.append)
+        runner.register("count", count_to)
+        state = runner.store.state
+
+        with pytest.raises(RuntimeError):
+            with state.transaction():
+                rolled_back = runner.submit("count", {"n": 1})
+                raise RuntimeError("abort")
+        with state.transaction():
+            job = runner.submit("count", {"n": 1})
+            assert dispatched == []
+
+        assert dispatched == [job.job_id]
+        assert runner.get(rolled_back.job_id) is None
+
+    def test_job_ids_sort_by_submission(
+        self, runner: JobRunner, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that job IDs are time-sortable IDs in submission order."""
+        monkeypatch.setattr(runner, "_dispatch", lambda job_id: None)
+        runner.register("count", count_to)
+
+        job_ids = [runner.submit("count", {"n": 1}).job_id for _ in range(20)]
+
+        assert job_ids == sorted(job_ids)
+        assert all(id_time(job_id) is not None for job_id in job_ids)
+
+    def test_unknown_kind_rejected(self, runner: JobRunner):
+        """Test that submitting an unregistered kind raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown job kind"):
+            runner.submit("missing", {})
+
+    def test_failure_is_recorded(self, runner: JobRunner):
+        """Test that a handler exception marks the job failed."""
+        def fail(job: Job, context: JobContext) -> dict:
+            raise ValueError("boom")
+
+        runner.register("fail", fail)
+        job = runner.submit("fail", {})
+
+        assert wait_for(runner, job.job_id, JobStatus.FAILED).error == "boom"
+
+    def test_cancel_stops_running_job(self, runner: JobRunner):
+        """Test that cancellation takes effect at the handler's next report."""
+        started = threading.Event()
+
+        def spin(job: Job, context: JobContext) -> dict:
+            started.set()
+            while True:
+                context.report(0, force=True)
+                time.sleep(0.01)
+
+        runner.register("spin", spin)
+        job = runner.submit("spin", {})
+        assert started.wait(5)
+
+        runner.cancel(job.job_id)
+
+        assert wait_for(runner, job.job_id, JobStatus.CANCELLED).cancel_requested
+
+    def test_abandoned_job_resumes_from_checkpoint(self, runner: JobRunner):
+        """Test that a job left running by a dead runner is resumed after its lease."""
+        store = runner.store
+        now = datetime.now()
+        job = Job(
+            job_id="JOB-ABANDONED",
+            kind="count",
+            status=JobStatus.QUEUED,
+            params={"n": 5},
+            created_at=now,
+            updated_at=now,
+        )
+        store.create(job)
+        dead = store.claim(job.job_id, "dead-runner", lease_seconds=0.2)
+        store.heartbeat(dead, "dead-runner", checkpoint={"i": 3, "total": 3})
+        runner.register("count", count_to)
+
+        assert runner.resume_pending() == []
+        time.sleep(0.3)
+        assert runner.resume_pending() == ["JOB-ABANDONED"]
+
+        done = wait_for(runner, "JOB-ABANDONED", JobStatus.SUCCEEDED)
+        assert done.result == {"total": 10, "resumed_from": 3}
+        assert done.processed == 5
+
+    def test_runner_that_lost_its_lease_stops(self, runner: JobRunner):
+        """Test that a runner whose job was taken over stops writing to it."""
+        store = runner.store
+        started, taken_over = threading.Event(), threading.Event()
+
+        def stall(job: Job, context: JobContext) -> dict:
+            context.save_checkpoint({"step": 1}, 1, 2)
+            started.set()
+            assert taken_over.wait(5)
+            context.save_checkpoint({"step": 2}, 2, 2)
+            return {}
+
+        runner.register("stall", stall)
+        job = runner.submit("stall", {})
+        assert started.wait(5)
+        time.sleep(0.3)
+        other = store.claim(job.job_id, "other-runner", lease_seconds=0.2)
+        assert other is not None
+        with pytest.raises(JobLeaseLostError):
+            store.heartbeat(other, runner.owner)
+        taken_over.set()
+
+        time.sleep(0.1)
+        assert runner.get(job.job_id).status == JobStatus.RUNNING
+        assert store.load_checkpoint(job.job_id) == {"step": 1}
+        store.heartbeat(other, "other-runner", checkpoint={"step": 2})
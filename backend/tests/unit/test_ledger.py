@@ -0,0 +1,145 @@
+"""Unit tests for the hash-chained run ledger."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from decision_ledger.cli import main
+from decision_ledger.schemas.decision import DecisionRun
+from decision_ledger.storage.run_ledger import verify_ledger
+from decision_ledger.storage.run_records import compact_run
+from decision_ledger.storage.sqlite import SqliteStateStore
+from decision_ledger.utils.merkle import merkle_proof, merkle_root, verify_proof
+from tests.conftest import make_run
+
+
+def numbered_run(index: int) -> DecisionRun:
+    """Run number ``index``, one minute after the previous one."""
+    return make_run(
+        f"RUN-{index:08d}",
+        claim_id=f"CLM-{index % 3}",
+        timestamp=datetime(2025, 1, 1) + timedelta(minutes=index),
+        payout_total=100.0 + index,
+    )
+
+
+class TestMerkle:
+    """Tests for Merkle roots and proofs."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 13])
+    def test_every_leaf_proves(self, size: int):
+        """Test that each leaf's proof verifies against the root, and only there."""
+        hashes = [f"{i:064x}" for i in range(size)]
+        root = merkle_root(hashes)
+        for index, leaf in enumerate(hashes):
+            proof = merkle_proof(hashes, index)
+            assert verify_proof(leaf, proof, root)
+            assert len(proof) <= size.bit_length()
+            assert not verify_proof(f"{size:064x}", proof, root)
+
+    def test_distinct_lists_distinct_roots(self):
+        """Test that an odd last leaf is not paired with a copy of itself."""
+        hashes = [f"{i:064x}" for i in range(3)]
+        assert merkle_root(hashes) != merkle_root([*hashes, hashes[-1]])
+
+
+class TestRunLedger:
+    """Tests for the ledger kept by SqliteStateStore and verify_ledger."""
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> SqliteStateStore:
+        store = SqliteStateStore(tmp_path / "state.db", ledger_batch_size=4)
+        for index in range(10):
+            store.save_run(numbered_run(index))
+        return store
+
+    def test_batches_sealed(self, store: SqliteStateStore):
+        """Test that every full batch is sealed and the rest stays open."""
+        batches = store.connection().execute(
+            "SELECT first_seq, last_seq FROM ledger_batches ORDER BY last_seq"
+        ).fetchall()
+        assert batches == [(1, 4), (5, 8)]
+
+    def test_run_proof(self, store: SqliteStateStore):
+        """Test receipts in a sealed and in the open batch."""
+        sealed = store.run_proof("RUN-00000005")
+        assert sealed.sealed and (sealed.batch_first_seq, sealed.batch_last_seq) == (5, 8)
+        path = [(step.side, step.hash) for step in sealed.path]
+        assert verify_proof(sealed.run_hash, path, sealed.merkle_root)
+
+        open_ = store.run_proof("RUN-00000009")
+        assert not open_.sealed and open_.batch_last_seq == 10
+        path = [(step.side, step.hash) for step in open_.path]
+        assert verify_proof(open_.run_hash, path, open_.merkle_root)
+        assert store.run_proof("RUN-MISSING") is None
+
+    def test_runs_are_immutable(self, store: SqliteStateStore):
+        """Test that saving a run ID twice is rejected and leaves the ledger intact."""
+        with pytest.raises(ValueError):
+            store.save_run(numbered_run(3))
+        assert verify_ledger(store.db_path).ok
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_verify_clean_ledger(self, store: SqliteStateStore, workers: int):
+        """Test that an untouched ledger verifies, in one or several processes."""
+        result = verify_ledger(store.db_path, workers=workers, batches_per_unit=1)
+        assert result.ok, result.failures
+        assert (result.runs_checked, result.batches_checked, result.head_seq) == (10, 2, 10)
+
+    def test_altered_run_detected(self, store: SqliteStateStore):
+        """Test that editing a stored run is reported."""
+        conn = store.connection()
+        conn.execute(
+            "UPDATE runs SET data = replace(data, '\"payout_total\":106.0', "
+            "'\"payout_total\":9999.0') WHERE run_id = 'RUN-00000006'"
+        )
+        result = verify_ledger(store.db_path, workers=2, batches_per_unit=1)
+        assert not result.ok
+        assert result.failures == ["Run RUN-00000006 (entry 7) does not match its ledger hash"]
+
+    def test_rewritten_ledger_detected(self, store: SqliteStateStore):
+        """Test that re-hashing an altered run in the ledger breaks the chain and the root."""
+        conn = store.connection()
+        conn.execute("UPDATE run_ledger SET run_hash = ? WHERE seq = 2", ("0" * 64,))
+        conn.execute("DELETE FROM runs WHERE run_id = 'RUN-00000008'")
+        failures = verify_ledger(store.db_path, batches_per_unit=1).failures
+        assert "Chain is broken at entry 2 (run RUN-00000001)" in failures
+        assert "Merkle root of batch 1-4 does not match" in failures
+        assert "Run RUN-00000008 (entry 9) is missing" in failures
+
+    def test_altered_inputs_detected(self, store: SqliteStateStore):
+        """Test that the content-addressed inputs of a run are checked too."""
+        inputs_hash = store.connection().execute("SELECT inputs_hash FROM run_inputs").fetchone()[0]
+        store.connection().execute(
+            "UPDATE run_inputs SET data = json_set(data, '$.assumption_set_version', '2024.9')"
+        )
+        # Reported once per checked range: the sealed batches and the open tail
+        assert verify_ledger(store.db_path).failures == [
+            f"Inputs {inputs_hash} of run {run_id} do not match their hash"
+            for run_id in ("RUN-00000000", "RUN-00000008")
+        ]
+
+    def test_legacy_runs_recorded(self, tmp_path: Path):
+        """Test that runs stored before the ledger existed are recorded on open."""
+        store = SqliteStateStore(tmp_path / "legacy.db")
+        conn = store.connection()
+        run = numbered_run(1)
+        conn.execute(
+            "INSERT INTO runs (run_id, claim_id, timestamp, data) VALUES (?, ?, ?, ?)",
+            (run.run_id, run.claim_id, run.timestamp.isoformat(), run.model_dump_json()),
+        )
+
+        reopened = SqliteStateStore(tmp_path / "legacy.db")
+        stored = reopened.get_run(run.run_id)
+        assert stored == compact_run(run).model_copy(update={"full_run": run})
+        assert verify_ledger(reopened.db_path).ok
+
+    def test_verify_command(self, store: SqliteStateStore, capsys: pytest.CaptureFixture):
+        """Test the CLI exit codes."""
+        assert main(["verify", "--db", str(store.db_path), "--workers", "1"]) == 0
+        assert "OK" in capsys.readouterr().out
+
+        store.connection().execute("DELETE FROM run_ledger WHERE seq = 3")
+        assert main(["verify", "--db", str(store.db_path), "--workers", "1"]) == 1
+        assert "FAILED" in capsys.readouterr().out
@@ -0,0 +1,241 @@
+"""Unit tests for the QA impact engine."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from decision_ledger.core.qa_engine import BaselineCache, QAImpactEngine
+from decision_ledger.storage.dependency_index import ClaimDependencyIndex
+from decision_ledger.storage.sqlite import SqliteStateStore
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.catalog import InterpretationSet, AssumptionSet
+from decision_ledger.schemas.qa import QACohort, QAProposedChange
+
+
+@pytest.fixture
+def cohort() -> QACohort:
+    """Create a cohort covering all CH Motor claims."""
+    return QACohort(
+        cohort_id="COH-TEST",
+        label="Test Cohort",
+        description="All test claims",
+        claim_count=0,
+    )
+
+
+@pytest.fixture
+def claims(sample_claim: Claim) -> list[Claim]:
+    """Create claims with and without accessory line items."""
+    repair_only = sample_claim.model_copy(
+        update={
+            "claim_id": "CLM-CH-002",
+            "line_items": [li for li in sample_claim.line_items if li.category == "repair"],
+        }
+    )
+    return [sample_claim, repair_only]
+
+
+class TestQAImpactEngine:
+    """Tests for QAImpactEngine."""
+
+    def test_interpretation_change_impacts_accessory_claims(
+        self,
+        cohort: QACohort,
+        claims: list[Claim],
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Test that including accessories by default only changes accessory claims."""
+        change = QAProposedChange(
+            proposal_id="PROP-TEST",
+            label="Include accessories by default",
+            description="",
+            change_type="INTERPRETATION",
+            target_item_id="DP.ACCESSORY_COVERAGE",
+            to_value="INCLUDED_BY_DEFAULT",
+        )
+
+        result = QAImpactEngine().run_study(
+            cohort, change, claims, lambda c: (sample_interpretation_set, sample_assumption_set)
+        )
+
+        assert result.impacted_claims_count == 1
+        assert result.total_delta_payout == 1200.0
+        assert [c.claim_id for c in result.top_impacted_claims] == ["CLM-CH-001"]
+
+    def test_assumption_change_with_executor(
+        self,
+        cohort: QACohort,
+        claims: list[Claim],
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Test batched evaluation on an executor with a recommended-resolution change."""
+        change = QAProposedChange(
+            proposal_id="PROP-TEST",
+            label="Assume declared",
+            description="",
+            change_type="ASSUMPTION",
+            target_item_id="ASM.ACCESSORY_DECLARED",
+            to_value="DECLARED",
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            engine = QAImpactEngine(executor=pool, batch_size=1)
+            result = engine.run_study(
+                cohort,
+                change,
+                claims * 3,
+                lambda c: (sample_interpretation_set, sample_assumption_set),
+            )
+
+        assert result.impacted_claims_count == 3
+        assert result.total_delta_payout == 3600.0
+
+    def test_unknown_target_is_rejected(
+        self,
+        cohort: QACohort,
+        claims: list[Claim],
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Test that an invalid option for an existing decision point raises."""
+        change = QAProposedChange(
+            proposal_id="PROP-TEST",
+            label="Bogus",
+            description="",
+            change_type="INTERPRETATION",
+            target_item_id="DP.ACCESSORY_COVERAGE",
+            to_value="NOT_AN_OPTION",
+        )
+
+        with pytest.raises(ValueError):
+            QAImpactEngine().run_study(
+                cohort, change, claims, lambda c: (sample_interpretation_set, sample_assumption_set)
+            )
+
+    def test_from_value_checked(
+        self,
+        cohort: QACohort,
+        claims: list[Claim],
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Test that a change is only applied to a target with its expected current value."""
+        change = QAProposedChange(
+            proposal_id="PROP-TEST",
+            label="Include accessories by default",
+            description="",
+            change_type="INTERPRETATION",
+            target_item_id="DP.ACCESSORY_COVERAGE",
+            from_value="INCLUDED_IF_DECLARED",
+            to_value="INCLUDED_BY_DEFAULT",
+        )
+
+        def catalog_for(claim: Claim) -> tuple[InterpretationSet, AssumptionSet]:
+            return sample_interpretation_set, sample_assumption_set
+
+        assert QAImpactEngine().run_study(cohort, change, claims, catalog_for).total_delta_payout
+        stale = change.model_copy(update={"from_value": "EXCLUDED"})
+        with pytest.raises(ValueError, match="expects DP.ACCESSORY_COVERAGE to be EXCLUDED"):
+            QAImpactEngine().run_study(cohort, stale, claims, catalog_for)
+
+    def test_dependency_index_limits_reevaluation(
+        self,
+        tmp_path,
+        cohort: QACohort,
+        claims: list[Claim],
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Test that indexed claims unaffected by a change are skipped."""
+        index = ClaimDependencyIndex(SqliteStateStore(tmp_path / "state.db"))
+        engine = QAImpactEngine()
+        catalog_for = lambda c: (sample_interpretation_set, sample_assumption_set)  # noqa: E731
+        change = QAProposedChange(
+            proposal_id="PROP-TEST",
+            label="Include accessories by default",
+            description="",
+            change_type="INTERPRETATION",
+            target_item_id="DP.ACCESSORY_COVERAGE",
+            to_value="INCLUDED_BY_DEFAULT",
+        )
+
+        first = engine.evaluate(claims, change, catalog_for, index)
+        second = engine.evaluate(claims, change, catalog_for, index)
+        result = engine.run_study(cohort, change, claims, catalog_for, index)
+
+        assert first.claim_count == 2
+        assert first.evaluated == 2
+        assert second.claim_count == 2
+        assert second.evaluated == 1
+        assert [c for c, _ in second.top.items()] == ["CLM-CH-001"]
+        assert result.total_delta_payout == 1200.0
+
+    def test_progress_reports_partial_results(
+        self,
+        cohort: QACohort,
+        claims: list[Claim],
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Test that a partial result is emitted after each batch."""
+        change = QAProposedChange(
+            proposal_id="PROP-TEST",
+            label="Include accessories by default",
+            description="",
+            change_type="INTERPRETATION",
+            target_item_id="DP.ACCESSORY_COVERAGE",
+            to_value="INCLUDED_BY_DEFAULT",
+        )
+        partials = []
+
+        result = QAImpactEngine(batch_size=1).run_study(
+            cohort,
+            change,
+            claims * 2,
+            lambda c: (sample_interpretation_set, sample_assumption_set),
+            on_progress=partials.append,
+        )
+
+        assert [p.claims_processed for p in partials] == [1, 2, 3, 4]
+        assert all(p.is_partial for p in partials)
+        assert not result.is_partial
+        assert result.delta_stats.count == 4
+        assert result.delta_stats.total == 2400.0
+
+    def test_baselines_shared_between_studies(
+        self,
+        cohort: QACohort,
+        claims: list[Claim],
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Test that a second proposal's study reuses the first one's baselines."""
+        baselines = BaselineCache()
+        engine = QAImpactEngine(baselines=baselines)
+        catalog_for = lambda c: (sample_interpretation_set, sample_assumption_set)  # noqa: E731
+        by_default = QAProposedChange(
+            proposal_id="PROP-DEFAULT",
+            label="Include accessories by default",
+            description="",
+            change_type="INTERPRETATION",
+            target_item_id="DP.ACCESSORY_COVERAGE",
+            to_value="INCLUDED_BY_DEFAULT",
+        )
+        declared = QAProposedChange(
+            proposal_id="PROP-DECLARED",
+            label="Assume declared",
+            description="",
+            change_type="ASSUMPTION",
+            target_item_id="ASM.ACCESSORY_DECLARED",
+            to_value="DECLARED",
+        )
+
+        engine.run_study(cohort, by_default, claims, catalog_for)
+        shared = engine.run_study(cohort, declared, claims, catalog_for)
+        fresh = QAImpactEngine().run_study(cohort, declared, claims, catalog_for)
+
+        assert (baselines.misses, baselines.hits) == (2, 2)
+        assert len(baselines) == 2
+        assert shared.model_dump(exclude={"run_date"}) == fresh.model_dump(exclude={"run_date"})
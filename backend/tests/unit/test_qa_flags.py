@@ -0,0 +1,90 @@
+"""Unit tests for computed QA flags."""
+
+from decision_ledger.core.qa_engine import QAImpactEngine
+from decision_ledger.core.qa_flags import QAFlagRules, evaluate_flags, similarity_key
+from decision_ledger.core.qa_stats import DeltaAggregate
+from decision_ledger.schemas.catalog import AssumptionSet, InterpretationSet
+from decision_ledger.schemas.claim import Claim, FactStatus
+from decision_ledger.schemas.qa import QACohort, QAFlag, QAProposedChange
+
+
+class TestQAFlags:
+    """Tests for flag rules and their evaluation in QA studies."""
+
+    def test_no_flags_below_thresholds(self):
+        """Test that a quiet study raises no flags."""
+        aggregate = DeltaAggregate()
+        aggregate.add("A", 100.0, bucket="b")
+        aggregate.add_unchanged(9, bucket="b")
+
+        assert evaluate_flags(aggregate, QAFlagRules(inconsistency_min_share=0.5)) == ([], [])
+
+    def test_high_impact_thresholds(self):
+        """Test the total and single-claim delta thresholds."""
+        aggregate = DeltaAggregate()
+        aggregate.add("A", -6000.0)
+        aggregate.add_unchanged(99)
+
+        flags, reasons = evaluate_flags(aggregate, QAFlagRules())
+        assert flags == [QAFlag.HIGH_IMPACT]
+        assert "6,000.00" in reasons[0]
+
+    def test_low_confidence_and_inconsistency(self):
+        """Test assumption share and mixed reactions within a bucket."""
+        aggregate = DeltaAggregate()
+        for i in range(3):
+            aggregate.add(f"A{i}", 10.0, bucket="b", assumption_driven=True)
+        aggregate.add_unchanged(2, bucket="b")
+
+        flags, _ = evaluate_flags(aggregate, QAFlagRules())
+        assert flags == [QAFlag.HIGH_IMPACT, QAFlag.LOW_CONFIDENCE, QAFlag.INCONSISTENCY_DETECTED]
+
+    def test_similarity_key_bands_amounts(self, sample_claim: Claim):
+        """Test that claims of similar size and composition share a bucket."""
+        slightly_larger = sample_claim.model_copy(
+            update={
+                "line_items": [
+                    li.model_copy(update={"amount_chf": li.amount_chf + 10})
+                    for li in sample_claim.line_items
+                ]
+            }
+        )
+
+        assert similarity_key(sample_claim) == similarity_key(slightly_larger)
+        assert similarity_key(sample_claim)[2] == ("accessory", "repair")
+
+    def test_flags_computed_in_study(
+        self,
+        sample_claim: Claim,
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Test that a study flags similar claims that react differently."""
+        declared = sample_claim.model_copy(
+            update={
+                "facts": [
+                    f.model_copy(update={"value": "DECLARED", "status": FactStatus.KNOWN})
+                    for f in sample_claim.facts
+                ]
+            }
+        )
+        claims = [sample_claim] * 3 + [declared] * 3
+        change = QAProposedChange(
+            proposal_id="PROP-TEST",
+            label="Assume declared",
+            description="",
+            change_type="ASSUMPTION",
+            target_item_id="ASM.ACCESSORY_DECLARED",
+            to_value="DECLARED",
+        )
+
+        result = QAImpactEngine(batch_size=2).run_study(
+            QACohort(cohort_id="COH", label="", description="", claim_count=0),
+            change,
+            claims,
+            lambda c: (sample_interpretation_set, sample_assumption_set),
+        )
+
+        assert QAFlag.INCONSISTENCY_DETECTED in result.flags
+        assert QAFlag.LOW_CONFIDENCE in result.flags
+        assert len(result.flag_reasons) == len(result.flags)
@@ -0,0 +1,283 @@
+"""Unit tests for the QA service."""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from decision_ledger.api.services.governance_service import GovernanceService
+from decision_ledger.api.services.qa_service import QAService
+from decision_ledger.schemas.job import JobStatus, QAStudyJobCreate
+from decision_ledger.schemas.catalog import AssumptionSet, InterpretationSet
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.governance import (
+    ChangeProposalCreate,
+    ChangeProposalUpdate,
+    ProposalType,
+)
+from decision_ledger.schemas.qa import QACohort, QAProposedChange
+from decision_ledger.storage.filesystem import FileStorage
+
+
+def write_fixtures(fixtures_path: Path, **files: list) -> None:
+    """Write model lists as JSON fixture files."""
+    for name, items in files.items():
+        (fixtures_path / f"{name}.json").write_text(
+            json.dumps([i.model_dump(mode="json") for i in items])
+        )
+
+
+class TestQAService:
+    """Tests for QAService."""
+
+    @pytest.fixture
+    def make_service(
+        self,
+        fixtures_path: Path,
+        sample_claim: Claim,
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Return a factory for services backed by temporary fixtures."""
+        write_fixtures(
+            fixtures_path,
+            claims=[sample_claim],
+            interpretation_sets=[sample_interpretation_set],
+            assumption_sets=[sample_assumption_set],
+            qa_cohorts=[
+                QACohort(
+                    cohort_id="COH-CH",
+                    label="CH Motor",
+                    description="",
+                    claim_count=1,
+                    query="jurisdiction = CH",
+                )
+            ],
+            qa_proposed_changes=[
+                QAProposedChange(
+                    proposal_id="PROP-DEFAULT",
+                    label="Include accessories by default",
+                    description="",
+                    change_type="INTERPRETATION",
+                    target_item_id="DP.ACCESSORY_COVERAGE",
+                    to_value="INCLUDED_BY_DEFAULT",
+                )
+            ],
+        )
+
+        def make() -> QAService:
+            service = QAService()
+            service.storage = FileStorage(fixtures_path)
+            return service
+
+        return make
+
+    def test_repeated_study_is_a_cache_hit(self, make_service):
+        """Test that the second request for a study is served from cache."""
+        service = make_service()
+
+        first = service.get_result("COH-CH", "PROP-DEFAULT")
+        second = service.get_result("COH-CH", "PROP-DEFAULT")
+
+        assert first.total_delta_payout == 1200.0
+        assert second == first
+        assert (service.result_cache.misses, service.result_cache.hits) == (1, 1)
+
+    def test_study_reports_progress(self, make_service):
+        """Test that a study reports partial results while it runs."""
+        service = make_service()
+        progress = []
+
+        result = service.run_study(
+            service._get_cohort("COH-CH"),
+            service._get_proposed_change("PROP-DEFAULT"),
+            on_progress=progress.append,
+        )
+
+        assert progress and all(partial.is_partial for partial in progress)
+        assert progress[-1].total_delta_payout == result.total_delta_payout
+
+    def test_disk_tier_survives_restart(self, make_service):
+        """Test that a new service instance finds results on disk."""
+        first = make_service().get_result("COH-CH", "PROP-DEFAULT")
+        restarted = make_service()
+
+        assert restarted.get_result("COH-CH", "PROP-DEFAULT") == first
+        assert restarted.result_cache.hits == 1
+
+    def test_claim_data_change_invalidates(
+        self, make_service, fixtures_path: Path, sample_claim: Claim
+    ):
+        """Test that changed claim data yields a fresh computation."""
+        service = make_service()
+        service.get_result("COH-CH", "PROP-DEFAULT")
+        second_claim = sample_claim.model_copy(update={"claim_id": "CLM-CH-002"})
+        write_fixtures(fixtures_path, claims=[sample_claim, second_claim])
+        service.storage.clear_cache()
+
+        result = service.get_result("COH-CH", "PROP-DEFAULT")
+
+        assert result.total_delta_payout == 2400.0
+        assert service.result_cache.misses == 2
+
+    def test_claim_data_change_between_restarts_invalidates_index(
+        self, make_service, fixtures_path: Path, sample_claim: Claim
+    ):
+        """Test that dependencies recorded for earlier claim data are not reused."""
+        without_accessory = sample_claim.model_copy(
+            update={"line_items": sample_claim.line_items[:1]}
+        )
+        write_fixtures(fixtures_path, claims=[without_accessory])
+        assert make_service().get_result("COH-CH", "PROP-DEFAULT").total_delta_payout == 0.0
+
+        write_fixtures(fixtures_path, claims=[sample_claim])
+        FileStorage(fixtures_path).clear_cache()
+        restarted = make_service()
+
+        assert restarted.get_result("COH-CH", "PROP-DEFAULT").total_delta_payout == 1200.0
+
+    def test_claim_index_kept_while_claims_unchanged(self, make_service, fixtures_path: Path):
+        """Test that claims reloaded through another storage do not rebuild the index."""
+        service = make_service()
+        index = service.claim_index()
+
+        FileStorage(fixtures_path).load_claims()
+
+        assert service.claim_index() is index
+
+    def test_study_job_checkpoints_each_chunk(
+        self, make_service, fixtures_path: Path, sample_claim: Claim
+    ):
+        """Test that a chunked study job matches the direct study result."""
+        second_claim = sample_claim.model_copy(update={"claim_id": "CLM-CH-002"})
+        write_fixtures(fixtures_path, claims=[sample_claim, second_claim])
+        service = make_service()
+        service.job_chunk_size = 1
+
+        job = service.submit_study_job(
+            QAStudyJobCreate(cohort_id="COH-CH", proposal_id="PROP-DEFAULT")
+        )
+        deadline = time.monotonic() + 5
+        while service.jobs.get(job.job_id).status != JobStatus.SUCCEEDED:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        done = service.jobs.get(job.job_id)
+        checkpoint = service.jobs.store.load_checkpoint(job.job_id)
+        assert (done.processed, done.total) == (2, 2)
+        assert checkpoint["offset"] == 2
+        assert done.result["total_delta_payout"] == 2400.0
+        assert done.result["impacted_claims_count"] == 2
+        direct = service.run_study(
+            service._get_cohort("COH-CH"), service._get_proposed_change("PROP-DEFAULT")
+        )
+        assert done.result["study_id"] == direct.study_id
+        assert direct.study_id.startswith("QA-")
+
+    def test_study_job_unknown_cohort(self, make_service):
+        """Test that a job for a missing cohort is not created."""
+        service = make_service()
+
+        request = QAStudyJobCreate(cohort_id="COH-X", proposal_id="PROP-DEFAULT")
+
+        assert service.submit_study_job(request) is None
+
+    def test_job_events_stream(self, make_service, monkeypatch: pytest.MonkeyPatch):
+        """Test that the events endpoint streams progress and a terminal event."""
+        from decision_ledger.api.main import app
+        from decision_ledger.api.routes import qa
+
+        monkeypatch.setenv("JOB_EVENTS_POLL_SECONDS", "0.01")
+        monkeypatch.setattr(qa, "qa_service", make_service())
+        client = TestClient(app)
+
+        job = client.post(
+            "/api/qa/jobs", json={"cohort_id": "COH-CH", "proposal_id": "PROP-DEFAULT"}
+        ).json()
+        response = client.get(f"/api/qa/jobs/{job['job_id']}/events")
+
+        events = [
+            line.removeprefix("event: ")
+            for line in response.text.splitlines()
+            if line.startswith("event: ")
+        ]
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert events[-1] == "succeeded"
+        assert set(events[:-1]) <= {"progress"}
+        assert client.get("/api/qa/jobs/JOB-MISSING/events").status_code == 404
+
+    def test_result_route_errors(
+        self, make_service, fixtures_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that missing results are 404 and invalid cohorts or changes 400."""
+        from decision_ledger.api.main import app
+        from decision_ledger.api.routes import qa
+
+        write_fixtures(
+            fixtures_path,
+            qa_cohorts=[
+                QACohort(
+                    cohort_id=cohort_id,
+                    label=cohort_id,
+                    description="",
+                    claim_count=1,
+                    query=query,
+                )
+                for cohort_id, query in (("COH-CH", "jurisdiction = CH"), ("COH-BAD", "= CH"))
+            ],
+            qa_proposed_changes=[
+                QAProposedChange(
+                    proposal_id=proposal_id,
+                    label=proposal_id,
+                    description="",
+                    change_type=change_type,
+                    target_item_id="DP.ACCESSORY_COVERAGE",
+                    to_value="INCLUDED_BY_DEFAULT",
+                )
+                for proposal_id, change_type in (
+                    ("PROP-DEFAULT", "INTERPRETATION"),
+                    ("PROP-BAD", "UNKNOWN"),
+                )
+            ],
+        )
+        monkeypatch.setattr(qa, "qa_service", make_service())
+        client = TestClient(app)
+
+        assert client.get("/api/qa/results/COH-CH/PROP-DEFAULT").status_code == 200
+        assert client.get("/api/qa/results/COH-MISSING/PROP-DEFAULT").status_code == 404
+        assert client.get("/api/qa/results/COH-BAD/PROP-DEFAULT").status_code == 400
+        assert client.get("/api/qa/results/COH-CH/PROP-BAD").status_code == 400
+
+    def test_submit_computes_impact_summary(self, make_service):
+        """Test that submitting a proposal fills in its QA impact in the background."""
+        governance = GovernanceService(qa_service=make_service())
+        proposal = governance.create_proposal(
+            ChangeProposalCreate(
+                title="Cover accessories by default",
+                proposal_type=ProposalType.INTERPRETATION,
+                proposed_version="2025.2",
+                rationale="",
+                jurisdiction="CH",
+                product_line="Motor/Casco",
+                change_type="INTERPRETATION",
+                target_item_id="DP.ACCESSORY_COVERAGE",
+                to_value="INCLUDED_BY_DEFAULT",
+                created_by="Policy Team",
+            )
+        )
+
+        submitted = governance.update_proposal(
+            proposal.proposal_id, ChangeProposalUpdate(action="submit", actor_role="Adjuster")
+        )
+        jobs = governance.qa_service.jobs
+        deadline = time.monotonic() + 5
+        while jobs.get(submitted.qa_impact_job_id).status != JobStatus.SUCCEEDED:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        summary = governance.get_proposal(proposal.proposal_id).qa_impact_summary
+        assert summary.cohort_id == "COH-CH"
+        assert summary.impacted_claims_count == 1
+        assert summary.total_delta_payout == 1200.0
@@ -0,0 +1,128 @@
+"""Unit tests for Monte Carlo assumption simulation."""
+
+import pytest
+
+from decision_ledger.core.qa_simulation import (
+    AssumptionSimulator,
+    PayoutTable,
+    alternative_probabilities,
+    np,
+    sample_totals,
+)
+from decision_ledger.schemas.catalog import AssumptionSet, InterpretationSet
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.qa import QACohort, QAProposedChange
+
+SAMPLERS = [False, pytest.param(True, marks=pytest.mark.skipif(np is None, reason="numpy not installed"))]
+
+
+@pytest.fixture
+def cohort() -> QACohort:
+    """Create a cohort covering all test claims."""
+    return QACohort(cohort_id="COH-TEST", label="Test Cohort", description="", claim_count=0)
+
+
+@pytest.fixture
+def change() -> QAProposedChange:
+    """Create a change that excludes accessories."""
+    return QAProposedChange(
+        proposal_id="PROP-TEST",
+        label="Exclude accessories",
+        description="",
+        change_type="INTERPRETATION",
+        target_item_id="DP.ACCESSORY_COVERAGE",
+        to_value="EXCLUDED",
+    )
+
+
+@pytest.fixture
+def weighted_assumptions(sample_assumption_set: AssumptionSet) -> AssumptionSet:
+    """Give the accessory declaration a 25% prior of having been declared."""
+    assumption = sample_assumption_set.assumptions[0]
+    alternatives = [
+        a.model_copy(update={"probability": 0.25 if a.alternative_id == "DECLARED" else None})
+        for a in assumption.alternatives
+    ]
+    return sample_assumption_set.model_copy(
+        update={"assumptions": [assumption.model_copy(update={"alternatives": alternatives})]}
+    )
+
+
+class TestAssumptionSimulator:
+    """Tests for AssumptionSimulator."""
+
+    def test_alternative_probabilities(self, weighted_assumptions: AssumptionSet):
+        """Test that unspecified alternatives share the remaining mass."""
+        assert alternative_probabilities(weighted_assumptions.assumptions[0]) == (0.75, 0.25)
+
+    def test_invalid_probabilities_are_rejected(self, weighted_assumptions: AssumptionSet):
+        """Test that probabilities summing to more than one raise."""
+        assumption = weighted_assumptions.assumptions[0]
+        bad = assumption.model_copy(
+            update={
+                "alternatives": [
+                    a.model_copy(update={"probability": 0.8}) for a in assumption.alternatives
+                ]
+            }
+        )
+
+        with pytest.raises(ValueError):
+            alternative_probabilities(bad)
+
+    def test_payout_tables_only_expand_consulted_assumptions(
+        self,
+        sample_claim: Claim,
+        change: QAProposedChange,
+        sample_interpretation_set: InterpretationSet,
+        weighted_assumptions: AssumptionSet,
+    ):
+        """Test that only claims depending on the assumption get several outcomes."""
+        repair_only = sample_claim.model_copy(
+            update={
+                "claim_id": "CLM-CH-002",
+                "line_items": [li for li in sample_claim.line_items if li.category == "repair"],
+            }
+        )
+
+        groups = AssumptionSimulator().payout_groups(
+            [sample_claim, repair_only], change, lambda c: (sample_interpretation_set, weighted_assumptions)
+        )
+
+        assert groups == {
+            PayoutTable((0.75, 0.25), (2000.0, 3200.0), (2000.0, 2000.0)): 1,
+            PayoutTable((1.0,), (2000.0,), (2000.0,)): 1,
+        }
+
+    @pytest.mark.parametrize("use_numpy", SAMPLERS)
+    def test_simulation_is_seeded_and_unbiased(
+        self,
+        use_numpy: bool,
+        sample_claim: Claim,
+        cohort: QACohort,
+        change: QAProposedChange,
+        sample_interpretation_set: InterpretationSet,
+        weighted_assumptions: AssumptionSet,
+    ):
+        """Test reproducibility and that the mean delta matches the expectation."""
+        simulator = AssumptionSimulator()
+        claims = [sample_claim.model_copy(update={"claim_id": f"CLM-{i}"}) for i in range(40)]
+        catalog_for = lambda c: (sample_interpretation_set, weighted_assumptions)  # noqa: E731
+
+        first = simulator.run(cohort, change, claims, catalog_for, draws=2000, seed=7, use_numpy=use_numpy)
+        second = simulator.run(cohort, change, claims, catalog_for, draws=2000, seed=7, use_numpy=use_numpy)
+
+        assert first.current == second.current
+        assert first.uncertain_claim_count == 40
+        # Each claim loses the 1200 accessory payout with probability 0.25
+        assert first.delta.mean == pytest.approx(-40 * 0.25 * 1200, rel=0.05)
+        assert first.proposed.std_dev == 0.0
+        assert first.delta.percentiles["p5"] <= first.delta.percentiles["p95"]
+
+    def test_fixed_payouts_need_no_sampling(self):
+        """Test that certain claims contribute a constant to every draw."""
+        current, proposed = sample_totals(
+            {PayoutTable((1.0,), (100.0,), (150.0,)): 3}, draws=4, seed=0
+        )
+
+        assert current == [300.0] * 4
+        assert proposed == [450.0] * 4
@@ -0,0 +1,125 @@
+"""Unit tests for streaming QA aggregates."""
+
+import json
+import random
+import statistics
+
+import pytest
+
+from decision_ledger.core.qa_stats import DeltaAggregate, Histogram, RunningStats, TopK
+
+
+class TestRunningStats:
+    """Tests for RunningStats."""
+
+    def test_matches_batch_statistics(self):
+        """Test that streamed mean and variance match the batch computation."""
+        values = [random.Random(7).uniform(-500, 500) for _ in range(1000)]
+        stats = RunningStats()
+        for v in values:
+            stats.add(v)
+
+        assert stats.count == 1000
+        assert stats.mean == pytest.approx(statistics.fmean(values))
+        assert stats.variance == pytest.approx(statistics.pvariance(values))
+        assert stats.min == min(values)
+        assert stats.max == max(values)
+
+    def test_merged_shards_match_single_pass(self):
+        """Test that merging shard statistics equals one pass over all values."""
+        rng = random.Random(11)
+        values = [rng.gauss(100, 40) for _ in range(900)]
+        single, merged = RunningStats(), RunningStats()
+        for v in values:
+            single.add(v)
+        for start in range(0, 900, 250):
+            shard = RunningStats()
+            for v in values[start : start + 250]:
+                shard.add(v)
+            merged.merge(shard)
+
+        assert merged.count == single.count
+        assert merged.mean == pytest.approx(single.mean)
+        assert merged.variance == pytest.approx(single.variance)
+
+    def test_add_repeated(self):
+        """Test that a block of equal values is added in one step."""
+        stats = RunningStats()
+        stats.add(10.0)
+        stats.add_repeated(0.0, 3)
+
+        assert stats.count == 4
+        assert stats.total == pytest.approx(10.0)
+        assert stats.variance == pytest.approx(statistics.pvariance([10.0, 0, 0, 0]))
+
+
+class TestTopK:
+    """Tests for TopK."""
+
+    def test_keeps_largest_absolute_deltas(self):
+        """Test that only the K largest absolute deltas are kept, in order."""
+        top = TopK(2)
+        for claim_id, delta in [("A", 5.0), ("B", -50.0), ("C", 20.0), ("D", 1.0)]:
+            top.push(claim_id, delta)
+
+        assert top.items() == [("B", -50.0), ("C", 20.0)]
+
+    def test_merge(self):
+        """Test that merged shards keep the global top K."""
+        left, right = TopK(2), TopK(2)
+        left.push("A", 10.0)
+        left.push("B", 30.0)
+        right.push("C", -40.0)
+        right.push("D", 5.0)
+        left.merge(right)
+
+        assert left.items() == [("C", -40.0), ("B", 30.0)]
+
+
+class TestDeltaAggregate:
+    """Tests for DeltaAggregate and Histogram."""
+
+    def test_histogram_buckets(self):
+        """Test that values fall into half-open buckets and merge."""
+        left, right = Histogram((0.0, 100.0)), Histogram((0.0, 100.0))
+        left.add(-5.0)
+        left.add(0.0)
+        right.add(250.0, n=2)
+        left.merge(right)
+
+        assert [(b.lower, b.upper, b.count) for b in left.buckets()] == [
+            (None, 0.0, 1),
+            (0.0, 100.0, 1),
+            (100.0, None, 2),
+        ]
+
+    def test_unchanged_claims_count_but_are_not_impacted(self):
+        """Test that skipped claims contribute zeros to the distribution only."""
+        aggregate = DeltaAggregate(top_k=5)
+        aggregate.add("A", 300.0)
+        aggregate.add("B", 0.0)
+        aggregate.add_unchanged(2)
+
+        stats = aggregate.delta_stats()
+        assert aggregate.claim_count == 4
+        assert aggregate.evaluated == 2
+        assert aggregate.impacted.count == 1
+        assert stats.mean == pytest.approx(75.0)
+        assert [c.claim_id for c in aggregate.impacted_claims()] == ["A"]
+
+    def test_state_round_trip(self):
+        """Test that an aggregate restored from its JSON state keeps accumulating."""
+        aggregate = DeltaAggregate(top_k=2)
+        bucket = ("CH", "Motor", ("repair",), 11)
+        aggregate.add("CLM-1", 1200.0, bucket=bucket, assumption_driven=True)
+        aggregate.add("CLM-2", -50.0, bucket=bucket)
+        aggregate.add_unchanged(3)
+
+        restored = DeltaAggregate.from_state(json.loads(json.dumps(aggregate.to_state())), top_k=2)
+        restored.add("CLM-3", 300.0)
+        aggregate.add("CLM-3", 300.0)
+
+        assert restored.to_state() == aggregate.to_state()
+        assert restored.buckets == aggregate.buckets
+        assert restored.impacted_claims() == aggregate.impacted_claims()
+        assert restored.delta_stats() == aggregate.delta_stats()
@@ -0,0 +1,127 @@
+"""Unit tests for replay verification of stored runs."""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from decision_ledger.api.services.decision_service import DecisionService
+from decision_ledger.api.services.replay_service import ReplayService
+from decision_ledger.core.engine import DecisionEngine
+from decision_ledger.schemas.catalog import AssumptionSet, InterpretationSet
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.decision import DecisionRunRequest, SelectedInterpretation
+from decision_ledger.storage.filesystem import FileStorage
+
+
+class TestReplayService:
+    """Tests for ReplayService and core.replay."""
+
+    @pytest.fixture
+    def storage(
+        self,
+        fixtures_path: Path,
+        sample_claim: Claim,
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ) -> FileStorage:
+        """Fixtures with two decision runs stored for the sample claim."""
+        for filename, items in [
+            ("claims.json", [sample_claim]),
+            ("interpretation_sets.json", [sample_interpretation_set]),
+            ("assumption_sets.json", [sample_assumption_set]),
+        ]:
+            (fixtures_path / filename).write_text(
+                json.dumps([i.model_dump(mode="json") for i in items])
+            )
+        storage = FileStorage(fixtures_path)
+        decisions = DecisionService()
+        decisions.storage = storage
+        for option in ("INCLUDED_IF_DECLARED", "EXCLUDED"):
+            decisions.run_decision(
+                DecisionRunRequest(
+                    claim_id="CLM-CH-001",
+                    resolved_assumptions=[],
+                    selected_interpretations=[
+                        SelectedInterpretation(
+                            decision_point_id="DP.ACCESSORY_COVERAGE", option=option
+                        )
+                    ],
+                    role="Adjuster",
+                )
+            )
+        return storage
+
+    @pytest.fixture
+    def service(self, storage: FileStorage) -> ReplayService:
+        service = ReplayService()
+        service.storage = storage
+        return service
+
+    def test_unchanged_engine_replays_identically(self, service: ReplayService):
+        """Test that stored runs replay byte for byte."""
+        report = service.replay()
+        assert report.ok
+        assert (report.runs_replayed, report.drift_count) == (2, 0)
+
+    def test_parallel_replay(self, service: ReplayService):
+        """Test replaying batches on a process pool."""
+        service.batch_size = 1
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            report = service.replay(executor=pool)
+        assert report.ok and report.runs_replayed == 2
+
+    def test_engine_change_reported(
+        self, service: ReplayService, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that an engine change altering payouts is reported as outcome drift."""
+        monkeypatch.setattr(DecisionEngine, "DEDUCTIBLE", 400.0)
+        report = service.replay(max_reported=1)
+        assert not report.ok
+        assert report.drift_count == 2
+        (drift,) = report.drifts
+        assert drift.kind == "outcome"
+        assert drift.claim_id == "CLM-CH-001"
+
+    def test_trace_drift_reported(
+        self, service: ReplayService, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a trace difference with identical totals is reported."""
+        run_with_dependencies = DecisionEngine.run_with_dependencies
+
+        def edited(engine, **kwargs):
+            outcome, trace_steps, dependencies = run_with_dependencies(engine, **kwargs)
+            trace_steps[1] = trace_steps[1].model_copy(update={"output": "Edited"})
+            return outcome, trace_steps, dependencies
+
+        monkeypatch.setattr(DecisionEngine, "run_with_dependencies", edited)
+        report = service.replay()
+        assert report.drift_count == 2
+        assert {drift.kind for drift in report.drifts} == {"trace"}
+
+    def test_claim_change_reported(
+        self, service: ReplayService, fixtures_path: Path, sample_claim: Claim
+    ):
+        """Test that a run whose claim was edited is not reported as engine drift."""
+        sample_claim.line_items[0].amount_chf += 1000.0
+        (fixtures_path / "claims.json").write_text(
+            json.dumps([sample_claim.model_dump(mode="json")])
+        )
+        service.storage = FileStorage(fixtures_path)
+        report = service.replay()
+        assert report.drift_count == 2
+        assert {drift.kind for drift in report.drifts} == {"claim_changed"}
+
+    def test_unavailable_inputs_reported(self, service: ReplayService, fixtures_path: Path):
+        """Test that runs whose claim or set version is gone are reported, not skipped."""
+        (fixtures_path / "assumption_sets.json").write_text("[]")
+        service.storage = FileStorage(fixtures_path)
+        report = service.replay(claim_id="CLM-CH-001")
+        assert {drift.kind for drift in report.drifts} == {"missing_catalog"}
+
+        (fixtures_path / "claims.json").write_text("[]")
+        service.storage = FileStorage(fixtures_path)
+        report = service.replay()
+        assert report.drift_count == 2
+        assert {drift.kind for drift in report.drifts} == {"missing_claim"}
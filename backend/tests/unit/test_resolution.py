@@ -0,0 +1,70 @@
+"""Unit tests for catalog-derived engine inputs."""
+
+import pytest
+
+from decision_ledger.core.resolution import (
+    SYSTEM_ROLE,
+    AssumptionTriggerMap,
+    recommended_assumptions,
+    role_mask,
+    trigger_map,
+)
+from decision_ledger.schemas.catalog import AssumptionSet, Role
+from decision_ledger.schemas.claim import Claim, FactStatus
+from decision_ledger.schemas.decision import ResolvedAssumption
+
+
+def resolution(chosen: str, role: str) -> ResolvedAssumption:
+    return ResolvedAssumption(
+        assumption_id="ASM.ACCESSORY_DECLARED",
+        fact_id="FACT.ACCESSORY_DECLARED",
+        fact_label="Accessory Declared",
+        chosen_resolution=chosen,
+        chosen_by_role=role,
+    )
+
+
+class TestAssumptionTriggerMap:
+    """Tests for AssumptionTriggerMap."""
+
+    def test_recommended_for_unknown_facts(
+        self, sample_claim: Claim, sample_assumption_set: AssumptionSet
+    ):
+        """Test that each UNKNOWN fact gets its assumption's recommended resolution."""
+        triggers = AssumptionTriggerMap(sample_assumption_set)
+
+        (resolved,) = triggers.recommended(sample_claim)
+        assert resolved.assumption_id == "ASM.ACCESSORY_DECLARED"
+        assert resolved.chosen_resolution == "NOT_DECLARED"
+        assert resolved.chosen_by_role == SYSTEM_ROLE
+        # Built once and shared by every claim with the same fact
+        assert triggers.recommended(sample_claim)[0] is resolved
+
+        known = sample_claim.model_copy(deep=True)
+        known.facts[1].status = FactStatus.KNOWN
+        assert triggers.recommended(known) == []
+        assert recommended_assumptions(sample_claim, None) == []
+
+    def test_role_permissions(self, sample_assumption_set: AssumptionSet):
+        """Test role checks against the alternatives' role bitmasks."""
+        triggers = AssumptionTriggerMap(sample_assumption_set)
+        allowed = triggers.by_assumption["ASM.ACCESSORY_DECLARED"].allowed_roles
+        assert allowed["DECLARED"] == role_mask(
+            [Role.SUPERVISOR, Role.QA_LEAD, Role.POLICY_OWNER]
+        )
+
+        triggers.check_resolution(resolution("NOT_DECLARED", "Adjuster"))
+        triggers.check_resolution(resolution("DECLARED", "Supervisor"))
+        triggers.check_resolution(resolution("NOT_DECLARED", SYSTEM_ROLE))
+        with pytest.raises(ValueError, match="may not choose"):
+            triggers.check_resolution(resolution("DECLARED", "Adjuster"))
+        with pytest.raises(ValueError, match="may not choose"):
+            triggers.check_resolution(resolution("DECLARED", SYSTEM_ROLE))
+        with pytest.raises(ValueError, match="not defined"):
+            triggers.check_resolution(resolution("MAYBE", "Supervisor"))
+
+    def test_trigger_map_built_once_per_version(self, sample_assumption_set: AssumptionSet):
+        """Test that the map of a set version is reused, and a new version gets its own."""
+        assert trigger_map(sample_assumption_set) is trigger_map(sample_assumption_set)
+        copy = sample_assumption_set.model_copy()
+        assert trigger_map(copy) is not trigger_map(sample_assumption_set)
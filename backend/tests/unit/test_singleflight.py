@@ -0,0 +1,53 @@
+"""Unit tests for single-flight request coalescing."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from decision_ledger.utils.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that concurrent callers with one key run fn once."""
+        flight: SingleFlight[int] = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def compute() -> int:
+            calls.append(1)
+            release.wait()
+            return 42
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [pool.submit(flight.do, "key", compute) for _ in range(5)]
+            while flight.executed + flight.coalesced < 5:
+                pass
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == [42] * 5
+        assert len(calls) == 1
+        assert flight.coalesced == 4
+
+    def test_sequential_calls_recompute(self):
+        """Test that results are not cached after completion."""
+        flight: SingleFlight[int] = SingleFlight()
+        counter = iter(range(10))
+
+        assert flight.do("key", lambda: next(counter)) == 0
+        assert flight.do("key", lambda: next(counter)) == 1
+
+    def test_errors_propagate_and_clear(self):
+        """Test that a failing call raises and does not poison the key."""
+        flight: SingleFlight[int] = SingleFlight()
+
+        def fail() -> int:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            flight.do("key", fail)
+        assert flight.do("key", lambda: 1) == 1
@@ -0,0 +1,103 @@
+"""Unit tests for state shared between processes through the SQLite store."""
+
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from decision_ledger.schemas.governance import ChangeProposal, ProposalStatus, ProposalType
+from decision_ledger.storage.governance_log import PROPOSAL_CREATED, GovernanceLog
+from decision_ledger.storage.idempotency import IdempotencyConflictError, IdempotencyStore
+from decision_ledger.storage.sqlite import SqliteStateStore
+from tests.conftest import make_run
+
+
+class TestSqliteStateStore:
+    """Tests for two store instances, as in two worker processes, on one database."""
+
+    @pytest.fixture
+    def stores(self, tmp_path: Path) -> tuple[SqliteStateStore, SqliteStateStore]:
+        return SqliteStateStore(tmp_path / "state.db"), SqliteStateStore(tmp_path / "state.db")
+
+    def test_runs_shared(self, stores: tuple[SqliteStateStore, SqliteStateStore]):
+        """Test that a run saved through one store is read through the other."""
+        first, second = stores
+        first.save_run(make_run("RUN-00000001"))
+
+        assert second.get_run("RUN-00000001").payout_total == 100.0
+        assert [run.run_id for run in second.list_runs()] == ["RUN-00000001"]
+        with pytest.raises(ValueError, match="already recorded"):
+            second.save_run(make_run("RUN-00000001"))
+
+    def test_proposals_shared(self, stores: tuple[SqliteStateStore, SqliteStateStore]):
+        """Test that a proposal created through one store's log is seen by the other's."""
+        first, second = GovernanceLog(stores[0]), GovernanceLog(stores[1])
+        proposal = ChangeProposal(
+            proposal_id="PROP-1",
+            title="Cover accessories by default",
+            proposal_type=ProposalType.INTERPRETATION,
+            proposed_version="2025.2",
+            rationale="",
+            status=ProposalStatus.DRAFT,
+            created_at=datetime(2025, 6, 1, 12, 0),
+            created_by="Policy Team",
+        )
+        first.append("PROP-1", PROPOSAL_CREATED, "Policy Team", proposal.model_dump(mode="json"))
+
+        assert second.get("PROP-1") == proposal
+        assert [p.proposal_id for p in second.list_proposals()] == ["PROP-1"]
+
+
+class TestIdempotencyStore:
+    """Tests for idempotency keys shared between store instances."""
+
+    @pytest.fixture
+    def stores(self, tmp_path: Path) -> tuple[IdempotencyStore, IdempotencyStore]:
+        return (
+            IdempotencyStore(SqliteStateStore(tmp_path / "state.db"), poll_seconds=0.01),
+            IdempotencyStore(SqliteStateStore(tmp_path / "state.db"), poll_seconds=0.01),
+        )
+
+    def test_key_shared(self, stores: tuple[IdempotencyStore, IdempotencyStore]):
+        """Test that a key recorded through one store returns its run through the other."""
+        first, second = stores
+        assert first.reserve("key-1", "fingerprint") is None
+        with first.state.transaction():
+            first.complete("key-1", "RUN-1")
+
+        assert second.reserve("key-1", "fingerprint") == "RUN-1"
+        with pytest.raises(IdempotencyConflictError):
+            second.reserve("key-1", "other fingerprint")
+
+    def test_concurrent_submission_waits(
+        self, stores: tuple[IdempotencyStore, IdempotencyStore]
+    ):
+        """Test that a reserved key makes the other store wait for its run."""
+        first, second = stores
+        assert first.reserve("key-1", "fingerprint") is None
+        result: list[str | None] = []
+        waiter = threading.Thread(
+            target=lambda: result.append(second.reserve("key-1", "fingerprint"))
+        )
+        waiter.start()
+        waiter.join(0.1)
+        assert waiter.is_alive()
+
+        with first.state.transaction():
+            first.complete("key-1", "RUN-1")
+        waiter.join(5)
+        assert result == ["RUN-1"]
+
+    def test_released_and_expired_keys_reusable(
+        self, stores: tuple[IdempotencyStore, IdempotencyStore]
+    ):
+        """Test that failed and abandoned reservations do not block the key."""
+        first, second = stores
+        assert first.reserve("key-1", "fingerprint") is None
+        first.release("key-1")
+        assert second.reserve("key-1", "fingerprint") is None
+
+        second.reservation_seconds = 0.0
+        assert second.reserve("key-2", "fingerprint") is None
+        assert first.reserve("key-2", "fingerprint") is None
@@ -0,0 +1,107 @@
+"""Unit tests for compact trace encoding, step sharing and field projection."""
+
+import gc
+import json
+
+import pytest
+
+from decision_ledger.core.engine import DecisionEngine
+from decision_ledger.core.trace_codec import TraceStepPool, decode_trace, encode_trace
+from decision_ledger.schemas.claim import Claim
+from decision_ledger.schemas.catalog import InterpretationSet, AssumptionSet
+from decision_ledger.schemas.decision import SelectedInterpretation, TraceStep, TraceStepTemplate
+from decision_ledger.utils.projection import parse_fields, project, validate_fields
+
+
+class TestTraceCodec:
+    """Tests for encode_trace/decode_trace."""
+
+    @pytest.fixture
+    def trace(
+        self,
+        sample_claim: Claim,
+        sample_interpretation_set: InterpretationSet,
+        sample_assumption_set: AssumptionSet,
+    ):
+        """Produce a full engine trace for the sample claim."""
+        _, trace_steps = DecisionEngine().run(
+            claim=sample_claim,
+            interpretation_set=sample_interpretation_set,
+            assumption_set=sample_assumption_set,
+            resolved_assumptions=[],
+            selected_interpretations=[
+                SelectedInterpretation(
+                    decision_point_id="DP.ACCESSORY_COVERAGE",
+                    option="INCLUDED_IF_DECLARED",
+                )
+            ],
+        )
+        return trace_steps
+
+    def test_round_trip(self, trace):
+        """Test that decoding a compact trace restores the original steps."""
+        templates: dict[str, TraceStepTemplate] = {}
+        compact = encode_trace(trace, templates)
+
+        assert decode_trace(compact, templates) == trace
+
+    def test_templates_shared_across_runs(self, trace):
+        """Test that identical steps in different runs share one template."""
+        templates: dict[str, TraceStepTemplate] = {}
+        first = encode_trace(trace, templates)
+        second = encode_trace(trace, templates)
+
+        assert len(templates) == len(trace)
+        assert [s.template_id for s in first] == [s.template_id for s in second]
+
+    def test_pool_shares_identical_steps(self, trace):
+        """Test that equal steps of separately parsed runs become one instance."""
+        pool = TraceStepPool()
+        first = pool.share([TraceStep.model_validate_json(s.model_dump_json()) for s in trace])
+        second = pool.share([TraceStep.model_validate_json(s.model_dump_json()) for s in trace])
+        changed = trace[-1].model_copy(update={"output": "Other"})
+
+        assert all(a is b for a, b in zip(first, second))
+        assert pool.share([changed])[0] is changed
+        assert len(pool) == len(trace) + 1
+        del first, second, changed
+        gc.collect()
+        assert len(pool) == 0
+
+    def test_repeated_strings_interned(self, trace):
+        """Test that parsed steps refer to a single copy of repeated strings."""
+        data = trace[0].model_dump_json()
+        first, second = (TraceStep.model_validate(json.loads(data)) for _ in range(2))
+        assert first.label is second.label
+        assert first.rule_refs[0] is second.rule_refs[0]
+
+
+class TestProjection:
+    """Tests for field projection helpers."""
+
+    def test_parse_fields(self):
+        """Test parsing of comma-separated field lists."""
+        assert parse_fields(None) is None
+        assert parse_fields(" , ") is None
+        assert parse_fields("run_id, outcome.status") == ["run_id", "outcome.status"]
+
+    def test_project_nested_and_lists(self):
+        """Test projection through nested dicts and lists."""
+        data = {
+            "run_id": "RUN-1",
+            "outcome": {"status": "Approved", "payout_total": 10.0, "payout_breakdown": []},
+            "trace_steps": [{"label": "A", "output": "x"}, {"label": "B", "output": "y"}],
+        }
+
+        projected = project(data, ["run_id", "outcome.status", "trace_steps.label"])
+
+        assert projected == {
+            "run_id": "RUN-1",
+            "outcome": {"status": "Approved"},
+            "trace_steps": [{"label": "A"}, {"label": "B"}],
+        }
+
+    def test_validate_fields_rejects_unknown(self):
+        """Test that unknown top-level fields are rejected."""
+        with pytest.raises(ValueError, match="bogus"):
+            validate_fields(["run_id", "bogus.x"], {"run_id"})
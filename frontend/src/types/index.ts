@@ -238,7 +238,6 @@ export interface QAProposedChange {
   label: string;
   description: string;
   change_type: ChangeType;
-  target_set_id: string;
   target_item_id: string;
   from_value: string;
   to_value: string;